@@ -83,36 +83,21 @@ assignmentExpr
   ;
 
 conditionalExpr
-  : logicalOrExpr ('?' expression ':' expression)? # TernaryExpr
-  ;
-
-logicalOrExpr
-  : logicalAndExpr ( '||' logicalAndExpr )*
-  ;
-
-logicalAndExpr
-  : equalityExpr ( '&&' equalityExpr )*
-  ;
-
-equalityExpr
-  : relationalExpr ( ('==' | '!=') relationalExpr )*
-  ;
-
-relationalExpr
-  : additiveExpr ( ('<' | '<=' | '>' | '>=') additiveExpr )*
-  ;
-
-additiveExpr
-  : multiplicativeExpr ( ('+' | '-') multiplicativeExpr )*
-  ;
-
-multiplicativeExpr
-  : unaryExpr ( ('*' | '/' | '%') unaryExpr )*
-  ;
-
-unaryExpr
-  : ('-' | '!') unaryExpr
-  | primaryExpr
+  : operatorExpr ('?' expression ':' expression)? # TernaryExpr
+  ;
+
+// Operadores unarios y binarios en una sola regla con recursión izquierda:
+// la precedencia la da el orden de las alternativas (de mayor a menor) y
+// cada operación binaria es un contexto con exactamente dos operandos.
+operatorExpr
+  : ('-' | '!') operatorExpr                                # UnaryExpr
+  | primaryExpr                                             # OperandExpr
+  | operatorExpr op=('*' | '/' | '%') operatorExpr          # MultiplicativeExpr
+  | operatorExpr op=('+' | '-') operatorExpr                # AdditiveExpr
+  | operatorExpr op=('<' | '<=' | '>' | '>=') operatorExpr  # RelationalExpr
+  | operatorExpr op=('==' | '!=') operatorExpr              # EqualityExpr
+  | operatorExpr op='&&' operatorExpr                       # LogicalAndExpr
+  | operatorExpr op='||' operatorExpr                       # LogicalOrExpr
   ;
 
 primaryExpr
@@ -0,0 +1,85 @@
+"""
+Benchmark de la generación de TAC para literales de arreglo.
+
+Arma programas con literales grandes y anidados (constantes, que terminan
+en .data, y dinámicos, que se construyen con CREATE_ARRAY + stores), corre
+lex/parse/semántica una vez y mide solo TacGenerator.visit (mejor de
+--repeat). "deep-wide" es el caso que más castiga re-escanear el texto del
+literal en cada nivel de anidamiento.
+
+Uso (desde la raíz del repo):
+    python benchmarks/array_literals.py
+    python benchmarks/array_literals.py --repeat 5 --output arrays.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+for path in (ROOT, ROOT / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from pipeline import compile_source  # noqa: E402
+from intermediate.tac_generator import TacGenerator  # noqa: E402
+
+
+def _nest(inner: str, depth: int) -> str:
+    return "[" * depth + inner + "]" * depth
+
+
+def _row(n: int, dynamic: bool) -> str:
+    return "[" + ", ".join("x" if dynamic and i % 2 == 0 else str(i) for i in range(n)) + "]"
+
+
+def cases() -> Dict[str, str]:
+    head = "let x: integer = 7;\n"
+    return {
+        "flat-static-20000": head + f"let a = {_row(20000, False)};\n",
+        "flat-dynamic-20000": head + f"let a = {_row(20000, True)};\n",
+        "matrix-static-150x150": head + "let a = [" + ", ".join(_row(150, False) for _ in range(150)) + "];\n",
+        "matrix-dynamic-150x150": head + "let a = [" + ", ".join(_row(150, True) for _ in range(150)) + "];\n",
+        "deep-static-100": head + f"let a = {_nest('1, 2', 100)};\n",
+        "deep-wide-100x2000": head + f"let a = {_nest(_row(2000, True)[1:-1], 100)};\n",
+    }
+
+
+def measure(name: str, source: str, repeat: int = 3) -> Dict[str, object]:
+    result = compile_source(source, stop_after="semantic")
+    assert not result.errors, (name, result.errors[:3])
+    sem = result.semantic
+    best = float("inf")
+    for _ in range(repeat):
+        gen = TacGenerator(sem.table, sem.resolved_symbols, sem.types)
+        t = time.perf_counter()
+        gen.visit(result.tree)
+        best = min(best, time.perf_counter() - t)
+    return {"case": name, "kb": round(len(source) / 1024, 1), "tac_ms": best * 1000,
+            "instructions": len(gen.code)}
+
+
+def run(repeat: int = 3) -> List[Dict[str, object]]:
+    return [measure(name, source, repeat) for name, source in cases().items()]
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="TAC de literales de arreglo grandes y anidados")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--output", help="escribe el reporte JSON aquí")
+    args = ap.parse_args(argv)
+
+    rows = run(args.repeat)
+    print(f"{'caso':<24} {'KiB':>7} {'TAC ms':>9} {'instr':>8}")
+    for r in rows:
+        print(f"{r['case']:<24} {r['kb']:>7.1f} {r['tac_ms']:>9.1f} {r['instructions']:>8}")
+    if args.output:
+        Path(args.output).write_text(json.dumps(rows, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
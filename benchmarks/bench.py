@@ -0,0 +1,330 @@
+"""
+Benchmarks de compilación y de código generado sobre el corpus .cps.
+
+Por programa y por nivel de optimización registra:
+  - tiempo de cada fase (lex, parse, semantic, tac, pgo, pre_analysis, codegen)
+  - memoria por fase (tracemalloc): pico y lo retenido al terminar la fase,
+    con los sitios que más retienen; y el pico total por KiB de fuente
+  - cantidad de instrucciones TAC
+  - instrucciones MIPS estáticas y cantidad de spills en el .asm
+  - instrucciones y ciclos dinámicos en el simulador (mips_simulator)
+
+Uso (desde la raíz del repo):
+    python benchmarks/bench.py                       # compara contra baseline.json
+    python benchmarks/bench.py --update-baseline     # regraba el baseline
+    python benchmarks/bench.py --output out.json --repeat 5 --levels O1,O2
+
+Sale con código 1 si alguna métrica empeora más que su umbral (THRESHOLDS).
+"""
+
+import argparse
+import gc
+import json
+import platform
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from antlr4 import InputStream, CommonTokenStream  # noqa: E402
+from antlr4.error.ErrorListener import ErrorListener  # noqa: E402
+from parser.CompiscriptLexer import CompiscriptLexer  # noqa: E402
+from semantic.ast_and_semantic import AstAndSemantic  # noqa: E402
+from intermediate.tac_generator import TacGenerator  # noqa: E402
+from intermediate.profile import collect_profile, apply_profile  # noqa: E402
+from code_generator.mips_generator import MIPSCodeGenerator  # noqa: E402
+from code_generator.mips_simulator import run_asm, MIPSSimulationError  # noqa: E402
+from compile_trace import CompileTrace  # noqa: E402
+from pipeline import parse_program  # noqa: E402
+from tree_walk import IterativeWalker  # noqa: E402
+from memory_report import MemoryTrace  # noqa: E402
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+# ========================================
+# CONFIGURACIÓN
+# ========================================
+
+# Niveles de optimización del pipeline actual
+OPT_LEVELS: Dict[str, Dict[str, bool]] = {
+    "O0": {"buffered_print": False, "pgo": False},   # default de DriverGen: un syscall por print
+    "O1": {"buffered_print": False, "pgo": True},    # + PGO con perfil del intérprete
+    "O2": {"buffered_print": True, "pgo": True},     # + salida en buffer (--buffered-print)
+}
+
+PHASES = ("lex", "parse", "semantic", "tac", "pgo", "pre_analysis", "codegen")
+
+# métrica -> (tolerancia relativa, holgura absoluta)
+# Los tiempos son ruidosos: solo cuenta como regresión si sube más de 50%
+# y más de 5 ms. Las métricas de código generado son deterministas.
+THRESHOLDS = {
+    "time": (0.50, 0.005),
+    "peak_memory_kb": (0.20, 64.0),
+    # por fase, dentro de record["memory"][fase]
+    "memory.peak_kb": (0.20, 64.0),
+    "memory.retained_kb": (0.25, 64.0),
+    "tac_count": (0.0, 0),
+    "asm_instructions": (0.0, 0),
+    "spills": (0.0, 0),
+    "sim_instructions": (0.0, 0),
+    "sim_cycles": (0.0, 0),
+}
+
+SIM_BUDGET = 2_000_000
+
+
+def default_corpus() -> List[Path]:
+    paths = sorted((ROOT / "examples").glob("*.cps"))
+    paths += [ROOT / "input.cps"]
+    paths += sorted((Path(__file__).resolve().parent / "programs").glob("*.cps"))
+    return [p for p in paths if p.exists()]
+
+
+# ========================================
+# MEDICIÓN
+# ========================================
+
+class _Errors(ErrorListener):
+    def __init__(self):
+        super().__init__()
+        self.errors = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.errors.append(f"[Line {line}] {msg}")
+
+
+class CompileError(Exception):
+    pass
+
+
+def compile_once(source: str, level: str, trace: Optional[CompileTrace] = None) -> dict:
+    """
+    Compila `source` una vez; devuelve tiempos por fase, TAC y asm. Cada fase
+    corre en un span de `trace` (un MemoryTrace agrega memoria por fase).
+    """
+    opts = OPT_LEVELS[level]
+    trace = trace or CompileTrace(level)
+
+    with trace.span("lex"):
+        lexer = CompiscriptLexer(InputStream(source))
+        errors = _Errors()
+        lexer.removeErrorListeners()
+        lexer.addErrorListener(errors)
+        stream = CommonTokenStream(lexer)
+        stream.fill()
+
+    with trace.span("parse"):
+        tree = parse_program(stream, errors)
+
+    with trace.span("semantic"):
+        sem = AstAndSemantic()
+        IterativeWalker().walk(sem, tree)
+    if errors.errors or sem.errors:
+        raise CompileError("; ".join(errors.errors + sem.errors))
+
+    with trace.span("tac"):
+        tac_gen = TacGenerator(sem.table, sem.resolved_symbols, sem.types)
+        tac_gen.visit(tree)
+
+    with trace.span("pgo"):
+        code, priorities = tac_gen.code, None
+        if opts["pgo"]:
+            code, priorities = apply_profile(code, collect_profile(code))
+
+    with trace.span("pre_analysis"):
+        mips_gen = MIPSCodeGenerator(
+            code, tac_gen.frame_manager,
+            buffered_print=opts["buffered_print"],
+            var_priorities=priorities,
+        )
+        mips_gen.analyze()
+
+    with trace.span("codegen"):
+        asm = mips_gen.generate()
+
+    return {"times": trace.phase_times(), "tac": code, "asm": asm}
+
+
+_NOT_INSTRUCTION = re.compile(r"^\s*($|#|\.|[\w.$]+:\s*(#.*)?$)")
+
+
+def asm_counts(asm: str) -> Dict[str, int]:
+    """Instrucciones estáticas en .text y spills emitidos por el allocator."""
+    instructions = 0
+    in_text = False
+    for line in asm.splitlines():
+        stripped = line.strip()
+        if stripped.startswith(".text"):
+            in_text = True
+            continue
+        if stripped.startswith(".data"):
+            in_text = False
+            continue
+        if in_text and not _NOT_INSTRUCTION.match(line):
+            instructions += 1
+    return {"asm_instructions": instructions, "spills": asm.count("# spill ")}
+
+
+def measure(path: Path, level: str, repeat: int = 5) -> dict:
+    source = path.read_text(encoding="utf-8")
+    record: dict = {"program": _rel(path), "level": level}
+
+    # La primera compilación llena los caches de DFA de ANTLR; no se mide
+    try:
+        compile_once(source, level)
+    except CompileError as e:
+        record["error"] = str(e)
+        return record
+
+    gc.collect()
+    gc.disable()
+    try:
+        runs = [compile_once(source, level) for _ in range(max(1, repeat))]
+    finally:
+        gc.enable()
+
+    # Mínimo por fase: lo menos afectado por ruido del sistema
+    record["phases"] = {p: min(r["times"][p] for r in runs) for p in PHASES}
+    record["time"] = sum(record["phases"].values())
+
+    # Corrida aparte con tracemalloc (lo hace varias veces más lento)
+    with MemoryTrace(record["program"], source_bytes=len(source.encode("utf-8")), top=3) as mem:
+        compile_once(source, level, mem)
+    record["peak_memory_kb"] = mem.peak_kb
+    record["peak_per_source_kb"] = mem.peak_per_source_kb()
+    record["memory"] = {
+        p: {"peak_kb": m.peak_kb, "retained_kb": m.retained_kb, "top": m.top}
+        for p, m in mem.memory.items()
+    }
+
+    last = runs[-1]
+    record["tac_count"] = len(last["tac"])
+    record.update(asm_counts(last["asm"]))
+
+    try:
+        sim = run_asm(last["asm"], max_instructions=SIM_BUDGET)
+        record["sim_instructions"] = sim.stats.instructions
+        record["sim_cycles"] = sim.stats.cycles
+        record["sim_exit"] = sim.exit_reason
+    except MIPSSimulationError as e:
+        record["sim_error"] = str(e)
+    return record
+
+
+def run_suite(paths: List[Path], levels: List[str], repeat: int = 5) -> dict:
+    results = {}
+    for path in paths:
+        for level in levels:
+            rec = measure(path, level, repeat)
+            results[f"{rec['program']}@{level}"] = rec
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "levels": levels,
+        },
+        "results": results,
+    }
+
+
+def _rel(path: Path) -> str:
+    try:
+        return path.resolve().relative_to(ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+# ========================================
+# COMPARACIÓN CONTRA BASELINE
+# ========================================
+
+def _metric_pairs(metric: str, base: dict, cur: dict):
+    """(nombre, viejo, nuevo) de `metric`; "memory.<campo>" se expande por fase."""
+    if metric.startswith("memory."):
+        field = metric.split(".", 1)[1]
+        for phase, old in base.get("memory", {}).items():
+            new = cur.get("memory", {}).get(phase)
+            if new is not None and field in old and field in new:
+                yield f"memory.{phase}.{field}", old[field], new[field]
+    elif metric in base and metric in cur:
+        yield metric, base[metric], cur[metric]
+
+
+def compare(current: dict, baseline: dict, thresholds: Optional[dict] = None) -> List[str]:
+    """Devuelve una línea por cada métrica que empeoró más que su umbral."""
+    thresholds = thresholds or THRESHOLDS
+    regressions = []
+    for key, base in baseline.get("results", {}).items():
+        cur = current.get("results", {}).get(key)
+        if cur is None or "error" in base:
+            continue
+        if "error" in cur:
+            regressions.append(f"{key}: ya no compila ({cur['error']})")
+            continue
+        for metric, (rel, slack) in thresholds.items():
+            for name, old, new in _metric_pairs(metric, base, cur):
+                if new > old * (1 + rel) and new - old > slack:
+                    pct = (new - old) / old * 100 if old else float("inf")
+                    regressions.append(f"{key}: {name} {old} -> {new} (+{pct:.1f}%)")
+    return regressions
+
+
+def _summary(report: dict) -> str:
+    lines = [f"{'programa@nivel':<42} {'ms':>8} {'KiB':>8} {'TAC':>6} {'asm':>6} {'spill':>6} {'dyn':>9}"]
+    for key, r in report["results"].items():
+        if "error" in r:
+            lines.append(f"{key:<42} error: {r['error'][:60]}")
+            continue
+        dyn = r.get("sim_instructions", "-")
+        lines.append(
+            f"{key:<42} {r['time'] * 1000:>8.2f} {r['peak_memory_kb']:>8.1f} {r['tac_count']:>6} "
+            f"{r['asm_instructions']:>6} {r['spills']:>6} {dyn:>9}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmarks del compilador de Compiscript")
+    ap.add_argument("programs", nargs="*", help="archivos .cps (default: corpus completo)")
+    ap.add_argument("--levels", default=",".join(OPT_LEVELS), help="ej. O0,O1,O2")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--output", help="escribe el reporte JSON aquí")
+    ap.add_argument("--baseline", default=str(BASELINE_PATH))
+    ap.add_argument("--update-baseline", action="store_true")
+    args = ap.parse_args(argv)
+
+    paths = [Path(p) for p in args.programs] or default_corpus()
+    levels = [lvl.strip() for lvl in args.levels.split(",") if lvl.strip()]
+    report = run_suite(paths, levels, args.repeat)
+    print(_summary(report))
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        baseline_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\n[OK] Baseline actualizado: {baseline_path}")
+        return 0
+    if not baseline_path.exists():
+        print(f"\n[WARN] No hay baseline en {baseline_path} (usa --update-baseline)")
+        return 0
+
+    regressions = compare(report, json.loads(baseline_path.read_text(encoding="utf-8")))
+    if regressions:
+        print("\n== REGRESIONES ==")
+        for r in regressions:
+            print("•", r)
+        return 1
+    print("\n[OK] Sin regresiones contra el baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Benchmark de front ends de pipeline.parse_ast: ANTLR (FastLexer + parse
+SLL/LL + AstBuilder) contra PrattParser.
+
+Parsea programas sintéticos de tamaño creciente hasta el AST de ast_nodes
+con cada front end (DFA de ANTLR ya calientes), verifica que los árboles
+sean idénticos y reporta el speedup.
+
+Uso (desde la raíz del repo):
+    python benchmarks/front_ends.py
+    python benchmarks/front_ends.py --sizes 100,400 --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+ROOT = Path(__file__).resolve().parent.parent
+for path in (ROOT, ROOT / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from benchmarks.scaling import shape_for  # noqa: E402
+from benchmarks.synth import generate_program  # noqa: E402
+
+from pipeline import parse_ast  # noqa: E402
+
+DEFAULT_SIZES = (25, 100, 400)
+
+
+def _best(front_end: str, source: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        parse_ast(source, front_end)
+        best = min(best, time.perf_counter() - t)
+    return best
+
+
+def run(sizes: Sequence[int], repeat: int = 3) -> List[Dict[str, object]]:
+    rows = []
+    for size in sizes:
+        source = generate_program(shape_for(size))
+        # primera pasada: warmup de los DFA y verificación
+        (antlr_ast, antlr_errors), (pratt_ast, pratt_errors) = (
+            parse_ast(source, "antlr"), parse_ast(source, "pratt"))
+        same = antlr_ast == pratt_ast and antlr_errors == pratt_errors
+        antlr, pratt = _best("antlr", source, repeat), _best("pratt", source, repeat)
+        rows.append({
+            "statements": size, "kb": round(len(source) / 1024, 1),
+            "antlr": antlr, "pratt": pratt, "speedup": antlr / pratt, "same_ast": same,
+        })
+    return rows
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="parse_ast: ANTLR + AstBuilder vs PrattParser")
+    ap.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args(argv)
+
+    rows = run([int(s) for s in args.sizes.split(",")], args.repeat)
+    print(f"{'sentencias':>10} {'KiB':>8} {'ANTLR ms':>10} {'Pratt ms':>10} {'x':>6}")
+    for r in rows:
+        print(f"{r['statements']:>10} {r['kb']:>8.1f} {r['antlr'] * 1000:>10.1f} {r['pratt'] * 1000:>10.1f} "
+              f"{r['speedup']:>6.2f}" + ("" if r["same_ast"] else "  [AST DISTINTO]"))
+    return 0 if all(r["same_ast"] for r in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Benchmark de los formatos del IR (intermediate/ir_format.py).
+
+Por programa: tamaño del TAC como .pretty_tac, .raw_tac y .ir binario
+(este último incluye los frames), y tiempo de volver a tener el TAC en
+memoria desde cada uno (load_ir, parse_tac) contra regenerarlo desde el
+fuente (front end completo). Mejor de --repeat.
+
+Uso (desde la raíz del repo):
+    python benchmarks/ir_format.py
+    python benchmarks/ir_format.py --repeat 5 --output ir_format.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+for path in (ROOT, ROOT / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from benchmarks.scaling import shape_for  # noqa: E402
+from benchmarks.synth import generate_program  # noqa: E402
+from pipeline import compile_source  # noqa: E402
+from intermediate.ir_format import dump_ir, format_tac, load_ir, parse_tac  # noqa: E402
+
+
+def cases() -> Dict[str, str]:
+    return {
+        "synth-100": generate_program(shape_for(100)),
+        "synth-400": generate_program(shape_for(400)),
+    }
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best * 1000
+
+
+def measure(name: str, source: str, repeat: int = 3) -> Dict[str, object]:
+    result = compile_source(source, stop_after="tac")
+    assert not result.errors, (name, result.errors[:3])
+    tac = result.tac
+    text = format_tac(tac)
+    raw = "\n".join(f"{t.result},{t.op},{t.arg1},{t.arg2}" for t in tac)
+    data = dump_ir(tac, result.frame_manager)
+    assert load_ir(data).tac == tac and parse_tac(text) == tac
+
+    return {
+        "case": name,
+        "instructions": len(tac),
+        "pretty_bytes": len(text.encode("utf-8")),
+        "raw_bytes": len(raw.encode("utf-8")),
+        "ir_bytes": len(data),
+        "frontend_ms": best_of(lambda: compile_source(source, stop_after="tac"), max(1, repeat // 2)),
+        "parse_tac_ms": best_of(lambda: parse_tac(text), repeat),
+        "load_ir_ms": best_of(lambda: load_ir(data), repeat),
+        "dump_ir_ms": best_of(lambda: dump_ir(tac, result.frame_manager), repeat),
+    }
+
+
+def run(repeat: int = 3) -> List[Dict[str, object]]:
+    return [measure(name, source, repeat) for name, source in cases().items()]
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Tamaño y tiempo de carga del IR binario y del TAC en texto")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--output", help="escribe el reporte JSON aquí")
+    args = ap.parse_args(argv)
+
+    rows = run(args.repeat)
+    print(f"{'caso':<12} {'instr':>7} {'pretty B':>9} {'raw B':>8} {'ir B':>8} "
+          f"{'front ms':>9} {'parse ms':>9} {'load ms':>8} {'dump ms':>8}")
+    for r in rows:
+        print(f"{r['case']:<12} {r['instructions']:>7} {r['pretty_bytes']:>9} {r['raw_bytes']:>8} "
+              f"{r['ir_bytes']:>8} {r['frontend_ms']:>9.1f} {r['parse_tac_ms']:>9.1f} "
+              f"{r['load_ir_ms']:>8.1f} {r['dump_ir_ms']:>8.1f}")
+    if args.output:
+        Path(args.output).write_text(json.dumps(rows, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
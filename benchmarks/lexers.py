@@ -0,0 +1,75 @@
+"""
+Benchmark de lexers: CompiscriptLexer (ANTLR) contra FastLexer (regex).
+
+Tokeniza (CommonTokenStream.fill) programas sintéticos de tamaño creciente
+con cada lexer, verifica que los tokens sean idénticos y reporta el speedup.
+
+Uso (desde la raíz del repo):
+    python benchmarks/lexers.py
+    python benchmarks/lexers.py --sizes 100,400,1600 --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+ROOT = Path(__file__).resolve().parent.parent
+for path in (ROOT, ROOT / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from benchmarks.scaling import shape_for  # noqa: E402
+from benchmarks.synth import generate_program  # noqa: E402
+
+from antlr4 import InputStream, CommonTokenStream  # noqa: E402
+from pipeline import LEXERS  # noqa: E402
+
+DEFAULT_SIZES = (100, 400, 1600)
+
+
+def tokenize(name: str, source: str) -> List[tuple]:
+    stream = CommonTokenStream(LEXERS[name](InputStream(source)))
+    stream.fill()
+    return [(t.type, t.start, t.stop, t.line, t.column) for t in stream.tokens]
+
+
+def _best(name: str, source: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        tokenize(name, source)
+        best = min(best, time.perf_counter() - t)
+    return best
+
+
+def run(sizes: Sequence[int], repeat: int = 3) -> List[Dict[str, object]]:
+    rows = []
+    for size in sizes:
+        source = generate_program(shape_for(size))
+        same = tokenize("antlr", source) == tokenize("fast", source)
+        antlr, fast = _best("antlr", source, repeat), _best("fast", source, repeat)
+        rows.append({
+            "statements": size, "kb": round(len(source) / 1024, 1),
+            "antlr": antlr, "fast": fast, "speedup": antlr / fast, "same_tokens": same,
+        })
+    return rows
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="CompiscriptLexer vs FastLexer")
+    ap.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args(argv)
+
+    rows = run([int(s) for s in args.sizes.split(",")], args.repeat)
+    print(f"{'sentencias':>10} {'KiB':>8} {'ANTLR ms':>10} {'fast ms':>10} {'x':>6}")
+    for r in rows:
+        print(f"{r['statements']:>10} {r['kb']:>8.1f} {r['antlr'] * 1000:>10.1f} {r['fast'] * 1000:>10.1f} "
+              f"{r['speedup']:>6.2f}" + ("" if r["same_tokens"] else "  [TOKENS DISTINTOS]"))
+    return 0 if all(r["same_tokens"] for r in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
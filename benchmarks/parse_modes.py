@@ -0,0 +1,133 @@
+"""
+Benchmark del parse en dos etapas (pipeline.parse_program) contra LL puro.
+
+Por cada programa del corpus (y algunos sintéticos grandes) mide el parse
+con caches de DFA ya calientes en ambos modos:
+  - "ll": CompiscriptParser en modo LL completo (lo que hacía el pipeline)
+  - "sll_first": SLL + BailErrorStrategy, con fallback a LL si falla
+y registra si hubo fallback y que los errores reportados sean idénticos.
+
+Uso (desde la raíz del repo):
+    python benchmarks/parse_modes.py
+    python benchmarks/parse_modes.py --repeat 10 --output parse_modes.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmarks.bench import default_corpus, _rel  # noqa: E402
+from benchmarks.scaling import shape_for  # noqa: E402
+from benchmarks.synth import generate_program  # noqa: E402
+
+from antlr4 import InputStream, CommonTokenStream  # noqa: E402
+from parser.CompiscriptLexer import CompiscriptLexer  # noqa: E402
+from parser.CompiscriptParser import CompiscriptParser  # noqa: E402
+import pipeline  # noqa: E402
+from pipeline import ErrorCollector, parse_program  # noqa: E402
+
+SYNTH_SIZES = (100, 400)
+
+
+def _tokens(source: str) -> CommonTokenStream:
+    lexer = CompiscriptLexer(InputStream(source))
+    lexer.removeErrorListeners()
+    stream = CommonTokenStream(lexer)
+    stream.fill()
+    return stream
+
+
+def parse_ll(source: str) -> List[str]:
+    errors = ErrorCollector()
+    parser = CompiscriptParser(_tokens(source))
+    parser.removeErrorListeners()
+    parser.addErrorListener(errors)
+    parser.program()
+    return errors.errors
+
+
+def parse_sll_first(source: str) -> List[str]:
+    errors = ErrorCollector()
+    parse_program(_tokens(source), errors)
+    return errors.errors
+
+
+def _best(fn, source: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn(source)
+        best = min(best, time.perf_counter() - t)
+    return best
+
+
+def measure(name: str, source: str, repeat: int = 5) -> Dict[str, object]:
+    # warmup de ambos modos (los DFA de SLL y LL se comparten)
+    ll_errors = parse_ll(source)
+    before = pipeline.PARSE_STATS["ll_fallback"]
+    sll_errors = parse_sll_first(source)
+    fallback = pipeline.PARSE_STATS["ll_fallback"] > before
+
+    ll = _best(parse_ll, source, repeat)
+    sll = _best(parse_sll_first, source, repeat)
+    return {
+        "program": name,
+        "ll": ll,
+        "sll_first": sll,
+        "speedup": ll / sll if sll else None,
+        "fallback": fallback,
+        "same_errors": ll_errors == sll_errors,
+    }
+
+
+def run(repeat: int = 5) -> dict:
+    rows = []
+    for path in default_corpus():
+        rows.append(measure(_rel(path), path.read_text(encoding="utf-8"), repeat))
+    for size in SYNTH_SIZES:
+        rows.append(measure(f"synth-{size}", generate_program(shape_for(size)), repeat))
+    ll = sum(r["ll"] for r in rows)
+    sll = sum(r["sll_first"] for r in rows)
+    return {
+        "rows": rows,
+        "fallbacks": sum(r["fallback"] for r in rows),
+        "programs": len(rows),
+        "speedup": ll / sll if sll else None,
+    }
+
+
+def _summary(report: dict) -> str:
+    lines = [f"{'programa':<42} {'LL ms':>9} {'SLL ms':>9} {'x':>6}  fallback"]
+    for r in report["rows"]:
+        lines.append(
+            f"{r['program']:<42} {r['ll'] * 1000:>9.2f} {r['sll_first'] * 1000:>9.2f} "
+            f"{r['speedup']:>6.2f}  {'sí' if r['fallback'] else 'no'}"
+            + ("" if r["same_errors"] else "  [ERRORES DISTINTOS]")
+        )
+    lines.append(f"fallback a LL: {report['fallbacks']}/{report['programs']} programas, "
+                 f"speedup total x{report['speedup']:.2f}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Parse SLL-first contra LL puro")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--output", help="escribe el reporte JSON aquí")
+    args = ap.parse_args(argv)
+
+    report = run(args.repeat)
+    print(_summary(report))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 0 if all(r["same_errors"] for r in report["rows"]) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
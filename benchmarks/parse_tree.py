@@ -0,0 +1,111 @@
+"""
+Tamaño del parse tree de ANTLR y tiempo de parse por programa.
+
+Por cada programa del corpus (y algunos sintéticos) cuenta los nodos del
+parse tree (contextos de regla y terminales) y mide el parse con
+pipeline.parse_program sobre tokens ya generados, con los DFA calientes.
+Sirve para comparar cambios en la forma de la gramática (p. ej. la regla de
+expresiones con recursión izquierda de Compiscript.g4).
+
+Uso (desde la raíz del repo):
+    python benchmarks/parse_tree.py
+    python benchmarks/parse_tree.py --repeat 10 --output parse_tree.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+for path in (ROOT, ROOT / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from benchmarks.bench import default_corpus, _rel  # noqa: E402
+from benchmarks.scaling import shape_for  # noqa: E402
+from benchmarks.synth import generate_program  # noqa: E402
+
+from antlr4 import InputStream, CommonTokenStream  # noqa: E402
+from antlr4.tree.Tree import TerminalNode  # noqa: E402
+from fast_lexer import FastLexer  # noqa: E402
+from pipeline import parse_program  # noqa: E402
+
+SYNTH_SIZES = (100, 400)
+
+
+def _tokens(source: str) -> CommonTokenStream:
+    stream = CommonTokenStream(FastLexer(InputStream(source)))
+    stream.fill()
+    return stream
+
+
+def count_nodes(tree) -> Tuple[int, int]:
+    """(contextos de regla, terminales) del parse tree."""
+    contexts = terminals = 0
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, TerminalNode):
+            terminals += 1
+            continue
+        contexts += 1
+        if node.children:
+            stack.extend(node.children)
+    return contexts, terminals
+
+
+def measure(name: str, source: str, repeat: int = 5) -> Dict[str, object]:
+    stream = _tokens(source)
+    contexts, terminals = count_nodes(parse_program(stream))   # también warmup
+    best = float("inf")
+    for _ in range(repeat):
+        stream.seek(0)
+        t = time.perf_counter()
+        parse_program(stream)
+        best = min(best, time.perf_counter() - t)
+    return {"program": name, "tokens": len(stream.tokens), "contexts": contexts,
+            "terminals": terminals, "parse": best}
+
+
+def run(repeat: int = 5) -> dict:
+    rows: List[Dict[str, object]] = []
+    for path in default_corpus():
+        rows.append(measure(_rel(path), path.read_text(encoding="utf-8"), repeat))
+    for size in SYNTH_SIZES:
+        rows.append(measure(f"synth-{size}", generate_program(shape_for(size)), repeat))
+    return {
+        "rows": rows,
+        "contexts": sum(r["contexts"] for r in rows),
+        "terminals": sum(r["terminals"] for r in rows),
+        "parse": sum(r["parse"] for r in rows),
+    }
+
+
+def _summary(report: dict) -> str:
+    lines = [f"{'programa':<42} {'tokens':>7} {'contextos':>10} {'ctx/token':>9} {'parse ms':>9}"]
+    for r in report["rows"]:
+        lines.append(f"{r['program']:<42} {r['tokens']:>7} {r['contexts']:>10} "
+                     f"{r['contexts'] / r['tokens']:>9.2f} {r['parse'] * 1000:>9.2f}")
+    lines.append(f"total: {report['contexts']} contextos, {report['terminals']} terminales, "
+                 f"parse {report['parse'] * 1000:.1f} ms")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Nodos del parse tree y tiempo de parse")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--output", help="escribe el reporte JSON aquí")
+    args = ap.parse_args(argv)
+
+    report = run(args.repeat)
+    print(_summary(report))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
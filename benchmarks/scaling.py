@@ -0,0 +1,169 @@
+"""
+Benchmark de escala: tiempo de cada fase contra el tamaño del programa.
+
+Genera programas sintéticos (benchmarks/synth.py) de tamaño creciente, mide
+cada fase con bench.compile_once y ajusta  tiempo ~ lineas^k  por mínimos
+cuadrados en escala log-log. Una fase con k > SUPERLINEAR se marca como
+superlineal (típicamente un O(n²) escondido: búsquedas lineales dentro de
+un recorrido, concatenación de listas en un loop, membership en listas).
+
+Uso (desde la raíz del repo):
+    python benchmarks/scaling.py                         # tamaños por defecto
+    python benchmarks/scaling.py --sizes 25,50,100,200,400 --repeat 3
+    python benchmarks/scaling.py --output scaling.json --strict
+
+Con --strict sale con código 1 si alguna fase es superlineal.
+"""
+
+import argparse
+import gc
+import json
+import math
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmarks.bench import PHASES, compile_once  # noqa: E402
+from benchmarks.synth import ProgramShape, generate_program  # noqa: E402
+
+# ========================================
+# CONFIGURACIÓN
+# ========================================
+
+DEFAULT_SIZES = (25, 50, 100, 200)
+
+# exponente a partir del cual una fase se considera superlineal
+SUPERLINEAR = 1.3
+
+# fases que tardan menos que esto (en el tamaño mayor) no se ajustan: el
+# ruido domina y el exponente no significa nada
+MIN_FIT_SECONDS = 0.002
+
+
+def shape_for(size: int) -> ProgramShape:
+    """Forma del programa para `size` sentencias de nivel superior."""
+    return ProgramShape(
+        statements=size,
+        functions=max(1, size // 10),
+        classes=max(1, size // 100),
+    )
+
+
+# ========================================
+# AJUSTE
+# ========================================
+
+def fit_exponent(xs: Sequence[float], ys: Sequence[float]) -> Optional[float]:
+    """Pendiente de log(y) contra log(x) por mínimos cuadrados."""
+    points = [(math.log(x), math.log(y)) for x, y in zip(xs, ys) if x > 0 and y > 0]
+    if len(points) < 2:
+        return None
+    mx = sum(p[0] for p in points) / len(points)
+    my = sum(p[1] for p in points) / len(points)
+    sxx = sum((p[0] - mx) ** 2 for p in points)
+    if sxx == 0:
+        return None
+    sxy = sum((p[0] - mx) * (p[1] - my) for p in points)
+    return sxy / sxx
+
+
+# ========================================
+# MEDICIÓN
+# ========================================
+
+def measure_sizes(
+    sizes: Sequence[int],
+    level: str = "O0",
+    repeat: int = 3,
+    seed: int = 0,
+) -> List[dict]:
+    """Un registro por tamaño: líneas, instrucciones TAC y tiempo mínimo por fase."""
+    samples = []
+    for size in sizes:
+        source = generate_program(shape_for(size), seed)
+        compile_once(source, level)           # warmup (caches de DFA de ANTLR)
+        gc.collect()
+        gc.disable()
+        try:
+            runs = [compile_once(source, level) for _ in range(max(1, repeat))]
+        finally:
+            gc.enable()
+        samples.append({
+            "size": size,
+            "lines": source.count("\n"),
+            "tac_count": len(runs[-1]["tac"]),
+            "phases": {p: min(r["times"][p] for r in runs) for p in PHASES},
+        })
+    return samples
+
+
+def analyze(samples: List[dict], threshold: float = SUPERLINEAR) -> Dict[str, dict]:
+    """Exponente por fase (y total) contra líneas de fuente."""
+    xs = [s["lines"] for s in samples]
+    series = {p: [s["phases"][p] for s in samples] for p in PHASES}
+    series["total"] = [sum(s["phases"].values()) for s in samples]
+
+    fits = {}
+    for name, ys in series.items():
+        if not ys or max(ys) < MIN_FIT_SECONDS:
+            fits[name] = {"exponent": None, "superlinear": False}
+            continue
+        k = fit_exponent(xs, ys)
+        fits[name] = {
+            "exponent": None if k is None else round(k, 3),
+            "superlinear": k is not None and k > threshold,
+        }
+    return fits
+
+
+def _summary(samples: List[dict], fits: Dict[str, dict]) -> str:
+    names = list(PHASES) + ["total"]
+    lines = [f"{'fase':<14}" + "".join(f"{s['lines']:>10}" for s in samples) + f"{'k':>8}"]
+    for name in names:
+        if name == "total":
+            row = [sum(s["phases"].values()) for s in samples]
+        else:
+            row = [s["phases"][name] for s in samples]
+        fit = fits[name]
+        k = "-" if fit["exponent"] is None else f"{fit['exponent']:.2f}"
+        mark = "  <- superlineal" if fit["superlinear"] else ""
+        lines.append(f"{name:<14}" + "".join(f"{v * 1000:>10.1f}" for v in row) + f"{k:>8}{mark}")
+    lines.append("(ms por fase; columnas = líneas de fuente)")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Escala de cada fase del compilador")
+    ap.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                    help="sentencias de nivel superior por programa, ej. 25,50,100")
+    ap.add_argument("--level", default="O0")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--threshold", type=float, default=SUPERLINEAR)
+    ap.add_argument("--output", help="escribe el reporte JSON aquí")
+    ap.add_argument("--strict", action="store_true", help="falla si hay fases superlineales")
+    args = ap.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    samples = measure_sizes(sizes, args.level, args.repeat, args.seed)
+    fits = analyze(samples, args.threshold)
+    print(_summary(samples, fits))
+
+    if args.output:
+        report = {"level": args.level, "seed": args.seed, "samples": samples, "fits": fits}
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    flagged = [name for name, fit in fits.items() if fit["superlinear"]]
+    if flagged:
+        print(f"\n[WARN] Fases superlineales (k > {args.threshold}): {', '.join(flagged)}")
+        return 1 if args.strict else 0
+    print("\n[OK] Ninguna fase crece más rápido que lineal")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Benchmark del backend en streaming (code_generator/streaming.py).
+
+Por programa: tiempo y pico de memoria (tracemalloc) del backend completo
+con emit_mips (todo el programa en memoria, un solo string) contra
+stream_mips escribiendo cada parte a un writer que la descarta. El TAC ya
+generado no cuenta en el pico. Con muchas funciones chicas el pico del
+streaming queda en el de la función más grande; con un main enorme (synth-N)
+los dos se parecen.
+
+Uso (desde la raíz del repo):
+    python benchmarks/streaming.py
+    python benchmarks/streaming.py --output streaming.json
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+for path in (ROOT, ROOT / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from benchmarks.scaling import shape_for  # noqa: E402
+from benchmarks.synth import ProgramShape, generate_program  # noqa: E402
+from pipeline import compile_source, emit_mips, stream_mips  # noqa: E402
+
+
+def cases() -> Dict[str, str]:
+    return {
+        "synth-100": generate_program(shape_for(100)),
+        "funcs-100": generate_program(ProgramShape(statements=20, functions=100, classes=2)),
+        "funcs-300": generate_program(ProgramShape(statements=20, functions=300, classes=2)),
+    }
+
+
+class _Discard:
+    def write(self, chunk: str) -> None:
+        pass
+
+
+def traced(fn: Callable[[], object]) -> Tuple[float, int]:
+    """(ms, bytes pico) de una corrida de fn."""
+    tracemalloc.start()
+    t = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed * 1000, peak
+
+
+def measure(name: str, source: str) -> Dict[str, object]:
+    result = compile_source(source, stop_after="tac")
+    assert not result.errors, (name, result.errors[:3])
+    tac, frames = result.tac, result.frame_manager
+    out = _Discard()
+
+    def whole():
+        out.write(emit_mips(tac, frames))
+
+    def streamed():
+        for chunk in stream_mips(iter(tac), frames):
+            out.write(chunk)
+
+    emit_ms, emit_peak = traced(whole)
+    stream_ms, stream_peak = traced(streamed)
+    return {
+        "case": name,
+        "instructions": len(tac),
+        "functions": sum(1 for t in tac if t.op == "fn_decl"),
+        "emit_ms": emit_ms,
+        "emit_peak_bytes": emit_peak,
+        "stream_ms": stream_ms,
+        "stream_peak_bytes": stream_peak,
+    }
+
+
+def run() -> List[Dict[str, object]]:
+    return [measure(name, source) for name, source in cases().items()]
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Pico de memoria del backend: emit_mips vs stream_mips")
+    ap.add_argument("--output", help="escribe el reporte JSON aquí")
+    args = ap.parse_args(argv)
+
+    rows = run()
+    print(f"{'caso':<12} {'instr':>7} {'funcs':>6} {'emit ms':>9} {'emit MB':>8} {'stream ms':>10} {'stream MB':>10}")
+    for r in rows:
+        print(f"{r['case']:<12} {r['instructions']:>7} {r['functions']:>6} {r['emit_ms']:>9.0f} "
+              f"{r['emit_peak_bytes'] / 1e6:>8.1f} {r['stream_ms']:>10.0f} {r['stream_peak_bytes'] / 1e6:>10.1f}")
+    if args.output:
+        Path(args.output).write_text(json.dumps(rows, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
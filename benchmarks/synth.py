@@ -0,0 +1,218 @@
+"""
+Generador aleatorio de programas Compiscript válidos (para pruebas de escala).
+
+Los programas usan solo construcciones que el front-end y el backend ya
+soportan: let tipados, asignaciones, if/else, while con contador, print,
+funciones hoja y funciones que llaman a las anteriores, clases con
+constructor y métodos, literales de arreglo y strings.
+
+Todo programa generado:
+  - pasa el análisis semántico (nombres únicos, tipos consistentes)
+  - termina (cada while tiene su contador y un límite chico)
+  - es determinista para una misma semilla y forma
+
+Uso:
+    from benchmarks.synth import ProgramShape, generate_program
+    src = generate_program(ProgramShape(statements=500, functions=20), seed=1)
+
+    python benchmarks/synth.py --statements 2000 --seed 3 > big.cps
+"""
+
+import argparse
+import random
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass
+class ProgramShape:
+    statements: int = 50        # sentencias de nivel superior en el programa principal
+    functions: int = 4          # funciones libres
+    classes: int = 1            # clases (cada una con constructor y 2 métodos)
+    max_depth: int = 3          # anidamiento máximo de bloques if/while
+    loop_ratio: float = 0.15    # fracción de sentencias compuestas que son while
+    loop_bound: int = 3         # iteraciones de cada while
+    array_size: int = 8         # elementos por literal de arreglo
+    statements_per_block: int = 4
+
+
+class _Gen:
+    def __init__(self, shape: ProgramShape, seed: int):
+        self.shape = shape
+        self.rng = random.Random(seed)
+        self.counter = 0
+        self.out: List[str] = []
+        self.functions: List[tuple] = []     # (nombre, aridad)
+        self.classes: List[str] = []
+        self.counters = set()               # contadores de while: solo lectura
+
+    # ------------------------------------------------------------
+    # Utilidades
+    # ------------------------------------------------------------
+
+    def fresh(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def emit(self, depth: int, line: str) -> None:
+        self.out.append("  " * depth + line)
+
+    def int_expr(self, ints: List[str], depth: int = 0) -> str:
+        rng = self.rng
+        if depth >= 2 or rng.random() < 0.35:
+            if ints and rng.random() < 0.7:
+                return rng.choice(ints)
+            return str(rng.randint(0, 50))
+        op = rng.choice(["+", "-", "*", "+", "%"])
+        left = self.int_expr(ints, depth + 1)
+        if op == "%":
+            return f"({left} % {rng.randint(2, 9)})"
+        return f"({left} {op} {self.int_expr(ints, depth + 1)})"
+
+    def cond_expr(self, ints: List[str]) -> str:
+        rel = self.rng.choice(["<", "<=", ">", ">=", "==", "!="])
+        return f"{self.int_expr(ints, 1)} {rel} {self.int_expr(ints, 1)}"
+
+    # ------------------------------------------------------------
+    # Sentencias
+    # ------------------------------------------------------------
+
+    def block(self, ints: List[str], depth: int, count: int, in_function: bool) -> None:
+        scope = list(ints)
+        for _ in range(count):
+            self.statement(scope, depth, in_function)
+
+    def statement(self, ints: List[str], depth: int, in_function: bool) -> None:
+        rng, shape = self.rng, self.shape
+        compound = depth < shape.max_depth and rng.random() < 0.3
+        if compound:
+            if rng.random() < shape.loop_ratio / 0.3:
+                self.while_stmt(ints, depth, in_function)
+            else:
+                self.if_stmt(ints, depth, in_function)
+            return
+
+        kind = rng.random()
+        if kind < 0.3 or not ints:
+            name = self.fresh("v")
+            self.emit(depth, f"let {name}: integer = {self.int_expr(ints)};")
+            ints.append(name)
+        elif kind < 0.55 and any(v not in self.counters for v in ints):
+            target = rng.choice([v for v in ints if v not in self.counters])
+            self.emit(depth, f"{target} = {self.int_expr(ints)};")
+        elif kind < 0.7:
+            self.emit(depth, f"print({self.int_expr(ints)});")
+        elif kind < 0.82 and self.functions and not in_function:
+            fname, arity = rng.choice(self.functions)
+            args = ", ".join(self.int_expr(ints, 1) for _ in range(arity))
+            name = self.fresh("r")
+            self.emit(depth, f"let {name}: integer = {fname}({args});")
+            ints.append(name)
+        elif kind < 0.9 and not in_function:
+            self.array_stmt(ints, depth)
+        elif self.classes and not in_function and depth == 0:
+            # objetos solo en el scope global: el TAC no resuelve la clase
+            # de un objeto declarado dentro de un bloque
+            cls = rng.choice(self.classes)
+            obj = self.fresh("o")
+            name = self.fresh("m")
+            self.emit(depth, f"let {obj}: {cls} = new {cls}({self.int_expr(ints, 1)});")
+            self.emit(depth, f"let {name}: integer = {obj}.get({self.int_expr(ints, 1)});")
+            ints.append(name)
+        else:
+            s = self.fresh("s")
+            self.emit(depth, f'let {s}: string = "{s}";')
+            self.emit(depth, f'{s} = {s} + "_{self.rng.randint(0, 9)}";')
+            self.emit(depth, f"print({s});")
+
+    def array_stmt(self, ints: List[str], depth: int) -> None:
+        size = max(1, self.shape.array_size)
+        arr = self.fresh("a")
+        elems = ", ".join(str(self.rng.randint(0, 99)) for _ in range(size))
+        self.emit(depth, f"let {arr} = [{elems}];")
+        name = self.fresh("e")
+        self.emit(depth, f"let {name}: integer = {arr}[{self.rng.randrange(size)}];")
+        ints.append(name)
+
+    def if_stmt(self, ints: List[str], depth: int, in_function: bool) -> None:
+        n = self.shape.statements_per_block
+        self.emit(depth, f"if ({self.cond_expr(ints)}) {{")
+        self.block(ints, depth + 1, n, in_function)
+        if self.rng.random() < 0.5:
+            self.emit(depth, "} else {")
+            self.block(ints, depth + 1, n, in_function)
+        self.emit(depth, "}")
+
+    def while_stmt(self, ints: List[str], depth: int, in_function: bool) -> None:
+        i = self.fresh("i")
+        self.emit(depth, f"let {i}: integer = 0;")
+        self.emit(depth, f"while ({i} < {self.shape.loop_bound}) {{")
+        # el contador se puede leer pero no reasignar dentro del cuerpo
+        self.counters.add(i)
+        self.block(ints + [i], depth + 1, self.shape.statements_per_block, in_function)
+        self.emit(depth + 1, f"{i} = {i} + 1;")
+        self.emit(depth, "}")
+
+    # ------------------------------------------------------------
+    # Declaraciones
+    # ------------------------------------------------------------
+
+    def function_decl(self) -> None:
+        name = self.fresh("f")
+        arity = self.rng.randint(1, 3)
+        params = [f"p{k}" for k in range(arity)]
+        self.emit(0, f"function {name}({', '.join(p + ': integer' for p in params)}): integer {{")
+        ints = list(params)
+        self.block(ints, 1, self.shape.statements_per_block, in_function=True)
+        self.emit(1, f"return {self.int_expr(ints)};")
+        self.emit(0, "}")
+        self.functions.append((name, arity))
+
+    def class_decl(self) -> None:
+        name = self.fresh("C")
+        # campos con nombre único: el semántico no aísla los de clases hermanas
+        field_name = f"base{self.counter}"
+        self.emit(0, f"class {name} {{")
+        self.emit(1, f"let {field_name}: integer;")
+        self.emit(1, f"function constructor(b: integer) {{ this.{field_name} = b; }}")
+        self.emit(1, f"function get(x: integer): integer {{ return this.{field_name} + x; }}")
+        self.emit(1, f"function twice(): integer {{ return this.{field_name} * 2; }}")
+        self.emit(0, "}")
+        self.classes.append(name)
+
+    def program(self) -> str:
+        for _ in range(self.shape.classes):
+            self.class_decl()
+        for _ in range(self.shape.functions):
+            self.function_decl()
+        ints: List[str] = []
+        for _ in range(self.shape.statements):
+            self.statement(ints, 0, in_function=False)
+        return "\n".join(self.out) + "\n"
+
+
+def generate_program(shape: Optional[ProgramShape] = None, seed: int = 0) -> str:
+    """Programa Compiscript válido con la forma pedida."""
+    return _Gen(shape or ProgramShape(), seed).program()
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Genera un programa Compiscript aleatorio")
+    ap.add_argument("--statements", type=int, default=ProgramShape.statements)
+    ap.add_argument("--functions", type=int, default=ProgramShape.functions)
+    ap.add_argument("--classes", type=int, default=ProgramShape.classes)
+    ap.add_argument("--depth", type=int, default=ProgramShape.max_depth)
+    ap.add_argument("--loops", type=float, default=ProgramShape.loop_ratio)
+    ap.add_argument("--array-size", type=int, default=ProgramShape.array_size)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+    shape = ProgramShape(
+        statements=args.statements, functions=args.functions, classes=args.classes,
+        max_depth=args.depth, loop_ratio=args.loops, array_size=args.array_size,
+    )
+    print(generate_program(shape, args.seed), end="")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,92 @@
+"""
+Benchmark de la fase TAC: costo de armar y concatenar el código emitido.
+
+Corre lex/parse/semántica una vez por programa y mide solo
+TacGenerator.visit (mejor de --repeat) y el pico de memoria de esa fase
+(tracemalloc, en una pasada aparte). Los casos "nested-*" anidan bloques:
+cada instrucción del cuerpo más interno sube por todos los niveles, que
+es donde se nota si el código se copia por nivel o se enlaza.
+
+Uso (desde la raíz del repo):
+    python benchmarks/tac_emission.py
+    python benchmarks/tac_emission.py --repeat 5 --output tac_emission.json
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+for path in (ROOT, ROOT / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from benchmarks.scaling import shape_for  # noqa: E402
+from benchmarks.synth import generate_program  # noqa: E402
+from pipeline import compile_source  # noqa: E402
+from intermediate.tac_generator import TacGenerator  # noqa: E402
+
+
+def nested(depth: int, body: int) -> str:
+    stmts = "x = x + 1;\nprint(x);\n" * body
+    return ("let x: integer = 0;\n" + "while (x < 100000) {\n" * depth
+            + stmts + "}\n" * depth)
+
+
+def cases() -> Dict[str, str]:
+    return {
+        "synth-100": generate_program(shape_for(100)),
+        "synth-400": generate_program(shape_for(400)),
+        "nested-50x400": nested(50, 400),
+        "nested-250x4000": nested(250, 4000),
+    }
+
+
+def measure(name: str, source: str, repeat: int = 3) -> Dict[str, object]:
+    result = compile_source(source, stop_after="semantic")
+    assert not result.errors, (name, result.errors[:3])
+    sem = result.semantic
+
+    def generate():
+        gen = TacGenerator(sem.table, sem.resolved_symbols, sem.types)
+        gen.visit(result.tree)
+        return gen
+
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        gen = generate()
+        best = min(best, time.perf_counter() - t)
+    tracemalloc.start()
+    generate()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"case": name, "tac_ms": best * 1000, "peak_kib": peak / 1024,
+            "instructions": len(gen.code)}
+
+
+def run(repeat: int = 3) -> List[Dict[str, object]]:
+    return [measure(name, source, repeat) for name, source in cases().items()]
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Tiempo y memoria de la generación de TAC")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--output", help="escribe el reporte JSON aquí")
+    args = ap.parse_args(argv)
+
+    rows = run(args.repeat)
+    print(f"{'caso':<16} {'TAC ms':>9} {'pico KiB':>10} {'instr':>8}")
+    for r in rows:
+        print(f"{r['case']:<16} {r['tac_ms']:>9.1f} {r['peak_kib']:>10.0f} {r['instructions']:>8}")
+    if args.output:
+        Path(args.output).write_text(json.dumps(rows, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
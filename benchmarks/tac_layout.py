@@ -0,0 +1,104 @@
+"""
+Benchmark de la representación de las instrucciones TAC.
+
+Por programa: bytes por instrucción de la lista de TACOP ya generada y
+tiempo de las pasadas del backend que recorren el TAC comparando `op`
+(build_cfg, liveness_analysis por función y emit_mips completo, mejor de
+--repeat). Los bytes se miden con tracemalloc al deserializar una copia
+(pickle): instancias + operandos, respetando qué strings están compartidos.
+
+Uso (desde la raíz del repo):
+    python benchmarks/tac_layout.py
+    python benchmarks/tac_layout.py --repeat 5 --output tac_layout.json
+"""
+
+import argparse
+import json
+import pickle
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+for path in (ROOT, ROOT / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from benchmarks.scaling import shape_for  # noqa: E402
+from benchmarks.synth import generate_program  # noqa: E402
+from pipeline import compile_source, emit_mips  # noqa: E402
+from intermediate.cfg import build_cfg  # noqa: E402
+from code_generator.pre_analysis import identify_functions, liveness_analysis  # noqa: E402
+
+
+def cases() -> Dict[str, str]:
+    return {
+        "synth-100": generate_program(shape_for(100)),
+        "synth-400": generate_program(shape_for(400)),
+    }
+
+
+def bytes_per_instruction(tac: List) -> float:
+    blob = pickle.dumps(tac)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    copy = pickle.loads(blob)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    assert len(copy) == len(tac)
+    return used / len(tac)
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best * 1000
+
+
+def measure(name: str, source: str, repeat: int = 3) -> Dict[str, object]:
+    result = compile_source(source, stop_after="tac")
+    assert not result.errors, (name, result.errors[:3])
+    tac = result.tac
+    funcs = [info.tac_ops for info in identify_functions(tac).values()]
+
+    def liveness():
+        for body in funcs:
+            liveness_analysis(body)
+
+    return {
+        "case": name,
+        "instructions": len(tac),
+        "bytes_per_instr": bytes_per_instruction(tac),
+        "cfg_ms": best_of(lambda: build_cfg(tac), repeat),
+        "liveness_ms": best_of(liveness, repeat),
+        "backend_ms": best_of(lambda: emit_mips(tac, result.frame_manager), repeat),
+    }
+
+
+def run(repeat: int = 3) -> List[Dict[str, object]]:
+    return [measure(name, source, repeat) for name, source in cases().items()]
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Memoria por instrucción TAC y tiempo de las pasadas del backend")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--output", help="escribe el reporte JSON aquí")
+    args = ap.parse_args(argv)
+
+    rows = run(args.repeat)
+    print(f"{'caso':<12} {'instr':>7} {'B/instr':>8} {'cfg ms':>8} {'live ms':>8} {'backend ms':>11}")
+    for r in rows:
+        print(f"{r['case']:<12} {r['instructions']:>7} {r['bytes_per_instr']:>8.0f} "
+              f"{r['cfg_ms']:>8.1f} {r['liveness_ms']:>8.1f} {r['backend_ms']:>11.1f}")
+    if args.output:
+        Path(args.output).write_text(json.dumps(rows, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""
+Latencia del primer request de CompilerServer en frío y con warmup.
+
+Cada medición corre en un proceso nuevo (los DFA de ANTLR son globales del
+proceso): arranca la app con TestClient, que ejecuta el lifespan igual que
+uvicorn antes de abrir el puerto, y mide los primeros requests a /asm.
+
+  - "cold": COMPILER_WARMUP=0
+  - "warm": warmup con src/warmup_corpus (default del servidor)
+
+Uso (desde la raíz del repo):
+    python benchmarks/warmup.py
+    python benchmarks/warmup.py --runs 5 --output warmup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+
+# Requests que se miden, en orden: el primero paga el arranque en frío
+REQUESTS = [
+    ROOT / "benchmarks" / "programs" / "classes.cps",
+    ROOT / "benchmarks" / "programs" / "loops.cps",
+    ROOT / "benchmarks" / "programs" / "strings.cps",
+]
+
+
+def _child() -> None:
+    """Mide dentro de un proceso nuevo e imprime el resultado como JSON."""
+    sys.path.insert(0, str(SRC))
+    from fastapi.testclient import TestClient
+
+    t = time.perf_counter()
+    import CompilerServer
+    with TestClient(CompilerServer.app) as client:
+        startup = time.perf_counter() - t
+        latencies = []
+        for path in REQUESTS:
+            source = path.read_text(encoding="utf-8")
+            t = time.perf_counter()
+            resp = client.post("/asm", json={"source": source})
+            latencies.append(time.perf_counter() - t)
+            assert resp.status_code == 200 and not resp.json()["errors"], path
+    print(json.dumps({"startup": startup, "requests": latencies}))
+
+
+def measure(mode: str) -> Dict[str, object]:
+    env = dict(os.environ, COMPILER_WARMUP="0" if mode == "cold" else "1")
+    out = subprocess.run(
+        [sys.executable, __file__, "--child"],
+        env=env, cwd=str(ROOT), capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def run(runs: int = 3) -> dict:
+    report = {}
+    for mode in ("cold", "warm"):
+        samples = [measure(mode) for _ in range(runs)]
+        report[mode] = {
+            "startup": statistics.median(s["startup"] for s in samples),
+            "requests": [statistics.median(s["requests"][i] for s in samples)
+                         for i in range(len(REQUESTS))],
+        }
+    return report
+
+
+def _summary(report: dict) -> str:
+    names = [p.name for p in REQUESTS]
+    lines = [f"{'modo':<6} {'arranque ms':>12} " + " ".join(f"{n:>14}" for n in names)]
+    for mode, r in report.items():
+        lines.append(f"{mode:<6} {r['startup'] * 1000:>12.1f} "
+                     + " ".join(f"{t * 1000:>14.1f}" for t in r["requests"]))
+    cold, warm = report["cold"]["requests"][0], report["warm"]["requests"][0]
+    lines.append(f"primer request: {cold * 1000:.1f} ms en frío -> {warm * 1000:.1f} ms con warmup "
+                 f"(x{cold / warm:.1f})")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Primer request en frío vs con warmup")
+    ap.add_argument("--runs", type=int, default=3, help="procesos por modo (se toma la mediana)")
+    ap.add_argument("--output", help="escribe el reporte JSON aquí")
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.child:
+        _child()
+        return 0
+    report = run(args.runs)
+    print(_summary(report))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
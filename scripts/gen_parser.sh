@@ -0,0 +1,12 @@
+#!/usr/bin/env bash
+# scripts/gen_parser.sh
+# Regenera src/parser/ (lexer, parser, listener y visitor de Python) desde
+# Compiscript.g4. Usa el jar de ANTLR de la imagen de Docker; otro jar con
+# ANTLR_JAR=/ruta/antlr-complete.jar y otro java con JAVA=/ruta/java.
+set -e
+cd "$(dirname "$0")/.."
+ANTLR_JAR="${ANTLR_JAR:-/usr/local/lib/antlr-4.13.1-complete.jar}"
+JAVA="${JAVA:-java}"
+echo "[GEN_PARSER] Compiscript.g4 -> src/parser/ ($(basename "$ANTLR_JAR"))"
+"$JAVA" -jar "$ANTLR_JAR" -Dlanguage=Python3 -visitor -listener \
+    -Xexact-output-dir -o src/parser Compiscript.g4
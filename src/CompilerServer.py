@@ -1,25 +1,145 @@
 # src/CompilerServer.py
-from antlr4 import *
-from antlr4.error.ErrorListener import ErrorListener
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import List, Literal
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
+from contextlib import asynccontextmanager
+import contextvars
+import os
 import re
+import threading
+import time
 
-from parser.CompiscriptLexer import CompiscriptLexer
-from parser.CompiscriptParser import CompiscriptParser
-from semantic.ast_and_semantic import AstAndSemantic
-from intermediate.tac_generator import TacGenerator
-from code_generator.mips_generator import MIPSCodeGenerator
+from pipeline import compile_source, emit_mips, stream_mips, warm_up
+from compile_trace import CompileTrace
+from function_cache import FunctionCache
+from code_generator.mips_simulator import run_asm, MIPSSimulationError
+from metrics import Registry, CONTENT_TYPE, process_rss_bytes
 
 
-app = FastAPI()
+# COMPILER_WARMUP=0 desactiva el warmup (ej. para medir el arranque en frío)
+WARMUP = os.environ.get("COMPILER_WARMUP", "1") != "0"
+
+# Límites de /run: el cliente elige max_instructions pero nunca más que
+# RUN_MAX_INSTRUCTIONS; la salida y el heap (sbrk) también se acotan
+RUN_MAX_INSTRUCTIONS = int(os.environ.get("COMPILER_RUN_MAX_INSTRUCTIONS", "10000000"))
+RUN_MAX_OUTPUT = int(os.environ.get("COMPILER_RUN_MAX_OUTPUT", str(1 << 20)))
+RUN_MAX_HEAP = int(os.environ.get("COMPILER_RUN_MAX_HEAP", str(64 << 20)))
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # Corre antes de que uvicorn abra el puerto: el primer request ya
+    # encuentra los DFA de ANTLR construidos
+    if WARMUP:
+        times = warm_up()
+        WARMUP_SECONDS.set(sum(times.values()))
+        print(f"[WARMUP] {len(times)} programas en {sum(times.values()) * 1000:.0f} ms")
+    yield
+
+
+app = FastAPI(lifespan=_lifespan)
+
+# ========================================
+# MÉTRICAS (GET /metrics)
+# ========================================
+
+REGISTRY = Registry()
+REQUESTS = REGISTRY.counter(
+    "compiler_requests_total", "Requests atendidos por endpoint y status HTTP", ("endpoint", "status"))
+REQUEST_LATENCY = REGISTRY.histogram(
+    "compiler_request_duration_seconds", "Latencia de cada request por endpoint", ("endpoint",))
+PHASE_LATENCY = REGISTRY.histogram(
+    "compiler_phase_duration_seconds", "Duración de cada fase de compilación", ("phase",))
+IN_FLIGHT = REGISTRY.gauge(
+    "compiler_requests_in_flight", "Requests recibidos que todavía no terminan")
+QUEUE_DEPTH = REGISTRY.gauge(
+    "compiler_queue_depth", "Requests recibidos que esperan un worker del threadpool")
+CACHE_REQUESTS = REGISTRY.counter(
+    "compiler_cache_requests_total", "Consultas a caches del servidor (hit/miss)", ("cache", "result"))
+COMPILE_ERRORS = REGISTRY.counter(
+    "compiler_errors_total", "Compilaciones con errores por etapa", ("stage",))
+PARSES = REGISTRY.counter(
+    "compiler_parses_total", "Parses por modo (sll o ll_fallback, ver pipeline.parse_program)", ("mode",))
+WARMUP_SECONDS = REGISTRY.gauge(
+    "compiler_warmup_seconds", "Duración del warmup de arranque (corpus en src/warmup_corpus)")
+REGISTRY.gauge(
+    "process_resident_memory_bytes", "Memoria residente del proceso", function=process_rss_bytes)
+
+_ROUTES = {"/", "/diagnostics", "/tac/pretty", "/tac/quadruplet", "/asm", "/asm/stream", "/run"}
+
+# Marca por request de "todavía en cola": la pone el middleware y la apaga
+# el handler al arrancar (los handlers sync corren en el threadpool, que
+# hereda el contexto del request)
+_queued: contextvars.ContextVar = contextvars.ContextVar("queued", default=None)
+
+
+def _mark_started() -> None:
+    flag = _queued.get()
+    if flag is not None and flag[0]:
+        flag[0] = False
+        QUEUE_DEPTH.dec()
+
+
+@app.middleware("http")
+async def _metrics_middleware(request: Request, call_next):
+    if request.url.path == "/metrics":
+        return await call_next(request)
+    endpoint = request.url.path if request.url.path in _ROUTES else "other"
+    flag = [True]
+    _queued.set(flag)
+    QUEUE_DEPTH.inc()
+    IN_FLIGHT.inc()
+    start = time.perf_counter()
+    status = "500"
+    try:
+        response = await call_next(request)
+        status = str(response.status_code)
+        return response
+    finally:
+        if flag[0]:
+            flag[0] = False
+            QUEUE_DEPTH.dec()
+        IN_FLIGHT.dec()
+        REQUESTS.inc(endpoint=endpoint, status=status)
+        REQUEST_LATENCY.observe(time.perf_counter() - start, endpoint=endpoint)
+
+
+def _observe_trace(trace: CompileTrace) -> None:
+    phases = trace.phase_times()
+    for phase, seconds in phases.items():
+        PHASE_LATENCY.observe(seconds, phase=phase)
+    if "parse" in phases:
+        PARSES.inc(mode="ll_fallback" if trace.counters.get("parse.ll_fallback") else "sll")
+    for kind in ("tac", "asm"):
+        for result in ("hit", "miss"):
+            n = trace.counters.get(f"cache.{kind}_{result}s", 0)
+            if n:
+                CACHE_REQUESTS.inc(n, cache=f"function_{kind}", result=result)
+
+
+# TAC / asm por función (function_cache.py): una edición en el IDE solo
+# regenera las funciones que cambiaron
+FUNCTION_CACHE = FunctionCache()
 
 class InputCode(BaseModel):
     source: str
 class OutputCode(BaseModel):
     result: str
     errors: List[str] = []
+    # tiempos por fase y contadores (solo con ?trace=json|chrome)
+    trace: Optional[dict] = None
+    # top-N y stacks colapsados (solo con ?profile=1|sample|cprofile)
+    profile: Optional[dict] = None
+
+class RunInput(BaseModel):
+    source: str
+    max_instructions: int = Field(default=1_000_000, gt=0)
+class RunOutput(BaseModel):
+    output: str = ""
+    exit_reason: str = ""
+    stats: dict = {}
+    errors: List[str] = []
 
 class Errors(BaseModel):
     line: int
@@ -27,131 +147,94 @@ class Errors(BaseModel):
     severity: Literal["error", "warning"]
 class Diagnostics(BaseModel):
     diagnostics: List[Errors]
+    trace: Optional[dict] = None
+    profile: Optional[dict] = None
 
-class ErrorCollector(ErrorListener):
-    def __init__(self):
-        super(ErrorCollector, self).__init__()
-        self.errors = []
+TraceFormat = Optional[Literal["json", "chrome"]]
+# "1" = "sample" (profiler por muestreo con flamegraph)
+ProfileMode = Optional[Literal["1", "sample", "cprofile"]]
+# Si está definido, los stacks colapsados (.folded) se guardan aquí
+PROFILE_DIR = os.environ.get("COMPILER_PROFILE_DIR")
 
-    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
-        self.errors.append(f"[Line {line}] {msg}")
+def _trace_payload(trace: Optional[CompileTrace], fmt: Optional[str]) -> Optional[dict]:
+    if trace is None:
+        return None
+    return trace.to_chrome_trace() if fmt == "chrome" else trace.to_dict()
 
 def compile_asm_driver(
-    code: str
-)->str:
-    # Lexic/Syntax
-    input_stream = InputStream(code)
-    lexer = CompiscriptLexer(input_stream)
-    lexer_error_listener = ErrorCollector()
-    lexer.removeErrorListeners()
-    lexer.addErrorListener(lexer_error_listener)
-    
-    ## 2. Semantic Analysis
-    stream = CommonTokenStream(lexer)
-    parser = CompiscriptParser(stream)
-    parser_error_listener = ErrorCollector()
-    parser.removeErrorListeners()
-    parser.addErrorListener(parser_error_listener)
-
-    tree = parser.program()
-
-    # 1) Análisis semántico (listeners)
-    walker = ParseTreeWalker()
-    sem_listener = AstAndSemantic()
-    walker.walk(sem_listener, tree)
-
-    all_errors = lexer_error_listener.errors + parser_error_listener.errors + sem_listener.errors
-    if all_errors:
-        return OutputCode(result="== ERRORS ==", errors=all_errors)
-    
-    tac_gen = TacGenerator(sem_listener.table, sem_listener.resolved_symbols)
-    tac_gen.visit(tree)
-    
-    mips_gen = MIPSCodeGenerator(
-        tac_gen.code, tac_gen.frame_manager
-    )
+    code: str,
+    trace: Optional[CompileTrace] = None
+)->OutputCode:
+    result = compile_source(code, stop_after="tac", trace=trace, cache=FUNCTION_CACHE)
+    if result.errors:
+        COMPILE_ERRORS.inc(stage=result.error_stage)
+        return OutputCode(result="== ERRORS ==", errors=result.errors)
 
     try:
-        asm_str = mips_gen.generate()
+        asm_str = emit_mips(result.tac, result.frame_manager, trace=trace, cache=FUNCTION_CACHE)
         return OutputCode(result=str(asm_str), errors=[])
     except Exception as e:
-        return OutputCode(result="", errors=[e])
+        COMPILE_ERRORS.inc(stage="codegen")
+        return OutputCode(result="", errors=[str(e)])
     
+def run_driver(
+    code: str,
+    max_instructions: int
+) -> RunOutput:
+    # Compila a MIPS y lo ejecuta en el simulador con un presupuesto de instrucciones
+    trace = CompileTrace("run")
+    compiled = compile_asm_driver(code, trace=trace)
+    _observe_trace(trace)
+    if compiled.errors:
+        return RunOutput(errors=[str(e) for e in compiled.errors])
+    try:
+        result = run_asm(
+            compiled.result,
+            max_instructions=min(max_instructions, RUN_MAX_INSTRUCTIONS),
+            max_output=RUN_MAX_OUTPUT,
+            max_heap=RUN_MAX_HEAP,
+        )
+    except MIPSSimulationError as e:
+        COMPILE_ERRORS.inc(stage="runtime")
+        return RunOutput(errors=[str(e)])
+    return RunOutput(
+        output=result.output,
+        exit_reason=result.exit_reason,
+        stats=result.stats.to_dict(),
+    )
+
 def compile_tac_driver(
     code:str,
-    mode:str
+    mode:str,
+    trace: Optional[CompileTrace] = None
     ) -> OutputCode:
-    
-    # Lexic/Syntax
-    input_stream = InputStream(code)
-    lexer = CompiscriptLexer(input_stream)
-    lexer_error_listener = ErrorCollector()
-    lexer.removeErrorListeners()
-    lexer.addErrorListener(lexer_error_listener)
-    
-    ## 2. Semantic Analysis
-    stream = CommonTokenStream(lexer)
-    parser = CompiscriptParser(stream)
-    parser_error_listener = ErrorCollector()
-    parser.removeErrorListeners()
-    parser.addErrorListener(parser_error_listener)
-
-    tree = parser.program()
-
-    # 1) Análisis semántico (listeners)
-    walker = ParseTreeWalker()
-    sem_listener = AstAndSemantic()
-    walker.walk(sem_listener, tree)
-
-    all_errors = lexer_error_listener.errors + parser_error_listener.errors + sem_listener.errors
-    if all_errors:
-        return OutputCode(result="== ERRORS ==", errors=all_errors)
-    
-    tac_gen = TacGenerator(sem_listener.table, sem_listener.resolved_symbols)
-    tac_gen.visit(tree)
+    result = compile_source(code, stop_after="tac", trace=trace, cache=FUNCTION_CACHE)
+    if result.errors:
+        COMPILE_ERRORS.inc(stage=result.error_stage)
+        return OutputCode(result="== ERRORS ==", errors=result.errors)
     
     if mode=="pretty":
-        pretty_tac = "\n".join(str(taco) for taco in tac_gen.code)
+        pretty_tac = "\n".join(str(taco) for taco in result.tac)
         return OutputCode(result=str(pretty_tac), errors=[])
     else: 
-        raw_tac = "\n".join(f"{taco.result},{taco.op},{taco.arg1},{taco.arg2}" for taco in tac_gen.code)
+        raw_tac = "\n".join(f"{taco.result},{taco.op},{taco.arg1},{taco.arg2}" for taco in result.tac)
         return OutputCode(result=str(raw_tac), errors=[])
 
 def diagnostics_driver(
-        code: str
+        code: str,
+        trace: Optional[CompileTrace] = None
     )->Diagnostics:
-    # Lexic/Syntax
-    # Lexic/Syntax
-    input_stream = InputStream(code)
-    lexer = CompiscriptLexer(input_stream)
-    lexer_error_listener = ErrorCollector()
-    lexer.removeErrorListeners()
-    lexer.addErrorListener(lexer_error_listener)
-    
-    ## 2. Semantic Analysis
-    stream = CommonTokenStream(lexer)
-    parser = CompiscriptParser(stream)
-    parser_error_listener = ErrorCollector()
-    parser.removeErrorListeners()
-    parser.addErrorListener(parser_error_listener)
-
-    tree = parser.program()
-
-    # 1) Análisis semántico (listeners)
-    walker = ParseTreeWalker()
-    sem_listener = AstAndSemantic()
-    walker.walk(sem_listener, tree)
-
-    all_errors = lexer_error_listener.errors + parser_error_listener.errors + sem_listener.errors
+    result = compile_source(code, stop_after="semantic", trace=trace)
+    if result.errors:
+        COMPILE_ERRORS.inc(stage=result.error_stage)
 
     diags = []
-    if all_errors:
-        for e in all_errors:
-            end_idx = e.index("]")
-            line_str = e[6:end_idx]
-            line = int(line_str.strip())
-            msg = e[end_idx+2:]
-            diags.append(Errors(line=line, message=msg, severity="error"))
+    for e in result.errors:
+        end_idx = e.index("]")
+        line_str = e[6:end_idx]
+        line = int(line_str.strip())
+        msg = e[end_idx+2:]
+        diags.append(Errors(line=line, message=msg, severity="error"))
     
     return Diagnostics(diagnostics=diags)
     
@@ -162,31 +245,101 @@ def root():
     return {"message", "Hello from Compiscript Compiler service!"}
 
 
+def _serve(name: str, fmt: TraceFormat, driver, profile: ProfileMode = None):
+    """Corre `driver(trace)` registrando los tiempos de fase."""
+    _mark_started()
+    tr = CompileTrace(name)
+    if profile:
+        # import diferido: sin ?profile el servidor no paga nada
+        from profiling import profile_call
+        mode = "sample" if profile == "1" else profile
+        out, report = profile_call(lambda: driver(tr), mode=mode, out_dir=PROFILE_DIR, name=name)
+        out.profile = report.to_dict()
+    else:
+        out = driver(tr)
+    _observe_trace(tr)
+    if fmt:
+        out.trace = _trace_payload(tr, fmt)
+    return out
+
+
+def _internal_error(e: Exception) -> HTTPException:
+    COMPILE_ERRORS.inc(stage="internal")
+    return HTTPException(status_code=500, detail=str(e))
+
+
 ## Diagnostic endpoints
 @app.post("/diagnostics", response_model=Diagnostics)
-def test(payload: InputCode):
+def test(payload: InputCode, trace: TraceFormat = None, profile: ProfileMode = None):
     code = payload.source
-    return diagnostics_driver(code)
+    return _serve("diagnostics", trace, lambda tr: diagnostics_driver(code, trace=tr), profile)
 
 
 ## Compile endpoints
 @app.post("/tac/pretty", response_model=OutputCode)
-def generate_tac_pretty(payload: InputCode):
+def generate_tac_pretty(payload: InputCode, trace: TraceFormat = None, profile: ProfileMode = None):
     try: 
-        return compile_tac_driver(payload.source, mode="pretty")
+        return _serve("tac/pretty", trace,
+                      lambda tr: compile_tac_driver(payload.source, mode="pretty", trace=tr), profile)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _internal_error(e)
     
 @app.post("/tac/quadruplet", response_model=OutputCode)
-def generate_tac_pretty(payload: InputCode):
+def generate_tac_pretty(payload: InputCode, trace: TraceFormat = None, profile: ProfileMode = None):
     try: 
-        return compile_tac_driver(payload.source, mode="raw")
+        return _serve("tac/quadruplet", trace,
+                      lambda tr: compile_tac_driver(payload.source, mode="raw", trace=tr), profile)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _internal_error(e)
     
 @app.post("/asm", response_model=OutputCode)
-def generate_tac_pretty(payload: InputCode):
+def generate_tac_pretty(payload: InputCode, trace: TraceFormat = None, profile: ProfileMode = None):
     try: 
-        return compile_asm_driver(payload.source)
+        return _serve("asm", trace,
+                      lambda tr: compile_asm_driver(payload.source, trace=tr), profile)
+    except Exception as e:
+        raise _internal_error(e)
+
+@app.post("/asm/stream")
+def generate_asm_stream(payload: InputCode):
+    """
+    Como /asm, pero el asm sale como text/plain chunked, una función por
+    chunk (code_generator/streaming.py). Los errores del front end vuelven
+    como OutputCode (JSON); los del codegen, ya con la respuesta empezada,
+    como una línea "# ERROR: ..." al final.
+    """
+    _mark_started()
+    try:
+        trace = CompileTrace("asm/stream")
+        result = compile_source(payload.source, stop_after="tac", trace=trace, cache=FUNCTION_CACHE)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise _internal_error(e)
+    if result.errors:
+        COMPILE_ERRORS.inc(stage=result.error_stage)
+        _observe_trace(trace)
+        return OutputCode(result="== ERRORS ==", errors=result.errors)
+
+    def chunks():
+        try:
+            yield from stream_mips(result.tac, result.frame_manager, trace=trace, cache=FUNCTION_CACHE)
+        except Exception as e:
+            COMPILE_ERRORS.inc(stage="codegen")
+            yield f"\n# ERROR: {e}\n"
+        finally:
+            _observe_trace(trace)
+
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+## Execution endpoints
+@app.post("/run", response_model=RunOutput)
+def run_program(payload: RunInput):
+    _mark_started()
+    try:
+        return run_driver(payload.source, payload.max_instructions)
+    except Exception as e:
+        raise _internal_error(e)
+
+## Observability
+@app.get("/metrics")
+def metrics():
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
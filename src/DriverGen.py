@@ -1,29 +1,68 @@
 # src/DriverGen.py
 import sys
-from antlr4 import *
-from antlr4.error.ErrorListener import ErrorListener
-from parser.CompiscriptLexer import CompiscriptLexer
-from parser.CompiscriptParser import CompiscriptParser
-from semantic.ast_and_semantic import AstAndSemantic
 from ast_nodes import create_tree_image, render_ascii
-from intermediate.tac_generator import TacGenerator
+from intermediate.profile import ExecutionProfile, collect_profile, apply_profile
 from code_generator.pre_analysis import MIPSPreAnalysis
-from code_generator.mips_generator import MIPSCodeGenerator
 from symbol_table.runtime_validator import validate_runtime_consistency, dump_runtime_info_json
 from intermediate.cfg import *
+from compile_trace import CompileTrace
+from memory_report import MemoryTrace
+from intermediate.ir_format import iter_tac, parse_tac, read_ir, write_ir
+from pipeline import compile_source, emit_mips, parse_ast, stream_mips
 
-class ErrorCollector(ErrorListener):
-    def __init__(self):
-        super(ErrorCollector, self).__init__()
-        self.errors = []
+def _parse_flags(argv):
+    """--profile-generate <json> | --profile-use <json> | --trace <json> | --lexer antlr|fast | --memory | --ast auto|antlr|pratt | --stream | --buffered-print"""
+    flags = {}
+    rest = []
+    i = 0
+    while i < len(argv):
+        if argv[i] in ("--profile-generate", "--profile-use", "--trace", "--lexer", "--ast") and i + 1 < len(argv):
+            flags[argv[i]] = argv[i + 1]
+            i += 2
+            continue
+        if argv[i] in ("--memory", "--stream", "--buffered-print"):
+            flags[argv[i]] = True
+            i += 1
+            continue
+        rest.append(argv[i])
+        i += 1
+    return rest, flags
 
-    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
-        self.errors.append(f"[Line {line}] {msg}")
+def _backend_only(input_path, flags):
+    """Entrada .ir (o .pretty_tac): solo backend, sin front end."""
+    trace = CompileTrace(input_path)
+    base = input_path.rsplit(".", 1)[0]
+    buffered = "--buffered-print" in flags
+    if "--stream" in flags and input_path.endswith(".pretty_tac"):
+        # línea por línea: ni el TAC ni el asm completos quedan en memoria
+        with open(input_path, encoding="utf-8") as f, open(f"{base}.asm", "w") as pp:
+            for chunk in stream_mips(iter_tac(f), trace=trace, buffered_print=buffered):
+                pp.write(chunk)
+    else:
+        if input_path.endswith(".ir"):
+            module = read_ir(input_path)
+            tac_code, frame_manager = module.tac, module.frame_manager
+        else:
+            # el texto no trae frames: emit_mips usa los offsets por defecto
+            with open(input_path, encoding="utf-8") as f:
+                tac_code, frame_manager = parse_tac(f.read()), None
+        with open(f"{base}.asm", "w") as pp:
+            if "--stream" in flags:
+                for chunk in stream_mips(tac_code, frame_manager, trace=trace, buffered_print=buffered):
+                    pp.write(chunk)
+            else:
+                pp.write(emit_mips(tac_code, frame_manager, trace=trace, buffered_print=buffered))
+    print(trace.summary())
+    if "--trace" in flags:
+        trace.save_chrome_trace(flags["--trace"])
+        print(f"[TRACE] Chrome trace escrito: {flags['--trace']}")
+    return 0
 
 def main(argv):
+    argv, flags = _parse_flags(argv)
     # Param Check
     if len(argv) < 2:
-        print("Uso: python src/DriverGen.py <archivo.cps>")
+        print("Uso: python src/DriverGen.py <archivo.cps|archivo.cps.ir|archivo.cps.pretty_tac> [--profile-generate perfil.json | --profile-use perfil.json] [--trace trace.json] [--lexer antlr|fast] [--memory] [--ast auto|antlr|pratt] [--stream] [--buffered-print]")
         return 1
     
     # Path define
@@ -31,33 +70,38 @@ def main(argv):
     input_path = argv[1]
     pretty_path = f"{input_path}.pretty_tac"
     raw_path = f"{input_path}.raw_tac"
+    ir_path = f"{input_path}.ir"
+
+    # IR ya generado (binario o TAC en texto): directo al backend
+    if input_path.endswith((".ir", ".pretty_tac")):
+        return _backend_only(input_path, flags)
     
-    
-    ## 1. Lexic analysis
-    input_stream = FileStream(input_path, encoding='utf-8')
-    lexer = CompiscriptLexer(input_stream)
-    lexer_error_listener = ErrorCollector()
-    lexer.removeErrorListeners()
-    lexer.addErrorListener(lexer_error_listener)
-    
-    ## 2. Semantic Analysis
-    stream = CommonTokenStream(lexer)
-    parser = CompiscriptParser(stream)
-    parser_error_listener = ErrorCollector()
-    parser.removeErrorListeners()
-    parser.addErrorListener(parser_error_listener)
-
-    tree = parser.program()
-
-    # 1) Análisis semántico (listeners)
-    walker = ParseTreeWalker()
-    sem_listener = AstAndSemantic()
-    walker.walk(sem_listener, tree)
-
-    all_errors = lexer_error_listener.errors + parser_error_listener.errors + sem_listener.errors
-    if all_errors:
+    # Trace de la compilación (tiempos por fase + contadores); con --trace
+    # se escribe en formato Chrome trace (chrome://tracing, Perfetto).
+    # Con --memory además mide memoria por fase con tracemalloc (más lento)
+    with open(input_path, encoding="utf-8") as f:
+        source = f.read()
+    # --ast: solo el front end sintáctico; imprime el AST y termina
+    if "--ast" in flags:
+        program, errors = parse_ast(source, flags["--ast"])
+        for e in errors:
+            print("•", e)
+        if program is not None:
+            print(render_ascii(program))
+        return 1 if errors else 0
+
+    if "--memory" in flags:
+        trace = MemoryTrace(input_path, source_bytes=len(source.encode("utf-8"))).start()
+    else:
+        trace = CompileTrace(input_path)
+
+    ## 1. Lexic / Syntax / Semantic analysis + TAC
+    result = compile_source(source, stop_after="tac", trace=trace, lexer=flags.get("--lexer", "antlr"))
+    sem_listener = result.semantic
+
+    if result.errors:
         print("== ERRORES  ==")
-        for e in all_errors:
+        for e in result.errors:
             print("•", e)
         return 1
 
@@ -91,16 +135,36 @@ def main(argv):
         # print("Symbol table:")
         # sem_listener.table.print_table()
         # print(sem_listener.resolved_symbols)
-        tac_gen = TacGenerator(sem_listener.table, sem_listener.resolved_symbols)
-        # Recorrido del AST (visitor); genera tac y, si corresponde, frames via FrameManager
-        tac_gen.visit(tree)
+        # El TAC ya lo generó el pipeline (visitor); frames via FrameManager
+        tac_gen = result.tac_gen
+        tac_code = tac_gen.code
+        var_priorities = None
+
+        # PGO: build instrumentado (corre el TAC y guarda conteos por bloque)
+        if "--profile-generate" in flags:
+            profile = collect_profile(tac_code)
+            profile.save(flags["--profile-generate"])
+            print(f"[PGO] Perfil escrito: {flags['--profile-generate']} ({profile.steps} pasos)")
+
+        # PGO: build optimizado con un perfil existente
+        if "--profile-use" in flags:
+            profile = ExecutionProfile.load(flags["--profile-use"])
+            tac_code, var_priorities = apply_profile(tac_code, profile)
+            print(f"[PGO] Perfil aplicado: {flags['--profile-use']}")
+
         print("\n== MIPS GENERATION ==")
+        # --buffered-print: salida en buffer del runtime en vez de un syscall por print
+        buffered = "--buffered-print" in flags
         
-        mips_gen = MIPSCodeGenerator(tac_gen.code, tac_gen.frame_manager)
-        asm_str = mips_gen.generate()
-        # print(asm_str)
         with open(f"{input_path}.asm", "w") as pp:
-            pp.write(asm_str)
+            if "--stream" in flags:
+                # cada función se escribe apenas se genera
+                for chunk in stream_mips(tac_code, tac_gen.frame_manager, trace=trace, var_priorities=var_priorities, buffered_print=buffered):
+                    pp.write(chunk)
+            else:
+                asm_str = emit_mips(tac_code, tac_gen.frame_manager, trace=trace, var_priorities=var_priorities, buffered_print=buffered)
+                # print(asm_str)
+                pp.write(asm_str)
         # Ejecutar pre-análisis
         # pre_analysis = MIPSPreAnalysis(tac_gen.code, tac_gen.frame_manager)
         # pre_analysis.analyze()
@@ -109,6 +173,14 @@ def main(argv):
         print(f"[ERROR] Fallo en la generación de TAC: {e}")
         raise
 
+    print(trace.summary())
+    if "--memory" in flags:
+        trace.stop()
+        print(trace.memory_summary())
+    if "--trace" in flags:
+        trace.save_chrome_trace(flags["--trace"])
+        print(f"[TRACE] Chrome trace escrito: {flags['--trace']}")
+
     cfg_ = build_cfg(tac_gen.code)
     print("=== Control Flow Graph ===")
     cfg_ = build_cfg(tac_gen.code)
@@ -160,6 +232,9 @@ def main(argv):
         raw_tac = "\n".join(f"{taco.result},{taco.op},{taco.arg1},{taco.arg2}" for taco in tac_gen.code)
         with open(raw_path, "w") as rp:
             rp.write(raw_tac)
+
+        # IR binario (TAC + frames) para correr el backend sin el front end
+        write_ir(ir_path, tac_gen.code, tac_gen.frame_manager)
         
         
         # if hasattr(tac_gen, "emit_pretty"):
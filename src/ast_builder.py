@@ -0,0 +1,283 @@
+# src/ast_builder.py
+"""
+AstBuilder: parse tree de ANTLR -> ast_nodes (AST sintáctico, sin tipos).
+
+Es el front end "antlr" de pipeline.parse_ast y el oráculo de los tests
+diferenciales del PrattParser (pratt_parser.py): los dos deben producir el
+mismo árbol, con las mismas posiciones, para cualquier programa.
+
+Forma del árbol (igual a la que arma AstAndSemantic donde existe):
+  - sentencia de expresión -> el nodo de la expresión
+  - a[i] = v               -> Assign(dest=a, index=i, value=v)
+  - o.p = v                -> Assign(dest=PropertyAccess(o, p), value=v)
+  - sufijos                -> Call / Indexed / PropertyAccess anidados
+  - cadenas de operadores  -> BinaryOp asociativo a la izquierda
+  - métodos de una clase   -> MethodDecl; atributos -> VarDecl
+Cada nodo lleva la posición de su primer token; `ty` queda en su default
+(lo llena el análisis semántico).
+"""
+
+from antlr4.tree.Tree import TerminalNode
+
+from parser.CompiscriptParser import CompiscriptParser
+from parser.CompiscriptVisitor import CompiscriptVisitor
+from ast_nodes import *
+
+P = CompiscriptParser
+
+
+def _at(node, token):
+    node.line = token.line
+    node.column = token.column
+    return node
+
+
+def literal_value(text: str):
+    """Valor de un token Literal: entero o string sin comillas."""
+    return text[1:-1] if text.startswith('"') else int(text)
+
+
+def array_type(base: str, dims: int) -> Type:
+    ty = Type(base)
+    for _ in range(dims):
+        ty = type_list(ty)
+    return ty
+
+
+def call_name(callee) -> str:
+    return getattr(callee, "name", None) or getattr(callee, "prop", "")
+
+
+def assign_to(lhs, value):
+    """Assign para `lhs = value`; un Indexed se separa en arreglo + índice."""
+    if isinstance(lhs, Indexed):
+        return Assign(dest=lhs.array, index=lhs.index, value=value)
+    return Assign(dest=lhs, value=value)
+
+
+class AstBuilder(CompiscriptVisitor):
+
+    # ========================================
+    # SENTENCIAS
+    # ========================================
+
+    def visitProgram(self, ctx: P.ProgramContext):
+        return Program(body=[self.visit(s) for s in ctx.statement()], line=1, column=0)
+
+    def visitStatement(self, ctx: P.StatementContext):
+        return self.visit(ctx.getChild(0))
+
+    def visitBlock(self, ctx: P.BlockContext):
+        return _at(Block(statements=[self.visit(s) for s in ctx.statement()]), ctx.start)
+
+    def visitVariableDeclaration(self, ctx: P.VariableDeclarationContext):
+        return _at(VarDecl(
+            name=ctx.Identifier().getText(),
+            declared_type=self.visit(ctx.typeAnnotation()) if ctx.typeAnnotation() else None,
+            init=self.visit(ctx.initializer().expression()) if ctx.initializer() else None,
+        ), ctx.start)
+
+    def visitConstantDeclaration(self, ctx: P.ConstantDeclarationContext):
+        return _at(VarDecl(
+            name=ctx.Identifier().getText(),
+            is_const=True,
+            declared_type=self.visit(ctx.typeAnnotation()) if ctx.typeAnnotation() else None,
+            init=self.visit(ctx.expression()),
+        ), ctx.start)
+
+    def visitTypeAnnotation(self, ctx: P.TypeAnnotationContext):
+        return self.visit(ctx.type_())
+
+    def visitType(self, ctx: P.TypeContext):
+        return array_type(ctx.baseType().getText(), (ctx.getChildCount() - 1) // 2)
+
+    def visitAssignment(self, ctx: P.AssignmentContext):
+        if ctx.Identifier() is not None and ctx.getChild(0) is ctx.Identifier():
+            # Identifier '=' expression ';'
+            dest = _at(Identifier(name=ctx.Identifier().getText()), ctx.start)
+            return _at(Assign(dest=dest, value=self.visit(ctx.expression(0))), ctx.start)
+        # expression '.' Identifier '=' expression ';'
+        dest = _at(PropertyAccess(obj=self.visit(ctx.expression(0)), prop=ctx.Identifier().getText()), ctx.start)
+        return _at(Assign(dest=dest, value=self.visit(ctx.expression(1))), ctx.start)
+
+    def visitExpressionStatement(self, ctx: P.ExpressionStatementContext):
+        return self.visit(ctx.expression())
+
+    def visitPrintStatement(self, ctx: P.PrintStatementContext):
+        return _at(PrintStmt(expr=self.visit(ctx.expression())), ctx.start)
+
+    def visitIfStatement(self, ctx: P.IfStatementContext):
+        blocks = ctx.block()
+        return _at(IfStmt(
+            cond=self.visit(ctx.expression()),
+            then_block=self.visit(blocks[0]),
+            else_block=self.visit(blocks[1]) if len(blocks) > 1 else None,
+        ), ctx.start)
+
+    def visitWhileStatement(self, ctx: P.WhileStatementContext):
+        return _at(WhileStmt(cond=self.visit(ctx.expression()), body=self.visit(ctx.block())), ctx.start)
+
+    def visitDoWhileStatement(self, ctx: P.DoWhileStatementContext):
+        return _at(WhileStmt(is_do_while=True, cond=self.visit(ctx.expression()),
+                             body=self.visit(ctx.block())), ctx.start)
+
+    def visitForStatement(self, ctx: P.ForStatementContext):
+        # 'for' '(' (variableDeclaration | assignment | ';') expression? ';' expression? ')' block
+        children = list(ctx.getChildren())
+        init = None if isinstance(children[2], TerminalNode) else self.visit(children[2])
+        i = 3
+        cond = update = None
+        if isinstance(children[i], P.ExpressionContext):
+            cond = self.visit(children[i])
+            i += 1
+        i += 1                                  # ';'
+        if isinstance(children[i], P.ExpressionContext):
+            update = self.visit(children[i])
+        return _at(ForStmt(init=init, cond=cond, update=update, body=self.visit(ctx.block())), ctx.start)
+
+    def visitForeachStatement(self, ctx: P.ForeachStatementContext):
+        item = _at(VarDecl(name=ctx.Identifier().getText()), ctx.Identifier().getSymbol())
+        return _at(ForEachStmt(array=self.visit(ctx.expression()), item=item,
+                               body=self.visit(ctx.block())), ctx.start)
+
+    def visitBreakStatement(self, ctx: P.BreakStatementContext):
+        return _at(BreakStmt(), ctx.start)
+
+    def visitContinueStatement(self, ctx: P.ContinueStatementContext):
+        return _at(ContinueStmt(), ctx.start)
+
+    def visitReturnStatement(self, ctx: P.ReturnStatementContext):
+        expr = self.visit(ctx.expression()) if ctx.expression() else None
+        return _at(ReturnStmt(expr=expr), ctx.start)
+
+    def visitTryCatchStatement(self, ctx: P.TryCatchStatementContext):
+        blocks = ctx.block()
+        return _at(TryCatchStmt(try_block=self.visit(blocks[0]), err_name=ctx.Identifier().getText(),
+                                catch_block=self.visit(blocks[1])), ctx.start)
+
+    def visitSwitchStatement(self, ctx: P.SwitchStatementContext):
+        return _at(SwitchStatement(
+            variable=self.visit(ctx.expression()),
+            cases=[self.visit(c) for c in ctx.switchCase()],
+            default=self.visit(ctx.defaultCase()) if ctx.defaultCase() else None,
+        ), ctx.start)
+
+    def visitSwitchCase(self, ctx: P.SwitchCaseContext):
+        block = _at(Block(statements=[self.visit(s) for s in ctx.statement()]), ctx.start)
+        return _at(SwitchCase(literal=self.visit(ctx.expression()), case_block=block), ctx.start)
+
+    def visitDefaultCase(self, ctx: P.DefaultCaseContext):
+        block = _at(Block(statements=[self.visit(s) for s in ctx.statement()]), ctx.start)
+        return _at(DefaultCase(default_block=block), ctx.start)
+
+    def _function(self, ctx: P.FunctionDeclarationContext, cls):
+        params = []
+        if ctx.parameters():
+            for p in ctx.parameters().parameter():
+                params.append((p.Identifier().getText(), self.visit(p.type_()) if p.type_() else None))
+        return _at(cls(
+            name=ctx.Identifier().getText(),
+            params=params,
+            ret=self.visit(ctx.type_()) if ctx.type_() else None,
+            body=self.visit(ctx.block()),
+        ), ctx.start)
+
+    def visitFunctionDeclaration(self, ctx: P.FunctionDeclarationContext):
+        return self._function(ctx, FuncDecl)
+
+    def visitClassDeclaration(self, ctx: P.ClassDeclarationContext):
+        names = ctx.Identifier()
+        members = []
+        for m in ctx.classMember():
+            if m.functionDeclaration():
+                members.append(self._function(m.functionDeclaration(), MethodDecl))
+            else:
+                members.append(self.visit(m.getChild(0)))
+        return _at(ClassDecl(name=names[0].getText(), members=members,
+                             parent=names[1].getText() if len(names) > 1 else None), ctx.start)
+
+    # ========================================
+    # EXPRESIONES
+    # ========================================
+
+    def visitExpression(self, ctx: P.ExpressionContext):
+        return self.visit(ctx.assignmentExpr())
+
+    def visitAssignExpr(self, ctx: P.AssignExprContext):
+        return _at(assign_to(self.visit(ctx.lhs), self.visit(ctx.assignmentExpr())), ctx.start)
+
+    def visitPropertyAssignExpr(self, ctx: P.PropertyAssignExprContext):
+        dest = _at(PropertyAccess(obj=self.visit(ctx.lhs), prop=ctx.Identifier().getText()), ctx.start)
+        return _at(Assign(dest=dest, value=self.visit(ctx.assignmentExpr())), ctx.start)
+
+    def visitExprNoAssign(self, ctx: P.ExprNoAssignContext):
+        return self.visit(ctx.conditionalExpr())
+
+    def visitTernaryExpr(self, ctx: P.TernaryExprContext):
+        cond = self.visit(ctx.operatorExpr())
+        if ctx.getChildCount() == 1:
+            return cond
+        return _at(TernaryExpr(cond=cond, then_expr=self.visit(ctx.expression(0)),
+                               else_expr=self.visit(ctx.expression(1))), ctx.start)
+
+    def _binary(self, ctx):
+        # operatorExpr op operatorExpr; la recursión izquierda ya asocia
+        return _at(BinaryOp(op=ctx.op.text, left=self.visit(ctx.operatorExpr(0)),
+                            right=self.visit(ctx.operatorExpr(1))), ctx.start)
+
+    visitLogicalOrExpr = _binary
+    visitLogicalAndExpr = _binary
+    visitEqualityExpr = _binary
+    visitRelationalExpr = _binary
+    visitAdditiveExpr = _binary
+    visitMultiplicativeExpr = _binary
+
+    def visitUnaryExpr(self, ctx: P.UnaryExprContext):
+        return _at(UnaryOp(op=ctx.getChild(0).getText(), expr=self.visit(ctx.operatorExpr())), ctx.start)
+
+    def visitOperandExpr(self, ctx: P.OperandExprContext):
+        return self.visit(ctx.primaryExpr())
+
+    def visitPrimaryExpr(self, ctx: P.PrimaryExprContext):
+        if ctx.expression():
+            return self.visit(ctx.expression())
+        return self.visit(ctx.getChild(0))
+
+    def visitLiteralExpr(self, ctx: P.LiteralExprContext):
+        if ctx.arrayLiteral():
+            return self.visit(ctx.arrayLiteral())
+        text = ctx.getText()
+        value = {"null": None, "true": True, "false": False}.get(text, text)
+        if value is text:
+            value = literal_value(text)
+        return _at(Literal(value=value), ctx.start)
+
+    def visitArrayLiteral(self, ctx: P.ArrayLiteralContext):
+        return _at(ArrayLiteral(elements=[self.visit(e) for e in ctx.expression()]), ctx.start)
+
+    def visitLeftHandSide(self, ctx: P.LeftHandSideContext):
+        node = self.visit(ctx.primaryAtom())
+        for sfx in ctx.suffixOp():
+            if isinstance(sfx, P.CallExprContext):
+                args = [self.visit(e) for e in sfx.arguments().expression()] if sfx.arguments() else []
+                node = Call(name=call_name(node), callee=node, args=args)
+            elif isinstance(sfx, P.IndexExprContext):
+                node = Indexed(name="*" + getattr(node, "name", ""), array=node, index=self.visit(sfx.expression()))
+            else:
+                node = PropertyAccess(obj=node, prop=sfx.Identifier().getText())
+            _at(node, ctx.start)
+        return node
+
+    def visitIdentifierExpr(self, ctx: P.IdentifierExprContext):
+        return _at(Identifier(name=ctx.getText()), ctx.start)
+
+    def visitNewExpr(self, ctx: P.NewExprContext):
+        args = [self.visit(e) for e in ctx.arguments().expression()] if ctx.arguments() else []
+        return _at(NewExpr(class_name=ctx.Identifier().getText(), args=args), ctx.start)
+
+    def visitThisExpr(self, ctx: P.ThisExprContext):
+        return _at(ThisExpr(), ctx.start)
+
+
+def build_ast(tree: P.ProgramContext) -> Program:
+    return AstBuilder().visit(tree)
@@ -46,6 +46,11 @@ def index(array: Type):
 @dataclass
 class ASTNode:
     ty: Type = field(default_factory=lambda: ERROR)
+    # Posición del primer token del nodo (línea desde 1, columna desde 0).
+    # Solo por keyword y fuera de __eq__: dos árboles iguales pueden venir
+    # de front ends distintos
+    line: int = field(default=0, kw_only=True, compare=False, repr=False)
+    column: int = field(default=0, kw_only=True, compare=False, repr=False)
 
 
 @dataclass
@@ -99,6 +104,12 @@ class ArrayLiteral(ASTNode):
     ty: Type = ERROR
     elements: List['ASTNode'] = field(default_factory=list)
 
+@dataclass
+class TernaryExpr(ASTNode):
+    cond: 'ASTNode' = None  # type: ignore
+    then_expr: 'ASTNode' = None  # type: ignore
+    else_expr: 'ASTNode' = None  # type: ignore
+
 @dataclass
 class UnaryOp(ASTNode):
     op: str = ""
@@ -129,10 +140,10 @@ class WhileStmt(ASTNode):
 
 @dataclass
 class ForStmt(ASTNode):
-    # init: Optional['ASTNode'] = None
     cond: 'ASTNode' = None
     update: 'ASTNode' = None
     body: Block= None
+    init: Optional['ASTNode'] = None    # VarDecl o Assign
 
 @dataclass
 class ForEachStmt(ASTNode):
@@ -140,6 +151,12 @@ class ForEachStmt(ASTNode):
     item: 'ASTNode' = None
     body: Block = None    
 
+@dataclass
+class TryCatchStmt(ASTNode):
+    try_block: Block = None  # type: ignore
+    err_name: str = ""
+    catch_block: Block = None  # type: ignore
+
 @dataclass
 class ReturnStmt(ASTNode):
     expr: Optional['ASTNode'] = None
@@ -218,7 +235,9 @@ def _label(n: ASTNode) -> str:
     if isinstance(n, Block):       return "Block"
     if isinstance(n, VarDecl): declared = f"{n.declared_type}" if n.declared_type else "—"; inferred = f"{n.ty}"; return f"VarDecl name={n.name} const={n.is_const} declared={declared} ty={inferred}" #cuando declared is None mejor rotular inferred=integer en la etiqueta para más slay
     if isinstance(n, Assign):
-        return f"Assign ty={n.dest.ty} '{n.dest.name}'{f' at {n.index.value!r}' if n.index else ''}"
+        dest = getattr(n.dest, "name", None) or getattr(n.dest, "prop", type(n.dest).__name__)
+        at = f" at {getattr(n.index, 'value', type(n.index).__name__)!r}" if n.index else ""
+        return f"Assign ty={n.dest.ty} '{dest}'{at}"
     if isinstance(n, BinaryOp):    return f"BinaryOp '{n.op}' ty={n.ty}"
     if isinstance(n, UnaryOp):     return f"UnaryOp '{n.op}' ty={n.ty}"
     if isinstance(n, Identifier):  return f"Identifier {n.name} ty={n.ty}"
@@ -227,7 +246,8 @@ def _label(n: ASTNode) -> str:
         elems = [(str(el.ty)) for el in n.elements]
         return f"ArrayLiteral elements={elems}"
     if isinstance(n, Indexed):
-        return f"Indexed {n.name} ty={str(n.ty)} at index {n.index.value}"
+        return f"Indexed {n.name} ty={str(n.ty)} at index {getattr(n.index, 'value', '…')}"
+    if isinstance(n, TernaryExpr): return f"TernaryExpr ty={n.ty}"
 
     if isinstance(n, PrintStmt):   return "PrintStmt"
     if isinstance(n, IfStmt):      return "IfStmt"
@@ -239,10 +259,11 @@ def _label(n: ASTNode) -> str:
     if isinstance(n, ForStmt):
         return f"ForLoop "
     if isinstance(n, ReturnStmt):  return "ReturnStmt"
+    if isinstance(n, TryCatchStmt): return f"TryCatchStmt catch({n.err_name})"
     if isinstance(n, FuncDecl):
         ps = ", ".join(f"{p}:{t}" for p, t in n.params)
         return f"FuncDecl {n.name}({ps}) : {n.ret}"
-    if isinstance(n, Call):        return f"Call {n.callee.name}() ty={n.ty}"
+    if isinstance(n, Call):        return f"Call {n.name}() ty={n.ty}"
     if isinstance(n, ClassDecl):   return f"ClassDecl {n.name}"
     if isinstance(n, MethodDecl):
         ps = ", ".join(f"{p}:{t}" for p, t in n.params)
@@ -253,15 +274,17 @@ def _label(n: ASTNode) -> str:
     return type(n).__name__
 
 def render_ascii(root: ASTNode) -> str:
+    # pila explícita (no recursión): ASTs muy profundos no llegan al límite
     lines = []
-    def dfs(node: ASTNode, prefix: str="", is_last: bool=True):
+    stack = [(root, "", True)]
+    while stack:
+        node, prefix, is_last = stack.pop()
         connector = "└─ " if is_last else "├─ "
         lines.append(prefix + connector + _label(node))
         children = list(_iter_children(node))
-        for idx, (_, ch) in enumerate(children):
-            last = (idx == len(children) - 1)
-            dfs(ch, prefix + ("   " if is_last else "│  "), last)
-    dfs(root)
+        child_prefix = prefix + ("   " if is_last else "│  ")
+        for idx in range(len(children) - 1, -1, -1):
+            stack.append((children[idx][1], child_prefix, idx == len(children) - 1))
     return "\n".join(lines)
 
 def create_tree_image(root: ASTNode, out_basename: str = "ast", fmt: str = "png") -> str:
@@ -287,15 +310,15 @@ def create_tree_image(root: ASTNode, out_basename: str = "ast", fmt: str = "png"
             counter += 1
             return f"n{counter}"
 
-        def walk(n: ASTNode) -> str:
+        # preorden con pila explícita: (nodo, id del padre, nombre del campo)
+        stack = [(root, None, None)]
+        while stack:
+            n, parent, child_name = stack.pop()
             me = new_id()
             g.node(me, safe_label(n))
-            for child_name, ch in _iter_children(n):
-                child = walk(ch)
-                g.edge(me, child, label=child_name)
-            return me
-
-        walk(root)
+            if parent is not None:
+                g.edge(parent, me, label=child_name)
+            stack.extend((ch, me, name) for name, ch in reversed(list(_iter_children(n))))
         # Nota: render lanza si no está el binario 'dot' instalado
         out_path = g.render(filename=out_basename, cleanup=True)  # crea p.ej. ast.png
         return out_path
@@ -320,15 +343,15 @@ def create_tree_image(root: ASTNode, out_basename: str = "ast", fmt: str = "png"
             ids[key] = nid
             return nid
 
-        def walk_text(n: ASTNode):
+        stack = [root]
+        while stack:
+            n = stack.pop()
             me = get_id(n)
             dot_lines.append(f'  {me} [label="{safe_label(n)}"];')
-            for _, ch in _iter_children(n):
-                ce = get_id(ch)
-                dot_lines.append(f"  {me} -> {ce};")
-                walk_text(ch)
-
-        walk_text(root)
+            children = [ch for _, ch in _iter_children(n)]
+            for ch in children:
+                dot_lines.append(f"  {me} -> {get_id(ch)};")
+            stack.extend(reversed(children))
         dot_lines.append("}")
 
         dot_path = out_basename + ".dot"
@@ -9,15 +9,20 @@ This module uses:
 The goal is to provide a simple but structured translation from a small
 subset of TAC operations to runnable MIPS code for MARS.
 """
+import hashlib
 import pprint
 from dataclasses import dataclass
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Callable, Dict, List, Set, Tuple, Optional
 
-from intermediate.tac_nodes import TACOP
+from intermediate.tac_nodes import TACOP, TacOp, ARITHMETIC_OPS, RELATIONAL_OPS
+from intermediate.operands import BoolConst, IntConst, Operand, StrConst
 from symbol_table.runtime_layout import FrameManager
 from code_generator.pre_analysis import MIPSPreAnalysis
 from code_generator.procedure_manager import ProcedureManager, FrameInfo, generate_asm_file
 from code_generator.register_allocator import RegisterAllocator
+from code_generator.runtime_lib import runtime_text, runtime_data
+from compile_trace import CompileTrace, NULL_TRACE
+from function_cache import FORMAT_VERSION, AsmEntry, FunctionCache
 
 
 @dataclass
@@ -66,19 +71,63 @@ class MIPSCodeGenerator:
         asm_text = gen.generate()
     """
 
-    def __init__(self, tac_code: List[TACOP], frame_manager: Optional[FrameManager] = None):
+    def __init__(
+        self,
+        tac_code: List[TACOP],
+        frame_manager: Optional[FrameManager] = None,
+        buffered_print: bool = False,
+        var_priorities: Optional[Dict[str, Dict[str, int]]] = None,
+        trace: Optional[CompileTrace] = None,
+        cache: Optional[FunctionCache] = None,
+    ):
+        """
+        Args:
+            tac_code: TAC completo del programa
+            frame_manager: layout de frames del TacGenerator
+            buffered_print: si es True los print escriben en un buffer del
+                runtime (__rt_print_int / __rt_print_str) que se vacía en
+                bloques y al salir; si es False (default), un syscall por
+                print. Es opcional: formatear enteros en MIPS usa div por
+                dígito y en el simulador cuesta más que el syscall 1.
+            var_priorities: pesos por función/variable de un perfil
+                (intermediate.profile.apply_profile); guían los spills.
+            trace: CompileTrace para tiempos del pre-análisis y del codegen
+                y contadores (funciones, spills, líneas de asm).
+            cache: FunctionCache con fragmentos ya generados; las funciones
+                que pegan no pasan por liveness ni por el codegen.
+        """
+        self.trace = trace or NULL_TRACE
         self.tac_code = tac_code
+        self.buffered_print = buffered_print
+        self.var_priorities = var_priorities or {}
         self.frame_manager = frame_manager or FrameManager()
-        self.pre = MIPSPreAnalysis(tac_code, self.frame_manager)
+        self.pre = MIPSPreAnalysis(tac_code, self.frame_manager, trace=self.trace)
         self.proc_manager = ProcedureManager(self.frame_manager)
         
         self.string_temps: Dict[str, str] = {}
+        # Rutinas de runtime_lib que el programa necesita
+        self.runtime_used: Set[str] = set()
+        # label del descriptor -> label de sus caracteres (.asciiz); se
+        # completa desde pre.str_encoder, que en streaming crece por función
+        self._string_chars: Dict[str, str] = {}
+        self._emitters = self._build_emitters()
+        self.cache = cache
+        # función -> clave del fragmento / fragmento reusado del cache
+        self._fragment_keys: Dict[str, str] = {}
+        self._cached: Dict[str, AsmEntry] = {}
 
         
     # ------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------
 
+    def analyze(self) -> None:
+        """
+        Pre-análisis. Con cache, las funciones cuyo fragmento ya está no
+        pasan por liveness (ver _lookup_fragment).
+        """
+        self.pre.analyze(skip=self._lookup_fragment if self.cache is not None else None)
+
     def generate(self) -> str:
         """
         Run pre-analysis and then translate every function TAC block into MIPS.
@@ -87,43 +136,123 @@ class MIPSCodeGenerator:
             Complete .asm program as a single string.
         """
         # 1) Run pre-analysis (functions, frame sizes, liveness, saved regs)
-        self.pre.analyze()
+        #    unless the caller already ran it (e.g. to time it separately)
+        if not self.pre.functions:
+            with self.trace.span("pre_analysis"):
+                self.analyze()
 
         functions_payload: List[Tuple[str, List[str], bool]] = []
 
         # 2) Generate body for each function
         var_offsets = {}
         funcs_saved : Dict[str, set] = {}
+        runtime_used: Set[str] = set()
         for func_name in self.pre.get_all_functions():
-            func_tac, frame_info, liveness, _saved_regs = self.pre.get_function_info(func_name)
-            funcs_saved[func_name] = _saved_regs
-            var_offsets = {**var_offsets, **_gen_offsets_from_tac(func_tac)}
-            ctx = FunctionCodegenContext(
-                name=func_name,
-                frame_info=frame_info,
-                liveness=liveness,
-                body=[],
-                reg_alloc=RegisterAllocator(
-                    base_pointer="$fp",
-                    var_offsets=var_offsets[func_name])
-            )
-
-            self._generate_function_body(ctx, func_tac)
-
-            has_return = any(op.op == "return" for op in func_tac)
-            functions_payload.append((func_name, ctx.body, has_return))
+            entry = self._cached.get(func_name)
+            if entry is None:
+                entry = self._generate_function(func_name)
+            else:
+                self.pre.frame_infos[func_name].uses_saved_regs = set(entry.saved_regs)
+            var_offsets[func_name] = dict(entry.var_offsets)
+            funcs_saved[func_name] = set(entry.saved_regs)
+            runtime_used |= entry.runtime_used
+            functions_payload.append((func_name, list(entry.body), entry.has_return))
+        self.runtime_used = runtime_used
 
         # 3) Use ProcedureManager helper to assemble a complete .asm
         asm_text = generate_asm_file(
             functions=functions_payload,
-            data_section=self.pre.data_section,
+            data_section=self.pre.data_section + runtime_data(self.runtime_used),
             procedure_manager=self.proc_manager,
             var_offsets=var_offsets,
-            funcs_saved = funcs_saved
-            
+            funcs_saved = funcs_saved,
+            runtime_section=runtime_text(self.runtime_used),
+            flush_output="__rt_flush" in self.runtime_used
         )
+        self.trace.set("asm.lines", asm_text.count("\n") + 1)
         return asm_text
 
+    def _generate_function(self, func_name: str) -> AsmEntry:
+        """
+        Cuerpo MIPS de una función ya pre-analizada (sin prólogo/epílogo),
+        con lo que el ensamblado final necesita de ella. Si hay cache, lo
+        guarda ahí.
+        """
+        func_tac, frame_info, liveness, saved_regs = self.pre.get_function_info(func_name)
+        var_offsets = _gen_offsets_from_tac(func_tac).get(func_name, {})
+        ctx = FunctionCodegenContext(
+            name=func_name,
+            frame_info=frame_info,
+            liveness=liveness,
+            body=[],
+            reg_alloc=RegisterAllocator(
+                base_pointer="$fp",
+                var_offsets=var_offsets,
+                priorities=self.var_priorities.get(func_name),
+                trace=self.trace)
+        )
+
+        # estado por función: el fragmento no depende de las anteriores
+        self.string_temps = {}
+        self.runtime_used = set()
+        with self.trace.span("codegen.function", function=func_name):
+            self._generate_function_body(ctx, func_tac)
+
+        entry = AsmEntry(
+            body=tuple(ctx.body),
+            has_return=any(op.op == "return" for op in func_tac),
+            saved_regs=frozenset(saved_regs),
+            var_offsets=var_offsets,
+            runtime_used=frozenset(self.runtime_used),
+        )
+        key = self._fragment_keys.pop(func_name, None)
+        if key is not None:
+            self.cache.put_asm(key, entry)
+        return entry
+
+    # ------------------------------------------------------------
+    # Per-function cache (function_cache.py)
+    # ------------------------------------------------------------
+
+    def _fragment_key(self, func_name: str, func_tac: List[TACOP]) -> str:
+        """
+        Hash de todo lo que lee el codegen de una función: su TAC (labels y
+        temporales son locales a la función), los labels de sus strings, los
+        arreglos estáticos que puede copiar y sus prioridades de registros.
+        """
+        h = hashlib.sha1(f"asm{FORMAT_VERSION}\0{func_name}\0{self.buffered_print}\0".encode())
+        strings, arrays = [], set()
+        for tac in func_tac:
+            h.update(str(tac).encode())
+            h.update(b"\n")
+            for operand in (tac.arg1, tac.arg2):
+                if isinstance(operand, StrConst):
+                    strings.append(self.pre.str_encoder[operand]["id"])
+            if tac.opcode is TacOp.STATIC_ARRAY:
+                arrays.add(tac.arg1)
+        pending = list(arrays)
+        while pending:
+            for w in self.pre.static_arrays.get(pending.pop(), ()):
+                if w in self.pre.static_arrays and w not in arrays:
+                    arrays.add(w)
+                    pending.append(w)
+        h.update(repr(strings).encode())
+        h.update(repr(sorted((a, self.pre.static_arrays.get(a)) for a in arrays)).encode())
+        h.update(repr(sorted(self.var_priorities.get(func_name, {}).items())).encode())
+        return h.hexdigest()
+
+    def _lookup_fragment(self, func_name: str, info) -> bool:
+        """skip de MIPSPreAnalysis.analyze: True si el fragmento ya está en el cache."""
+        key = self._fragment_key(func_name, info.tac_ops)
+        cached = self.cache.get_asm(key)
+        if cached is None:
+            self._fragment_keys[func_name] = key
+            self.trace.count("cache.asm_misses")
+            return False
+        self._cached[func_name] = cached
+        self.trace.count("cache.asm_hits")
+        return True
+
     # ------------------------------------------------------------
     # Core codegen for a single function
     # ------------------------------------------------------------
@@ -133,56 +262,59 @@ class MIPSCodeGenerator:
         Translate every TAC operation of a function into MIPS, storing lines
         in ctx.body.
         """
+        emitters = self._emitters
         for index, tac in enumerate(func_tac):
             live_out = ctx.liveness.get(index, set())
 
-            if tac.op == "fn_decl":
+            if tac.opcode is TacOp.FN_DECL:
                 # The ProcedureManager will generate labels + prologue.
                 # Here we only leave a helpful comment.
                 ctx.body.append(f"    # Function {tac.result} body")
                 continue
 
+            emit = emitters.get(tac.opcode)
+            if emit is not None:
+                emit(ctx, tac, live_out)
+            else:
+                # For unsupported ops, emit a comment so it is visible in output.
+                ctx.body.append(f"    # TODO: unsupported TAC op {tac.op} ({tac})")
+
+    def _build_emitters(self) -> Dict[TacOp, Callable[[FunctionCodegenContext, TACOP, Set[str]], None]]:
+        """
+        Tabla opcode -> emisor(ctx, tac, live_out) que usa
+        _generate_function_body (un lookup por instrucción en vez de la
+        cadena de comparaciones de strings).
+        """
+        emitters = {
             # Assignment / movement
-            if tac.op == "=":
-                self._emit_assign(ctx, tac, live_out)
-            # Arithmetic
-            elif tac.op in "+-*/%":
-                self._emit_arithmetic(ctx, tac, live_out)
-            # Relational / logical (boolean result in result)
-            elif tac.op in {"==", "!=", "<", "<=", ">", ">=", "&&", "||"}:
-                self._emit_relop(ctx, tac, live_out)
+            TacOp.ASSIGN: self._emit_assign,
+            # Strings
+            TacOp.CONCAT: lambda ctx, tac, live: self._emit_string_op(ctx, tac, live, "__rt_str_concat"),
+            TacOp.STR_EQ: lambda ctx, tac, live: self._emit_string_op(ctx, tac, live, "__rt_str_eq"),
+            TacOp.STR_NE: lambda ctx, tac, live: self._emit_string_op(ctx, tac, live, "__rt_str_eq"),
             # Control flow
-            elif tac.op == "label":
-                self._emit_label(ctx, tac)
-            elif tac.op == "goto":
-                self._emit_goto(ctx, tac)
-            elif tac.op == "if-goto":
-                self._emit_if_goto(ctx, tac, live_out)
-            elif tac.op == "return":
-                self._emit_return(ctx, tac, live_out)
+            TacOp.LABEL: lambda ctx, tac, live: self._emit_label(ctx, tac),
+            TacOp.GOTO: lambda ctx, tac, live: self._emit_goto(ctx, tac),
+            TacOp.IF_GOTO: self._emit_if_goto,
+            TacOp.RETURN: self._emit_return,
             # Parameters push
-            elif tac.op == "push_param":
-                self._emit_push_param(ctx, tac, live_out)
-            elif tac.op == "load_param":
-                self._emit_load_param(ctx, tac, live_out)
-            elif tac.op == "print":
-                self._emit_print(ctx, tac, live_out, False)
-            elif tac.op == "print_s":
-                self._emit_print(ctx, tac, live_out, True)
-            elif tac.op == "call":
-                self._emit_call(ctx, tac, live_out)
+            TacOp.PUSH_PARAM: self._emit_push_param,
+            TacOp.LOAD_PARAM: self._emit_load_param,
+            TacOp.PRINT: lambda ctx, tac, live: self._emit_print(ctx, tac, live, False),
+            TacOp.PRINT_S: lambda ctx, tac, live: self._emit_print(ctx, tac, live, True),
+            TacOp.CALL: self._emit_call,
             # Arrays and clases
-            elif tac.op == "CREATE_ARRAY":
-                self._emit_create_array(ctx, tac, live_out)
-            elif tac.op == "alloc":
-                self._emit_alloc(ctx, tac, live_out)
-            elif tac.op == "load":
-                self._emit_load(ctx, tac, live_out)
-            elif tac.op == "store":
-                self._emit_store(ctx, tac, live_out)
-            else:
-                # For unsupported ops, emit a comment so it is visible in output.
-                ctx.body.append(f"    # TODO: unsupported TAC op {tac.op} ({tac})")
+            TacOp.CREATE_ARRAY: self._emit_create_array,
+            TacOp.STATIC_ARRAY: self._emit_static_array,
+            TacOp.ALLOC: self._emit_alloc,
+            TacOp.LOAD: self._emit_load,
+            TacOp.STORE: self._emit_store,
+        }
+        # Arithmetic
+        emitters.update(dict.fromkeys(ARITHMETIC_OPS, self._emit_arithmetic))
+        # Relational / logical (boolean result in result)
+        emitters.update(dict.fromkeys(RELATIONAL_OPS | {TacOp.AND, TacOp.OR}, self._emit_relop))
+        return emitters
 
     # ------------------------------------------------------------
     # Helpers: literal detection
@@ -192,6 +324,8 @@ class MIPSCodeGenerator:
     def _is_int_literal(value: Optional[str]) -> bool:
         if value is None:
             return False
+        if isinstance(value, Operand):
+            return type(value) is IntConst
         try:
             int(value)
             return True
@@ -218,7 +352,7 @@ class MIPSCodeGenerator:
             ctx.reg_alloc.mark_written(reg)
             return
         
-        if src in ("true", "false"):
+        if isinstance(src, BoolConst):
             val = "1" if src == "true" else "0"
             reg, pre = ctx.reg_alloc.get_register_for(dest, live_out, for_read=False, for_write=True)
             ctx.body.extend(pre)
@@ -238,7 +372,7 @@ class MIPSCodeGenerator:
         #     ctx.body.append(f"    # {dest} = (str){src} -> {data_label}")
         #     return
 
-        if isinstance(src, str) and src.startswith('"'):
+        if isinstance(src, StrConst):
             data_info = self.pre.str_encoder.get(src)
             if data_info is None:
                 ctx.body.append(f"    # WARNING: string literal {src} no encontrado en str_encoder")
@@ -281,7 +415,7 @@ class MIPSCodeGenerator:
                 ctx.body.append(f"    move {dest}, {reg}")
                 ctx.param_counter+=1
                 return
-            if src in ("true", "false"):
+            if isinstance(src, BoolConst):
                 val = "1" if src == "true" else "0"
                 reg, pre = ctx.reg_alloc.get_register_for(f"param[{pcount}]", live_out, for_read=False, for_write=True)
                 ctx.body.extend(pre)
@@ -343,6 +477,51 @@ class MIPSCodeGenerator:
         ctx.body.append(f"    # == END CREATE ARRAY == #\n")
         ctx.reg_alloc.mark_written(dest_reg)
         
+    def _emit_static_array(self, ctx, tac, live_out):
+        """
+        t = STATIC_ARRAY label [cow]
+        - sin cow: t apunta directo al .data (nadie lo escribe)
+        - cow: copia profunda al heap con __rt_array_copy; los sub-arreglos
+          anidados se copian también y se enlazan en la copia del padre
+        """
+        dest = tac.result
+        label = tac.arg1
+
+        dest_reg, pre = ctx.reg_alloc.get_register_for(dest, live_out, for_read=False, for_write=True)
+        ctx.body.extend(pre)
+
+        if tac.arg2 != "cow":
+            ctx.body.append(f"    la {dest_reg}, {label}    # {dest} = &{label} (static)")
+            ctx.reg_alloc.mark_written(dest_reg)
+            return
+
+        self.runtime_used.add("__rt_array_copy")
+        ctx.body.append(f"\n    # == COPY STATIC ARRAY ({dest} <- {label}) == #")
+        ctx.body.append(f"    la $a0, {label}")
+        ctx.body.append(f"    jal __rt_array_copy")
+        ctx.body.append(f"    move {dest_reg}, $v0    # {dest} = copy({label})")
+
+        # Hijos en pre-orden: el padre ya está copiado cuando se enlaza el hijo
+        pending = [((), label)]
+        while pending:
+            path, lbl = pending.pop()
+            words = self.pre.static_arrays.get(lbl, [])
+            children = [
+                (path + (i,), w) for i, w in enumerate(words[1:])
+                if w in self.pre.static_arrays
+            ]
+            pending.extend(reversed(children))
+            if not path:
+                continue
+            ctx.body.append(f"    la $a0, {lbl}")
+            ctx.body.append(f"    jal __rt_array_copy")
+            ctx.body.append(f"    move $v1, {dest_reg}")
+            for idx in path[:-1]:
+                ctx.body.append(f"    lw $v1, {4 * (idx + 1)}($v1)")
+            ctx.body.append(f"    sw $v0, {4 * (path[-1] + 1)}($v1)    # {dest}{''.join(f'[{i}]' for i in path)} = copy({lbl})")
+        ctx.body.append(f"    # == END COPY STATIC ARRAY == #\n")
+        ctx.reg_alloc.mark_written(dest_reg)
+
     def _emit_alloc(self, ctx: FunctionCodegenContext, tac: TACOP, live_out: Set[str]) -> None:
         """
         alloc result, arg1
@@ -408,20 +587,24 @@ class MIPSCodeGenerator:
     # ====================
     
     def _emit_print(self, ctx, tac, live_out, is_str):
+        if self.buffered_print:
+            self._emit_buffered_print(ctx, tac, live_out, is_str)
+            return
         src = tac.arg1
         if is_str:
             # Intentamos primero usar el mapeo temp -> label, generado en _emit_assign
             label = self.string_temps.get(src)
 
             if label is not None:
-                # No usamos RegisterAllocator: cargamos la etiqueta directo
+                # No usamos RegisterAllocator: cargamos los chars del literal
+                chars = self._chars_label(label)
                 ctx.body.append(f"    li $v0, 4    # print string")
-                ctx.body.append(f"    la $a0, {label}    # print({src})")
+                ctx.body.append(f"    la $a0, {chars}    # print({src})")
                 ctx.body.append(f"    syscall")
                 return
 
-            # Fallback por si algún día tienes strings dinámicos o algo raro:
-            # usa el allocator, como antes.
+            # String dinámico (concat): sus chars no terminan en 0; el
+            # runtime los termina un momento y hace el syscall directo.
             src_reg, pre1 = ctx.reg_alloc.get_register_for(
                 src,
                 live_out,
@@ -429,9 +612,9 @@ class MIPSCodeGenerator:
                 for_write=False
             )
             ctx.body.extend(pre1)
-            ctx.body.append(f"    li $v0, 4    # print string (fallback)")
+            self.runtime_used.add("__rt_print_str_direct")
             ctx.body.append(f"    move $a0, {src_reg}    # print({src_reg})")
-            ctx.body.append(f"    syscall")
+            ctx.body.append(f"    jal __rt_print_str_direct")
             return
 
         # -------- Caso normal: print int (igual que ya lo tenías) --------
@@ -451,6 +634,38 @@ class MIPSCodeGenerator:
             #     f"    li {preg}, $v0    # ret of {fname}()"
             # )
     
+    def _chars_label(self, label: str) -> str:
+        """Label de los caracteres (.asciiz) del descriptor `label`."""
+        if label not in self._string_chars:
+            self._string_chars = {
+                info["id"]: info["chars"] for info in self.pre.str_encoder.values()
+            }
+        return self._string_chars[label]
+
+    def _emit_buffered_print(self, ctx, tac, live_out, is_str):
+        """
+        print / print_s sobre el buffer del runtime: un jal por print y un
+        solo syscall cada vez que se llena el buffer (y al salir, ver
+        generate_main_wrapper).
+        """
+        src = tac.arg1
+        routine = "__rt_print_str" if is_str else "__rt_print_int"
+        self.runtime_used.update((routine, "__rt_flush"))
+
+        label = self.string_temps.get(src) if is_str else None
+        if label is not None:
+            ctx.body.append(f"    la $a0, {label}    # print({src})")
+        else:
+            src_reg, pre1 = ctx.reg_alloc.get_register_for(
+                src,
+                live_out,
+                for_read=True,
+                for_write=False
+            )
+            ctx.body.extend(pre1)
+            ctx.body.append(f"    move $a0, {src_reg}    # print({src})")
+        ctx.body.append(f"    jal {routine}")
+
     def _emit_arithmetic(self, ctx: FunctionCodegenContext, tac: TACOP, live_out: Set[str]) -> None:
         op = tac.op
         a = tac.arg1
@@ -690,6 +905,34 @@ class MIPSCodeGenerator:
         ctx.body.append(f"    {mips_op} {reg_dest}, {reg_a}, {reg_b}    # {dest} = {a} {op} {b}")
         ctx.reg_alloc.mark_written(reg_dest)
 
+    def _emit_string_op(self, ctx, tac, live_out, routine):
+        """
+        concat / str_eq / str_ne: los dos operandos van en $a0/$a1 y el
+        runtime deja el resultado en $v0 (descriptor o 0/1).
+        """
+        dest = tac.result
+        a = tac.arg1
+        b = tac.arg2
+        if dest is None or a is None or b is None:
+            return
+        self.runtime_used.add(routine)
+
+        reg_a, pre1 = ctx.reg_alloc.get_register_for(a, live_out, for_read=True, for_write=False)
+        ctx.body.extend(pre1)
+        ctx.body.append(f"    move $a0, {reg_a}    # {a}")
+        reg_b, pre2 = ctx.reg_alloc.get_register_for(b, live_out, for_read=True, for_write=False)
+        ctx.body.extend(pre2)
+        ctx.body.append(f"    move $a1, {reg_b}    # {b}")
+        ctx.body.append(f"    jal {routine}")
+
+        reg_dest, pre3 = ctx.reg_alloc.get_register_for(dest, live_out, for_read=False, for_write=True)
+        ctx.body.extend(pre3)
+        if tac.op == "str_ne":
+            ctx.body.append(f"    xori {reg_dest}, $v0, 1    # {dest} = {a} != {b}")
+        else:
+            ctx.body.append(f"    move {reg_dest}, $v0    # {dest} = {a} {tac.op} {b}")
+        ctx.reg_alloc.mark_written(reg_dest)
+
     def _emit_label(self, ctx: FunctionCodegenContext, tac: TACOP) -> None:
         label = tac.result or tac.arg1
         if label:
@@ -0,0 +1,982 @@
+"""
+Simulador MIPS (subconjunto) en Python puro.
+
+Ejecuta el .asm que producen MIPSCodeGenerator / ProcedureManager sin
+depender de MARS, para poder medir el código generado en tests y en CI.
+
+Cubre:
+- directivas .data/.text, .word (incluye `valor:n`), .half, .byte, .space,
+  .ascii, .asciiz, .align, .globl
+- instrucciones reales de MIPS32 que emite el backend y las pseudo
+  instrucciones de MARS que usamos (li, la, move, seq, sne, sle, sgt, sge,
+  b, beqz, bnez, blt, bgt, ble, bge, div/rem de 3 operandos, ...)
+- syscalls 1 (print int), 4 (print string), 9 (sbrk), 10 (exit),
+  11 (print char) y 17 (exit2)
+
+Cada instrucción se decodifica una sola vez a un closure; el loop principal
+solo despacha y lleva las estadísticas (ExecutionStats).
+
+Uso:
+    result = run_asm(asm_text, max_instructions=1_000_000)
+    result.output, result.stats.instructions, result.stats.cycles
+
+max_output (bytes impresos) y max_heap (bytes pedidos con sbrk) acotan lo
+que un programa puede consumir además de las instrucciones; el servidor
+los usa para /run.
+"""
+
+import re
+from dataclasses import dataclass, field, asdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+# ========================================
+# LAYOUT DE MEMORIA (igual que MARS)
+# ========================================
+
+TEXT_BASE = 0x00400000
+DATA_BASE = 0x10010000
+HEAP_BASE = 0x10040000
+STACK_TOP = 0x7FFFEFFC
+GP_INIT = 0x10008000
+
+_MASK = 0xFFFFFFFF
+
+
+def _s32(value: int) -> int:
+    """Trunca a 32 bits con signo."""
+    value &= _MASK
+    return value - 0x100000000 if value & 0x80000000 else value
+
+
+def _u32(value: int) -> int:
+    return value & _MASK
+
+
+class MIPSSimulationError(Exception):
+    """Error al ensamblar o ejecutar el programa."""
+
+
+class _Halt(Exception):
+    def __init__(self, code: int = 0, reason: str = "exit"):
+        self.code = code
+        self.reason = reason
+
+
+# ========================================
+# REGISTROS
+# ========================================
+
+_REG_NAMES = [
+    "zero", "at", "v0", "v1", "a0", "a1", "a2", "a3",
+    "t0", "t1", "t2", "t3", "t4", "t5", "t6", "t7",
+    "s0", "s1", "s2", "s3", "s4", "s5", "s6", "s7",
+    "t8", "t9", "k0", "k1", "gp", "sp", "fp", "ra",
+]
+REGISTERS: Dict[str, int] = {f"${name}": i for i, name in enumerate(_REG_NAMES)}
+REGISTERS.update({f"${i}": i for i in range(32)})
+REGISTERS["$s8"] = 30
+
+
+# ========================================
+# ESTADÍSTICAS
+# ========================================
+
+# Clases de instrucción para el conteo dinámico
+INSTRUCTION_CLASSES = ("alu", "muldiv", "load", "store", "branch", "jump", "syscall")
+_ALU, _MULDIV, _LOAD, _STORE, _BRANCH, _JUMP, _SYSCALL = range(len(INSTRUCTION_CLASSES))
+
+
+@dataclass
+class PipelineModel:
+    """
+    Modelo simple de un pipeline clásico de 5 etapas (sin delay slots):
+      - CPI base de 1 y `fill_cycles` para llenar el pipeline
+      - load-use: la instrucción que usa el resultado de un load inmediato
+        anterior espera `load_use_stall` ciclos
+      - saltos tomados y jumps pierden `taken_penalty` ciclos
+      - mul / div ocupan la unidad de multiplicación ciclos extra
+    """
+    fill_cycles: int = 4
+    load_use_stall: int = 1
+    taken_penalty: int = 1
+    mul_extra: int = 2
+    div_extra: int = 31
+
+
+@dataclass
+class ExecutionStats:
+    instructions: int = 0
+    by_class: Dict[str, int] = field(default_factory=dict)
+    loads: int = 0
+    stores: int = 0
+    branches: int = 0
+    branches_taken: int = 0
+    jumps: int = 0
+    syscalls: int = 0
+    load_use_stalls: int = 0
+    cycles: int = 0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class SimulationResult:
+    output: str
+    stats: ExecutionStats
+    exit_reason: str          # "exit" | "end" | "budget" | "output"
+    exit_code: int = 0
+
+
+# ========================================
+# MEMORIA
+# ========================================
+
+class Memory:
+    """Memoria dispersa por páginas de 4 KiB, little-endian (como MARS)."""
+
+    PAGE_BITS = 12
+    PAGE_SIZE = 1 << PAGE_BITS
+
+    def __init__(self):
+        self.pages: Dict[int, bytearray] = {}
+
+    def _page(self, addr: int) -> bytearray:
+        page_no = addr >> self.PAGE_BITS
+        page = self.pages.get(page_no)
+        if page is None:
+            page = self.pages[page_no] = bytearray(self.PAGE_SIZE)
+        return page
+
+    def load_word(self, addr: int) -> int:
+        addr &= _MASK
+        if addr & 3:
+            raise MIPSSimulationError(f"lw no alineado en {addr:#010x}")
+        off = addr & (self.PAGE_SIZE - 1)
+        return int.from_bytes(self._page(addr)[off:off + 4], "little", signed=True)
+
+    def store_word(self, addr: int, value: int) -> None:
+        addr &= _MASK
+        if addr & 3:
+            raise MIPSSimulationError(f"sw no alineado en {addr:#010x}")
+        off = addr & (self.PAGE_SIZE - 1)
+        self._page(addr)[off:off + 4] = (value & _MASK).to_bytes(4, "little")
+
+    def load_half(self, addr: int, signed: bool) -> int:
+        addr &= _MASK
+        if addr & 1:
+            raise MIPSSimulationError(f"lh no alineado en {addr:#010x}")
+        off = addr & (self.PAGE_SIZE - 1)
+        return int.from_bytes(self._page(addr)[off:off + 2], "little", signed=signed)
+
+    def store_half(self, addr: int, value: int) -> None:
+        addr &= _MASK
+        if addr & 1:
+            raise MIPSSimulationError(f"sh no alineado en {addr:#010x}")
+        off = addr & (self.PAGE_SIZE - 1)
+        self._page(addr)[off:off + 2] = (value & 0xFFFF).to_bytes(2, "little")
+
+    def load_byte(self, addr: int) -> int:
+        addr &= _MASK
+        return self._page(addr)[addr & (self.PAGE_SIZE - 1)]
+
+    def store_byte(self, addr: int, value: int) -> None:
+        addr &= _MASK
+        self._page(addr)[addr & (self.PAGE_SIZE - 1)] = value & 0xFF
+
+    def write_bytes(self, addr: int, data: bytes) -> None:
+        for i, b in enumerate(data):
+            self.store_byte(addr + i, b)
+
+    def read_cstring(self, addr: int, limit: int = 1 << 20) -> bytes:
+        out = bytearray()
+        while len(out) < limit:
+            b = self.load_byte(addr + len(out))
+            if b == 0:
+                break
+            out.append(b)
+        return bytes(out)
+
+
+# ========================================
+# PARSER DEL .asm
+# ========================================
+
+_ESCAPES = {"n": 10, "t": 9, "r": 13, "0": 0, "\\": 92, '"': 34, "'": 39}
+
+
+def _strip_comment(line: str) -> str:
+    quote = None
+    for i, ch in enumerate(line):
+        if quote:
+            if ch == "\\":
+                continue
+            if ch == quote and line[i - 1] != "\\":
+                quote = None
+        elif ch in ('"', "'"):
+            quote = ch
+        elif ch == "#":
+            return line[:i]
+    return line
+
+
+def _split_operands(text: str) -> List[str]:
+    ops, buf, quote = [], [], None
+    for ch in text:
+        if quote:
+            buf.append(ch)
+            if ch == quote and (len(buf) < 2 or buf[-2] != "\\"):
+                quote = None
+            continue
+        if ch in ('"', "'"):
+            quote = ch
+        if ch == "," and quote is None:
+            ops.append("".join(buf).strip())
+            buf = []
+            continue
+        buf.append(ch)
+    if "".join(buf).strip():
+        ops.append("".join(buf).strip())
+    return ops
+
+
+def _parse_string_literal(text: str) -> bytes:
+    text = text.strip()
+    if len(text) < 2 or text[0] != '"' or text[-1] != '"':
+        raise MIPSSimulationError(f"string inválido: {text}")
+    body = text[1:-1]
+    out = bytearray()
+    i = 0
+    while i < len(body):
+        ch = body[i]
+        if ch == "\\" and i + 1 < len(body):
+            out.append(_ESCAPES.get(body[i + 1], ord(body[i + 1])))
+            i += 2
+            continue
+        out.extend(ch.encode("utf-8"))
+        i += 1
+    return bytes(out)
+
+
+def _parse_int(text: str) -> Optional[int]:
+    text = text.strip()
+    if len(text) >= 3 and text[0] == "'" and text[-1] == "'":
+        inner = text[1:-1]
+        if inner.startswith("\\") and len(inner) == 2:
+            return _ESCAPES.get(inner[1], ord(inner[1]))
+        return ord(inner) if len(inner) == 1 else None
+    try:
+        return int(text, 0)
+    except ValueError:
+        return None
+
+
+_LABEL_RE = re.compile(r"^([A-Za-z_.$][\w.$]*)\s*:(.*)$")
+
+
+@dataclass
+class _RawInstr:
+    mnemonic: str
+    operands: List[str]
+    line_no: int
+    source: str
+
+
+@dataclass
+class MIPSProgram:
+    """Resultado de ensamblar un .asm: instrucciones crudas + datos."""
+    instructions: List[_RawInstr]
+    text_labels: Dict[str, int]          # label -> índice de instrucción
+    data_labels: Dict[str, int]          # label -> dirección
+    data: bytearray
+    data_fixups: List[Tuple[int, str, int]]   # (offset, label, line)
+
+    def address_of(self, label: str) -> int:
+        if label in self.data_labels:
+            return self.data_labels[label]
+        if label in self.text_labels:
+            return TEXT_BASE + 4 * self.text_labels[label]
+        raise MIPSSimulationError(f"label no definido: {label}")
+
+
+def assemble(asm: str) -> MIPSProgram:
+    """
+    Primera pasada: separa .data/.text, resuelve labels y arma la imagen de
+    datos. Los operandos de texto se decodifican después (MIPSSimulator).
+    """
+    instructions: List[_RawInstr] = []
+    text_labels: Dict[str, int] = {}
+    data_labels: Dict[str, int] = {}
+    data = bytearray()
+    fixups: List[Tuple[int, str, int]] = []
+    section = "text"
+    pending: List[str] = []
+
+    def align(n: int):
+        while len(data) % n:
+            data.append(0)
+
+    for line_no, raw in enumerate(asm.splitlines(), start=1):
+        line = _strip_comment(raw).strip()
+        while line:
+            m = _LABEL_RE.match(line)
+            if not m:
+                break
+            pending.append(m.group(1))
+            line = m.group(2).strip()
+        if not line:
+            continue
+
+        parts = line.split(None, 1)
+        head = parts[0]
+        rest = parts[1] if len(parts) > 1 else ""
+        if head in (".data", ".text"):
+            section = head[1:]
+        elif section == "data":
+            # como MARS: .word/.half alinean solos y el label apunta al dato alineado
+            if head in (".word", ".half"):
+                align(4 if head == ".word" else 2)
+            for label in pending:
+                data_labels[label] = DATA_BASE + len(data)
+            pending = []
+        elif not head.startswith("."):
+            for label in pending:
+                text_labels[label] = len(instructions)
+            pending = []
+
+        if head.startswith("."):
+            if head in (".data", ".text"):
+                pass
+            elif head in (".globl", ".global", ".extern", ".eqv"):
+                pass
+            elif section != "data":
+                raise MIPSSimulationError(f"línea {line_no}: directiva {head} fuera de .data")
+            elif head == ".align":
+                align(1 << int(rest.strip() or "0"))
+            elif head == ".space":
+                data.extend(bytes(int(rest.strip(), 0)))
+            elif head in (".ascii", ".asciiz"):
+                data.extend(_parse_string_literal(rest))
+                if head == ".asciiz":
+                    data.append(0)
+            elif head in (".word", ".half", ".byte"):
+                size = {".word": 4, ".half": 2, ".byte": 1}[head]
+                for item in _split_operands(rest):
+                    count = 1
+                    if ":" in item:
+                        item, count_txt = item.rsplit(":", 1)
+                        count = int(count_txt, 0)
+                    value = _parse_int(item)
+                    for _ in range(count):
+                        if value is None:
+                            fixups.append((len(data), item.strip(), line_no))
+                            data.extend(bytes(size))
+                        else:
+                            data.extend((value & ((1 << (8 * size)) - 1)).to_bytes(size, "little"))
+            else:
+                raise MIPSSimulationError(f"línea {line_no}: directiva no soportada {head}")
+            continue
+
+        if section == "data":
+            raise MIPSSimulationError(f"línea {line_no}: instrucción en .data: {line}")
+        instructions.append(_RawInstr(head.lower(), _split_operands(rest), line_no, raw.strip()))
+
+    # labels al final del .text (ej. un epílogo vacío) apuntan al fin del código
+    for label in pending:
+        if section == "data":
+            data_labels[label] = DATA_BASE + len(data)
+        else:
+            text_labels[label] = len(instructions)
+
+    program = MIPSProgram(instructions, text_labels, data_labels, data, fixups)
+    for offset, label, line_no in fixups:
+        try:
+            addr = program.address_of(label)
+        except MIPSSimulationError:
+            raise MIPSSimulationError(f"línea {line_no}: label no definido {label}")
+        data[offset:offset + 4] = addr.to_bytes(4, "little")
+    return program
+
+
+# ========================================
+# DECODIFICACIÓN
+# ========================================
+
+@dataclass
+class _Decoded:
+    fn: Callable                  # fn(regs) -> Optional[int] (próximo pc)
+    cls: int
+    reads: Tuple[int, ...]        # registros leídos (para load-use)
+    load_dest: int = 0            # registro destino si es un load
+    extra_cycles: int = 0
+    line_no: int = 0
+    source: str = ""
+
+
+class MIPSSimulator:
+    """
+    Ejecuta un programa ensamblado. Las instrucciones se decodifican una sola
+    vez a closures; run() es un loop de despacho más el conteo de stats.
+    """
+
+    def __init__(
+        self,
+        asm: str,
+        max_instructions: int = 10_000_000,
+        pipeline: Optional[PipelineModel] = None,
+        max_output: Optional[int] = None,
+        max_heap: Optional[int] = None,
+    ):
+        self.program = assemble(asm)
+        self.max_instructions = max_instructions
+        self.max_output = max_output
+        self.max_heap = max_heap
+        self.pipeline = pipeline or PipelineModel()
+
+        self.regs: List[int] = [0] * 32
+        self.regs[REGISTERS["$sp"]] = STACK_TOP
+        self.regs[REGISTERS["$gp"]] = GP_INIT
+        self.hi = 0
+        self.lo = 0
+        self.memory = Memory()
+        self.memory.write_bytes(DATA_BASE, bytes(self.program.data))
+        self.heap_ptr = HEAP_BASE
+        self.output = bytearray()
+        self._pc = 0
+
+        self.code: List[_Decoded] = [self._decode(ins) for ins in self.program.instructions]
+
+    # ------------------------------------------------------------
+    # Operandos
+    # ------------------------------------------------------------
+
+    def _reg(self, text: str, ins: _RawInstr) -> int:
+        reg = REGISTERS.get(text.strip())
+        if reg is None:
+            raise MIPSSimulationError(f"línea {ins.line_no}: registro inválido '{text}' en: {ins.source}")
+        return reg
+
+    def _imm(self, text: str, ins: _RawInstr) -> int:
+        value = _parse_int(text)
+        if value is None:
+            # MARS permite label / label+off como inmediato (ej. li $t0, label)
+            value = self._label_expr(text, ins)
+        return value
+
+    def _label_expr(self, text: str, ins: _RawInstr) -> int:
+        m = re.match(r"^([A-Za-z_.$][\w.$]*)\s*(?:([+-])\s*(\w+))?$", text.strip())
+        if not m:
+            raise MIPSSimulationError(f"línea {ins.line_no}: operando inválido '{text}' en: {ins.source}")
+        try:
+            addr = self.program.address_of(m.group(1))
+        except MIPSSimulationError:
+            raise MIPSSimulationError(f"línea {ins.line_no}: label no definido '{m.group(1)}'")
+        if m.group(2):
+            off = int(m.group(3), 0)
+            addr += off if m.group(2) == "+" else -off
+        return addr
+
+    def _mem(self, text: str, ins: _RawInstr) -> Tuple[int, int]:
+        """off($reg) | ($reg) | label | label+off | label($reg) -> (reg, offset)"""
+        text = text.strip()
+        m = re.match(r"^(.*)\(\s*(\$\w+)\s*\)$", text)
+        if m:
+            base = self._reg(m.group(2), ins)
+            off_txt = m.group(1).strip()
+            off = 0 if not off_txt else self._imm(off_txt, ins)
+            return base, off
+        return 0, self._imm(text, ins)
+
+    def _target(self, text: str, ins: _RawInstr) -> int:
+        label = text.strip()
+        if label not in self.program.text_labels:
+            raise MIPSSimulationError(f"línea {ins.line_no}: label de salto no definido '{label}'")
+        return self.program.text_labels[label]
+
+    def _is_reg(self, text: str) -> bool:
+        return text.strip() in REGISTERS
+
+    # ------------------------------------------------------------
+    # Decodificador
+    # ------------------------------------------------------------
+
+    def _decode(self, ins: _RawInstr) -> _Decoded:
+        m = ins.mnemonic
+        ops = ins.operands
+        r = self.regs
+        mem = self.memory
+        p = self.pipeline
+
+        def need(n):
+            if len(ops) != n:
+                raise MIPSSimulationError(
+                    f"línea {ins.line_no}: '{m}' espera {n} operandos: {ins.source}"
+                )
+
+        def done(fn, cls, reads=(), load_dest=0, extra=0):
+            return _Decoded(fn, cls, tuple(x for x in reads if x), load_dest, extra, ins.line_no, ins.source)
+
+        # ---------- ALU de 3 operandos (registro o inmediato) ----------
+        if m in _ALU3:
+            need(3)
+            rd = self._reg(ops[0], ins)
+            rs = self._reg(ops[1], ins)
+            func = _ALU3[m]
+            if self._is_reg(ops[2]):
+                rt = self._reg(ops[2], ins)
+
+                def fn(r, rd=rd, rs=rs, rt=rt, func=func):
+                    if rd:
+                        r[rd] = func(r[rs], r[rt])
+                return done(fn, _ALU, (rs, rt))
+            imm = self._imm(ops[2], ins)
+
+            def fn(r, rd=rd, rs=rs, imm=imm, func=func):
+                if rd:
+                    r[rd] = func(r[rs], imm)
+            return done(fn, _ALU, (rs,))
+
+        if m in _SHIFTS:
+            need(3)
+            rd = self._reg(ops[0], ins)
+            rt = self._reg(ops[1], ins)
+            func = _SHIFTS[m]
+            if self._is_reg(ops[2]):
+                rs = self._reg(ops[2], ins)
+
+                def fn(r, rd=rd, rt=rt, rs=rs, func=func):
+                    if rd:
+                        r[rd] = func(r[rt], r[rs] & 31)
+                return done(fn, _ALU, (rt, rs))
+            sh = self._imm(ops[2], ins) & 31
+
+            def fn(r, rd=rd, rt=rt, sh=sh, func=func):
+                if rd:
+                    r[rd] = func(r[rt], sh)
+            return done(fn, _ALU, (rt,))
+
+        # ---------- mul / div ----------
+        if m == "mul":
+            need(3)
+            rd, rs = self._reg(ops[0], ins), self._reg(ops[1], ins)
+            if self._is_reg(ops[2]):
+                rt = self._reg(ops[2], ins)
+
+                def fn(r, rd=rd, rs=rs, rt=rt):
+                    if rd:
+                        r[rd] = _s32(r[rs] * r[rt])
+                return done(fn, _MULDIV, (rs, rt), extra=p.mul_extra)
+            imm = self._imm(ops[2], ins)
+
+            def fn(r, rd=rd, rs=rs, imm=imm):
+                if rd:
+                    r[rd] = _s32(r[rs] * imm)
+            return done(fn, _MULDIV, (rs,), extra=p.mul_extra)
+
+        if m in ("mult", "multu"):
+            need(2)
+            rs, rt = self._reg(ops[0], ins), self._reg(ops[1], ins)
+            signed = m == "mult"
+
+            def fn(r, rs=rs, rt=rt):
+                a, b = (r[rs], r[rt]) if signed else (_u32(r[rs]), _u32(r[rt]))
+                prod = a * b
+                self.lo = _s32(prod)
+                self.hi = _s32(prod >> 32)
+            return done(fn, _MULDIV, (rs, rt), extra=p.mul_extra)
+
+        if m in ("div", "divu", "rem", "remu"):
+            signed = m in ("div", "rem")
+            if len(ops) == 2:
+                # instrucción real: lo = cociente, hi = resto
+                rs, rt = self._reg(ops[0], ins), self._reg(ops[1], ins)
+
+                def fn(r, rs=rs, rt=rt):
+                    self.lo, self.hi = _divmod(r[rs], r[rt], signed, ins)
+                return done(fn, _MULDIV, (rs, rt), extra=p.div_extra)
+            need(3)
+            rd, rs = self._reg(ops[0], ins), self._reg(ops[1], ins)
+            want_rem = m.startswith("rem")
+            if self._is_reg(ops[2]):
+                rt = self._reg(ops[2], ins)
+                get_b = lambda r, rt=rt: r[rt]
+                reads = (rs, rt)
+            else:
+                imm = self._imm(ops[2], ins)
+                get_b = lambda r, imm=imm: imm
+                reads = (rs,)
+
+            def fn(r, rd=rd, rs=rs, get_b=get_b):
+                self.lo, self.hi = _divmod(r[rs], get_b(r), signed, ins)
+                if rd:
+                    r[rd] = self.hi if want_rem else self.lo
+            return done(fn, _MULDIV, reads, extra=p.div_extra)
+
+        if m in ("mfhi", "mflo"):
+            need(1)
+            rd = self._reg(ops[0], ins)
+            if m == "mfhi":
+                def fn(r, rd=rd):
+                    if rd:
+                        r[rd] = self.hi
+            else:
+                def fn(r, rd=rd):
+                    if rd:
+                        r[rd] = self.lo
+            return done(fn, _ALU)
+
+        # ---------- movimiento / constantes ----------
+        if m in ("li", "la"):
+            need(2)
+            rd = self._reg(ops[0], ins)
+            value = _s32(self._imm(ops[1], ins)) if m == "li" else _s32(self._mem_addr_const(ops[1], ins))
+            if m == "la" and "(" in ops[1]:
+                base, off = self._mem(ops[1], ins)
+
+                def fn(r, rd=rd, base=base, off=off):
+                    if rd:
+                        r[rd] = _s32(r[base] + off)
+                return done(fn, _ALU, (base,))
+
+            def fn(r, rd=rd, value=value):
+                if rd:
+                    r[rd] = value
+            return done(fn, _ALU)
+
+        if m == "lui":
+            need(2)
+            rd = self._reg(ops[0], ins)
+            value = _s32(self._imm(ops[1], ins) << 16)
+
+            def fn(r, rd=rd, value=value):
+                if rd:
+                    r[rd] = value
+            return done(fn, _ALU)
+
+        if m in ("move", "neg", "negu", "not", "abs"):
+            need(2)
+            rd, rs = self._reg(ops[0], ins), self._reg(ops[1], ins)
+            func = {
+                "move": lambda a: a,
+                "neg": lambda a: _s32(-a),
+                "negu": lambda a: _s32(-a),
+                "not": lambda a: _s32(~a),
+                "abs": lambda a: _s32(abs(a)),
+            }[m]
+
+            def fn(r, rd=rd, rs=rs, func=func):
+                if rd:
+                    r[rd] = func(r[rs])
+            return done(fn, _ALU, (rs,))
+
+        # ---------- memoria ----------
+        if m in _LOADS:
+            need(2)
+            rd = self._reg(ops[0], ins)
+            base, off = self._mem(ops[1], ins)
+            load = _LOADS[m](mem)
+
+            def fn(r, rd=rd, base=base, off=off, load=load):
+                value = load(r[base] + off)
+                if rd:
+                    r[rd] = value
+            return done(fn, _LOAD, (base,), load_dest=rd)
+
+        if m in _STORES:
+            need(2)
+            rt = self._reg(ops[0], ins)
+            base, off = self._mem(ops[1], ins)
+            store = _STORES[m](mem)
+
+            def fn(r, rt=rt, base=base, off=off, store=store):
+                store(r[base] + off, r[rt])
+            return done(fn, _STORE, (rt, base))
+
+        # ---------- saltos condicionales ----------
+        if m in _BRANCH2:
+            need(3)
+            rs = self._reg(ops[0], ins)
+            target = self._target(ops[2], ins)
+            cond = _BRANCH2[m]
+            if self._is_reg(ops[1]):
+                rt = self._reg(ops[1], ins)
+
+                def fn(r, rs=rs, rt=rt, target=target, cond=cond):
+                    if cond(r[rs], r[rt]):
+                        return target
+                return done(fn, _BRANCH, (rs, rt))
+            imm = self._imm(ops[1], ins)
+
+            def fn(r, rs=rs, imm=imm, target=target, cond=cond):
+                if cond(r[rs], imm):
+                    return target
+            return done(fn, _BRANCH, (rs,))
+
+        if m in _BRANCH1:
+            need(2)
+            rs = self._reg(ops[0], ins)
+            target = self._target(ops[1], ins)
+            cond = _BRANCH1[m]
+
+            def fn(r, rs=rs, target=target, cond=cond):
+                if cond(r[rs]):
+                    return target
+            return done(fn, _BRANCH, (rs,))
+
+        # ---------- saltos incondicionales ----------
+        if m in ("j", "b"):
+            need(1)
+            target = self._target(ops[0], ins)
+            return done(lambda r, target=target: target, _JUMP)
+
+        if m == "jal":
+            need(1)
+            target = self._target(ops[0], ins)
+            def fn(r, target=target):
+                r[31] = TEXT_BASE + 4 * (self._pc + 1)
+                return target
+            return done(fn, _JUMP)
+
+        if m in ("jr", "jalr"):
+            rs = self._reg(ops[0], ins)
+            link = m == "jalr"
+            rd = self._reg(ops[1], ins) if link and len(ops) > 1 else 31
+            ncode = len(self.program.instructions)
+
+            def fn(r, rs=rs):
+                addr = r[rs]
+                if link and rd:
+                    r[rd] = TEXT_BASE + 4 * (self._pc + 1)
+                index = (addr - TEXT_BASE) >> 2
+                if addr & 3 or not 0 <= index <= ncode:
+                    raise MIPSSimulationError(f"jr a dirección inválida {_u32(addr):#010x}")
+                return index
+            return done(fn, _JUMP, (rs,))
+
+        # ---------- otros ----------
+        if m == "syscall":
+            return done(lambda r: self._syscall(r), _SYSCALL, (2, 4))
+
+        if m == "nop":
+            return done(lambda r: None, _ALU)
+
+        if m == "break":
+            def fn(r):
+                raise MIPSSimulationError(f"break en línea {ins.line_no}")
+            return done(fn, _ALU)
+
+        raise MIPSSimulationError(f"línea {ins.line_no}: instrucción no soportada '{m}': {ins.source}")
+
+    def _mem_addr_const(self, text: str, ins: _RawInstr) -> int:
+        if "(" in text:
+            return 0
+        return self._imm(text, ins)
+
+    # ------------------------------------------------------------
+    # Syscalls
+    # ------------------------------------------------------------
+
+    def _syscall(self, r: List[int]) -> None:
+        code = r[2]
+        a0 = r[4]
+        if code == 1:
+            self.output.extend(str(a0).encode())
+        elif code == 4:
+            self.output.extend(self.memory.read_cstring(a0))
+        elif code == 11:
+            self.output.append(a0 & 0xFF)
+        elif code == 9:
+            size = (a0 + 3) & ~3
+            if self.max_heap is not None and self.heap_ptr + size - HEAP_BASE > self.max_heap:
+                raise MIPSSimulationError(f"sbrk: el heap supera el límite de {self.max_heap} bytes")
+            r[2] = self.heap_ptr
+            self.heap_ptr += size
+        elif code == 10:
+            raise _Halt(0)
+        elif code == 17:
+            raise _Halt(a0)
+        else:
+            raise MIPSSimulationError(f"syscall {code} no soportado")
+        if self.max_output is not None and len(self.output) > self.max_output:
+            del self.output[self.max_output:]
+            raise _Halt(0, reason="output")
+
+    # ------------------------------------------------------------
+    # Ejecución
+    # ------------------------------------------------------------
+
+    def run(self) -> SimulationResult:
+        code = self.code
+        ncode = len(code)
+        regs = self.regs
+        budget = self.max_instructions
+        pipeline = self.pipeline
+
+        class_counts = [0] * len(INSTRUCTION_CLASSES)
+        taken = 0
+        stalls = 0
+        extra = 0
+        executed = 0
+        last_load = 0
+
+        pc = self.program.text_labels.get("main", 0)
+        exit_reason, exit_code = "end", 0
+        try:
+            while pc < ncode:
+                if executed >= budget:
+                    exit_reason = "budget"
+                    break
+                ins = code[pc]
+                executed += 1
+                class_counts[ins.cls] += 1
+                if last_load and last_load in ins.reads:
+                    stalls += 1
+                last_load = ins.load_dest
+                extra += ins.extra_cycles
+                self._pc = pc
+                nxt = ins.fn(regs)
+                if nxt is None:
+                    pc += 1
+                else:
+                    if ins.cls == _BRANCH:
+                        taken += 1
+                    pc = nxt
+        except _Halt as halt:
+            exit_reason, exit_code = halt.reason, halt.code
+        except MIPSSimulationError as e:
+            raise MIPSSimulationError(f"{e} (línea {code[pc].line_no}: {code[pc].source})") from None
+
+        stats = ExecutionStats(
+            instructions=executed,
+            by_class={name: class_counts[i] for i, name in enumerate(INSTRUCTION_CLASSES)},
+            loads=class_counts[_LOAD],
+            stores=class_counts[_STORE],
+            branches=class_counts[_BRANCH],
+            branches_taken=taken,
+            jumps=class_counts[_JUMP],
+            syscalls=class_counts[_SYSCALL],
+            load_use_stalls=stalls * pipeline.load_use_stall,
+        )
+        if executed:
+            stats.cycles = (
+                pipeline.fill_cycles
+                + executed
+                + stats.load_use_stalls
+                + pipeline.taken_penalty * (taken + stats.jumps)
+                + extra
+            )
+        return SimulationResult(
+            output=self.output.decode("utf-8", errors="replace"),
+            stats=stats,
+            exit_reason=exit_reason,
+            exit_code=exit_code,
+        )
+
+
+def run_asm(
+    asm: str,
+    max_instructions: int = 10_000_000,
+    max_output: Optional[int] = None,
+    max_heap: Optional[int] = None,
+) -> SimulationResult:
+    """Ensambla y ejecuta `asm`; atajo para tests y el servidor."""
+    return MIPSSimulator(
+        asm, max_instructions=max_instructions, max_output=max_output, max_heap=max_heap
+    ).run()
+
+
+# ========================================
+# TABLAS DE OPERACIONES
+# ========================================
+
+def _divmod(a: int, b: int, signed: bool, ins: _RawInstr) -> Tuple[int, int]:
+    if b == 0:
+        raise MIPSSimulationError("división entre cero")
+    if not signed:
+        a, b = _u32(a), _u32(b)
+        return _s32(a // b), _s32(a % b)
+    q = abs(a) // abs(b)
+    if (a < 0) != (b < 0):
+        q = -q
+    return _s32(q), _s32(a - q * b)
+
+
+_ALU3 = {
+    "add": lambda a, b: _s32(a + b),
+    "addu": lambda a, b: _s32(a + b),
+    "addi": lambda a, b: _s32(a + b),
+    "addiu": lambda a, b: _s32(a + b),
+    "sub": lambda a, b: _s32(a - b),
+    "subu": lambda a, b: _s32(a - b),
+    "subi": lambda a, b: _s32(a - b),
+    "and": lambda a, b: _s32(a & b),
+    "andi": lambda a, b: _s32(a & (b & 0xFFFF)),
+    "or": lambda a, b: _s32(a | b),
+    "ori": lambda a, b: _s32(a | (b & 0xFFFF)),
+    "xor": lambda a, b: _s32(a ^ b),
+    "xori": lambda a, b: _s32(a ^ (b & 0xFFFF)),
+    "nor": lambda a, b: _s32(~(a | b)),
+    "slt": lambda a, b: int(a < b),
+    "slti": lambda a, b: int(a < b),
+    "sltu": lambda a, b: int(_u32(a) < _u32(b)),
+    "sltiu": lambda a, b: int(_u32(a) < _u32(b)),
+    # pseudo instrucciones de MARS
+    "seq": lambda a, b: int(a == b),
+    "sne": lambda a, b: int(a != b),
+    "sle": lambda a, b: int(a <= b),
+    "sgt": lambda a, b: int(a > b),
+    "sge": lambda a, b: int(a >= b),
+    "sleu": lambda a, b: int(_u32(a) <= _u32(b)),
+    "sgtu": lambda a, b: int(_u32(a) > _u32(b)),
+    "sgeu": lambda a, b: int(_u32(a) >= _u32(b)),
+}
+
+_SHIFTS = {
+    "sll": lambda a, s: _s32(a << s),
+    "sllv": lambda a, s: _s32(a << s),
+    "srl": lambda a, s: _s32(_u32(a) >> s),
+    "srlv": lambda a, s: _s32(_u32(a) >> s),
+    "sra": lambda a, s: a >> s,
+    "srav": lambda a, s: a >> s,
+}
+
+_LOADS = {
+    "lw": lambda mem: mem.load_word,
+    "lb": lambda mem: (lambda addr: _s8(mem.load_byte(addr))),
+    "lbu": lambda mem: mem.load_byte,
+    "lh": lambda mem: (lambda addr: mem.load_half(addr, True)),
+    "lhu": lambda mem: (lambda addr: mem.load_half(addr, False)),
+}
+
+_STORES = {
+    "sw": lambda mem: mem.store_word,
+    "sb": lambda mem: mem.store_byte,
+    "sh": lambda mem: mem.store_half,
+}
+
+
+def _s8(value: int) -> int:
+    return value - 0x100 if value & 0x80 else value
+
+
+_BRANCH2 = {
+    "beq": lambda a, b: a == b,
+    "bne": lambda a, b: a != b,
+    "blt": lambda a, b: a < b,
+    "bgt": lambda a, b: a > b,
+    "ble": lambda a, b: a <= b,
+    "bge": lambda a, b: a >= b,
+    "bltu": lambda a, b: _u32(a) < _u32(b),
+    "bgtu": lambda a, b: _u32(a) > _u32(b),
+    "bleu": lambda a, b: _u32(a) <= _u32(b),
+    "bgeu": lambda a, b: _u32(a) >= _u32(b),
+}
+
+_BRANCH1 = {
+    "beqz": lambda a: a == 0,
+    "bnez": lambda a: a != 0,
+    "bgez": lambda a: a >= 0,
+    "bgtz": lambda a: a > 0,
+    "blez": lambda a: a <= 0,
+    "bltz": lambda a: a < 0,
+}
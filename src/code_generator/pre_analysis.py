@@ -7,12 +7,15 @@ Realiza 4 tareas antes de generar código:
 4. Detectar uso de $s0-$s7
 """
 
-from typing import Dict, List, Set, Tuple, Optional, Any
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
+from itertools import islice
 
-from intermediate.tac_nodes import TACOP
+from intermediate.tac_nodes import TACOP, TacOp
+from intermediate.operands import Operand, StrConst
 from code_generator.procedure_manager import FrameInfo
 from symbol_table.runtime_layout import FrameManager
+from compile_trace import CompileTrace, NULL_TRACE
 
 
 @dataclass
@@ -81,6 +84,24 @@ def identify_functions(tac_code: List[TACOP]) -> Dict[str, FunctionInfo]:
     return functions
 
 
+def iter_functions(tac_code: Iterable[TACOP]) -> Iterator[Tuple[Optional[str], List[TACOP]]]:
+    """
+    Versión incremental de identify_functions: consume el TAC de a una
+    instrucción y entrega (nombre, tac_ops) en cuanto una función termina
+    (al ver el siguiente fn_decl o el final). Lo que hay antes del primer
+    fn_decl (DATA_WORDS) sale con nombre None.
+    """
+    name, ops = None, []
+    for tac_op in tac_code:
+        if tac_op.op == "fn_decl":
+            if ops:
+                yield name, ops
+            name, ops = tac_op.result, []
+        ops.append(tac_op)
+    if ops:
+        yield name, ops
+
+
 # ========================================
 # 2. CALCULAR TAMAÑOS DE FRAMES
 # ========================================
@@ -164,6 +185,9 @@ def is_literal(operand: str) -> bool:
     """
     if not operand:
         return True
+    # operandos de un TACOP: ya vienen clasificados
+    if isinstance(operand, Operand):
+        return operand.is_literal
     
     # Literales booleanos y null
     if operand.lower() in ("true", "false", "null"):
@@ -192,40 +216,125 @@ def is_literal(operand: str) -> bool:
     return False
 
 
-def encode_strs(code: List[TACOP]):
-    # Enode strings
-    str_encoder = {} # value->idx
-    counter = 0
-    for i, t in enumerate(code):
+# Escapes que MARS interpreta dentro de .asciiz
+_MIPS_ESCAPES = {"n": 10, "t": 9, "r": 13, "0": 0, "\\": 92, '"': 34, "'": 39}
+
+
+def mips_string_bytes(literal: str) -> bytes:
+    """
+    Bytes que quedan en memoria para un literal "..." (mismos escapes que
+    .asciiz), sin el terminador.
+    """
+    text = literal[1:-1]
+    out = bytearray()
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if ch == "\\" and i + 1 < len(text) and text[i + 1] in _MIPS_ESCAPES:
+            out.append(_MIPS_ESCAPES[text[i + 1]])
+            i += 2
+            continue
+        out.extend(ch.encode("utf-8"))
+        i += 1
+    return bytes(out)
+
+
+def str_hash(data: bytes) -> int:
+    """
+    FNV-1a de 32 bits, igual que __rt_str_hash. Nunca devuelve 0: en el
+    runtime 0 significa "hash aún no calculado".
+    """
+    h = 0x811C9DC5
+    for b in data:
+        h = ((h ^ b) * 16777619) & 0xFFFFFFFF
+    return h or 1
+
+
+def assign_str_ids(code: Iterable[TACOP], str_encoder: Dict[str, dict], counter: int = 0) -> int:
+    """
+    Agrega a `str_encoder` los literales de `code` que todavía no tiene
+    (id strN) y devuelve el contador para seguir con el siguiente bloque.
+    """
+    for t in code:
         if t.arg1:
-            if (t.arg1.startswith('"')):
+            if isinstance(t.arg1, StrConst):
                 if t.arg1 not in str_encoder:
                     str_encoder[t.arg1] = {
                         "id": f"str{counter}",
                     }
                 counter+=1
         if t.arg2:
-            if (t.arg2.startswith('"')):
+            if isinstance(t.arg2, StrConst):
                 if t.arg2 not in str_encoder:
                     str_encoder[t.arg2] = {
                         "id": f"str{counter}",
                     }
                 counter+=1
+    return counter
+
+
+def encode_strs(code: List[TACOP]):
+    # Enode strings
+    str_encoder = {} # value->idx
+    assign_str_ids(code, str_encoder)
     
     # No strings -> return case
     if len(str_encoder) == 0:
         return None, None
     
+    return str_encoder, str_data_lines(str_encoder.items())
+
+
+def str_data_lines(entries: Iterable[Tuple[str, dict]]) -> List[str]:
+    """
+    Líneas de .data de los literales (entradas de str_encoder); completa
+    chars, len y hash de cada entrada.
+    """
     # Prepare data section
+    # Cada literal queda internado: un descriptor
+    #   strN: len, hash, chars, buffer(0 = internado)
+    # y sus caracteres en strN_c (terminados en 0 para syscall 4)
     data_section = []
-    for k, v in str_encoder.items():
+    for k, v in entries:
+        raw = mips_string_bytes(k)
+        v["chars"] = f"{v['id']}_c"
+        v["len"] = len(raw)
+        v["hash"] = str_hash(raw)
+        data_section.append(".align 2")
         data_section.append(
-            f"{v["id"]}: .asciiz {k}"
+            f"{v['id']}: .word {v['len']}, {v['hash']:#010x}, {v['chars']}, 0"
         )
-
-    return str_encoder, data_section
+        data_section.append(
+            f"{v['chars']}: .asciiz {k}"
+        )
+    return data_section
     
 
+def encode_static_arrays(code: List[TACOP]):
+    """
+    Convierte los DATA_WORDS del TAC en líneas de .data.
+
+    Returns:
+        ({label: [palabras]}, líneas de .data)
+    """
+    static_arrays = {}
+    data_section = []
+    for t in code:
+        if t.op != "DATA_WORDS":
+            continue
+        words = [w.strip() for w in t.arg1.split(",")]
+        static_arrays[t.result] = words
+        # .word en bloques de 16 para que el .asm siga siendo legible
+        for i in range(0, len(words), 16):
+            prefix = f"{t.result}:" if i == 0 else " " * (len(t.result) + 1)
+            data_section.append(f"{prefix} .word {', '.join(words[i:i + 16])}")
+    return static_arrays, data_section
+
+
+# instrucciones cuyo `result` es una etiqueta/nombre, no una variable definida
+_NO_DEF_OPS = frozenset((TacOp.LABEL, TacOp.GOTO, TacOp.IF_GOTO, TacOp.FN_DECL))
+
+
 def liveness_analysis(func_tac: List[TACOP]) -> Dict[int, Set[str]]:
     """
     Calcula las variables vivas (live) en cada instrucción.
@@ -247,31 +356,33 @@ def liveness_analysis(func_tac: List[TACOP]) -> Dict[int, Set[str]]:
     live_in = [set() for _ in range(n)]
     live_out = [set() for _ in range(n)]
     
+    # Índice de etiquetas (primera aparición), para no buscar el destino
+    # de cada salto recorriendo toda la función
+    label_index: Dict[str, int] = {}
+    for j, tac_op in enumerate(func_tac):
+        if tac_op.opcode is TacOp.LABEL:
+            label_index.setdefault(tac_op.result, j)
+
     # Construir grafo de flujo de control (CFG simplificado)
     successors = [set() for _ in range(n)]
     for i in range(n):
         tac_op = func_tac[i]
+        opcode = tac_op.opcode
         
-        if tac_op.op == "goto":
+        if opcode is TacOp.GOTO:
             # Buscar etiqueta destino
-            target_label = tac_op.arg1
-            for j in range(n):
-                if func_tac[j].op == "label" and func_tac[j].result == target_label:
-                    successors[i].add(j)
-                    break
+            if tac_op.arg1 in label_index:
+                successors[i].add(label_index[tac_op.arg1])
         
-        elif tac_op.op == "if-goto":
+        elif opcode is TacOp.IF_GOTO:
             # Rama verdadera
-            target_label = tac_op.arg2
-            for j in range(n):
-                if func_tac[j].op == "label" and func_tac[j].result == target_label:
-                    successors[i].add(j)
-                    break
+            if tac_op.arg2 in label_index:
+                successors[i].add(label_index[tac_op.arg2])
             # Rama falsa (caída)
             if i + 1 < n:
                 successors[i].add(i + 1)
         
-        elif tac_op.op == "return":
+        elif opcode is TacOp.RETURN:
             # Sin sucesores (fin de función)
             pass
         
@@ -279,41 +390,46 @@ def liveness_analysis(func_tac: List[TACOP]) -> Dict[int, Set[str]]:
             # Flujo secuencial normal
             if i + 1 < n:
                 successors[i].add(i + 1)
-    
-    # Iteración hacia atrás (fixed-point)
-    changed = True
-    max_iterations = 100
-    iteration = 0
-    
-    while changed and iteration < max_iterations:
-        changed = False
-        iteration += 1
-        
-        for i in range(n - 1, -1, -1):
-            tac_op = func_tac[i]
-            
-            # Variables usadas (use)
-            use = set()
+
+    # use/def no cambian entre iteraciones: se calculan una sola vez
+    uses: List[Set[str]] = []
+    defs: List[Set[str]] = []
+    for tac_op in func_tac:
+        use = set()
+        if tac_op.opcode is not TacOp.STATIC_ARRAY:
+            # en STATIC_ARRAY arg1 es una etiqueta de .data, no una variable
             if tac_op.arg1 and not is_literal(tac_op.arg1):
                 use.add(tac_op.arg1)
             if tac_op.arg2 and not is_literal(tac_op.arg2):
                 use.add(tac_op.arg2)
-            
-            # Variable definida (def)
-            def_var = set()
-            if tac_op.result and tac_op.op not in ["label", "goto", "if-goto", "fn_decl"]:
-                def_var.add(tac_op.result)
-            
-            # Calcular live_in
-            new_live_in = (live_out[i] - def_var) | use
-            
-            if new_live_in != live_in[i]:
-                live_in[i] = new_live_in
-                changed = True
-            
-            # Propagar a sucesores
-            for succ_idx in successors[i]:
-                live_out[i] |= live_in[succ_idx]
+        def_var = set()
+        if tac_op.result and tac_op.opcode not in _NO_DEF_OPS:
+            def_var.add(tac_op.result)
+        uses.append(use)
+        defs.append(def_var)
+    
+    predecessors: List[List[int]] = [[] for _ in range(n)]
+    for i, succs in enumerate(successors):
+        for succ_idx in succs:
+            predecessors[succ_idx].append(i)
+
+    # Iteración hacia atrás (fixed-point) con worklist: solo se recalculan
+    # las instrucciones cuyo live_out pudo cambiar. Llega al mismo punto fijo
+    # que recorrer toda la función hasta que nada cambie.
+    worklist = list(range(n))          # pop() saca primero la última instrucción
+    pending = [True] * n
+    while worklist:
+        i = worklist.pop()
+        pending[i] = False
+        for succ_idx in successors[i]:
+            live_out[i] |= live_in[succ_idx]
+        new_live_in = (live_out[i] - defs[i]) | uses[i]
+        if new_live_in != live_in[i]:
+            live_in[i] = new_live_in
+            for pred in predecessors[i]:
+                if not pending[pred]:
+                    pending[pred] = True
+                    worklist.append(pred)
     
     return {i: live_out[i] for i in range(n)}
 
@@ -387,64 +503,117 @@ class MIPSPreAnalysis:
     Coordina las 4 tareas del pre-análisis antes de generar código MIPS.
     """
     
-    def __init__(self, tac_code: List[TACOP], frame_manager: FrameManager):
+    def __init__(self, tac_code: List[TACOP], frame_manager: FrameManager, trace: Optional[CompileTrace] = None):
         """
         Args:
             tac_code: Lista completa de operaciones TAC
             frame_manager: Instancia de FrameManager con info de runtime
+            trace: CompileTrace donde se registran los tiempos de cada etapa
         """
         self.tac_code = tac_code
         self.frame_manager = frame_manager
+        self.trace = trace or NULL_TRACE
         
-        str_encoder, data_section = encode_strs(tac_code)
-        self.data_section = []
-        self.str_encoder = {}
-        if str_encoder:
-            self.str_encoder = str_encoder
-            self.data_section = data_section
+        # Arreglos estáticos primero: .word necesita alineación y los
+        # .asciiz la rompen
+        self.static_arrays, self.data_section = encode_static_arrays(tac_code)
+        self.str_encoder: Dict[str, dict] = {}
+        self._str_counter = assign_str_ids(tac_code, self.str_encoder)
+        self.data_section = self.data_section + str_data_lines(self.str_encoder.items())
         # Resultados del análisis (se llenan al llamar analyze())
         self.functions: Dict[str, FunctionInfo] = {}
         self.frame_infos: Dict[str, FrameInfo] = {}
         self.liveness: Dict[str, Dict[int, Set[str]]] = {}
         self.saved_regs_usage: Dict[str, Set[str]] = {}
     
-    def analyze(self) -> None:
-        """Ejecuta las 4 etapas del pre-análisis"""
-        print(" Iniciando pre-análisis...")
-        
+    def analyze(self, skip: Optional[Callable[[str, FunctionInfo], bool]] = None) -> None:
+        """
+        Ejecuta las 4 etapas del pre-análisis.
+
+        Args:
+            skip: si devuelve True para una función, no se le calcula
+                liveness ni registros $s (su código ya está en un cache,
+                ver MIPSCodeGenerator). Se llama después de las etapas 1 y 2.
+        """
+        trace = self.trace
+
         # 1. Identificar funciones
-        print("  [1/4] Identificando funciones...")
-        self.functions = identify_functions(self.tac_code)
-        print(f"        ✓ Encontradas {len(self.functions)} funciones")
+        with trace.span("pre.functions"):
+            self.functions = identify_functions(self.tac_code)
+        trace.set("pre.functions", len(self.functions))
         
         # 2. Calcular tamaños de frames
-        print("  [2/4] Calculando tamaños de frames...")
-        self.frame_infos = calculate_frame_sizes(self.functions, self.frame_manager)
-        print(f"        ✓ Frames calculados")
+        with trace.span("pre.frames"):
+            self.frame_infos = calculate_frame_sizes(self.functions, self.frame_manager)
+
+        pending = {
+            name: info for name, info in self.functions.items()
+            if skip is None or not skip(name, info)
+        }
         
         # 3. Liveness analysis por función
-        print("  [3/4] Analizando liveness...")
-        for func_name, func_info in self.functions.items():
-            self.liveness[func_name] = liveness_analysis(func_info.tac_ops)
-        print(f"        ✓ Liveness completado")
+        with trace.span("pre.liveness"):
+            for func_name, func_info in pending.items():
+                self.liveness[func_name] = liveness_analysis(func_info.tac_ops)
+        trace.set("pre.max_live", max(
+            (len(live) for table in self.liveness.values() for live in table.values()), default=0
+        ))
         
         # 4. Detectar uso de $s0-$s7
-        print("  [4/4] Detectando uso de registros $s...")
-        for func_name, func_info in self.functions.items():
-            saved_regs = detect_saved_registers_usage(
-                func_info.tac_ops,
-                self.liveness[func_name],
-                func_info
-            )
-            self.saved_regs_usage[func_name] = saved_regs
-            
-            # Actualizar FrameInfo con registros $s detectados
-            if func_name in self.frame_infos:
-                self.frame_infos[func_name].uses_saved_regs = saved_regs
-        
-        print(f"        ✓ Registros $s detectados")
-        print(" Pre-análisis completado\n")
-    
+        with trace.span("pre.saved_regs"):
+            for func_name, func_info in pending.items():
+                saved_regs = detect_saved_registers_usage(
+                    func_info.tac_ops,
+                    self.liveness[func_name],
+                    func_info
+                )
+                self.saved_regs_usage[func_name] = saved_regs
+                
+                # Actualizar FrameInfo con registros $s detectados
+                if func_name in self.frame_infos:
+                    self.frame_infos[func_name].uses_saved_regs = saved_regs
+    
+    def add_function(
+        self,
+        name: Optional[str],
+        func_tac: List[TACOP],
+        skip: Optional[Callable[[str, FunctionInfo], bool]] = None,
+    ) -> List[str]:
+        """
+        Pre-análisis de una sola función (modo streaming, ver
+        code_generator/streaming.py): registra sus DATA_WORDS y literales
+        nuevos y corre las 4 etapas solo sobre ella. `name` None es el TAC
+        previo al primer fn_decl (solo datos).
+
+        Returns:
+            Líneas de .data nuevas (arreglos estáticos y strings).
+        """
+        arrays, data = encode_static_arrays(func_tac)
+        self.static_arrays.update(arrays)
+        if data:
+            # .word necesita alineación y los .asciiz anteriores la rompen
+            data = [".align 2"] + data
+        first = len(self.str_encoder)
+        self._str_counter = assign_str_ids(func_tac, self.str_encoder, self._str_counter)
+        data += str_data_lines(islice(self.str_encoder.items(), first, None))
+        if name is None:
+            return data
+
+        info = identify_functions(func_tac)[name]
+        self.functions[name] = info
+        self.frame_infos[name] = calculate_frame_sizes({name: info}, self.frame_manager)[name]
+        if skip is None or not skip(name, info):
+            self.liveness[name] = liveness_analysis(func_tac)
+            saved_regs = detect_saved_registers_usage(func_tac, self.liveness[name], info)
+            self.saved_regs_usage[name] = saved_regs
+            self.frame_infos[name].uses_saved_regs = saved_regs
+        return data
+
+    def drop_function(self, name: str) -> None:
+        """Olvida el análisis de una función ya emitida (modo streaming)."""
+        for table in (self.functions, self.frame_infos, self.liveness, self.saved_regs_usage):
+            table.pop(name, None)
+
     def get_function_info(self, func_name: str) -> Tuple[List[TACOP], FrameInfo, Dict[int, Set[str]], Set[str]]:
         """
         Devuelve toda la información necesaria para generar código de una función.
@@ -336,10 +336,11 @@ class ProcedureManager:
         frame_info = self.get_frame_info(func_name)
         frame_info.local_size = size
     
-    def generate_main_wrapper(self) -> List[str]:
+    def generate_main_wrapper(self, flush_output: bool = False) -> List[str]:
         """
         Genera el wrapper para main (punto de entrada del programa).
         En MIPS, main debe retornar con syscall exit.
+        Si el programa usa la salida con buffer, se vacía antes de salir.
         """
         code = [
             ".text",
@@ -349,6 +350,14 @@ class ProcedureManager:
             "    # Llamar a func_main (tu función principal)",
             "    jal func_main",
             "    ",
+        ]
+        if flush_output:
+            code += [
+                "    # Vaciar el buffer de salida",
+                "    jal __rt_flush",
+                "    ",
+            ]
+        code += [
             "    # Salir del programa (syscall exit)",
             "    li $v0, 10",
             "    syscall"
@@ -405,7 +414,9 @@ def generate_asm_file(
     data_section: List[str] = None,
     procedure_manager: ProcedureManager = None,
     var_offsets = None,
-    funcs_saved: Dict[str, set] = None
+    funcs_saved: Dict[str, set] = None,
+    runtime_section: List[str] = None,
+    flush_output: bool = False
 ) -> str:
     """
     Genera un archivo .asm completo con múltiples funciones.
@@ -414,6 +425,8 @@ def generate_asm_file(
         functions: Lista de tuplas (func_name, body_instructions, has_return)
         data_section: Instrucciones de la sección .data (opcional)
         procedure_manager: Instancia de ProcedureManager (opcional)
+        runtime_section: Rutinas de runtime (.text) a agregar al final (opcional)
+        flush_output: Vaciar el buffer de salida antes del exit
     
     Returns:
         String con el contenido completo del .asm
@@ -430,7 +443,7 @@ def generate_asm_file(
         lines.append("")
     
     # Sección .text
-    lines.extend(procedure_manager.generate_main_wrapper())
+    lines.extend(procedure_manager.generate_main_wrapper(flush_output=flush_output))
     lines.append("")
     
     # Funciones
@@ -441,4 +454,9 @@ def generate_asm_file(
         lines.extend(func_code)
         lines.append("")
     
+    # Runtime (solo las rutinas usadas)
+    if runtime_section:
+        lines.append("# ===== runtime =====")
+        lines.extend(runtime_section)
+    
     return "\n".join(lines)
\ No newline at end of file
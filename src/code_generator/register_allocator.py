@@ -51,6 +51,9 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Set, Tuple
 import re
 
+from compile_trace import CompileTrace, NULL_TRACE
+from intermediate.operands import Operand, Temp
+
 
 @dataclass
 class RegisterState:
@@ -94,6 +97,8 @@ class RegisterAllocator:
         scratch_registers: Optional[List[str]] = None,
         base_pointer: str = "$fp",
         var_offsets: Optional[Dict[str, int]] = None,
+        priorities: Optional[Dict[str, int]] = None,
+        trace: Optional[CompileTrace] = None,
     ) -> None:
         # Configuración de registros disponibles
         if available_registers is None:
@@ -114,6 +119,11 @@ class RegisterAllocator:
         self.TEMP_REG_PATTERN = re.compile(r"^t\d+$")
         self.base_pointer: str = base_pointer
         self.var_offsets: Dict[str, int] = var_offsets.copy() if var_offsets else {}
+        # Peso de cada variable según el perfil (PGO); al hacer spill se
+        # elige la de menor peso. Sin perfil se conserva el orden de registros.
+        self.priorities: Dict[str, int] = priorities or {}
+        # Contadores de spills/recargas (regalloc.spills, regalloc.reloads)
+        self.trace = trace or NULL_TRACE
 
         # RegisterDescriptor: reg_name -> RegisterState
         self.registers: Dict[str, RegisterState] = {
@@ -187,6 +197,7 @@ class RegisterAllocator:
             code.append(
                 f"    sw {reg_name}, {offset}({self.base_pointer})    # spill {var_name}"
             )
+            self.trace.count("regalloc.spills")
             self._ensure_var_entry(var_name)
             self.address[var_name].add("mem")
         else:
@@ -206,7 +217,8 @@ class RegisterAllocator:
         Estrategia:
           1. Si existe un registro que esté libre, no deberíamos llegar aquí.
           2. Preferir registros cuyo contenido no esté en live_out.
-          3. Si todos están en live_out, preferir aquellos con offset en memoria.
+          3. Si todos están en live_out, preferir aquellos con offset en memoria
+             (con perfil: el de la variable menos usada).
           4. Como último recurso, devolver cualquiera (puede causar pérdida si no hay offset).
         """
         regs = candidate_regs or list(self.registers.keys())
@@ -227,6 +239,11 @@ class RegisterAllocator:
         if candidates_not_live:
             return candidates_not_live[0]
         if candidates_spillable:
+            if self.priorities:
+                return min(
+                    candidates_spillable,
+                    key=lambda r: self.priorities.get(self.registers[r].var, 0),
+                )
             return candidates_spillable[0]
         # Peor caso: no hay buena víctima, regresamos el primero
         return regs[0]
@@ -259,7 +276,11 @@ class RegisterAllocator:
         """
         self._ensure_var_entry(var_name)
         code: List[str] = []
-        is_temp = bool(self.TEMP_REG_PATTERN.match(var_name))
+        if isinstance(var_name, Operand):
+            is_temp = type(var_name) is Temp
+        else:
+            # nombres armados en el codegen (param[i], ...)
+            is_temp = bool(self.TEMP_REG_PATTERN.match(var_name))
         
         # Temporales -> $tX ; variables "reales" -> $sX
         if is_temp:
@@ -303,6 +324,7 @@ class RegisterAllocator:
                 code.append(
                     f"    lw {free_reg}, {offset}({self.base_pointer})    # load {var_name}"
                 )
+                self.trace.count("regalloc.reloads")
             else:
                 code.append(
                     f"    # WARNING: cannot load {var_name} into {free_reg} (no offset)"
@@ -0,0 +1,446 @@
+"""
+Rutinas de runtime en MIPS que el generador agrega al final del .asm.
+
+Solo se emiten las rutinas que el programa realmente usa: el generador
+registra los nombres en un set (MIPSCodeGenerator.runtime_used) y al final
+pide el texto con runtime_text() / runtime_data().
+
+Convención de las rutinas:
+  - argumentos en $a0-$a3, resultado en $v0
+  - solo tocan $a0-$a3, $v0 y $v1 (no hace falta salvar $t/$s alrededor
+    del jal)
+  - no usan el stack: si una rutina llama a otra guarda $ra en un
+    registro que la otra no toca ($a3 para __rt_flush) o en un bloque de
+    .data propio (__rt_str_tmp)
+"""
+
+from typing import Dict, Iterable, List, Set
+
+
+# ========================================
+# ARREGLOS
+# ========================================
+
+# $a0 = arreglo origen ([len, e0, e1, ...]) -> $v0 = copia nueva en el heap.
+# Reserva al menos 1024 bytes, igual que CREATE_ARRAY, para que la copia
+# admita los mismos push que un arreglo creado dinámicamente.
+_ARRAY_COPY = [
+    "__rt_array_copy:",
+    "    move $a1, $a0    # a1 = origen",
+    "    lw $a2, 0($a1)    # a2 = len",
+    "    addiu $a0, $a2, 1",
+    "    sll $a0, $a0, 2    # bytes = (len + 1) * 4",
+    "    li $v1, 1024",
+    "    slt $v1, $a0, $v1",
+    "    beq $v1, $zero, __rt_array_copy_alloc",
+    "    li $a0, 1024    # mínimo: mismo tamaño que CREATE_ARRAY",
+    "__rt_array_copy_alloc:",
+    "    li $v0, 9    # sbrk (heap)",
+    "    syscall",
+    "    move $a3, $v0    # a3 = cursor destino",
+    "    addiu $a2, $a2, 1    # palabras a copiar (len + header)",
+    "__rt_array_copy_loop:",
+    "    beq $a2, $zero, __rt_array_copy_done",
+    "    lw $v1, 0($a1)",
+    "    sw $v1, 0($a3)",
+    "    addiu $a1, $a1, 4",
+    "    addiu $a3, $a3, 4",
+    "    addiu $a2, $a2, -1",
+    "    j __rt_array_copy_loop",
+    "__rt_array_copy_done:",
+    "    jr $ra",
+]
+
+
+# ========================================
+# SALIDA CON BUFFER
+# ========================================
+
+# Capacidad del buffer de salida. Un print_int necesita a lo sumo 11 bytes
+# (signo + 10 dígitos); si no caben, se vacía antes de escribir.
+OUTBUF_SIZE = 1024
+
+# Vacía el buffer con un único syscall 4. Solo toca $a0, $a1 y $v0.
+_FLUSH = [
+    "__rt_flush:",
+    "    lw $a1, __rt_outpos",
+    "    beq $a1, $zero, __rt_flush_done",
+    "    la $a0, __rt_outbuf",
+    "    addu $a1, $a0, $a1",
+    "    sb $zero, 0($a1)    # terminar la cadena en la posición actual",
+    "    li $v0, 4    # print string (todo el buffer)",
+    "    syscall",
+    "    sw $zero, __rt_outpos",
+    "__rt_flush_done:",
+    "    jr $ra",
+]
+
+# $a0 = entero con signo -> se formatea en decimal dentro del buffer.
+# Se usa divu sobre el valor absoluto para que -2147483648 también funcione.
+_PRINT_INT = [
+    "__rt_print_int:",
+    "    lw $v1, __rt_outpos",
+    f"    slti $v0, $v1, {OUTBUF_SIZE - 11}",
+    "    bne $v0, $zero, __rt_print_int_fmt",
+    "    move $a3, $ra    # __rt_flush no toca $a2/$a3",
+    "    move $a2, $a0",
+    "    jal __rt_flush",
+    "    move $a0, $a2",
+    "    move $ra, $a3",
+    "    li $v1, 0",
+    "__rt_print_int_fmt:",
+    "    la $a1, __rt_outbuf",
+    "    addu $a1, $a1, $v1    # a1 = cursor",
+    "    bgez $a0, __rt_print_int_abs",
+    "    li $v0, 45    # '-'",
+    "    sb $v0, 0($a1)",
+    "    addiu $a1, $a1, 1",
+    "    subu $a0, $zero, $a0",
+    "__rt_print_int_abs:",
+    "    move $a2, $a0",
+    "    li $a3, 10",
+    "__rt_print_int_len:    # avanzar el cursor un byte por dígito",
+    "    divu $a2, $a3",
+    "    mflo $a2",
+    "    addiu $a1, $a1, 1",
+    "    bne $a2, $zero, __rt_print_int_len",
+    "    move $v0, $a1    # v0 = fin del número",
+    "__rt_print_int_digit:    # escribir los dígitos de derecha a izquierda",
+    "    divu $a0, $a3",
+    "    mflo $a0",
+    "    mfhi $a2",
+    "    addiu $a2, $a2, 48",
+    "    addiu $a1, $a1, -1",
+    "    sb $a2, 0($a1)",
+    "    bne $a0, $zero, __rt_print_int_digit",
+    "    la $a1, __rt_outbuf",
+    "    subu $v0, $v0, $a1",
+    "    sw $v0, __rt_outpos",
+    "    jr $ra",
+]
+
+# $a0 = descriptor de string (ver STRINGS) -> se copian sus `len` bytes al
+# buffer, vaciándolo cada vez que se llena.
+_PRINT_STR = [
+    "__rt_print_str:",
+    "    lw $a2, 0($a0)    # len",
+    "    lw $a0, 8($a0)    # a0 = chars",
+    "    addu $a2, $a0, $a2    # a2 = fin",
+    "    lw $v1, __rt_outpos",
+    "    la $a1, __rt_outbuf",
+    "__rt_print_str_loop:",
+    "    beq $a0, $a2, __rt_print_str_done",
+    f"    slti $v0, $v1, {OUTBUF_SIZE}",
+    "    bne $v0, $zero, __rt_print_str_put",
+    "    sw $v1, __rt_outpos    # buffer lleno",
+    "    move $a3, $ra",
+    "    move $v1, $a0    # __rt_flush no toca $v1",
+    "    jal __rt_flush",
+    "    move $a0, $v1",
+    "    move $ra, $a3",
+    "    li $v1, 0",
+    "    la $a1, __rt_outbuf",
+    "__rt_print_str_put:",
+    "    lbu $v0, 0($a0)",
+    "    addu $a3, $a1, $v1",
+    "    sb $v0, 0($a3)",
+    "    addiu $v1, $v1, 1",
+    "    addiu $a0, $a0, 1",
+    "    j __rt_print_str_loop",
+    "__rt_print_str_done:",
+    "    sw $v1, __rt_outpos",
+    "    jr $ra",
+]
+
+# $a0 = descriptor -> un syscall 4 sobre sus chars, sin pasar por el buffer
+# (print sin buffered_print). Los chars no terminan en 0: se termina la
+# cadena en chars + len un momento y se restaura el byte.
+_PRINT_STR_DIRECT = [
+    "__rt_print_str_direct:",
+    "    lw $a1, 0($a0)    # len",
+    "    lw $a0, 8($a0)    # a0 = chars",
+    "    addu $a1, $a0, $a1    # a1 = fin",
+    "    lbu $a2, 0($a1)",
+    "    sb $zero, 0($a1)",
+    "    li $v0, 4    # print string",
+    "    syscall",
+    "    sb $a2, 0($a1)    # restaurar el byte siguiente",
+    "    jr $ra",
+]
+
+_OUTBUF_DATA = [
+    ".align 2",
+    "__rt_outpos: .word 0",
+    f"__rt_outbuf: .space {OUTBUF_SIZE + 4}    # + terminador",
+]
+
+
+# ========================================
+# STRINGS
+# ========================================
+#
+# Un string es un puntero a un descriptor de 4 palabras:
+#   0: len
+#   4: hash FNV-1a (0 = aún no calculado)
+#   8: puntero a los caracteres (no necesariamente terminados en 0)
+#  12: buffer dueño de los caracteres (0 = literal internado en .data)
+#
+# Un buffer es [used, cap, bytes...]. Concatenar A + B escribe B en el
+# mismo buffer de A si A termina justo en `used` y hay capacidad (crecer
+# un builder); si no, copia a un buffer nuevo del doble de tamaño. Los
+# strings existentes nunca ven bytes ajenos: cada uno solo lee `len`
+# bytes, así que armar un string en un loop cuesta O(n) amortizado.
+
+# $a0 = descriptor, $a3 = destino -> copia los bytes y avanza $a3.
+# Toca $a1, $a2, $v0.
+_COPY_CHARS = [
+    "__rt_copy_chars:",
+    "    lw $a2, 0($a0)",
+    "    lw $a1, 8($a0)",
+    "    addu $a2, $a1, $a2",
+    "__rt_copy_chars_loop:",
+    "    beq $a1, $a2, __rt_copy_chars_done",
+    "    lbu $v0, 0($a1)",
+    "    sb $v0, 0($a3)",
+    "    addiu $a1, $a1, 1",
+    "    addiu $a3, $a3, 1",
+    "    j __rt_copy_chars_loop",
+    "__rt_copy_chars_done:",
+    "    jr $ra",
+]
+
+# $a0 = A, $a1 = B -> $v0 = descriptor nuevo de A + B
+_STR_CONCAT = [
+    "__rt_str_concat:",
+    "    lw $v0, 0($a1)",
+    "    bne $v0, $zero, __rt_str_concat_a",
+    "    move $v0, $a0    # B vacío -> A",
+    "    jr $ra",
+    "__rt_str_concat_a:",
+    "    lw $v0, 0($a0)",
+    "    bne $v0, $zero, __rt_str_concat_go",
+    "    move $v0, $a1    # A vacío -> B",
+    "    jr $ra",
+    "__rt_str_concat_go:",
+    "    la $v1, __rt_str_tmp",
+    "    sw $a0, 0($v1)    # tmp[0] = A",
+    "    sw $a1, 4($v1)    # tmp[1] = B",
+    "    sw $ra, 16($v1)",
+    "    # ¿A termina en el final usado de su buffer y B cabe?",
+    "    lw $a2, 12($a0)    # bufA",
+    "    beq $a2, $zero, __rt_str_concat_copy",
+    "    lw $a3, 8($a0)",
+    "    addu $a3, $a3, $v0    # a3 = charsA + lenA",
+    "    lw $v0, 0($a2)",
+    "    addu $v0, $v0, $a2",
+    "    addiu $v0, $v0, 8    # v0 = base + used",
+    "    bne $a3, $v0, __rt_str_concat_copy",
+    "    lw $v0, 0($a2)",
+    "    lw $a1, 0($a1)",
+    "    addu $v0, $v0, $a1    # used + lenB",
+    "    lw $a1, 4($a2)    # cap",
+    "    slt $a1, $a1, $v0",
+    "    bne $a1, $zero, __rt_str_concat_copy",
+    "    sw $v0, 0($a2)    # append in-place",
+    "    lw $a1, 8($a0)",
+    "    sw $a1, 8($v1)    # tmp[2] = chars = charsA",
+    "    sw $a2, 12($v1)    # tmp[3] = buf = bufA",
+    "    lw $a0, 4($v1)",
+    "    jal __rt_copy_chars    # B -> fin de A",
+    "    j __rt_str_concat_desc",
+    "__rt_str_concat_copy:",
+    "    lw $a2, 0($a0)",
+    "    lw $a1, 4($v1)",
+    "    lw $a1, 0($a1)",
+    "    addu $a2, $a2, $a1    # a2 = lenA + lenB",
+    "    sll $a3, $a2, 1    # cap = 2 * total (crecimiento geométrico)",
+    "    slti $a1, $a3, 32",
+    "    beq $a1, $zero, __rt_str_concat_alloc",
+    "    li $a3, 32",
+    "__rt_str_concat_alloc:",
+    "    addiu $a0, $a3, 8    # + header (used, cap)",
+    "    li $v0, 9    # sbrk (heap)",
+    "    syscall",
+    "    sw $a2, 0($v0)    # used",
+    "    sw $a3, 4($v0)    # cap",
+    "    sw $v0, 12($v1)    # tmp[3] = buf",
+    "    addiu $a3, $v0, 8",
+    "    sw $a3, 8($v1)    # tmp[2] = chars = base",
+    "    lw $a0, 0($v1)",
+    "    jal __rt_copy_chars    # A",
+    "    lw $a0, 4($v1)",
+    "    jal __rt_copy_chars    # B",
+    "__rt_str_concat_desc:",
+    "    li $a0, 16",
+    "    li $v0, 9    # sbrk (descriptor)",
+    "    syscall",
+    "    lw $a0, 0($v1)",
+    "    lw $a0, 0($a0)",
+    "    lw $a1, 4($v1)",
+    "    lw $a1, 0($a1)",
+    "    addu $a0, $a0, $a1",
+    "    sw $a0, 0($v0)    # len",
+    "    sw $zero, 4($v0)    # hash: se calcula al comparar",
+    "    lw $a0, 8($v1)",
+    "    sw $a0, 8($v0)",
+    "    lw $a0, 12($v1)",
+    "    sw $a0, 12($v0)",
+    "    lw $ra, 16($v1)",
+    "    jr $ra",
+]
+
+# $a0 = descriptor -> $v0 = hash (FNV-1a, distinto de 0), cacheado en 4($a0).
+# Conserva $a0; toca $a1-$a3, $v1.
+_STR_HASH = [
+    "__rt_str_hash:",
+    "    lw $v0, 4($a0)",
+    "    bne $v0, $zero, __rt_str_hash_done",
+    "    li $v0, 0x811c9dc5",
+    "    li $a3, 16777619",
+    "    lw $a2, 0($a0)",
+    "    lw $a1, 8($a0)",
+    "    addu $a2, $a1, $a2",
+    "__rt_str_hash_loop:",
+    "    beq $a1, $a2, __rt_str_hash_end",
+    "    lbu $v1, 0($a1)",
+    "    xor $v0, $v0, $v1",
+    "    mul $v0, $v0, $a3",
+    "    addiu $a1, $a1, 1",
+    "    j __rt_str_hash_loop",
+    "__rt_str_hash_end:",
+    "    bne $v0, $zero, __rt_str_hash_store",
+    "    li $v0, 1",
+    "__rt_str_hash_store:",
+    "    sw $v0, 4($a0)",
+    "__rt_str_hash_done:",
+    "    jr $ra",
+]
+
+# $a0 = A, $a1 = B -> $v0 = 1 si tienen el mismo contenido.
+# Literales internados: O(1) (mismo contenido <=> mismo puntero).
+_STR_EQ = [
+    "__rt_str_eq:",
+    "    li $v0, 1",
+    "    beq $a0, $a1, __rt_str_eq_ret",
+    "    li $v0, 0",
+    "    beqz $a0, __rt_str_eq_ret    # null solo es igual a null",
+    "    beqz $a1, __rt_str_eq_ret",
+    "    lw $a2, 0($a0)",
+    "    lw $a3, 0($a1)",
+    "    bne $a2, $a3, __rt_str_eq_ret    # longitudes distintas",
+    "    lw $a2, 12($a0)",
+    "    lw $a3, 12($a1)",
+    "    or $a2, $a2, $a3",
+    "    beq $a2, $zero, __rt_str_eq_ret    # dos literales internados distintos",
+    "    la $v1, __rt_str_tmp",
+    "    sw $a0, 0($v1)",
+    "    sw $a1, 4($v1)",
+    "    sw $ra, 16($v1)",
+    "    jal __rt_str_hash",
+    "    la $v1, __rt_str_tmp",
+    "    sw $v0, 8($v1)",
+    "    lw $a0, 4($v1)",
+    "    jal __rt_str_hash",
+    "    la $v1, __rt_str_tmp",
+    "    lw $ra, 16($v1)",
+    "    lw $a2, 8($v1)",
+    "    bne $v0, $a2, __rt_str_eq_false    # hashes distintos",
+    "    lw $a0, 0($v1)",
+    "    lw $a1, 4($v1)",
+    "    lw $a2, 0($a0)",
+    "    lw $a0, 8($a0)",
+    "    lw $a1, 8($a1)",
+    "    addu $a2, $a0, $a2",
+    "__rt_str_eq_loop:",
+    "    beq $a0, $a2, __rt_str_eq_true",
+    "    lbu $v0, 0($a0)",
+    "    lbu $v1, 0($a1)",
+    "    bne $v0, $v1, __rt_str_eq_false",
+    "    addiu $a0, $a0, 1",
+    "    addiu $a1, $a1, 1",
+    "    j __rt_str_eq_loop",
+    "__rt_str_eq_true:",
+    "    li $v0, 1",
+    "    jr $ra",
+    "__rt_str_eq_false:",
+    "    li $v0, 0",
+    "__rt_str_eq_ret:",
+    "    jr $ra",
+]
+
+_STR_DATA = [
+    ".align 2",
+    "__rt_str_tmp: .space 20    # A, B, chars/hash, buf, $ra",
+]
+
+
+# ========================================
+# REGISTRO DE RUTINAS
+# ========================================
+
+RUNTIME_ROUTINES: Dict[str, List[str]] = {
+    "__rt_array_copy": _ARRAY_COPY,
+    "__rt_print_int": _PRINT_INT,
+    "__rt_print_str": _PRINT_STR,
+    "__rt_print_str_direct": _PRINT_STR_DIRECT,
+    "__rt_flush": _FLUSH,
+    "__rt_str_concat": _STR_CONCAT,
+    "__rt_copy_chars": _COPY_CHARS,
+    "__rt_str_eq": _STR_EQ,
+    "__rt_str_hash": _STR_HASH,
+}
+
+# Rutinas que otras rutinas llaman internamente
+RUNTIME_DEPS: Dict[str, List[str]] = {
+    "__rt_print_int": ["__rt_flush"],
+    "__rt_print_str": ["__rt_flush"],
+    "__rt_str_concat": ["__rt_copy_chars"],
+    "__rt_str_eq": ["__rt_str_hash"],
+}
+
+# Datos (.data) que necesita cada rutina
+RUNTIME_DATA: Dict[str, List[str]] = {
+    "__rt_flush": _OUTBUF_DATA,
+    "__rt_str_concat": _STR_DATA,
+    "__rt_str_eq": _STR_DATA,
+}
+
+
+def _with_deps(used: Iterable[str]) -> Set[str]:
+    result = set()
+    pending = list(used)
+    while pending:
+        name = pending.pop()
+        if name in result:
+            continue
+        result.add(name)
+        pending.extend(RUNTIME_DEPS.get(name, []))
+    return result
+
+
+def runtime_text(used: Iterable[str]) -> List[str]:
+    """
+    Devuelve las líneas de .text de las rutinas usadas, en orden estable.
+    """
+    used = _with_deps(used)
+    lines: List[str] = []
+    for name, body in RUNTIME_ROUTINES.items():
+        if name in used:
+            lines.extend(body)
+            lines.append("")
+    return lines
+
+
+def runtime_data(used: Iterable[str]) -> List[str]:
+    """
+    Devuelve las líneas de .data que requieren las rutinas usadas.
+    """
+    used = _with_deps(used)
+    lines: List[str] = []
+    emitted = []
+    for name, data in RUNTIME_DATA.items():
+        if name in used and data not in emitted:
+            # varias rutinas pueden compartir el mismo bloque de datos
+            emitted.append(data)
+            lines.extend(data)
+    return lines
@@ -0,0 +1,134 @@
+# src/code_generator/streaming.py
+"""
+Backend en streaming: genera el .asm función por función.
+
+MIPSCodeGenerator.generate() necesita el TAC completo, pre-analiza todo el
+programa y junta todos los cuerpos antes de armar el archivo. Acá el TAC
+entra como un iterable (lista, generador, líneas de un .pretty_tac) y cada
+función se pre-analiza, se le asignan registros y se emite apenas llega el
+fn_decl siguiente; después se olvida su estado. La memoria pico queda en
+la función más grande (más los literales y arreglos estáticos, que se
+comparten entre funciones).
+
+El archivo queda con otro orden que el de generate(), pero con las mismas
+instrucciones:
+  - el wrapper `main` va primero en .text, como en generate(): MARS y SPIM
+    arrancan por defecto en la primera dirección de .text, no en `main`.
+    Con buffered_print vacía el buffer al salir aunque el programa no
+    imprima nada (cuando se emite todavía no se sabe);
+  - los .data de cada función (arreglos estáticos, strings nuevos) van
+    justo antes de su .text;
+  - el runtime y sus .data van al final, porque qué rutinas se usan se
+    sabe recién ahí.
+
+Uso:
+    gen = StreamingMIPSGenerator(tac_iter, frame_manager)
+    with open("out.asm", "w") as f:
+        gen.write_to(f)
+    # o: for chunk in gen.stream(): ...   (respuesta HTTP chunked)
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Set, TextIO
+
+from intermediate.tac_nodes import TACOP
+from symbol_table.runtime_layout import FrameManager
+from code_generator.mips_generator import MIPSCodeGenerator
+from code_generator.pre_analysis import iter_functions
+from code_generator.runtime_lib import runtime_text, runtime_data
+from compile_trace import CompileTrace
+from function_cache import FunctionCache
+
+
+class StreamingMIPSGenerator(MIPSCodeGenerator):
+    """MIPSCodeGenerator que consume el TAC de a una función y emite por partes."""
+
+    def __init__(
+        self,
+        tac_code: Iterable[TACOP],
+        frame_manager: Optional[FrameManager] = None,
+        buffered_print: bool = False,
+        var_priorities: Optional[Dict[str, Dict[str, int]]] = None,
+        trace: Optional[CompileTrace] = None,
+        cache: Optional[FunctionCache] = None,
+    ):
+        # el pre-análisis arranca vacío y se llena con add_function
+        super().__init__(
+            [], frame_manager,
+            buffered_print=buffered_print,
+            var_priorities=var_priorities,
+            trace=trace,
+            cache=cache,
+        )
+        self.tac_code = tac_code
+
+    def stream(self) -> Iterator[str]:
+        """
+        Genera el .asm en partes: primero el wrapper main, después una por
+        función (con sus .data) y al final el runtime. Unidas con "" dan el
+        archivo.
+        """
+        trace = self.trace
+        runtime_used: Set[str] = set()
+        if self.buffered_print:
+            runtime_used.add("__rt_flush")
+        skip = self._lookup_fragment if self.cache is not None else None
+
+        out = self.proc_manager.generate_main_wrapper(flush_output=self.buffered_print) + [""]
+        section = ".text"
+        lines = len(out)
+        yield "\n".join(out) + "\n"
+
+        for name, func_tac in iter_functions(self.tac_code):
+            out: List[str] = []
+            with trace.span("pre_analysis", function=name):
+                data = self.pre.add_function(name, func_tac, skip=skip)
+            if data:
+                out += [".data"] + data + [""]
+                section = ".data"
+            if name is not None:
+                entry = self._cached.pop(name, None)
+                if entry is None:
+                    entry = self._generate_function(name)
+                else:
+                    self.pre.frame_infos[name].uses_saved_regs = set(entry.saved_regs)
+                runtime_used |= entry.runtime_used
+                if section != ".text":
+                    out.append(".text")
+                    section = ".text"
+                out += self.proc_manager.generate_simple_function(
+                    name, list(entry.body), has_return=entry.has_return,
+                    var_offsets={name: dict(entry.var_offsets)},
+                    funcs_saved={name: set(entry.saved_regs)},
+                )
+                out.append("")
+                self.pre.drop_function(name)
+                trace.count("stream.functions")
+            if out:
+                lines += len(out)
+                yield "\n".join(out) + "\n"
+
+        self.runtime_used = runtime_used
+        out = []
+        runtime = runtime_text(runtime_used)
+        if runtime:
+            if section != ".text":
+                out.append(".text")
+            out.append("# ===== runtime =====")
+            out += runtime
+        data = runtime_data(runtime_used)
+        if data:
+            out += ["", ".data"] + data
+        lines += len(out)
+        trace.set("asm.lines", lines)
+        yield "\n".join(out)
+
+    def write_to(self, writer: TextIO) -> int:
+        """Escribe el .asm en `writer` (cualquier objeto con .write); devuelve los caracteres escritos."""
+        written = 0
+        for chunk in self.stream():
+            writer.write(chunk)
+            written += len(chunk)
+        return written
+
+    def generate(self) -> str:
+        return "".join(self.stream())
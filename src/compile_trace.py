@@ -0,0 +1,159 @@
+# src/compile_trace.py
+"""
+CompileTrace: tiempos por fase y contadores de una compilación.
+
+Cada etapa del pipeline (lexer, parser, AstAndSemantic, TacGenerator,
+MIPSPreAnalysis, RegisterAllocator, MIPSCodeGenerator) recibe un `trace`
+opcional y registra:
+  - spans: intervalos con nombre, anidados (`with trace.span("tac"): ...`)
+  - contadores: instrucciones TAC, temporales, etiquetas, spills, ...
+
+Sin trace se usa NULL_TRACE, cuyos métodos no hacen nada.
+
+Exportación:
+  - to_dict() / to_json(): spans + contadores
+  - to_chrome_trace(): formato "Trace Event" (chrome://tracing, Perfetto)
+
+Uso:
+    trace = CompileTrace()
+    with trace.span("parse"):
+        tree = parser.program()
+    trace.count("tac.instructions", len(code))
+    trace.save_chrome_trace("build.trace.json")
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from typing import Dict, Iterator, List, Optional
+
+
+@dataclass
+class Span:
+    name: str
+    start: float                  # segundos desde el inicio del trace
+    end: float = 0.0
+    depth: int = 0
+    args: Dict[str, object] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class CompileTrace:
+    def __init__(self, name: str = "compile", clock=time.perf_counter):
+        self.name = name
+        self._clock = clock
+        self._origin = clock()
+        self.spans: List[Span] = []
+        self.counters: Dict[str, int] = {}
+        self._depth = 0
+
+    # ------------------------------------------------------------
+    # Registro
+    # ------------------------------------------------------------
+
+    @contextmanager
+    def span(self, name: str, **args) -> Iterator[Span]:
+        sp = Span(name=name, start=self._clock() - self._origin, depth=self._depth, args=dict(args))
+        self.spans.append(sp)
+        self._depth += 1
+        try:
+            yield sp
+        finally:
+            self._depth -= 1
+            sp.end = self._clock() - self._origin
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def set(self, name: str, value: int) -> None:
+        self.counters[name] = value
+
+    # ------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------
+
+    def phase_times(self) -> Dict[str, float]:
+        """Duración de cada span de primer nivel (sumada si se repite)."""
+        out: Dict[str, float] = {}
+        for sp in self.spans:
+            if sp.depth == 0:
+                out[sp.name] = out.get(sp.name, 0.0) + sp.duration
+        return out
+
+    def total(self, name: str) -> float:
+        return sum(sp.duration for sp in self.spans if sp.name == name)
+
+    def summary(self) -> str:
+        lines = [f"== TRACE ({self.name}) =="]
+        for sp in self.spans:
+            label = " ".join([sp.name] + [str(v) for v in sp.args.values()])
+            lines.append(f"{'  ' * sp.depth}{label:<{28 - 2 * sp.depth}} {sp.duration * 1000:>9.2f} ms")
+        for key in sorted(self.counters):
+            lines.append(f"{key:<28} {self.counters[key]:>9}")
+        return "\n".join(lines)
+
+    # ------------------------------------------------------------
+    # Exportación
+    # ------------------------------------------------------------
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "spans": [asdict(sp) for sp in self.spans],
+            "counters": dict(self.counters),
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_chrome_trace(self) -> dict:
+        """Eventos "X" (duración completa) por span y un evento "C" con los contadores."""
+        pid, tid = os.getpid(), threading.get_ident() % (1 << 31)
+        events = [{
+            "name": "process_name", "ph": "M", "pid": pid, "tid": tid,
+            "args": {"name": self.name},
+        }]
+        for sp in self.spans:
+            events.append({
+                "name": sp.name, "cat": "compile", "ph": "X",
+                "ts": round(sp.start * 1e6, 3), "dur": round(sp.duration * 1e6, 3),
+                "pid": pid, "tid": tid, "args": dict(sp.args),
+            })
+        if self.counters:
+            end = max((sp.end for sp in self.spans), default=0.0)
+            events.append({
+                "name": "counters", "cat": "compile", "ph": "C",
+                "ts": round(end * 1e6, 3), "pid": pid, "tid": tid,
+                "args": dict(self.counters),
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+class _NullTrace(CompileTrace):
+    """Trace que no registra nada (default cuando no se pide tracing)."""
+
+    def __init__(self):
+        super().__init__(name="null")
+
+    @contextmanager
+    def span(self, name: str, **args) -> Iterator[Optional[Span]]:
+        yield None
+
+    def count(self, name: str, n: int = 1) -> None:
+        pass
+
+    def set(self, name: str, value: int) -> None:
+        pass
+
+
+NULL_TRACE = _NullTrace()
@@ -0,0 +1,171 @@
+# src/fast_lexer.py
+"""
+FastLexer: lexer de Compiscript con una sola regex, reemplazo directo de
+CompiscriptLexer (mismos tipos de token, posiciones y errores).
+
+El lexer generado por ANTLR simula el ATN carácter por carácter en Python;
+el token set de Compiscript es simple, así que una regex compilada hace el
+mismo trabajo en C. Las tablas de keywords y operadores salen de
+CompiscriptLexer.literalNames, así que siguen a la gramática al regenerarla.
+
+Semántica de ANTLR que se replica:
+  - match más largo; a igual largo gana el literal implícito ('let') sobre
+    Identifier, y Literal sobre IntegerLiteral / StringLiteral
+  - WS, COMMENT y MULTILINE_COMMENT se descartan; un '/*' sin cerrar es '/'
+  - error de reconocimiento: el texto va desde el inicio del token hasta el
+    carácter que falla inclusive, y ese carácter se consume
+    ('"abc<salto>' y '&x' se descartan completos)
+
+Uso:
+    stream = CommonTokenStream(FastLexer(InputStream(source)))
+    tree = CompiscriptParser(stream).program()
+"""
+
+import re
+from typing import Iterator, Tuple
+
+from antlr4 import InputStream
+from antlr4.CommonTokenFactory import CommonTokenFactory
+from antlr4.Recognizer import Recognizer
+from antlr4.Token import CommonToken, Token
+from antlr4.Lexer import TokenSource
+from antlr4.error.Errors import LexerNoViableAltException
+
+from parser.CompiscriptLexer import CompiscriptLexer
+
+
+def _literal_tables():
+    keywords, operators = {}, {}
+    for ttype, lit in enumerate(CompiscriptLexer.literalNames):
+        if not (lit.startswith("'") and lit.endswith("'")):
+            continue
+        text = lit[1:-1]
+        if re.fullmatch(r"[a-zA-Z_][a-zA-Z0-9_]*", text):
+            keywords[text] = ttype
+        else:
+            operators[text] = ttype
+    return keywords, operators
+
+
+KEYWORDS, OPERATORS = _literal_tables()
+
+# Orden de las alternativas = prioridad: los operadores de dos caracteres
+# antes que los de uno, y los comentarios antes que '/'
+_TOKEN_RE = re.compile(
+    r"(?P<ws>[ \t\r\n]+)"
+    r"|(?P<comment>//[^\r\n]*|/\*.*?\*/)"
+    r"|(?P<id>[a-zA-Z_][a-zA-Z0-9_]*)"
+    r"|(?P<lit>[0-9]+|\"[^\"\r\n]*\")"
+    r"|(?P<op>" + "|".join(re.escape(op) for op in sorted(OPERATORS, key=len, reverse=True)) + r")",
+    re.DOTALL,
+)
+
+# Prefijos que ANTLR sigue consumiendo aunque no sean token ('&' de '&&',
+# '"' de un string): al fallar se descarta también el carácter siguiente
+_PARTIAL_RE = re.compile(r"\"[^\"\r\n]*|&|\|")
+
+_DISPLAY = {"\n": "\\n", "\t": "\\t", "\r": "\\r"}
+
+
+class FastLexer(Recognizer, TokenSource):
+    literalNames = CompiscriptLexer.literalNames
+    symbolicNames = CompiscriptLexer.symbolicNames
+    ruleNames = CompiscriptLexer.ruleNames
+    grammarFileName = CompiscriptLexer.grammarFileName
+
+    def __init__(self, input: InputStream):
+        super().__init__()
+        self._input = input
+        self._factory = CommonTokenFactory.DEFAULT
+        self._tokenFactorySourcePair = (self, input)
+        self._text = input.strdata
+        self._pos = 0
+        # posición del próximo token (CommonToken la lee del token source)
+        self.line = 1
+        self.column = 0
+        self._line_start = 0
+        self._hitEOF = False
+        self._scanner = self.scan()
+
+    # ------------------------------------------------------------
+    # TokenSource
+    # ------------------------------------------------------------
+
+    @property
+    def inputStream(self):
+        return self._input
+
+    def getSourceName(self):
+        return self._input.getSourceName()
+
+    def getInputStream(self):
+        return self._input
+
+    def getCharPositionInLine(self):
+        return self.column
+
+    def nextToken(self) -> Token:
+        ttype, start, end = next(self._scanner)
+        return CommonToken(self._tokenFactorySourcePair, ttype, Token.DEFAULT_CHANNEL, start, end - 1)
+
+    def scan(self) -> Iterator[Tuple[int, int, int]]:
+        """
+        Tokens visibles como (tipo, inicio, fin) sin crear CommonToken; la
+        posición del token actual queda en self.line / self.column. Después
+        del EOF sigue devolviendo EOF.
+        """
+        text = self._text
+        match = _TOKEN_RE.match
+        identifier, literal = CompiscriptLexer.Identifier, CompiscriptLexer.Literal
+        while True:
+            pos = self._pos
+            self.column = pos - self._line_start
+            m = match(text, pos)
+            if m is None:
+                if pos >= len(text):
+                    self._hitEOF = True
+                    self._input.seek(pos)
+                    yield Token.EOF, pos, pos
+                    continue
+                self._error(pos)
+                continue
+            end = m.end()
+            kind = m.lastgroup
+            if kind == "ws" or kind == "comment":
+                self._advance(pos, end)
+                continue
+            if kind == "id":
+                ttype = KEYWORDS.get(m.group(), identifier)
+            elif kind == "op":
+                ttype = OPERATORS[m.group()]
+            else:
+                ttype = literal
+            # ningún token visible contiene saltos de línea
+            self._pos = end
+            yield ttype, pos, end
+
+    # ------------------------------------------------------------
+    # Internos
+    # ------------------------------------------------------------
+
+    def _advance(self, start: int, end: int) -> None:
+        newlines = self._text.count("\n", start, end)
+        if newlines:
+            self.line += newlines
+            self._line_start = self._text.rindex("\n", start, end) + 1
+        self._pos = end
+
+    def _error(self, pos: int) -> None:
+        text = self._text
+        partial = _PARTIAL_RE.match(text, pos)
+        stop = partial.end() if partial else pos
+        # el carácter que hizo fallar al ATN se reporta y se consume
+        end = min(stop + 1, len(text))
+        shown = "".join(_DISPLAY.get(c, c) for c in text[pos:end])
+        self._input.seek(stop)
+        self.getErrorListenerDispatch().syntaxError(
+            self, None, self.line, self.column,
+            f"token recognition error at: '{shown}'",
+            LexerNoViableAltException(self, self._input, pos, None),
+        )
+        self._advance(pos, end)
@@ -0,0 +1,112 @@
+# src/function_cache.py
+"""
+FunctionCache: cache de compilación incremental por función.
+
+Cada función numera sus etiquetas y temporales desde 0 (fn.L0, t0, ...),
+así que editar una función no cambia el texto del TAC ni del asm de las
+demás. Este cache guarda, por función:
+
+  - TAC (TacGenerator): clave = hash del span de tokens de la declaración
+    más las firmas (encabezados de funciones, clases, globales) de los
+    nombres top-level que menciona. Guarda el código generado (con el de sus
+    funciones anidadas), sus DATA_WORDS y las reservas que hizo en los
+    frames, que se vuelven a aplicar al reusarlo.
+  - Fragmentos MIPS (MIPSCodeGenerator): clave = hash del TAC de la función
+    más lo que el codegen lee fuera de ella (frame, labels de sus strings,
+    arreglos estáticos que copia, prioridades de registros). Guarda el
+    cuerpo en asm, los offsets de sus variables, los $s que usa y las
+    rutinas de runtime que necesita; las funciones que pegan en el cache no
+    pasan por liveness.
+
+El front end (lexer, parser, semántico) sigue corriendo sobre el programa
+completo: el análisis semántico necesita todas las declaraciones.
+
+Uso:
+    cache = FunctionCache()
+    compile_source(src_v1, cache=cache)
+    compile_source(src_v2, cache=cache)   # solo regenera lo editado
+    cache.stats  # {"tac_hits": ..., "tac_misses": ..., "asm_hits": ..., "asm_misses": ...}
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+# Sube cuando cambie lo que generan TacGenerator o MIPSCodeGenerator: las
+# entradas viejas dejan de coincidir
+FORMAT_VERSION = 2
+
+
+@dataclass(frozen=True)
+class TacEntry:
+    """TAC de una función (y de sus funciones anidadas) listo para reusar."""
+    code: Tuple = ()
+    # DATA_WORDS de sus literales de arreglo (labels fn.arrlitK)
+    static_data: Tuple = ()
+    # reservas en frames, en orden: (frame, "param" | "local", nombre, size)
+    frames: Tuple[Tuple[str, str, str, int], ...] = ()
+    # frames que creó (aunque queden vacíos), en orden
+    new_frames: Tuple[str, ...] = ()
+    temps: int = 0
+    labels: int = 0
+
+
+@dataclass(frozen=True)
+class AsmEntry:
+    """Fragmento MIPS de una función (sin prólogo/epílogo, que arma ProcedureManager)."""
+    body: Tuple[str, ...] = ()
+    has_return: bool = False
+    saved_regs: FrozenSet[str] = frozenset()
+    var_offsets: Dict[str, int] = field(default_factory=dict)
+    runtime_used: FrozenSet[str] = frozenset()
+
+
+class FunctionCache:
+    """Dos LRU (TAC y asm) por hash; thread-safe para los workers del servidor."""
+
+    def __init__(self, capacity: int = 4096):
+        self.capacity = capacity
+        self._tac: "OrderedDict[str, TacEntry]" = OrderedDict()
+        self._asm: "OrderedDict[str, AsmEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {"tac_hits": 0, "tac_misses": 0, "asm_hits": 0, "asm_misses": 0}
+
+    def _get(self, table: OrderedDict, kind: str, key: str):
+        with self._lock:
+            value = table.get(key)
+            if value is None:
+                self.stats[f"{kind}_misses"] += 1
+            else:
+                table.move_to_end(key)
+                self.stats[f"{kind}_hits"] += 1
+            return value
+
+    def _put(self, table: OrderedDict, key: str, value) -> None:
+        with self._lock:
+            table[key] = value
+            table.move_to_end(key)
+            while len(table) > self.capacity:
+                table.popitem(last=False)
+
+    def get_tac(self, key: str) -> Optional[TacEntry]:
+        return self._get(self._tac, "tac", key)
+
+    def put_tac(self, key: str, entry: TacEntry) -> None:
+        self._put(self._tac, key, entry)
+
+    def get_asm(self, key: str) -> Optional[AsmEntry]:
+        return self._get(self._asm, "asm", key)
+
+    def put_asm(self, key: str, entry: AsmEntry) -> None:
+        self._put(self._asm, key, entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tac.clear()
+            self._asm.clear()
+            for k in self.stats:
+                self.stats[k] = 0
+
+    def __len__(self) -> int:
+        return len(self._tac) + len(self._asm)
@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Set
-from intermediate.tac_nodes import TACOP
+from intermediate.tac_nodes import TACOP, TacOp
 
 @dataclass
 class BasicBlock:
@@ -20,7 +20,7 @@ def build_cfg(tac: List[TACOP]) -> CFG:
     # 1) Mapa label -> índice de instrucción
     label_at: Dict[str, int] = {}
     for i, ins in enumerate(tac):
-        if ins.op == "label" and ins.result:
+        if ins.opcode is TacOp.LABEL and ins.result:
             label_at[ins.result] = i
 
     # 2) Bloques líderes
@@ -33,15 +33,16 @@ def build_cfg(tac: List[TACOP]) -> CFG:
             leaders.add(idx)
 
     for i, ins in enumerate(tac):
-        if ins.op == "goto":
+        opcode = ins.opcode
+        if opcode is TacOp.GOTO:
             tgt = label_at.get(ins.arg1)
             if tgt is not None: add_leader(tgt)
             add_leader(i + 1)
-        elif ins.op == "if-goto":
+        elif opcode is TacOp.IF_GOTO:
             tgt = label_at.get(ins.arg2)
             if tgt is not None: add_leader(tgt)
             add_leader(i + 1)
-        elif ins.op == "return":
+        elif opcode is TacOp.RETURN:
             add_leader(i + 1)
 
     # 3) Construir bloques contiguos
@@ -53,7 +54,7 @@ def build_cfg(tac: List[TACOP]) -> CFG:
         end = (leaders_sorted[bidx+1] - 1) if bidx+1 < len(leaders_sorted) else (len(tac) - 1)
         labels = []
         for i in range(start, end + 1):
-            if tac[i].op == "label" and tac[i].result:
+            if tac[i].opcode is TacOp.LABEL and tac[i].result:
                 labels.append(tac[i].result)
         block = BasicBlock(id=bidx, start=start, end=end, labels=labels)
         blocks.append(block)
@@ -73,12 +74,12 @@ def build_cfg(tac: List[TACOP]) -> CFG:
         if b.start > b.end: 
             continue
         last = tac[b.end]
-        if last.op == "goto":
+        if last.opcode is TacOp.GOTO:
             add_edge(b.id, label2block.get(last.arg1))
-        elif last.op == "if-goto":
+        elif last.opcode is TacOp.IF_GOTO:
             add_edge(b.id, label2block.get(last.arg2))          # rama verdadera
             add_edge(b.id, b.id + 1 if b.id + 1 < len(blocks) else None)  # caída
-        elif last.op == "return":
+        elif last.opcode is TacOp.RETURN:
             pass  # no sucesores
         else:
             add_edge(b.id, b.id + 1 if b.id + 1 < len(blocks) else None)
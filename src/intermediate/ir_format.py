@@ -0,0 +1,364 @@
+# src/intermediate/ir_format.py
+"""
+Formatos del TAC que se pueden volver a leer.
+
+1. Binario (.ir): el TAC completo más el layout de frames del TacGenerator,
+   que es lo que emit_mips necesita. Con esto el backend corre sin volver a
+   parsear ni analizar el fuente (cache en disco, IR entre workers).
+
+       magic "CPIR", versión (u8), ancho de referencia (u8: 2 o 4)
+       tabla de strings:  n (u32), tipos (n × u8), largo del blob (u32),
+                          blob utf-8 con las n entradas separadas por NUL
+       secciones:         n (u32); por sección (una por función, más el
+                          preámbulo de .data antes del primer FN):
+                            nombre (ref), k instrucciones (u32),
+                            opcodes (k × u8, TacOp),
+                            arg1/arg2/result (k × 3 refs),
+                            c (u32) + c × (índice u32, ref) comentarios,
+                            u (u32) + u refs con el texto de cada op UNKNOWN
+       frames:            n (u32); por frame: nombre (ref), alignment (u8),
+                          p (u32), l (u32), p+l × (nombre (ref), size (u32))
+
+   Little-endian. Una ref 0 es None; una ref impar 2N+1 es el temporal tN
+   (no pasa por la tabla: son la mayoría de los operandos y son densos); una
+   ref par 2K+2 es la entrada K de la tabla, que guarda cada operando una
+   sola vez junto con su tipo (Var, Label, IntConst, ... de
+   intermediate.operands).
+
+2. Texto: format_tac() escribe una instrucción por línea con TACOP.__str__
+   (lo mismo que .pretty_tac) y parse_tac() lo lee de vuelta. Los operandos
+   se reclasifican al construir cada TACOP; el texto no guarda frames, así
+   que el backend que corre desde texto usa frames vacíos.
+"""
+
+import re
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from intermediate.operands import (
+    BoolConst, IntConst, Label, NullConst, StrConst, Temp, Var,
+)
+from intermediate.tac_nodes import OPCODES, TACOP, TacOp
+from symbol_table.runtime_layout import FrameManager
+
+MAGIC = b"CPIR"
+VERSION = 1
+
+# tipo de cada entrada de la tabla de strings
+_KINDS = (str, Temp, Var, Label, IntConst, BoolConst, NullConst, StrConst)
+_KIND_TAG = {kind: tag for tag, kind in enumerate(_KINDS)}
+
+_OP_TEXT: Dict[TacOp, str] = {code: text for text, code in OPCODES.items()}
+
+
+class IRFormatError(ValueError):
+    """Archivo .ir inválido, truncado o de otra versión."""
+
+
+@dataclass
+class IRModule:
+    """Lo que se lee de un .ir: el TAC y los frames para emit_mips."""
+    tac: List[TACOP] = field(default_factory=list)
+    frame_manager: FrameManager = field(default_factory=FrameManager)
+
+
+# ========================================
+# BINARIO
+# ========================================
+
+def _little(arr: array) -> bytes:
+    if sys.byteorder == "big":
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _sections(tac: List[TACOP]) -> List[Tuple[Optional[str], List[TACOP]]]:
+    # preámbulo (DATA_WORDS) + una sección por FN
+    sections: List[Tuple[Optional[str], List[TACOP]]] = [(None, [])]
+    for ins in tac:
+        if ins.opcode is TacOp.FN_DECL:
+            sections.append((ins.result, []))
+        sections[-1][1].append(ins)
+    if not sections[0][1]:
+        sections.pop(0)
+    return sections
+
+
+def dump_ir(tac: List[TACOP], frame_manager: Optional[FrameManager] = None) -> bytes:
+    """Serializa el TAC (y los frames, si se pasan) al formato binario."""
+    ids: Dict[Tuple[int, str], int] = {}
+    kinds = array("B")
+    texts: List[str] = []
+    top = 0
+
+    def ref(value) -> int:
+        nonlocal top
+        if value is None:
+            return 0
+        kind = type(value)
+        if kind is Temp and value == f"t{value.id}":
+            top = max(top, 2 * value.id + 1)
+            return 2 * value.id + 1
+        tag = _KIND_TAG.get(kind)
+        if tag is None:
+            raise IRFormatError(f"operando de tipo no soportado: {kind.__name__}")
+        key = (tag, value)
+        rid = ids.get(key)
+        if rid is None:
+            if "\0" in value:
+                raise IRFormatError(f"operando con NUL: {value!r}")
+            rid = ids[key] = 2 * len(texts) + 2
+            kinds.append(tag)
+            texts.append(value)
+        return rid
+
+    sections = []
+    for name, body in _sections(tac):
+        opcodes = array("B")
+        refs: List[int] = []
+        comments: List[Tuple[int, int]] = []
+        unknown: List[int] = []
+        for i, ins in enumerate(body):
+            opcodes.append(ins.opcode)
+            if ins.opcode is TacOp.UNKNOWN:
+                unknown.append(ref(str(ins.op)))
+            refs += (ref(ins.arg1), ref(ins.arg2), ref(ins.result))
+            if ins.comment is not None:
+                comments.append((i, ref(str(ins.comment))))
+        sections.append((ref(name), opcodes, refs, comments, unknown))
+
+    frames = []
+    if frame_manager is not None:
+        for fid, frame in frame_manager._frames.items():
+            params = [(ref(n), size) for n, (_, size, _) in frame.params.items()]
+            locals_ = [(ref(n), size) for n, (_, size, _) in frame.locals.items()]
+            frames.append((ref(fid), frame.alignment, params, locals_))
+
+    code = "H" if max(top, 2 * len(texts)) <= 0xFFFF else "I"
+    blob = "\0".join(texts).encode("utf-8")
+    out = [MAGIC, struct.pack("<BBI", VERSION, array(code).itemsize, len(texts))]
+    out.append(kinds.tobytes())
+    out.append(struct.pack("<I", len(blob)))
+    out.append(blob)
+    out.append(struct.pack("<I", len(sections)))
+    for name, opcodes, refs, comments, unknown in sections:
+        out.append(_little(array(code, (name,))))
+        out.append(struct.pack("<I", len(opcodes)))
+        out.append(opcodes.tobytes())
+        out.append(_little(array(code, refs)))
+        out.append(struct.pack("<I", len(comments)))
+        for i, rid in comments:
+            out.append(struct.pack("<I", i))
+            out.append(_little(array(code, (rid,))))
+        out.append(struct.pack("<I", len(unknown)))
+        out.append(_little(array(code, unknown)))
+    out.append(struct.pack("<I", len(frames)))
+    for name, alignment, params, locals_ in frames:
+        out.append(_little(array(code, (name,))))
+        out.append(struct.pack("<BII", alignment, len(params), len(locals_)))
+        for rid, size in params + locals_:
+            out.append(_little(array(code, (rid,))))
+            out.append(struct.pack("<I", size))
+    return b"".join(out)
+
+
+class _Reader:
+    def __init__(self, data: bytes):
+        self.data = memoryview(data)
+        self.pos = 0
+
+    def take(self, n: int) -> memoryview:
+        if self.pos + n > len(self.data):
+            raise IRFormatError("archivo .ir truncado")
+        chunk = self.data[self.pos:self.pos + n]
+        self.pos += n
+        return chunk
+
+    def unpack(self, fmt: str):
+        return struct.unpack(fmt, self.take(struct.calcsize(fmt)))
+
+    def array(self, code: str, n: int) -> array:
+        arr = array(code)
+        arr.frombytes(self.take(n * arr.itemsize))
+        if sys.byteorder == "big":
+            arr.byteswap()
+        return arr
+
+
+def load_ir(data: bytes) -> IRModule:
+    """Lee lo que escribió dump_ir: TACOP con operandos tipados y frames."""
+    r = _Reader(data)
+    if bytes(r.take(4)) != MAGIC:
+        raise IRFormatError("no es un archivo .ir (magic inválido)")
+    version, width, n = r.unpack("<BBI")
+    if version != VERSION:
+        raise IRFormatError(f"versión de .ir no soportada: {version}")
+    code = {2: "H", 4: "I"}.get(width)
+    if code is None:
+        raise IRFormatError(f"ancho de referencia inválido: {width}")
+
+    try:
+        kinds = r.take(n)
+        blob = str(r.take(r.unpack("<I")[0]), "utf-8")
+        texts = blob.split("\0") if n else []
+        if len(texts) != n:
+            raise IRFormatError("tabla de strings inconsistente")
+        table = [_KINDS[tag](text) for tag, text in zip(kinds, texts)]
+        temps: Dict[int, Temp] = {}
+
+        def value(rid: int) -> Optional[str]:
+            if rid & 1:
+                t = temps.get(rid)
+                if t is None:
+                    t = temps[rid] = Temp(f"t{rid >> 1}")
+                return t
+            return table[(rid >> 1) - 1] if rid else None
+
+        tac: List[TACOP] = []
+        for _ in range(r.unpack("<I")[0]):
+            r.array(code, 1)  # nombre de la sección (es el result del FN)
+            k = r.unpack("<I")[0]
+            opcodes = r.take(k)
+            refs = r.array(code, 3 * k)
+            comments = {}
+            for _ in range(r.unpack("<I")[0]):
+                i = r.unpack("<I")[0]
+                comments[i] = value(r.array(code, 1)[0])
+            unknown = iter([value(u) for u in r.array(code, r.unpack("<I")[0])])
+            for i, opcode in enumerate(opcodes):
+                op = _OP_TEXT[TacOp(opcode)] if opcode else next(unknown)
+                j = 3 * i
+                tac.append(TACOP(op=op, arg1=value(refs[j]), arg2=value(refs[j + 1]),
+                                 result=value(refs[j + 2]), comment=comments.get(i)))
+
+        fm = FrameManager()
+        for _ in range(r.unpack("<I")[0]):
+            fid = value(r.array(code, 1)[0])
+            alignment, n_params, n_locals = r.unpack("<BII")
+            fm.enter_frame(fid, alignment)
+            fm.exit_frame()
+            for j in range(n_params + n_locals):
+                name = value(r.array(code, 1)[0])
+                size = r.unpack("<I")[0]
+                if j < n_params:
+                    fm.allocate_param(fid, name, size=size)
+                else:
+                    fm.allocate_local(fid, name, size=size)
+    except IRFormatError:
+        raise
+    except (IndexError, KeyError, ValueError, StopIteration) as e:
+        raise IRFormatError(f"archivo .ir corrupto: {e}") from e
+    return IRModule(tac=tac, frame_manager=fm)
+
+
+def write_ir(path: str, tac: List[TACOP], frame_manager: Optional[FrameManager] = None) -> int:
+    data = dump_ir(tac, frame_manager)
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def read_ir(path: str) -> IRModule:
+    with open(path, "rb") as f:
+        return load_ir(f.read())
+
+
+# ========================================
+# TEXTO
+# ========================================
+
+# operando: literal de string (sin escapes, como en el lexer) o texto sin
+# espacios ni comas
+_O = r'("[^"]*"|[^\s,]+)'
+# cuerpo de la línea + comentario opcional (" \t# ..." fuera de strings)
+_LINE_RE = re.compile(r'^((?:"[^"]*"|[^"])*?)(?: ?\t# (.*))?$')
+
+# (regex, op, campos) en orden: las formas especiales antes que "=" y binarios
+_FORMS = [(re.compile("^" + pat.replace("{o}", _O) + "$"), op, slots) for pat, op, slots in (
+    (r"FN {o}", "fn_decl", ("result",)),
+    (r"label {o}", "label", ("result",)),
+    (r"goto {o}", "goto", ("arg1",)),
+    (r"if {o} goto {o}", "if-goto", ("arg1", "arg2")),
+    (r"return", "return", ()),
+    (r"return {o}", "return", ("arg1",)),
+    (r"print {o}", "print", ("arg1",)),
+    (r"push_param {o}", "push_param", ("result",)),
+    (r"CREATE_ARRAY {o}", "CREATE_ARRAY", ("result",)),
+    (r"call {o}", "call", ("arg1",)),
+    (r"setprop {o}, {o}, {o}", "setprop", ("arg1", "arg2", "result")),
+    (r"STORE_IDX {o}, {o}, {o}", "STORE_IDX", ("result", "arg1", "arg2")),
+    (r"DATA_WORDS ([^\s:]+): (.*)", "DATA_WORDS", ("result", "arg1")),
+    (r"\*{o} store {o}", "store", ("result", "arg1")),
+    (r"\*{o} = alloc {o}", "alloc", ("result", "arg1")),
+    (r"{o} load \*{o}", "load", ("result", "arg1")),
+    (r"{o} PUSH_ARRAY {o}", "PUSH_ARRAY", ("result", "arg1")),
+    (r"{o} = not {o}", "not", ("result", "arg1")),
+    (r"{o} = uminus {o}", "uminus", ("result", "arg1")),
+    (r"{o} = load_param {o}", "load_param", ("result", "arg1")),
+    (r"{o} = call {o}", "call", ("result", "arg1")),
+    (r"{o} = len {o}", "len", ("result", "arg1")),
+    (r"{o} = {o} getidx {o}", "getidx", ("result", "arg1", "arg2")),
+    (r"{o} = STATIC_ARRAY {o}", "STATIC_ARRAY", ("result", "arg1")),
+    (r"{o} = STATIC_ARRAY {o} \(cow\)", "STATIC_ARRAY", ("result", "arg1")),
+    (r"{o} = LOAD_IDX {o}, {o}", "LOAD_IDX", ("result", "arg1", "arg2")),
+    (r"{o} = {o}", "=", ("result", "arg1")),
+    (r"{o} = {o} , {o}", "=", ("result", "arg1", "arg2")),
+)]
+_BINARY_RE = re.compile(r"^" + _O + r" = (.*)$")
+_TOKEN_RE = re.compile(_O)
+
+
+class TACParseError(ValueError):
+    """Línea de TAC en texto que no corresponde a ninguna instrucción."""
+
+
+def _value(text: Optional[str]) -> Optional[str]:
+    # TACOP.__str__ imprime None para los campos vacíos
+    return None if text is None or text == "None" else text
+
+
+def _parse_line(line: str, lineno: int) -> TACOP:
+    m = _LINE_RE.match(line)
+    body, comment = m.group(1).strip(), m.group(2)
+    if not body:
+        return TACOP(op="nop", comment=comment)
+    for regex, op, slots in _FORMS:
+        fm = regex.match(body)
+        if fm:
+            fields = {slot: _value(v) for slot, v in zip(slots, fm.groups())}
+            if op == "STATIC_ARRAY" and body.endswith(" (cow)"):
+                fields["arg2"] = "cow"
+            return TACOP(op=op, comment=comment, **fields)
+    bm = _BINARY_RE.match(body)
+    if bm:
+        # "r = a OP b", con a y/o b opcionales
+        tokens = _TOKEN_RE.findall(bm.group(2))
+        result = _value(bm.group(1))
+        if len(tokens) == 3:
+            return TACOP(op=tokens[1], arg1=_value(tokens[0]), arg2=_value(tokens[2]),
+                         result=result, comment=comment)
+        if len(tokens) == 2:
+            if tokens[1] in OPCODES:
+                return TACOP(op=tokens[1], arg1=_value(tokens[0]), result=result, comment=comment)
+            return TACOP(op=tokens[0], arg2=_value(tokens[1]), result=result, comment=comment)
+    raise TACParseError(f"línea {lineno}: no se reconoce la instrucción TAC: {line!r}")
+
+
+def format_tac(tac: List[TACOP]) -> str:
+    """Una instrucción por línea (el formato de .pretty_tac)."""
+    return "\n".join(str(ins) for ins in tac)
+
+
+def parse_tac(text: str) -> List[TACOP]:
+    """Lee el TAC en texto que escribe format_tac."""
+    return [_parse_line(line, i) for i, line in enumerate(text.split("\n"), 1)]
+
+
+def iter_tac(lines: Iterable[str]) -> Iterator[TACOP]:
+    """parse_tac de a una línea (ej. un archivo abierto), sin cargar el texto entero."""
+    for i, line in enumerate(lines, 1):
+        yield _parse_line(line.rstrip("\n"), i)
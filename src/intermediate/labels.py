@@ -15,7 +15,7 @@ Notas:
 - Recomiendo crear una instancia por compilación para reproducibilidad en tests/logs.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Set
 import threading
 import re
 
@@ -26,7 +26,7 @@ class LabelGenerator:
             raise ValueError("prefix must be a non-empty string")
         self._prefix = prefix
         self._next_id = int(start)
-        self._allocated_ids: List[int] = []
+        self._allocated_ids: Set[int] = set()
         self._lock = threading.Lock()
         # precompile regex for parsing names like 'L12'
         self._name_re = re.compile(rf"^{re.escape(self._prefix)}(\d+)$")
@@ -36,7 +36,7 @@ class LabelGenerator:
         with self._lock:
             lid = self._next_id
             self._next_id += 1
-            self._allocated_ids.append(lid)
+            self._allocated_ids.add(lid)
             return f"{self._prefix}{lid}"
 
     def reserve(self, name: str) -> None:
@@ -49,7 +49,7 @@ class LabelGenerator:
         with self._lock:
             if lid in self._allocated_ids:
                 raise KeyError(f"Label {name} already reserved/allocated")
-            self._allocated_ids.append(lid)
+            self._allocated_ids.add(lid)
             if lid >= self._next_id:
                 self._next_id = lid + 1
 
@@ -0,0 +1,116 @@
+# src/intermediate/operands.py
+"""
+Operandos tipados del TAC.
+
+Cada operando de un TACOP se clasifica una sola vez, al construir la
+instrucción (TacGenerator emite Temp/Label directamente; el resto pasa por
+classify()). Los consumidores (liveness, register allocator, codegen MIPS,
+intérprete) preguntan por el tipo en vez de volver a parsear el texto con
+int()/float()/regex en cada uso.
+
+Son subclases de str: se imprimen, comparan, hashean y serializan igual que
+el texto que reemplazan, así que "t3" == Temp("t3") y los dict indexados por
+nombre (offsets, registros, liveness) no cambian.
+
+  - Temp       temporales tN (id = N, denso: lo reparte TempAllocator)
+  - Var        variables / nombres de usuario
+  - Label      etiquetas de salto, de función y de .data (id = N en LN o fn.LN)
+  - IntConst   enteros (value: int)
+  - BoolConst  true / false (value: bool)
+  - NullConst  null (value: None)
+  - StrConst   literal de string con comillas (value: texto sin comillas)
+"""
+
+import re
+from functools import lru_cache
+from typing import Optional
+
+_INT_RE = re.compile(r"-?\d+")
+_TEMP_RE = re.compile(r"t\d+")
+_LABEL_ID_RE = re.compile(r"(?:.*\.)?L(\d+)")
+
+
+class Operand(str):
+    __slots__ = ()
+    # constante: no ocupa registro ni es una variable para liveness
+    is_literal = False
+
+
+class Temp(Operand):
+    __slots__ = ()
+
+    @property
+    def id(self) -> int:
+        return int(self[1:])
+
+
+class Var(Operand):
+    __slots__ = ()
+
+
+class Label(Operand):
+    __slots__ = ()
+
+    @property
+    def id(self) -> Optional[int]:
+        """N para las etiquetas LN / fn.LN de LabelGenerator; None para func_*, arrK, etc."""
+        m = _LABEL_ID_RE.fullmatch(self)
+        return int(m.group(1)) if m else None
+
+
+class Const(Operand):
+    __slots__ = ()
+    is_literal = True
+
+
+class IntConst(Const):
+    __slots__ = ()
+
+    @property
+    def value(self) -> int:
+        return int(self)
+
+
+class BoolConst(Const):
+    __slots__ = ()
+
+    @property
+    def value(self) -> bool:
+        return self == "true"
+
+
+class NullConst(Const):
+    __slots__ = ()
+
+    @property
+    def value(self) -> None:
+        return None
+
+
+class StrConst(Const):
+    __slots__ = ()
+
+    @property
+    def value(self) -> str:
+        return self[1:-1]
+
+
+@lru_cache(maxsize=1 << 16)
+def classify(text: str) -> Operand:
+    """Tipo de un operando en posición de valor (no de etiqueta)."""
+    if text in ("true", "false"):
+        return BoolConst(text)
+    if text == "null":
+        return NullConst(text)
+    if len(text) >= 2 and text[0] == '"' and text[-1] == '"':
+        return StrConst(text)
+    if _INT_RE.fullmatch(text):
+        return IntConst(text)
+    if _TEMP_RE.fullmatch(text):
+        return Temp(text)
+    return Var(text)
+
+
+@lru_cache(maxsize=1 << 16)
+def as_label(text: str) -> Label:
+    return Label(text)
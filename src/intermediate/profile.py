@@ -0,0 +1,167 @@
+"""
+Perfiles de ejecución para PGO (profile-guided optimization).
+
+Flujo:
+    1. Build instrumentado (--profile-generate): el TAC se corre en el
+       intérprete (tac_interpreter) y se guarda cuántas veces se entró a cada
+       bloque básico en un JSON.
+    2. Build optimizado (--profile-use): se carga el perfil y apply_profile()
+       aplica las pasadas guiadas sobre el mismo TAC:
+         - inline de funciones hoja pequeñas en call sites calientes
+         - layout de bloques: el sucesor caliente cae sin saltar
+         - pesos por variable para que el allocator haga spill de las frías
+
+Formato del archivo (version 1):
+    {
+      "version": 1,
+      "fingerprint": "<sha1 del TAC perfilado>",
+      "steps": 1234,
+      "blocks": [
+        {"function": "func_main", "start": 3, "end": 9, "label": "L0", "count": 11},
+        ...
+      ]
+    }
+
+`start`/`end` son índices en el TAC, por eso el perfil solo vale para el TAC
+con el mismo fingerprint (mismo fuente y mismo compilador).
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Tuple
+
+from intermediate.tac_nodes import TACOP
+from intermediate.tac_interpreter import BlockCount, TACInterpreter
+from intermediate.tac_passes import inline_hot_calls, layout_hot_blocks, is_variable_operand
+
+PROFILE_VERSION = 1
+
+
+class ProfileMismatchError(Exception):
+    """El perfil se generó con otro TAC."""
+
+
+def tac_fingerprint(code: List[TACOP]) -> str:
+    h = hashlib.sha1()
+    for ins in code:
+        h.update(f"{ins.op}|{ins.arg1}|{ins.arg2}|{ins.result}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+@dataclass
+class ExecutionProfile:
+    fingerprint: str
+    steps: int = 0
+    blocks: List[BlockCount] = field(default_factory=list)
+
+    # ------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------
+
+    def matches(self, code: List[TACOP]) -> bool:
+        return self.fingerprint == tac_fingerprint(code)
+
+    def instruction_counts(self, code: List[TACOP]) -> List[int]:
+        """Conteo por instrucción (el de su bloque), alineado con `code`."""
+        counts = [0] * len(code)
+        for b in self.blocks:
+            for i in range(b.start, min(b.end, len(code) - 1) + 1):
+                counts[i] = b.count
+        return counts
+
+    def function_counts(self) -> Dict[str, int]:
+        """Veces que se entró a cada función (su primer bloque)."""
+        out: Dict[str, int] = {}
+        for b in self.blocks:
+            out.setdefault(b.function, b.count)
+        return out
+
+    # ------------------------------------------------------------
+    # Serialización
+    # ------------------------------------------------------------
+
+    def to_dict(self) -> dict:
+        return {
+            "version": PROFILE_VERSION,
+            "fingerprint": self.fingerprint,
+            "steps": self.steps,
+            "blocks": [asdict(b) for b in self.blocks],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ExecutionProfile":
+        if data.get("version") != PROFILE_VERSION:
+            raise ValueError(f"versión de perfil no soportada: {data.get('version')}")
+        return cls(
+            fingerprint=data["fingerprint"],
+            steps=data.get("steps", 0),
+            blocks=[BlockCount(**b) for b in data["blocks"]],
+        )
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> "ExecutionProfile":
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def collect_profile(code: List[TACOP], max_steps: int = 10_000_000) -> ExecutionProfile:
+    """Build instrumentado: corre el TAC y cuenta ejecuciones por bloque."""
+    result = TACInterpreter(code, max_steps=max_steps).run()
+    return ExecutionProfile(
+        fingerprint=tac_fingerprint(code),
+        steps=result.steps,
+        blocks=result.blocks,
+    )
+
+
+def variable_weights(code: List[TACOP], counts: List[int]) -> Dict[str, Dict[str, int]]:
+    """
+    Por función: suma de las ejecuciones de cada uso/definición de cada
+    variable. El allocator hace spill primero de las de menor peso.
+    """
+    weights: Dict[str, Dict[str, int]] = {}
+    current = weights.setdefault("", {})
+    for ins, count in zip(code, counts):
+        if ins.op == "fn_decl":
+            current = weights.setdefault(ins.result, {})
+            continue
+        if ins.op in ("label", "goto", "DATA_WORDS"):
+            continue
+        if ins.op == "if-goto":
+            operands = (ins.arg1,)
+        elif ins.op == "call":
+            operands = (ins.result,)
+        else:
+            operands = (ins.result, ins.arg1, ins.arg2)
+        for name in operands:
+            if is_variable_operand(name):
+                current[name] = current.get(name, 0) + count
+    weights.pop("", None)
+    return weights
+
+
+def apply_profile(
+    code: List[TACOP],
+    profile: ExecutionProfile,
+    inline: bool = True,
+    layout: bool = True,
+) -> Tuple[List[TACOP], Dict[str, Dict[str, int]]]:
+    """
+    Aplica las pasadas guiadas por perfil.
+
+    Returns:
+        (TAC optimizado, pesos por variable para MIPSCodeGenerator)
+    """
+    if not profile.matches(code):
+        raise ProfileMismatchError("el perfil no corresponde a este programa (fingerprint distinto)")
+    counts = profile.instruction_counts(code)
+    if inline:
+        code, counts = inline_hot_calls(code, counts)
+    if layout:
+        code, counts = layout_hot_blocks(code, counts)
+    return code, variable_weights(code, counts)
@@ -1,15 +1,34 @@
-from ast_nodes import is_list
+from ast_nodes import is_list, STR
+from parser.CompiscriptParser import CompiscriptParser
 from parser.CompiscriptVisitor import CompiscriptVisitor
 from intermediate.tac_nodes import *
+from intermediate.operands import as_label, classify
 from typing import Optional, List, Dict, Any
+import copy
+import hashlib
+from antlr4 import Token
 from symbol_table import SymbolTable
 from intermediate.labels import LabelGenerator
 from intermediate.temps import TempAllocator
 from symbol_table.runtime_layout import FrameManager
+from intermediate.tac_passes import resolve_static_array_cow, merge_constant_prints
+from compile_trace import CompileTrace, NULL_TRACE
+from function_cache import FORMAT_VERSION, FunctionCache, TacEntry
+from tree_walk import TrampolineVisitor
 import pprint
-class TacGenerator(CompiscriptVisitor):
-    def __init__(self, symbol_table, resolved):
+# Los visit* que bajan a hijos son generadores: `x = (yield hijo)` en vez de
+# `x = self.visit(hijo)`; TrampolineVisitor.visit los corre con una pila
+# explícita, así la profundidad del programa no pega contra el límite de
+# recursión de Python.
+class TacGenerator(TrampolineVisitor, CompiscriptVisitor):
+    def __init__(self, symbol_table, resolved, types=None, trace: Optional[CompileTrace] = None,
+                 cache: Optional[FunctionCache] = None):
         self.resolved_symbols = resolved
+        # Contadores de la compilación (instrucciones, temporales, etiquetas)
+        self.trace = trace or NULL_TRACE
+        # Tipos por ctx de AstAndSemantic (opcional): permiten bajar las
+        # operaciones de string (concat / str_eq / str_ne) al runtime
+        self.types = types
         self.sem_table = symbol_table
         self.tac_table = SymbolTable()
         self.frame_manager = FrameManager()  # 🔹 nuevo
@@ -22,11 +41,26 @@ class TacGenerator(CompiscriptVisitor):
         self.current_function = "main"
         self.current_class: Optional[str] = None
         self.current_class_instance_place: Optional[str] = None
-        self.class_methods : List[TACOP] = []
-        self.functions: List[TACOP] = []
+        self.class_methods = TacBuffer()
+        self.functions = TacBuffer()
+        # Literales de arreglo constantes -> .data (DATA_WORDS)
+        self.static_data: List[TACOP] = []
+        self._static_labels: Dict[tuple, str] = {}
+        self._static_arrays: Dict[Any, Optional[str]] = {}   # arrayLiteral ctx -> etiqueta o None
+        # Cada función numera etiquetas (fn.L0), temporales (t0) y literales
+        # estáticos (fn.arrlit0) desde 0; ver _enter_function
+        self._static_prefix = ""
+        self._closed_temps = 0
+        self._closed_labels = 0
+        # TAC por función ya generado (function_cache.py); None = sin cache
+        self.cache = cache
+        self._signatures: Dict[str, List[str]] = {}
     # ==============================================================
     # ||  [0] Aux Functions
     # ==============================================================
+    def _is_str(self, ctx) -> bool:
+        return self.types is not None and self.types.get(ctx) == STR
+
     def _detect_type(self, txt: str):
         text = txt.strip()
         if text.lower() in ("true", "false"):
@@ -50,7 +84,7 @@ class TacGenerator(CompiscriptVisitor):
             src: str,
             offset: int, 
             index : str, 
-            code: list,
+            code: TacBuffer,
         ):
         effective_address = None
         comment = None
@@ -76,7 +110,7 @@ class TacGenerator(CompiscriptVisitor):
         offset: int, 
         index : str, 
         is_len: bool,
-        code: list,
+        code: TacBuffer,
         ):
         t0 = index
         t = self._new_temp()
@@ -123,10 +157,10 @@ class TacGenerator(CompiscriptVisitor):
             return t
     
     # hooks de TAC
-    def _emit_goto(self, lab: str, code: list):
+    def _emit_goto(self, lab: str, code: TacBuffer):
         code.append(TACOP(op="goto", arg1=lab))
 
-    def _emit_if_goto(self, cond_place: str, lab: str, code: list, negated=False):
+    def _emit_if_goto(self, cond_place: str, lab: str, code: TacBuffer, negated=False):
         if not negated:
             code.append(TACOP(op="if-goto", arg1=cond_place, arg2=lab))
         else:
@@ -136,7 +170,7 @@ class TacGenerator(CompiscriptVisitor):
 
     # hooks de llamadas
     
-    def _emit_call(self, fname, code: list,  is_void: bool = False):
+    def _emit_call(self, fname, code: TacBuffer,  is_void: bool = False):
         if is_void:
             code.append(
                 TACOP(op="call", arg1=fname)
@@ -149,7 +183,7 @@ class TacGenerator(CompiscriptVisitor):
             )
             return t
     
-    # def _emit_call(self, fname: str, arg_places: list[str], code: list) -> str:
+    # def _emit_call(self, fname: str, arg_places: list[str], code: TacBuffer) -> str:
     #     for p in arg_places:
     #         code.append(TACOP(op="param", arg1=p)) 
     #     code.append(TACOP(op="call", arg1=fname, arg2=str(len(arg_places))))
@@ -160,32 +194,32 @@ class TacGenerator(CompiscriptVisitor):
 
 
     ############################### Useful
-    def _emit_param_push(self, place,name, code: list):
+    def _emit_param_push(self, place,name, code: TacBuffer):
         code.append(
             TACOP(op="push_param", result=place)
         )
         
-    def _emit_load_param(self, dst, idx, code:list):
+    def _emit_load_param(self, dst, idx, code: TacBuffer):
         code.append(
             TACOP(op="load_param", result=dst, arg1=idx)
         )
-    def _emit_comment(self, comment, code:list):
+    def _emit_comment(self, comment, code: TacBuffer):
         code.append(
             TACOP(op="nop", comment=comment)
         )
-    def _emit_assign(self, dst: str, src: str, code: list):
+    def _emit_assign(self, dst: str, src: str, code: TacBuffer):
         code.append(TACOP(op="=", arg1=src, result=dst))
     
-    def _emit_label(self, label:str, code: list):
+    def _emit_label(self, label:str, code: TacBuffer):
         code.append(TACOP(op="label", result=label))
     
-    def _emit_un(self, op_tok: str, a: str, code: list) -> str:
+    def _emit_un(self, op_tok: str, a: str, code: TacBuffer) -> str:
         op = "uminus" if op_tok == "-" else ("not" if op_tok == "!" else op_tok)
         t = self._new_temp()
         code.append(TACOP(op=op, arg1=a, result=t))
         return t
     
-    def _emit_bin(self, op_tok: str, a: str, b: str, code: list) -> str:
+    def _emit_bin(self, op_tok: str, a: str, b: str, code: TacBuffer) -> str:
         op = op_tok
         t = self._new_temp()
         code.append(TACOP(op=op, arg1=a, arg2=b, result=t))
@@ -194,7 +228,7 @@ class TacGenerator(CompiscriptVisitor):
     
     
     ## Classes
-    def _emit_class_init(self, cls_name, space, atts: list, code: list):
+    def _emit_class_init(self, cls_name, space, atts: list, code: TacBuffer):
         
         t = self._new_temp()
         code.append(
@@ -202,7 +236,7 @@ class TacGenerator(CompiscriptVisitor):
         )
         return t
         
-    def _emit_class_att_assign(self,cls, src, offset, cname,aname,  code: list):
+    def _emit_class_att_assign(self,cls, src, offset, cname,aname,  code: TacBuffer):
         t = self._new_temp()
         code.append(
             TACOP(op="+", result=t, arg1=cls, arg2=offset)
@@ -211,7 +245,7 @@ class TacGenerator(CompiscriptVisitor):
             TACOP(op="store", result=t, arg1=src, comment=f"{cname}.{aname} = {src}")
         )
         
-    def _emit_class_att_load(self, obj: str, offset: int, cname:str,aname:str,iname:str, code:list):
+    def _emit_class_att_load(self, obj: str, offset: int, cname:str,aname:str,iname:str, code: TacBuffer):
         eff = self._new_temp()
         res = self._new_temp()
         code.append(
@@ -222,23 +256,157 @@ class TacGenerator(CompiscriptVisitor):
         )
         return res 
     
-    def _emit_class_begin(self, cls: str, base: Optional[str], code: list):
+    def _emit_class_begin(self, cls: str, base: Optional[str], code: TacBuffer):
         code.append(TACOP(op="class", arg1=cls, arg2=(base or None)))
 
-    def _emit_class_attr(self, cls: str, name: str, ty_name: Optional[str], code: list):
+    def _emit_class_attr(self, cls: str, name: str, ty_name: Optional[str], code: TacBuffer):
         code.append(TACOP(op="attr", arg1=cls, arg2=name, result=(ty_name or None)))
 
-    def _emit_class_method(self, cls: str, mname: str, entry_label: str, code: list):
+    def _emit_class_method(self, cls: str, mname: str, entry_label: str, code: TacBuffer):
         code.append(TACOP(op="method", arg1=cls, arg2=mname, result=entry_label))
 
-    def _emit_class_end(self, cls: str, code: list):
+    def _emit_class_end(self, cls: str, code: TacBuffer):
         code.append(TACOP(op="endclass", arg1=cls))
     
     def _new_temp(self):
-        return self.temp_allocator.new_temp()
+        return classify(self.temp_allocator.new_temp())
             
     def _new_label(self):
-        return self.label_generator.new_label()
+        return as_label(self.label_generator.new_label())
+
+    def _fn_label(self, name: str) -> str:
+        return f"{self.current_class}_method_{name}" if self.current_class else f"func_{name}"
+
+    def _enter_function(self, fn_label: str):
+        """
+        Namespace propio para la función: etiquetas fn.L0, fn.L1, ...,
+        temporales desde t0 y literales estáticos fn.arrlit0, ...; su código
+        (y el de sus funciones anidadas) se junta en un buffer aparte. Así
+        editar una función no cambia el TAC de las demás.
+        Devuelve el estado de quien la contiene, para _exit_function.
+        """
+        outer = (self.label_generator, self.temp_allocator, self._static_labels,
+                 self._static_prefix, self.functions)
+        self.label_generator = LabelGenerator(prefix=f"{fn_label}.L", start=0)
+        self.temp_allocator = TempAllocator(prefix="t", start=0)
+        self._static_labels = {}
+        self._static_prefix = f"{fn_label}."
+        self.functions = TacBuffer()
+        return outer
+
+    def _exit_function(self, outer) -> TacBuffer:
+        produced = self.functions
+        self._closed_temps += self.temp_allocator.next_id_hint()
+        self._closed_labels += self.label_generator.next_id_hint()
+        (self.label_generator, self.temp_allocator, self._static_labels,
+         self._static_prefix, self.functions) = outer
+        return produced
+
+    # ---------- cache por función (function_cache.py) ----------
+
+    @staticmethod
+    def _span_tokens(ctx, stop=None) -> List[Token]:
+        """Tokens (canal por defecto) de ctx, hasta `stop` exclusive si se da."""
+        tokens = ctx.parser.getTokenStream().tokens
+        end = stop.tokenIndex if stop is not None else ctx.stop.tokenIndex + 1
+        return [t for t in tokens[ctx.start.tokenIndex:end] if t.channel == Token.DEFAULT_CHANNEL]
+
+    @classmethod
+    def _span_text(cls, ctx, stop=None) -> str:
+        return " ".join(t.text for t in cls._span_tokens(ctx, stop))
+
+    def _collect_signatures(self, program_ctx) -> None:
+        """
+        Firma de cada declaración top-level, indexada por los nombres que la
+        hacen relevante: encabezado de funciones, globales completas, y para
+        clases el encabezado + atributos + encabezados de métodos (por el
+        nombre de la clase y por cada miembro; incluye la firma de la base).
+        """
+        sigs: Dict[str, List[str]] = {}
+        classes: Dict[str, tuple] = {}
+        for st in program_ctx.statement():
+            decl = st.getChild(0)
+            if isinstance(decl, CompiscriptParser.FunctionDeclarationContext):
+                sigs.setdefault(decl.Identifier().getText(), []).append(
+                    "fn " + self._span_text(decl, decl.block().start))
+            elif isinstance(decl, (CompiscriptParser.VariableDeclarationContext,
+                                   CompiscriptParser.ConstantDeclarationContext)):
+                sigs.setdefault(decl.Identifier().getText(), []).append("var " + self._span_text(decl))
+            elif isinstance(decl, CompiscriptParser.ClassDeclarationContext):
+                members, parts = [], []
+                for m in decl.classMember():
+                    inner = m.getChild(0)
+                    members.append(inner.Identifier().getText())
+                    if isinstance(inner, CompiscriptParser.FunctionDeclarationContext):
+                        parts.append(self._span_text(inner, inner.block().start))
+                    else:
+                        parts.append(self._span_text(inner))
+                header = self._span_text(decl, decl.classMember(0).start if members else decl.stop)
+                base = decl.Identifier(1).getText() if len(decl.Identifier()) > 1 else None
+                classes[decl.Identifier(0).getText()] = (header + " " + " ".join(parts), base, members)
+
+        def class_sig(name: str, seen=()) -> str:
+            text, base, _ = classes[name]
+            if base in classes and base not in seen:
+                text += " | " + class_sig(base, seen + (name,))
+            return "class " + text
+
+        for name, (_, _, members) in classes.items():
+            sig = class_sig(name)
+            for n in {name, *members}:
+                sigs.setdefault(n, []).append(sig)
+        self._signatures = sigs
+
+    def _function_key(self, ctx, fn_label: str) -> str:
+        tokens = self._span_tokens(ctx)
+        deps = set()
+        if self.current_class:
+            deps.update(self._signatures.get(self.current_class, ()))
+        for t in tokens:
+            if t.type == CompiscriptParser.Identifier:
+                deps.update(self._signatures.get(t.text, ()))
+        h = hashlib.sha1(f"tac{FORMAT_VERSION}\0{fn_label}\0{self.types is not None}\0".encode())
+        h.update(" ".join(t.text for t in tokens).encode())
+        for sig in sorted(deps):
+            h.update(b"\0" + sig.encode())
+        return h.hexdigest()
+
+    def _frames_snapshot(self) -> Dict[str, tuple]:
+        return {fid: (len(f.params), len(f.locals)) for fid, f in self.frame_manager._frames.items()}
+
+    def _frames_since(self, before: Dict[str, tuple]):
+        """Reservas hechas en los frames desde `before` (ver TacEntry.frames)."""
+        allocs, new_frames = [], []
+        for fid, frame in self.frame_manager._frames.items():
+            n_params, n_locals = before.get(fid, (0, 0))
+            if fid not in before:
+                new_frames.append(fid)
+            for name, (_, size, _) in list(frame.params.items())[n_params:]:
+                allocs.append((fid, "param", name, size))
+            for name, (_, size, _) in list(frame.locals.items())[n_locals:]:
+                allocs.append((fid, "local", name, size))
+        return tuple(allocs), tuple(new_frames)
+
+    def _replay_function(self, entry: TacEntry) -> None:
+        """Aplica un TacEntry como si la función se hubiera vuelto a generar."""
+        fm = self.frame_manager
+        for fid in entry.new_frames:
+            fm.enter_frame(fid)
+            fm.exit_frame()
+        for fid, kind, name, size in entry.frames:
+            frame = fm._frames.get(fid)
+            slots = None if frame is None else (frame.params if kind == "param" else frame.locals)
+            if slots is None or name not in slots:
+                if kind == "param":
+                    fm.allocate_param(fid, name, size=size)
+                else:
+                    fm.allocate_local(fid, name, size=size)
+        # copias: las pasadas de tac_passes modifican instrucciones in-place
+        # (arg2="cow") y el cache se comparte entre compilaciones
+        self.static_data.extend(map(copy.copy, entry.static_data))
+        self.functions += map(copy.copy, entry.code)
+        self._closed_temps += entry.temps
+        self._closed_labels += entry.labels
                
     def _enter_scope(self):
         self.sem_table.enter_scope()
@@ -253,12 +421,8 @@ class TacGenerator(CompiscriptVisitor):
     def get_code(self):
         return list(self.code)
     
-    def _emit_func_define(self, name, code : list):
-        eff_name = ""
-        if (self.current_class):
-            eff_name = f"{self.current_class}_method_{name}"
-        else:
-            eff_name = f"func_{name}"
+    def _emit_func_define(self, name, code : TacBuffer):
+        eff_name = self._fn_label(name)
         code.append(
             TACOP(op="fn_decl", result=eff_name)
         )
@@ -267,7 +431,7 @@ class TacGenerator(CompiscriptVisitor):
         fq = f"{self.current_class}_{name}" if self.current_class else name
         return (f"{fq}_entry", f"{fq}_exit")
     
-    def _emit_store_prop(self, obj_place: str, prop_offset: int, prop_name: str,cls_name: str, src_place: str, code: list):
+    def _emit_store_prop(self, obj_place: str, prop_offset: int, prop_name: str,cls_name: str, src_place: str, code: TacBuffer):
         # STORE_PROP: arg1 = objeto, arg2 = nombre_prop, result = valor
         effective = self._new_temp()
         code.append(
@@ -388,18 +552,28 @@ class TacGenerator(CompiscriptVisitor):
     # ==============================================================
     def visitProgram(self, ctx):
         stmts = ctx.statement()
-        code = [TACOP(
+        if self.cache is not None:
+            self._collect_signatures(ctx)
+        code = TacBuffer([TACOP(
             op="fn_decl", result="func_main"
-        )]
+        )])
         for st in stmts:
-            tem_node = self.visit(st)
+            tem_node = (yield st)
             if tem_node:
-                code = code + tem_node.code
+                code += tem_node.code
         
-        final_code = self.functions + self.class_methods + code
+        # único aplanado del código: todo lo anterior son enlaces entre buffers
+        final_code = list(TacBuffer(self.static_data) + self.functions + self.class_methods + code)
         # final_code = self.peephole(final_code)
+        with self.trace.span("tac.passes"):
+            final_code = resolve_static_array_cow(final_code)
+            final_code = merge_constant_prints(final_code)
         
         self.code = final_code
+        self.trace.set("tac.instructions", len(final_code))
+        self.trace.set("tac.temps", self._closed_temps + self.temp_allocator.next_id_hint())
+        self.trace.set("tac.labels", self._closed_labels + self.label_generator.next_id_hint())
+        self.trace.set("tac.functions", sum(1 for t in final_code if t.op == "fn_decl"))
         # self.dump_runtime_info()
         return IRNode(code=final_code)
     
@@ -424,7 +598,7 @@ class TacGenerator(CompiscriptVisitor):
             ctx.continueStatement() or      # ✅
             ctx.returnStatement()           # ✅
         )
-        return self.visit(child)
+        return (yield child)
 
     # ==============================================================
     # ||  [2] Conditional Expressions (if-else, switch)
@@ -433,15 +607,15 @@ class TacGenerator(CompiscriptVisitor):
     # IF-ELSE
     def visitIfStatement(self, ctx):
         # if '(' expression ')' block ('else' block)?
-        cond_node = self.visit(ctx.expression())
-        then_node = self.visit(ctx.block(0))
-        else_node = self.visit(ctx.block(1)) if len(ctx.block()) > 1 else None
+        cond_node = (yield ctx.expression())
+        then_node = (yield ctx.block(0))
+        else_node = (yield ctx.block(1)) if len(ctx.block()) > 1 else None
 
         Ltrue = self._new_label()
         Lfalse = self._new_label() if else_node else None
         Lend  = self._new_label()
 
-        code = []
+        code = TacBuffer()
         code += cond_node.code
         # si la condición es true → Ltrue, else → Lfalse o Lend
         self._emit_if_goto(cond_node.place, Ltrue, code)
@@ -471,8 +645,8 @@ class TacGenerator(CompiscriptVisitor):
         """
         switch '(' expression ')' '{' switchCase* defaultCase? '}'
         """
-        scrut = self.visit(ctx.expression())
-        code = []
+        scrut = (yield ctx.expression())
+        code = TacBuffer()
         if scrut and scrut.code: code += scrut.code
 
         cases = ctx.switchCase() or []
@@ -484,7 +658,7 @@ class TacGenerator(CompiscriptVisitor):
 
         # saltos a cada case
         for i, cctx in enumerate(cases):
-            cexpr = self.visit(cctx.expression())
+            cexpr = (yield cctx.expression())
             if cexpr and cexpr.code: code += cexpr.code
             tcmp = self._emit_bin("==", scrut.place, cexpr.place, code)
             self._emit_if_goto(tcmp, Lcases[i], code)
@@ -497,7 +671,7 @@ class TacGenerator(CompiscriptVisitor):
             self._emit_label(Lcases[i], code)
             # statements del case
             for s in cctx.statement():
-                n = self.visit(s)
+                n = (yield s)
                 if n and n.code: code += n.code
             # tras un case, por defecto caemos al end (si quieres 'fallthrough', no pongas este goto)
             self._emit_goto(Lend, code)
@@ -506,7 +680,7 @@ class TacGenerator(CompiscriptVisitor):
         if has_default:
             self._emit_label(Ldefault, code)
             for s in ctx.defaultCase().statement():
-                n = self.visit(s)
+                n = (yield s)
                 if n and n.code: code += n.code
 
         self._emit_label(Lend, code)
@@ -523,20 +697,20 @@ class TacGenerator(CompiscriptVisitor):
         Lbody = self._new_label()
         Lend  = self._new_label()
 
-        code = []
+        code = TacBuffer()
         # gestionar break/continue
         self.continue_stack.append(Lcond)
         self.break_stack.append(Lend)
 
         self._emit_label(Lcond, code)
 
-        cond = self.visit(ctx.expression())
+        cond = (yield ctx.expression())
         code += cond.code
         self._emit_if_goto(cond.place, Lbody, code)
         self._emit_goto(Lend, code)
 
         self._emit_label(Lbody, code)
-        body = self.visit(ctx.block())
+        body = (yield ctx.block())
         code += body.code
         self._emit_goto(Lcond, code)
 
@@ -554,17 +728,17 @@ class TacGenerator(CompiscriptVisitor):
         Lcond = self._new_label()
         Lend  = self._new_label()
 
-        code = []
+        code = TacBuffer()
         # en do..while, continue debe saltar a Lcond (chequear condición)
         self.continue_stack.append(Lcond)
         self.break_stack.append(Lend)
 
         self._emit_label(Lbody, code)
-        body = self.visit(ctx.block())
+        body = (yield ctx.block())
         code += body.code
 
         self._emit_label(Lcond, code)
-        cond = self.visit(ctx.expression())
+        cond = (yield ctx.expression())
         code += cond.code
         self._emit_if_goto(cond.place, Lbody, code)  # repetir si true
         self._emit_goto(Lend, code)
@@ -581,13 +755,13 @@ class TacGenerator(CompiscriptVisitor):
         """
         for '(' (variableDeclaration | assignment | ';') expression? ';' expression? ')' block;
         """
-        code = []
+        code = TacBuffer()
 
         # init
         if ctx.variableDeclaration():
-            init_node = self.visit(ctx.variableDeclaration());  code += init_node.code if init_node else []
+            init_node = (yield ctx.variableDeclaration());  code += init_node.code if init_node else []
         elif ctx.assignment():
-            init_node = self.visit(ctx.assignment());           code += init_node.code if init_node else []
+            init_node = (yield ctx.assignment());           code += init_node.code if init_node else []
             
 
         # cond y update
@@ -595,12 +769,12 @@ class TacGenerator(CompiscriptVisitor):
         if ctx.expression():
             exprs = ctx.expression()
             if isinstance(exprs, list):
-                if len(exprs) >= 1: cond_node = self.visit(exprs[0])
+                if len(exprs) >= 1: cond_node = (yield exprs[0])
                 if len(exprs) >= 2: 
-                    upd_node  = self.visit(exprs[1])
+                    upd_node  = (yield exprs[1])
                     up_code = upd_node.code
                     up_place = upd_node.place
-                    tem_code = []
+                    tem_code = TacBuffer()
                     tem_code += up_code
                     if (up_code[-1].result != up_place):
                         self._emit_assign(
@@ -614,7 +788,7 @@ class TacGenerator(CompiscriptVisitor):
                     )
                     
             else:
-                cond_node = self.visit(exprs)
+                cond_node = (yield exprs)
 
         Lcond = self._new_label()
         Lbody = self._new_label()
@@ -636,7 +810,7 @@ class TacGenerator(CompiscriptVisitor):
 
         # body
         self._emit_label(Lbody, code)
-        body_node = self.visit(ctx.block())
+        body_node = (yield ctx.block())
         code += body_node.code
         self._emit_goto(Lstep, code)
 
@@ -657,7 +831,7 @@ class TacGenerator(CompiscriptVisitor):
     # FOREACH
     def visitForeachStatement(self, ctx):
         item_name = ctx.Identifier().getText()
-        arr_node  = self.visit(ctx.expression())
+        arr_node  = (yield ctx.expression())
 
         t_i   = self._new_temp()   # índice
         t_n   = self._new_temp()   # longitud
@@ -666,7 +840,7 @@ class TacGenerator(CompiscriptVisitor):
         Lstep = self._new_label()  #  bloque step
         Lend  = self._new_label()
 
-        code = []
+        code = TacBuffer()
         # __i = 0
         self._emit_assign(dst=t_i, src="0", code=code)
         # __n = len(arr)
@@ -690,7 +864,7 @@ class TacGenerator(CompiscriptVisitor):
         self._emit_assign(dst=item_name, src=t_item, code=code)
 
         # cuerpo foreach
-        body = self.visit(ctx.block())
+        body = (yield ctx.block())
         if body and body.code: code += body.code
 
         # step: __i = __i + 1
@@ -713,9 +887,9 @@ class TacGenerator(CompiscriptVisitor):
     
     # RETURN
     def visitReturnStatement(self, ctx):
-        code = []
+        code = TacBuffer()
         if ctx.expression():
-            val = self.visit(ctx.expression())
+            val = (yield ctx.expression())
             code += val.code
             code.append(TACOP(op="return", arg1=val.place))
         else:
@@ -726,8 +900,8 @@ class TacGenerator(CompiscriptVisitor):
     def visitBreakStatement(self, ctx):
         # Salta al fin del lazo actual
         if not self.break_stack:
-            return IRNode(code=[])  # semántica ya reporta error; acá evita crashear
-        code = []
+            return IRNode(code=TacBuffer())  # semántica ya reporta error; acá evita crashear
+        code = TacBuffer()
         self._emit_goto(self.break_stack[-1], code)
         return IRNode(code=code)
 
@@ -735,8 +909,8 @@ class TacGenerator(CompiscriptVisitor):
     def visitContinueStatement(self, ctx):
         # Salta al "siguiente ciclo" (condición o step, según el lazo)
         if not self.continue_stack:
-            return IRNode(code=[])
-        code = []
+            return IRNode(code=TacBuffer())
+        code = TacBuffer()
         self._emit_goto(self.continue_stack[-1], code)
         return IRNode(code=code)
 
@@ -747,17 +921,17 @@ class TacGenerator(CompiscriptVisitor):
     def visitThisExpr(self, ctx):
         return IRNode(
             place= "this",
-            code = []
+            code = TacBuffer()
         )
     def visitTernaryExpr(self, ctx):
-        # conditionalExpr: logicalOrExpr ('?' expression ':' expression)?
+        # conditionalExpr: operatorExpr ('?' expression ':' expression)?
         if ctx.getChildCount() == 1:
-            return self.visit(ctx.logicalOrExpr())
+            return (yield ctx.operatorExpr())
 
         # Hay ternario
-        cond_node = self.visit(ctx.logicalOrExpr())
-        then_node = self.visit(ctx.expression(0))
-        else_node = self.visit(ctx.expression(1))
+        cond_node = (yield ctx.operatorExpr())
+        then_node = (yield ctx.expression(0))
+        else_node = (yield ctx.expression(1))
 
         Lthen = self._new_label()
         Lelse = self._new_label()
@@ -766,7 +940,7 @@ class TacGenerator(CompiscriptVisitor):
         # Usamos un temp para el "valor" del ternario (aunque tu gramática lo use como statement,
         # así también queda correcto si alguien lo usa en una expresión).
         result = self._new_temp()
-        code = []
+        code = TacBuffer()
 
         # cond
         if cond_node and cond_node.code: code += cond_node.code
@@ -791,137 +965,44 @@ class TacGenerator(CompiscriptVisitor):
         self._emit_label(Lend, code)
         return IRNode(place=result, code=code)
     
-    def visitRelationalExpr(self, ctx):
-        if len(ctx.additiveExpr()) == 1:
-            # Unary case
-            sub = self.visit(ctx.additiveExpr(0))
-            return sub
-        # Binary case
-        left = self.visit(ctx.additiveExpr(0))
-        op = ctx.getChild(1).getText()
-        right = self.visit(ctx.additiveExpr(1))
-        
-        code = left.code + right.code
-        temp = self._emit_bin(op, left.place, right.place, code)
-        
-        return IRNode(
-            place=temp,
-            code=code
-        )
-    
-    def visitEqualityExpr(self, ctx):
-        if len(ctx.relationalExpr()) == 1:
-            sub = self.visit(ctx.relationalExpr(0))
-            return sub
-        left = self.visit(ctx.relationalExpr(0))
-        op = ctx.getChild(1).getText()
-        right = self.visit(ctx.relationalExpr(1))
-        
+    # operatorExpr (recursión izquierda): cada operación binaria es un
+    # contexto con exactamente dos operandos, ctx.operatorExpr(0) y (1)
+    def _binary(self, ctx, op):
+        left = (yield ctx.operatorExpr(0))
+        right = (yield ctx.operatorExpr(1))
+
         code = left.code + right.code
         temp = self._emit_bin(op, left.place, right.place, code)
-        
-        return IRNode(
-            place=temp,
-            code=code
-        )
-    
-    def visitLogicalAndExpr(self, ctx):
-        if len(ctx.equalityExpr()) == 1:
-            sub = self.visit(ctx.equalityExpr(0))
-            return sub
-        left = self.visit(ctx.equalityExpr(0))
-        right = self.visit(ctx.equalityExpr(1))
-        
-        code = left.code + right.code
-        temp = self._emit_bin("&&", left.place, right.place, code)
-        
+
         return IRNode(
             place=temp,
             code=code
         )
-        
+
     def visitLogicalOrExpr(self, ctx):
-        # logicalAndExpr ( '||' logicalAndExpr )*
-        n = len(ctx.logicalAndExpr())
-        node0 = self.visit(ctx.logicalAndExpr(0))
-        acc_place = node0.place
-        code = node0.code[:]
-        for i in range(1, n):
-            rhs = self.visit(ctx.logicalAndExpr(i))
-            code += rhs.code
-            acc_place = self._emit_bin("||", acc_place, rhs.place, code)
-        return IRNode(place=acc_place, code=code)
+        return self._binary(ctx, "||")
 
     def visitLogicalAndExpr(self, ctx):
-        n = len(ctx.equalityExpr())
-        node0 = self.visit(ctx.equalityExpr(0))
-        acc_place = node0.place
-        code = node0.code[:]
-        for i in range(1, n):
-            rhs = self.visit(ctx.equalityExpr(i))
-            code += rhs.code
-            acc_place = self._emit_bin("&&", acc_place, rhs.place, code)
-        return IRNode(place=acc_place, code=code)
+        return self._binary(ctx, "&&")
 
     def visitEqualityExpr(self, ctx):
-        n = len(ctx.relationalExpr())
-        node0 = self.visit(ctx.relationalExpr(0))
-        acc_place = node0.place
-        code = node0.code[:]
-        idx = 1
-        childi = 1
-        while childi < ctx.getChildCount():
-            op = ctx.getChild(childi).getText()    # '==' | '!='
-            rhs = self.visit(ctx.relationalExpr(idx))
-            code += rhs.code
-            acc_place = self._emit_bin(op, acc_place, rhs.place, code)
-            idx += 1; childi += 2
-        return IRNode(place=acc_place, code=code)
+        op = ctx.op.text    # '==' | '!='
+        if self._is_str(ctx.operatorExpr(0)):
+            # comparación de contenido, no de punteros
+            op = "str_eq" if op == "==" else "str_ne"
+        return self._binary(ctx, op)
 
     def visitRelationalExpr(self, ctx):
-        n = len(ctx.additiveExpr())
-        node0 = self.visit(ctx.additiveExpr(0))
-        acc_place = node0.place
-        code = node0.code[:]
-        idx = 1
-        childi = 1
-        while childi < ctx.getChildCount():
-            op = ctx.getChild(childi).getText()    # < <= > >=
-            rhs = self.visit(ctx.additiveExpr(idx))
-            code += rhs.code
-            acc_place = self._emit_bin(op, acc_place, rhs.place, code)
-            idx += 1; childi += 2
-        return IRNode(place=acc_place, code=code)
+        return self._binary(ctx, ctx.op.text)    # < <= > >=
 
     def visitAdditiveExpr(self, ctx):
-        n = len(ctx.multiplicativeExpr())
-        node0 = self.visit(ctx.multiplicativeExpr(0))
-        acc_place = node0.place
-        code = node0.code[:]
-        idx = 1
-        childi = 1
-        while childi < ctx.getChildCount():
-            op = ctx.getChild(childi).getText()    # + | -
-            rhs = self.visit(ctx.multiplicativeExpr(idx))
-            code += rhs.code
-            acc_place = self._emit_bin(op, acc_place, rhs.place, code)
-            idx += 1; childi += 2
-        return IRNode(place=acc_place, code=code)
+        op = ctx.op.text    # + | -
+        if op == "+" and self._is_str(ctx.operatorExpr(0)):
+            op = "concat"
+        return self._binary(ctx, op)
 
     def visitMultiplicativeExpr(self, ctx):
-        n = len(ctx.unaryExpr())
-        node0 = self.visit(ctx.unaryExpr(0))
-        acc_place = node0.place
-        code = node0.code[:]
-        idx = 1
-        childi = 1
-        while childi < ctx.getChildCount():
-            op = ctx.getChild(childi).getText()    # * / %
-            rhs = self.visit(ctx.unaryExpr(idx))
-            code += rhs.code
-            acc_place = self._emit_bin(op, acc_place, rhs.place, code)
-            idx += 1; childi += 2
-        return IRNode(place=acc_place, code=code)
+        return self._binary(ctx, ctx.op.text)    # * / %
     
     # ==============================================================
     # ||  [5] Declarations
@@ -933,8 +1014,8 @@ class TacGenerator(CompiscriptVisitor):
         const Identifier typeAnnotation? '=' expression ';'
         """
         name = ctx.Identifier().getText()
-        expr_node = self.visit(ctx.expression())
-        code = []
+        expr_node = (yield ctx.expression())
+        code = TacBuffer()
         if expr_node and expr_node.code:
             code += expr_node.code
         # asignación
@@ -955,9 +1036,9 @@ class TacGenerator(CompiscriptVisitor):
         print '(' expression ')' ';'
         """
         expr_ctx = ctx.expression()
-        val = self.visit(ctx.expression())
+        val = (yield ctx.expression())
         
-        code = []
+        code = TacBuffer()
         if val and val.code:
             code += val.code
 
@@ -967,6 +1048,18 @@ class TacGenerator(CompiscriptVisitor):
         last = val.code[-1]
         expr_text = expr_ctx.getText()
 
+        if self.types is not None:
+            if not self._is_str(expr_ctx):
+                code.append(TACOP(op="print", arg1=val.place))
+            elif last.op == "concat" and last.result == val.place:
+                # print(a + b) -> print_s a; print_s b (sin armar el string)
+                code.pop()
+                code.append(TACOP(op="print_s", arg1=last.arg1))
+                code.append(TACOP(op="print_s", arg1=last.arg2))
+            else:
+                code.append(TACOP(op="print_s", arg1=val.place))
+            return IRNode(code=code)
+
         if last.op == "+" and '"' in expr_text:
             left = last.arg1
             right = last.arg2
@@ -988,11 +1081,25 @@ class TacGenerator(CompiscriptVisitor):
         function Identifier '(' parameters? ')' (':' type)? block;
         """
         fname = ctx.Identifier().getText()
+        fn_label = self._fn_label(fname)
+        key = None
+        if self.cache is not None:
+            key = self._function_key(ctx, fn_label)
+            entry = self.cache.get_tac(key)
+            if entry is not None:
+                self.trace.count("cache.tac_hits")
+                self._replay_function(entry)
+                return IRNode(place=None, code=TacBuffer())
+            self.trace.count("cache.tac_misses")
+            frames_before = self._frames_snapshot()
+            static_before = len(self.static_data)
+            closed_before = (self._closed_temps, self._closed_labels)
+        outer = self._enter_function(fn_label)
         self._enter_scope()
         
         self.current_function = fname
         self.frame_manager.enter_frame(fname)
-        code = []
+        code = TacBuffer()
         self._emit_func_define(fname, code)
         frame_id = f"func_{fname}"
 
@@ -1054,7 +1161,7 @@ class TacGenerator(CompiscriptVisitor):
                 )
 
         # Cuerpazo
-        body_ir = self.visit(ctx.block())
+        body_ir = (yield ctx.block())
         if body_ir and body_ir.code:
             code += body_ir.code
 
@@ -1063,19 +1170,30 @@ class TacGenerator(CompiscriptVisitor):
         self.frame_manager.exit_frame()
         self.current_function = "main"
 
-        return IRNode(place=None, code=[])
+        produced = self._exit_function(outer)
+        self.functions += produced
+        if key is not None:
+            frames, new_frames = self._frames_since(frames_before)
+            self.cache.put_tac(key, TacEntry(
+                code=tuple(map(copy.copy, produced)),
+                static_data=tuple(map(copy.copy, self.static_data[static_before:])),
+                frames=frames,
+                new_frames=new_frames,
+                temps=self._closed_temps - closed_before[0],
+                labels=self._closed_labels - closed_before[1],
+            ))
+        return IRNode(place=None, code=TacBuffer())
 
 
     # ==============================================================
     # ||  [6] Primary and Unary
     # ==============================================================
     
+    def visitOperandExpr(self, ctx):
+        return (yield ctx.primaryExpr())
+
     def visitUnaryExpr(self, ctx):
-        if ctx.getChildCount() == 1:
-            sub1 = self.visit(ctx.primaryExpr())
-            return sub1
-        
-        sub = self.visit(ctx.unaryExpr())
+        sub = (yield ctx.operatorExpr())
         op = ctx.getChild(0).getText()
         
         code = sub.code
@@ -1089,30 +1207,30 @@ class TacGenerator(CompiscriptVisitor):
     def visitPrimaryExpr(self, ctx):
         # primaryExpr: literalExpr | leftHandSide | '(' expression ')'
         if ctx.literalExpr():
-            sub = self.visit(ctx.literalExpr())
+            sub = (yield ctx.literalExpr())
             return sub
 
         if ctx.leftHandSide():
-            sub = self.visit(ctx.leftHandSide())
+            sub = (yield ctx.leftHandSide())
             if sub is None:
                 # fallback ultra-conservador: usar el texto
                 src = ctx.leftHandSide().getText()
                 place = self._new_temp()
-                code = []
+                code = TacBuffer()
                 self._emit_assign(dst=place, src=src, code=code)
                 return IRNode(place=place, code=code)
             # patrón: t = <place>
             place = self._new_temp()
-            code = sub.code[:] if sub.code else []
+            code = sub.code.copy() if sub.code else TacBuffer()
             self._emit_assign(dst=place, src=sub.place, code=code)
             return IRNode(place=place, code=code)
 
         # '(' expression ')'
-        inner = self.visit(ctx.expression())
+        inner = (yield ctx.expression())
         if inner is None:
             # fallback: asignar el texto (no ideal, pero evita crash)
             place = self._new_temp()
-            code = []
+            code = TacBuffer()
             self._emit_assign(dst=place, src=ctx.getText(), code=code)
             return IRNode(place=place, code=code)
         # devolvemos la subexpresión directamente
@@ -1125,7 +1243,7 @@ class TacGenerator(CompiscriptVisitor):
     def visitVariableDeclaration(self, ctx):
         id = ctx.Identifier().getText()
         init = ctx.initializer()
-        code = []
+        code = TacBuffer()
         node = None
         ty = None
         sem_info = self.sem_table.lookup(id)
@@ -1147,7 +1265,7 @@ class TacGenerator(CompiscriptVisitor):
                 
         
         if init:
-            expr_rslt = self.visit(init.expression())
+            expr_rslt = (yield init.expression())
             code += expr_rslt.code
             
             self._emit_assign(dst=id, src=expr_rslt.place, code=code)
@@ -1180,7 +1298,7 @@ class TacGenerator(CompiscriptVisitor):
                 if not tac_sym:
                     raise("ERROR - variable non existent on symbol table")
                 
-                rhs = self.visit(ctx.expression(0))
+                rhs = (yield ctx.expression(0))
                 code = rhs.code
                 self._emit_assign(dst=id, src=rhs.place, code=code)
                 frame_id = self.frame_manager.current_frame_id()
@@ -1204,9 +1322,9 @@ class TacGenerator(CompiscriptVisitor):
 
             obj_name, prop_name = lhs_text.rsplit(".", 1)
 
-            rhs_ir = self.visit(ctx.expression(1))
+            rhs_ir = (yield ctx.expression(1))
 
-            code = []
+            code = TacBuffer()
             if rhs_ir and rhs_ir.code:
                 code += rhs_ir.code
 
@@ -1299,26 +1417,26 @@ class TacGenerator(CompiscriptVisitor):
     
     def visitLiteralExpr(self, ctx):
         if ctx.arrayLiteral():
-            sub = self.visit(ctx.arrayLiteral())
+            sub = (yield ctx.arrayLiteral())
             return sub
         val = ctx.getText()
         place = self._new_temp()
-        code = []
+        code = TacBuffer()
         self._emit_assign(dst=place, src=val, code=code)
 
         return IRNode(place=place, code=code)
     
     def visitExprNoAssign(self, ctx):
-        sub = self.visit(ctx.conditionalExpr())
+        sub = (yield ctx.conditionalExpr())
         return sub
     
     def visitAssignExpr(self, ctx):
         # ctx.lhs es un leftHandSide (labeled)
         
-        lhs_node = self.visitLeftHandSide(ctx.lhs, mode="store")                   # debe devolver algo con .place
-        rhs_node = self.visit(ctx.assignmentExpr())      # valor a asignar
+        lhs_node = (yield from self.visitLeftHandSide(ctx.lhs, mode="store"))                   # debe devolver algo con .place
+        rhs_node = (yield ctx.assignmentExpr())      # valor a asignar
 
-        code = []
+        code = TacBuffer()
         if lhs_node:
             code += lhs_node.code
 
@@ -1364,11 +1482,11 @@ class TacGenerator(CompiscriptVisitor):
         Emite: setprop obj, prop, val
         """
         
-        obj_node = self.visit(ctx.lhs)                # objeto a la izquierda del punto
+        obj_node = (yield ctx.lhs)                # objeto a la izquierda del punto
         prop_name = ctx.Identifier().getText()
-        rhs_node = self.visit(ctx.assignmentExpr())
+        rhs_node = (yield ctx.assignmentExpr())
 
-        code = []
+        code = TacBuffer()
         if obj_node and obj_node.code: code += obj_node.code
         if rhs_node and rhs_node.code: code += rhs_node.code
 
@@ -1388,9 +1506,9 @@ class TacGenerator(CompiscriptVisitor):
         - No emite 'label' salvo que las sentencias internas lo hagan.
         """
         self._enter_scope()
-        code = []
+        code = TacBuffer()
         for s in ctx.statement():
-            node = self.visit(s)
+            node = (yield s)
             if node and getattr(node, "code", None):
                 code += node.code
         self._exit_scope()
@@ -1402,7 +1520,7 @@ class TacGenerator(CompiscriptVisitor):
     # ==============================================================
     
     def visitExpressionStatement(self, ctx):
-        sub = self.visit(ctx.expression())
+        sub = (yield ctx.expression())
         return sub
     # ==============================================================
     # ||  [10] leftHandSide and primaryAtom
@@ -1415,12 +1533,12 @@ class TacGenerator(CompiscriptVisitor):
         Si hay sufijos, de momento no los transformamos (queda TODO),
         pero devolvemos al menos un IRNode válido para no crashear.
         """
-        base = self.visit(ctx.primaryAtom())
+        base = (yield ctx.primaryAtom())
         if base is None:
             print("Fallback at visitLeftHandSide")
             # fallback ultra-conservador
             name = ctx.getText()
-            return IRNode(place=name, code=[])
+            return IRNode(place=name, code=TacBuffer())
         suffixes = []
         suffixes.append(base)
         if ctx.suffixOp():
@@ -1428,7 +1546,7 @@ class TacGenerator(CompiscriptVisitor):
                 text = sop_idx.getText()
                 if text[0] =="[": # handling for index suffix
                     before = suffixes[-1]
-                    sop = self.visit(sop_idx.expression())
+                    sop = (yield sop_idx.expression())
                     
                     code = sop.code
                     if mode == "load":
@@ -1448,8 +1566,8 @@ class TacGenerator(CompiscriptVisitor):
                 if text[0] =="(":  # Handle for call
                     before = suffixes[-1]
                     if (before.place == "len"):
-                        call_code = getattr(self.visitCallExpr(sop_idx), "code")
-                        code = [call_code[0]]
+                        call_code = getattr((yield sop_idx), "code")
+                        code = TacBuffer([call_code[0]])
                         arr_place = call_code[0].result
                         len_place = self._emit_array_offset_load(
                             arr_place,offset=0, index=0,is_len=True, code=code
@@ -1460,10 +1578,10 @@ class TacGenerator(CompiscriptVisitor):
                         ))
                     elif (isinstance(before, IRClassMethod)):
                         fname = f"{before.class_type}_method_{before.mname}"
-                        code = []
+                        code = TacBuffer()
                         
                         self._emit_param_push(before.parent, name=f"self -> ({before.class_type}){before.parent}", code=code)
-                        call_exp = self.visitCallExpr(sop_idx)
+                        call_exp = (yield sop_idx)
                         code += call_exp.code
                         # print(f"calling {fname}")
                         
@@ -1484,15 +1602,18 @@ class TacGenerator(CompiscriptVisitor):
                                 fname = getattr(fn_sym, "name", "ERROR")
                             else:
                                 print("ERROR function not found")
-                        code = []
+                        code = TacBuffer()
                         if sop_idx:
-                            call_exp = self.visitCallExpr(sop_idx)
+                            call_exp = (yield sop_idx)
                             code += call_exp.code
                         # call_exp = self.visitCallExpr(sop_idx)
                         # code += call_exp.code
                         
                         ret_place = self._emit_call(fname=f"func_{fname}", code=code)
-                        if (self.current_function !="main"):
+                        # los temporales son locales a cada función: otro
+                        # llamador pudo reservar ya el mismo nombre
+                        if (self.current_function !="main"
+                                and self.frame_manager.get_symbol_location(f"func_{fname}", ret_place) is None):
                             self.frame_manager.allocate_local(
                                 f"func_{fname}",
                                 ret_place,
@@ -1559,7 +1680,7 @@ class TacGenerator(CompiscriptVisitor):
                     if attr_name in cls_att:
                         if mode == "load":
                             offset = getattr(cls_att[attr_name], "metadata")["offset"]
-                            code = []
+                            code = TacBuffer()
                             prop_place = self._emit_class_att_load(
                                 obj=instance_name,
                                 offset=offset,
@@ -1580,7 +1701,7 @@ class TacGenerator(CompiscriptVisitor):
                             parent=before.place,
                             mname=attr_name
                         ))
-        final_code = []
+        final_code = TacBuffer()
         if suffixes:    
             for s in suffixes:
                 tem = getattr(s, "code")
@@ -1599,9 +1720,9 @@ class TacGenerator(CompiscriptVisitor):
     
     def visitCallExpr(self, ctx):
         args = None
-        code = []
+        code = TacBuffer()
         if ctx.arguments():
-            args = self.visit(ctx.arguments())
+            args = (yield ctx.arguments())
             code+=args.code
             for ar in args.places:
                 self._emit_param_push(ar, ar, code)
@@ -1616,7 +1737,7 @@ class TacGenerator(CompiscriptVisitor):
         No generamos código aquí; el que lo consuma decide si hace 't = id'.
         """
         name = ctx.Identifier().getText()
-        return IRNode(place=name, code=[])
+        return IRNode(place=name, code=TacBuffer())
     
     
     # ==============================================================
@@ -1633,7 +1754,7 @@ class TacGenerator(CompiscriptVisitor):
         if ctx.Identifier() and len(ctx.Identifier()) > 1:
             base_name = ctx.Identifier(1).getText()
 
-        out = []
+        out = TacBuffer()
         # self._emit_class_begin(cls_name, base_name, out)
 
         # activar contexto de clase (para prefijar labels de métodos)
@@ -1689,7 +1810,7 @@ class TacGenerator(CompiscriptVisitor):
                 # self._emit_class_method(cls_name, mname, Lentry, out)
 
                 # Generar el cuerpo del método con labels calificados
-                mir = self.visitFunctionDeclaration(fctx)
+                mir = (yield fctx)
                 if mir and mir.code:
                     out += mir.code
 
@@ -1733,7 +1854,7 @@ class TacGenerator(CompiscriptVisitor):
         cls_meta = getattr(cls_sym,"metadata")
  
         # Space to allocate for class
-        out = []
+        out = TacBuffer()
         self._emit_comment(f"init {cls_name}", out)
         space = cls_meta["size"]*4
         cls_place = self._emit_class_init(cls_name, space, cls_meta["att_meta"], code=out)
@@ -1746,7 +1867,7 @@ class TacGenerator(CompiscriptVisitor):
             # Fetch arguments sent
             args = []
             if ctx.arguments():
-                args = self.visit(ctx.arguments())
+                args = (yield ctx.arguments())
             # Push self
             self._emit_param_push(
                 cls_place,
@@ -1777,9 +1898,9 @@ class TacGenerator(CompiscriptVisitor):
     def visitArguments(self, ctx):
         expr_list = ctx.expression()
         places = []
-        code = []
+        code = TacBuffer()
         for e in expr_list:
-            tem = self.visit(e)
+            tem = (yield e)
             places.append(tem.place)
             code += tem.code
             
@@ -1803,62 +1924,117 @@ class TacGenerator(CompiscriptVisitor):
     # ==============================================================
     
     def visitIndexExpr(self, ctx):
-        sub = self.visit(ctx.expression())
+        sub = (yield ctx.expression())
         return sub
     
     
-    def _split_array_elements(self, text: str):
-        """Splits top-level array elements, respecting nested brackets."""
-        elems = []
-        buf = []
-        depth = 0
-        for ch in text:
-            if ch == '[':
-                depth += 1
-            elif ch == ']':
-                depth -= 1
-            elif ch == ',' and depth == 0:
-                elems.append(''.join(buf).strip())
-                buf = []
-                continue
-            buf.append(ch)
-        if buf:
-            elems.append(''.join(buf).strip())
-        return elems
+    _STATIC_SCALARS = {"true": "1", "false": "0", "null": "0"}
 
+    def _operand(self, expr):
+        """
+        Baja desde un `expression` por los contextos que solo reenvían el
+        valor de su único hijo (ExprNoAssign, ternario sin '?', OperandExpr)
+        y devuelve el primero que hace algo: un primaryExpr, un operador o
+        una asignación. Visitarlo da el mismo IRNode que visitar `expr`.
+        """
+        node = expr.children[0]                      # assignmentExpr
+        if type(node) is CompiscriptParser.ExprNoAssignContext:
+            node = node.children[0]                  # conditionalExpr
+            if len(node.children) == 1:
+                node = node.children[0]              # operatorExpr
+                if type(node) is CompiscriptParser.OperandExprContext:
+                    node = node.children[0]          # primaryExpr
+        return node
 
-    def _fake_array_ctx(self, text: str):
+    def _bare_literal(self, operand):
         """
-        Create a lightweight mock ctx for recursive array literals.
-        Assumes you only need .getText().
+        Si `operand` (ver _operand) es un literal suelto, a lo sumo con un
+        '-' delante, devuelve (signo, LiteralExprContext); si no, None.
         """
-        class FakeCtx:
-            def __init__(self, t): self.t = t
-            def getText(self): return self.t
-        return FakeCtx(text)
-    
+        sign = ""
+        if type(operand) is CompiscriptParser.UnaryExprContext and operand.children[0].getText() == "-":
+            inner = operand.children[1]
+            if type(inner) is not CompiscriptParser.OperandExprContext:
+                return None
+            sign, operand = "-", inner.children[0]
+        if type(operand) is not CompiscriptParser.PrimaryExprContext:
+            return None
+        lit = operand.children[0]
+        return (sign, lit) if type(lit) is CompiscriptParser.LiteralExprContext else None
+
+    def _emit_static_data(self, ctx) -> Optional[str]:
+        """
+        Si todos los elementos del arrayLiteral `ctx` son constantes (enteros,
+        booleanos, null o arreglos constantes anidados) registra el literal
+        como DATA_WORDS y devuelve su etiqueta; si no, devuelve None.
+        Layout igual que CREATE_ARRAY: [len, e0, e1, ...].
+        Literales idénticos comparten etiqueta (el .data nunca se escribe,
+        ver resolve_static_array_cow). El resultado queda memoizado por ctx,
+        así cada nivel de un literal anidado se mira una sola vez.
+        """
+        if ctx in self._static_arrays:
+            return self._static_arrays[ctx]
+        self._static_arrays[ctx] = None
+        elems = ctx.expression()
+        if not elems:
+            return None
+        words = [str(len(elems))]
+        for elem in elems:
+            bare = self._bare_literal(self._operand(elem))
+            if bare is None:
+                return None
+            sign, lit = bare
+            if lit.arrayLiteral() is not None:
+                label = self._emit_static_data(lit.arrayLiteral()) if not sign else None
+                if label is None:
+                    return None
+                words.append(label)
+                continue
+            text = lit.getText()
+            if text.isdigit():
+                words.append(str(int(sign + text)))
+            elif text in self._STATIC_SCALARS and not sign:
+                words.append(self._STATIC_SCALARS[text])
+            else:
+                return None
+
+        key = tuple(words)
+        if key not in self._static_labels:
+            label = f"{self._static_prefix}arrlit{len(self._static_labels)}"
+            self._static_labels[key] = label
+            self.static_data.append(
+                TACOP(op="DATA_WORDS", result=label, arg1=", ".join(words))
+            )
+        self._static_arrays[ctx] = self._static_labels[key]
+        return self._static_labels[key]
+
     def visitArrayLiteral(self, ctx):
-        code = []
+        # arrayLiteral: '[' (expression (',' expression)*)? ']'
+        code = TacBuffer()
+        static_label = self._emit_static_data(ctx)
+        if static_label:
+            t = self._new_temp()
+            code.append(TACOP(op="STATIC_ARRAY", result=t, arg1=static_label))
+            return IRNode(place=t, code=code)
+
         arr_temp = self._emit_create_array(id=None,code=code)
-        arr_text = ctx.getText().strip()[1:-1].strip()
-        arr_iter = self._split_array_elements(arr_text)
         
         offset_size = 4
         count = 1
-        for elem in arr_iter:
-            
-            if not elem:
-                continue
-            if elem.startswith('[') and elem.endswith(']'):
-                nested_ctx = self._fake_array_ctx(elem)
-                nested_node = self.visitArrayLiteral(nested_ctx)
-                i_place = nested_node.place
-                code += nested_node.code
-                self._emit_array_offset_store(arr_temp, i_place, offset_size, count, code)
-            else:
+        for elem in ctx.expression():
+            operand = self._operand(elem)
+            bare = self._bare_literal(operand)
+            if bare is not None and bare[1].arrayLiteral() is None:
+                # literal escalar: se copia tal cual (también "-5", sin uminus)
                 i_place = self._new_temp()
-                self._emit_assign(dst=i_place,src=elem, code=code)
-                self._emit_array_offset_store(arr_temp, i_place, offset_size, count, code)
+                self._emit_assign(dst=i_place, src=bare[0] + bare[1].getText(), code=code)
+            else:
+                # cualquier otra expresión (arreglos anidados incluidos) pasa
+                # por el visitor normal, una sola vez
+                elem_node = (yield operand)
+                i_place = elem_node.place
+                code += elem_node.code
+            self._emit_array_offset_store(arr_temp, i_place, offset_size, count, code)
             count+=1
         self._emit_array_offset_store(arr_temp, count-1, 0, 0, code)
         return IRNode(
@@ -0,0 +1,635 @@
+"""
+Intérprete de TAC.
+
+Ejecuta directamente la lista de TACOP que deja TacGenerator (sin pasar por
+MIPS), para poder probar pasadas de optimización en milisegundos y
+compararlas contra el backend (compare_with_mips).
+
+Diseño:
+- Cada TACOP se decodifica una sola vez (tabla de despacho por op) a un
+  closure `fn(env) -> Optional[int]` que devuelve el próximo índice si salta.
+- Los labels se resuelven a índices antes de ejecutar.
+- call / return usan una pila explícita de frames (sin recursión de Python),
+  así programas recursivos profundos no revientan el intérprete.
+- Se cuenta cuántas veces se entra a cada bloque básico (mismas reglas de
+  líderes que intermediate/cfg.py, más la entrada de cada función).
+
+Modelo de memoria igual al del backend: direcciones de byte, palabras de 4
+bytes, arreglos [len, e0, e1, ...], objetos como bloques de `alloc`. Los
+enteros se truncan a 32 bits para que la salida coincida con MIPS.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from intermediate.tac_nodes import TACOP
+from intermediate.operands import BoolConst, Const, IntConst, Operand, StrConst, Temp
+
+# Mismo layout que el simulador MIPS
+DATA_BASE = 0x10010000
+HEAP_BASE = 0x10040000
+ARRAY_BYTES = 1024          # CREATE_ARRAY reserva lo mismo que el backend
+
+_MASK = 0xFFFFFFFF
+
+
+def _s32(value: int) -> int:
+    value &= _MASK
+    return value - 0x100000000 if value & 0x80000000 else value
+
+
+class TACRuntimeError(Exception):
+    """Error al decodificar o ejecutar el TAC."""
+
+
+# ========================================
+# RESULTADOS
+# ========================================
+
+@dataclass
+class BlockCount:
+    """Un bloque básico y cuántas veces se entró a él."""
+    start: int
+    end: int
+    function: str
+    label: Optional[str]
+    count: int = 0
+
+
+@dataclass
+class TACRunResult:
+    output: str
+    steps: int
+    exit_reason: str                 # "return" | "budget"
+    return_value: Optional[object] = None
+    blocks: List[BlockCount] = field(default_factory=list)
+
+    def block_counts(self) -> Dict[int, int]:
+        """start -> número de ejecuciones."""
+        return {b.start: b.count for b in self.blocks}
+
+
+# ========================================
+# OPERANDOS
+# ========================================
+
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "0": "\0", "\\": "\\", '"': '"', "'": "'"}
+
+
+def _unquote(literal: str) -> str:
+    body = literal[1:-1]
+    out, i = [], 0
+    while i < len(body):
+        ch = body[i]
+        if ch == "\\" and i + 1 < len(body):
+            out.append(_ESCAPES.get(body[i + 1], body[i + 1]))
+            i += 2
+            continue
+        out.append(ch)
+        i += 1
+    return "".join(out)
+
+
+def _constant(text: str, data_labels: Dict[str, int]):
+    """Devuelve (True, valor) si `text` es una constante, si no (False, None)."""
+    if isinstance(text, Operand):
+        # operando de un TACOP, ya clasificado
+        if isinstance(text, Const):
+            kind = type(text)
+            if kind is IntConst:
+                return True, _s32(text.value)
+            if kind is BoolConst:
+                return True, int(text.value)
+            if kind is StrConst:
+                return True, _unquote(text)
+            return True, 0
+        if text in data_labels:
+            return True, data_labels[text]
+        return False, None
+    if text in ("true", "false"):
+        return True, int(text == "true")
+    if text == "null":
+        return True, 0
+    if len(text) >= 2 and text[0] == '"' and text[-1] == '"':
+        return True, _unquote(text)
+    try:
+        return True, _s32(int(text, 0))
+    except ValueError:
+        pass
+    if text in data_labels:
+        return True, data_labels[text]
+    return False, None
+
+
+class _Frame(dict):
+    """Variables de una activación; lo que no está se busca en los globales."""
+    __slots__ = ("globals_",)
+
+    def __missing__(self, name):
+        g = self.globals_
+        if g is not None and g is not self and name in g:
+            return g[name]
+        raise TACRuntimeError(f"variable sin inicializar: {name}")
+
+
+# ========================================
+# INTÉRPRETE
+# ========================================
+
+_NORMAL, _CALL, _RETURN = range(3)
+
+# Ops que solo describen metadatos y no hacen nada en ejecución
+_NO_OPS = {"nop", "class", "attr", "method", "endclass", "DATA_WORDS", "label"}
+
+
+class TACInterpreter:
+    def __init__(self, code: List[TACOP], max_steps: int = 10_000_000):
+        self.code = code
+        self.max_steps = max_steps
+
+        self.labels: Dict[str, int] = {}
+        self.functions: Dict[str, int] = {}
+        for i, ins in enumerate(code):
+            if ins.op == "label" and ins.result:
+                self.labels[ins.result] = i
+            elif ins.op == "fn_decl" and ins.result:
+                self.functions[ins.result] = i
+
+        self.memory: Dict[int, object] = {}
+        self.heap_ptr = HEAP_BASE
+        self.data_labels: Dict[str, int] = {}
+        self.static_children: Dict[int, List[int]] = {}   # dir -> offsets con sub-arreglos
+        self._load_static_data()
+
+        self.output: List[str] = []
+        self.pending_params: List[object] = []
+        self.params: List[object] = []
+
+        self.global_writes = self._find_global_writes()
+        self._decoding = -1
+        self.program = [self._decode(i, ins) for i, ins in enumerate(code)]
+        self.blocks, self.block_at = self._find_blocks()
+
+    # ------------------------------------------------------------
+    # Datos estáticos (DATA_WORDS)
+    # ------------------------------------------------------------
+
+    def _load_static_data(self) -> None:
+        tables = [ins for ins in self.code if ins.op == "DATA_WORDS"]
+        addr = DATA_BASE
+        for ins in tables:
+            self.data_labels[ins.result] = addr
+            addr += 4 * len(ins.arg1.split(","))
+        for ins in tables:
+            base = self.data_labels[ins.result]
+            children = []
+            for k, word in enumerate(w.strip() for w in ins.arg1.split(",")):
+                if word in self.data_labels:
+                    self.memory[base + 4 * k] = self.data_labels[word]
+                    children.append(4 * k)
+                else:
+                    ok, value = _constant(word, {})
+                    if not ok:
+                        raise TACRuntimeError(f"palabra inválida en {ins.result}: {word}")
+                    self.memory[base + 4 * k] = value
+            if children:
+                self.static_children[base] = children
+
+    def _alloc(self, nbytes: int) -> int:
+        addr = self.heap_ptr
+        self.heap_ptr += (nbytes + 3) & ~3
+        return addr
+
+    def _copy_static(self, src: int) -> int:
+        """Copia profunda de un arreglo estático al heap (lo que hace el backend con cow)."""
+        length = self.memory.get(src, 0)
+        dst = self._alloc(max((length + 1) * 4, ARRAY_BYTES))
+        for k in range(length + 1):
+            self.memory[dst + 4 * k] = self.memory.get(src + 4 * k, 0)
+        for off in self.static_children.get(src, ()):
+            self.memory[dst + off] = self._copy_static(self.memory[src + off])
+        return dst
+
+    # ------------------------------------------------------------
+    # Bloques básicos
+    # ------------------------------------------------------------
+
+    def _find_blocks(self) -> Tuple[List[BlockCount], List[int]]:
+        code = self.code
+        leaders = set()
+        for i, ins in enumerate(code):
+            if ins.op == "fn_decl":
+                leaders.add(i + 1)
+            elif ins.op == "label":
+                leaders.add(i)
+            elif ins.op in ("goto", "if-goto", "return"):
+                leaders.add(i + 1)
+        leaders = sorted(x for x in leaders if x < len(code))
+
+        blocks: List[BlockCount] = []
+        block_at = [-1] * (len(code) + 1)
+        function = ""
+        fn_iter = sorted(self.functions.items(), key=lambda kv: kv[1])
+        for b, start in enumerate(leaders):
+            end = (leaders[b + 1] - 1) if b + 1 < len(leaders) else len(code) - 1
+            for name, idx in fn_iter:
+                if idx < start:
+                    function = name
+            label = code[start].result if code[start].op == "label" else None
+            blocks.append(BlockCount(start=start, end=end, function=function, label=label))
+            block_at[start] = b
+        return blocks, block_at
+
+    # ------------------------------------------------------------
+    # Decodificación
+    # ------------------------------------------------------------
+
+    def _find_global_writes(self) -> Set[int]:
+        """
+        Índices de las instrucciones que escriben una variable global: un
+        nombre (no temporal) que define el código de nivel superior
+        (func_main) escrito en otra función que no lo recibe como parámetro.
+        El TAC no marca declaraciones, así que un local que sombrea a un
+        global se trata como el global.
+        """
+        defs: List[Tuple[int, str, str]] = []     # (índice, función, destino)
+        params: Dict[str, Set[str]] = {}
+        function = None
+        for i, ins in enumerate(self.code):
+            if ins.op == "fn_decl":
+                function = ins.result
+            elif ins.op in _WRITES and ins.result is not None and not isinstance(ins.result, Temp):
+                if ins.op == "load_param":
+                    params.setdefault(function, set()).add(ins.result)
+                else:
+                    defs.append((i, function, ins.result))
+        globals_ = {dest for _, function, dest in defs if function == "func_main"}
+        return {
+            i for i, function, dest in defs
+            if function != "func_main" and dest in globals_ and dest not in params.get(function, ())
+        }
+
+    def _global_dest(self) -> bool:
+        """True si la instrucción que se está decodificando escribe en los globales."""
+        return self._decoding in self.global_writes
+
+    def _getter(self, text: Optional[str], ins: TACOP) -> Callable:
+        if text is None:
+            raise TACRuntimeError(f"operando faltante en: {ins}")
+        ok, value = _constant(text, self.data_labels)
+        if ok:
+            return lambda env, value=value: value
+        return lambda env, name=text: env[name]
+
+    def _decode(self, index: int, ins: TACOP):
+        op = ins.op
+        if op in _NO_OPS:
+            return (_NORMAL, None, None)
+        if op == "fn_decl":
+            # Solo se llega aquí por caída desde la función anterior: return implícito
+            return (_RETURN, lambda env: None, None)
+
+        decoder = _DECODERS.get(op)
+        if decoder is None:
+            raise TACRuntimeError(f"op TAC no soportado en [{index}]: {ins}")
+        self._decoding = index
+        return decoder(self, ins)
+
+    def _jump_target(self, label: Optional[str], ins: TACOP) -> int:
+        if label not in self.labels:
+            raise TACRuntimeError(f"label no definido en: {ins}")
+        return self.labels[label]
+
+    # ------------------------------------------------------------
+    # Ejecución
+    # ------------------------------------------------------------
+
+    def run(self, entry: str = "func_main") -> TACRunResult:
+        if entry not in self.functions:
+            raise TACRuntimeError(f"no existe la función de entrada {entry}")
+
+        program = self.program
+        block_at = self.block_at
+        counts = [0] * len(self.blocks)
+        budget = self.max_steps
+        ncode = len(program)
+
+        env = _Frame()
+        env.globals_ = env
+        globals_ = env
+        stack: List[Tuple[int, _Frame, Optional[str], List[object]]] = []
+
+        pc = self.functions[entry] + 1
+        steps = 0
+        exit_reason, ret = "return", None
+        try:
+            while True:
+                if pc >= ncode:
+                    kind, fn, dest = _RETURN, None, None
+                else:
+                    b = block_at[pc]
+                    if b >= 0:
+                        counts[b] += 1
+                    if steps >= budget:
+                        exit_reason = "budget"
+                        break
+                    steps += 1
+                    kind, fn, dest = program[pc]
+
+                if kind == _NORMAL:
+                    if fn is None:
+                        pc += 1
+                    else:
+                        nxt = fn(env)
+                        pc = pc + 1 if nxt is None else nxt
+                elif kind == _CALL:
+                    target = self.functions.get(fn)
+                    if target is None:
+                        raise TACRuntimeError(f"función no definida: {fn}")
+                    stack.append((pc + 1, env, dest, self.params))
+                    self.params = self.pending_params
+                    self.pending_params = []
+                    env = _Frame()
+                    env.globals_ = globals_
+                    pc = target + 1
+                else:
+                    value = fn(env) if fn is not None else None
+                    if not stack:
+                        ret = value
+                        break
+                    pc, env, dest, self.params = stack.pop()
+                    if dest is not None:
+                        env[dest] = value
+        except TACRuntimeError as e:
+            raise TACRuntimeError(f"{e} (en [{pc}] {self.code[pc] if pc < ncode else ''})") from None
+
+        for block, count in zip(self.blocks, counts):
+            block.count = count
+        return TACRunResult(
+            output="".join(self.output),
+            steps=steps,
+            exit_reason=exit_reason,
+            return_value=ret,
+            blocks=self.blocks,
+        )
+
+
+# ========================================
+# TABLA DE DESPACHO
+# ========================================
+
+def _fmt(value) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+def _div(a, b):
+    if b == 0:
+        raise TACRuntimeError("división entre cero")
+    q = abs(a) // abs(b)
+    return _s32(-q if (a < 0) != (b < 0) else q)
+
+
+def _mod(a, b):
+    return _s32(a - _div(a, b) * b)
+
+
+_BINARY = {
+    "+": lambda a, b: _s32(a + b),
+    "-": lambda a, b: _s32(a - b),
+    "*": lambda a, b: _s32(a * b),
+    "/": _div,
+    "%": _mod,
+    "==": lambda a, b: int(a == b),
+    "!=": lambda a, b: int(a != b),
+    "<": lambda a, b: int(a < b),
+    "<=": lambda a, b: int(a <= b),
+    ">": lambda a, b: int(a > b),
+    ">=": lambda a, b: int(a >= b),
+    "&&": lambda a, b: int(bool(a) and bool(b)),
+    "||": lambda a, b: int(bool(a) or bool(b)),
+    "concat": lambda a, b: _fmt(a) + _fmt(b),
+    "str_eq": lambda a, b: int(a == b),
+    "str_ne": lambda a, b: int(a != b),
+}
+
+_UNARY = {
+    "uminus": lambda a: _s32(-a),
+    "not": lambda a: int(not a),
+}
+
+# Ops cuyo `result` es la variable que se escribe
+_WRITES = {
+    *_BINARY, *_UNARY, "=", "load", "getidx", "len", "CREATE_ARRAY", "alloc",
+    "STATIC_ARRAY", "load_param",
+}
+
+
+def _decode_binary(it: TACInterpreter, ins: TACOP):
+    glob = it._global_dest()
+    a, b, dest, func = it._getter(ins.arg1, ins), it._getter(ins.arg2, ins), ins.result, _BINARY[ins.op]
+
+    def fn(env):
+        (env.globals_ if glob else env)[dest] = func(a(env), b(env))
+    return (_NORMAL, fn, None)
+
+
+def _decode_unary(it: TACInterpreter, ins: TACOP):
+    glob = it._global_dest()
+    a, dest, func = it._getter(ins.arg1, ins), ins.result, _UNARY[ins.op]
+
+    def fn(env):
+        (env.globals_ if glob else env)[dest] = func(a(env))
+    return (_NORMAL, fn, None)
+
+
+def _decode_assign(it: TACInterpreter, ins: TACOP):
+    glob = it._global_dest()
+    a, dest = it._getter(ins.arg1, ins), ins.result
+
+    def fn(env):
+        (env.globals_ if glob else env)[dest] = a(env)
+    return (_NORMAL, fn, None)
+
+
+def _decode_goto(it: TACInterpreter, ins: TACOP):
+    target = it._jump_target(ins.arg1 or ins.result, ins)
+    return (_NORMAL, lambda env: target, None)
+
+
+def _decode_if_goto(it: TACInterpreter, ins: TACOP):
+    cond, target = it._getter(ins.arg1, ins), it._jump_target(ins.arg2, ins)
+
+    def fn(env):
+        if cond(env):
+            return target
+    return (_NORMAL, fn, None)
+
+
+def _decode_print(it: TACInterpreter, ins: TACOP):
+    a, out = it._getter(ins.arg1, ins), it.output
+
+    def fn(env):
+        out.append(_fmt(a(env)))
+    return (_NORMAL, fn, None)
+
+
+def _decode_load(it: TACInterpreter, ins: TACOP):
+    glob = it._global_dest()
+    addr, dest, mem = it._getter(ins.arg1, ins), ins.result, it.memory
+
+    def fn(env):
+        (env.globals_ if glob else env)[dest] = mem.get(addr(env), 0)
+    return (_NORMAL, fn, None)
+
+
+def _decode_store(it: TACInterpreter, ins: TACOP):
+    addr, value, mem = it._getter(ins.result, ins), it._getter(ins.arg1, ins), it.memory
+
+    def fn(env):
+        mem[addr(env)] = value(env)
+    return (_NORMAL, fn, None)
+
+
+def _decode_getidx(it: TACInterpreter, ins: TACOP):
+    glob = it._global_dest()
+    arr, idx, dest, mem = it._getter(ins.arg1, ins), it._getter(ins.arg2, ins), ins.result, it.memory
+
+    def fn(env):
+        (env.globals_ if glob else env)[dest] = mem.get(arr(env) + 4 * (idx(env) + 1), 0)
+    return (_NORMAL, fn, None)
+
+
+def _decode_len(it: TACInterpreter, ins: TACOP):
+    glob = it._global_dest()
+    arr, dest, mem = it._getter(ins.arg1, ins), ins.result, it.memory
+
+    def fn(env):
+        (env.globals_ if glob else env)[dest] = mem.get(arr(env), 0)
+    return (_NORMAL, fn, None)
+
+
+def _decode_create_array(it: TACInterpreter, ins: TACOP):
+    glob = it._global_dest()
+    dest = ins.result
+
+    def fn(env):
+        (env.globals_ if glob else env)[dest] = it._alloc(ARRAY_BYTES)
+    return (_NORMAL, fn, None)
+
+
+def _decode_alloc(it: TACInterpreter, ins: TACOP):
+    glob = it._global_dest()
+    size, dest = it._getter(ins.arg1, ins), ins.result
+
+    def fn(env):
+        (env.globals_ if glob else env)[dest] = it._alloc(size(env))
+    return (_NORMAL, fn, None)
+
+
+def _decode_static_array(it: TACInterpreter, ins: TACOP):
+    glob = it._global_dest()
+    if ins.arg1 not in it.data_labels:
+        raise TACRuntimeError(f"arreglo estático no definido: {ins}")
+    addr, dest = it.data_labels[ins.arg1], ins.result
+    if ins.arg2 == "cow":
+        def fn(env):
+            (env.globals_ if glob else env)[dest] = it._copy_static(addr)
+    else:
+        def fn(env):
+            (env.globals_ if glob else env)[dest] = addr
+    return (_NORMAL, fn, None)
+
+
+def _decode_push_param(it: TACInterpreter, ins: TACOP):
+    value = it._getter(ins.result, ins)
+
+    def fn(env):
+        it.pending_params.append(value(env))
+    return (_NORMAL, fn, None)
+
+
+def _decode_load_param(it: TACInterpreter, ins: TACOP):
+    idx, dest = int(ins.arg1), ins.result
+
+    def fn(env):
+        if idx >= len(it.params):
+            raise TACRuntimeError(f"falta el parámetro {idx}")
+        env[dest] = it.params[idx]
+    return (_NORMAL, fn, None)
+
+
+def _decode_call(it: TACInterpreter, ins: TACOP):
+    return (_CALL, ins.arg1, ins.result)
+
+
+def _decode_return(it: TACInterpreter, ins: TACOP):
+    if ins.arg1 is None:
+        return (_RETURN, lambda env: None, None)
+    return (_RETURN, it._getter(ins.arg1, ins), None)
+
+
+_DECODERS = {
+    **{op: _decode_binary for op in _BINARY},
+    **{op: _decode_unary for op in _UNARY},
+    "=": _decode_assign,
+    "goto": _decode_goto,
+    "if-goto": _decode_if_goto,
+    "print": _decode_print,
+    "print_s": _decode_print,
+    "load": _decode_load,
+    "store": _decode_store,
+    "getidx": _decode_getidx,
+    "len": _decode_len,
+    "CREATE_ARRAY": _decode_create_array,
+    "alloc": _decode_alloc,
+    "STATIC_ARRAY": _decode_static_array,
+    "push_param": _decode_push_param,
+    "load_param": _decode_load_param,
+    "call": _decode_call,
+    "return": _decode_return,
+}
+
+
+def run_tac(code: List[TACOP], max_steps: int = 10_000_000) -> TACRunResult:
+    return TACInterpreter(code, max_steps=max_steps).run()
+
+
+# ========================================
+# PRUEBA DIFERENCIAL CONTRA MIPS
+# ========================================
+
+@dataclass
+class DifferentialResult:
+    tac: TACRunResult
+    mips_output: str
+    mips_exit_reason: str
+    mips_instructions: int
+
+    @property
+    def matches(self) -> bool:
+        return self.tac.output == self.mips_output
+
+
+def compare_with_mips(
+    code: List[TACOP],
+    frame_manager=None,
+    max_steps: int = 1_000_000,
+    **mips_options,
+) -> DifferentialResult:
+    """
+    Corre el mismo TAC en el intérprete y a través del backend + simulador
+    MIPS. Si las salidas difieren, el bug está en el backend (o en la pasada
+    que se esté probando).
+    """
+    from code_generator.mips_generator import MIPSCodeGenerator
+    from code_generator.mips_simulator import run_asm
+
+    tac_result = run_tac(code, max_steps=max_steps)
+    asm = MIPSCodeGenerator(code, frame_manager, **mips_options).generate()
+    mips = run_asm(asm, max_instructions=max_steps * 50)
+    return DifferentialResult(
+        tac=tac_result,
+        mips_output=mips.output,
+        mips_exit_reason=mips.exit_reason,
+        mips_instructions=mips.stats.instructions,
+    )
@@ -1,9 +1,144 @@
 """Intermediate representation"""
 
 from dataclasses import dataclass, field, fields, is_dataclass
-from typing import List, Optional, Union, Any, Iterable, Literal, Dict
+from enum import IntEnum
+from typing import List, Optional, Union, Any, Iterable, Literal, Dict, Tuple
 
-@dataclass
+from intermediate.operands import Label, Operand, as_label, classify
+
+
+class TacOp(IntEnum):
+    """
+    Opcode entero de cada instrucción. TACOP guarda el texto (`op`, para
+    imprimir y para los tests) y su opcode (`opcode`); las pasadas del
+    backend despachan por el opcode.
+    """
+    UNKNOWN = 0
+    ASSIGN = 1
+    # Relational
+    EQ = 2
+    NE = 3
+    LT = 4
+    GT = 5
+    LE = 6
+    GE = 7
+    # Unary
+    UMINUS = 8
+    NOT = 9
+    # Logic
+    OR = 10
+    AND = 11
+    # Arithmetic
+    MUL = 12
+    DIV = 13
+    MOD = 14
+    ADD = 15
+    SUB = 16
+    # Strings (runtime)
+    CONCAT = 17
+    STR_EQ = 18
+    STR_NE = 19
+    # Flow
+    GOTO = 20
+    IF_GOTO = 21
+    LABEL = 22
+    FN_DECL = 23
+    # Functions
+    CALL = 24
+    RETURN = 25
+    PRINT = 26
+    PRINT_S = 27
+    PUSH_PARAM = 28
+    LOAD_PARAM = 29
+    PARAM = 30
+    # Memory
+    LOAD = 31
+    STORE = 32
+    MOVE = 33
+    ALLOC = 34
+    # Arrays / props
+    CREATE_ARRAY = 35
+    PUSH_ARRAY = 36
+    STATIC_ARRAY = 37
+    DATA_WORDS = 38
+    LOAD_PROP = 39
+    STORE_PROP = 40
+    LEN = 41
+    GETIDX = 42
+    SETPROP = 43
+    LOAD_IDX = 44
+    STORE_IDX = 45
+    # Classes
+    CLASS = 46
+    ATTR = 47
+    METHOD = 48
+    ENDCLASS = 49
+    NOP = 50
+
+
+# texto de la instrucción -> opcode (lo que no está acá es UNKNOWN)
+OPCODES: Dict[str, TacOp] = {
+    "=": TacOp.ASSIGN,
+    "==": TacOp.EQ, "!=": TacOp.NE, "<": TacOp.LT, ">": TacOp.GT,
+    "<=": TacOp.LE, ">=": TacOp.GE,
+    "uminus": TacOp.UMINUS, "not": TacOp.NOT,
+    "||": TacOp.OR, "&&": TacOp.AND,
+    "*": TacOp.MUL, "/": TacOp.DIV, "%": TacOp.MOD,
+    "+": TacOp.ADD, "-": TacOp.SUB,
+    "concat": TacOp.CONCAT, "str_eq": TacOp.STR_EQ, "str_ne": TacOp.STR_NE,
+    "goto": TacOp.GOTO, "if-goto": TacOp.IF_GOTO, "label": TacOp.LABEL,
+    "fn_decl": TacOp.FN_DECL,
+    "call": TacOp.CALL, "return": TacOp.RETURN,
+    "print": TacOp.PRINT, "print_s": TacOp.PRINT_S,
+    "push_param": TacOp.PUSH_PARAM, "load_param": TacOp.LOAD_PARAM,
+    "param": TacOp.PARAM,
+    "load": TacOp.LOAD, "store": TacOp.STORE, "move": TacOp.MOVE,
+    "alloc": TacOp.ALLOC,
+    "CREATE_ARRAY": TacOp.CREATE_ARRAY, "PUSH_ARRAY": TacOp.PUSH_ARRAY,
+    "STATIC_ARRAY": TacOp.STATIC_ARRAY, "DATA_WORDS": TacOp.DATA_WORDS,
+    "LOAD_PROP": TacOp.LOAD_PROP, "STORE_PROP": TacOp.STORE_PROP,
+    "len": TacOp.LEN, "getidx": TacOp.GETIDX, "setprop": TacOp.SETPROP,
+    "LOAD_IDX": TacOp.LOAD_IDX, "STORE_IDX": TacOp.STORE_IDX,
+    "class": TacOp.CLASS, "attr": TacOp.ATTR, "method": TacOp.METHOD,
+    "endclass": TacOp.ENDCLASS,
+    "nop": TacOp.NOP,
+}
+
+RELATIONAL_OPS = frozenset((TacOp.EQ, TacOp.NE, TacOp.LT, TacOp.GT, TacOp.LE, TacOp.GE))
+ARITHMETIC_OPS = frozenset((TacOp.ADD, TacOp.SUB, TacOp.MUL, TacOp.DIV, TacOp.MOD))
+
+
+# posiciones que no son valores: etiquetas (de salto, de función, de .data)
+# y texto crudo (la lista de palabras de DATA_WORDS, la marca "cow")
+_LABEL_SLOTS: Dict[TacOp, Tuple[str, ...]] = {
+    TacOp.LABEL: ("result", "arg1"),
+    TacOp.GOTO: ("arg1", "result"),
+    TacOp.IF_GOTO: ("arg2",),
+    TacOp.FN_DECL: ("result",),
+    TacOp.CALL: ("arg1",),
+    TacOp.STATIC_ARRAY: ("arg1",),
+    TacOp.DATA_WORDS: ("result",),
+}
+_RAW_SLOTS: Dict[TacOp, Tuple[str, ...]] = {
+    TacOp.STATIC_ARRAY: ("arg2",),
+    TacOp.DATA_WORDS: ("arg1",),
+}
+
+
+def _operand(x) -> Optional[str]:
+    # operandos tipados (intermediate.operands), clasificados una sola vez;
+    # classify() cachea, así que las copias de "t12" o "x" que arma cada
+    # visit* comparten un solo objeto
+    if type(x) is str:
+        return classify(x)
+    if isinstance(x, tuple) and x:
+        x = x[0]
+    if x is None or isinstance(x, Operand):
+        return x
+    return classify(str(x))
+
+
+@dataclass(slots=True)
 class TACOP:
     op : Literal[
         # Assignment
@@ -24,6 +159,9 @@ class TACOP:
         # add
         "+", "-",
         
+        # Strings (runtime)
+        "concat", "str_eq", "str_ne",
+        
         # Flow
         "goto", "if-goto", "label", "fn_decl", # Flow
         
@@ -36,6 +174,8 @@ class TACOP:
         ## Special tags ##
         "CREATE_ARRAY",
         "PUSH_ARRAY", 
+        "STATIC_ARRAY",
+        "DATA_WORDS",
         
         "LOAD_PROP",
         "STORE_PROP",
@@ -50,6 +190,8 @@ class TACOP:
     arg2 : Optional[str] = None
     result :Optional[str] = None 
     comment : Optional[str] = None
+    # derivado de `op` en __post_init__; no es parte de la igualdad ni del repr
+    opcode : TacOp = field(default=TacOp.UNKNOWN, init=False, repr=False, compare=False)
 
     ## Esta funcion es solo para imprimir el tac bonito. 
     ## No cambia como esta guardado ni nada, solo es para poder escribirlo/leerlo de manera bonita
@@ -96,6 +238,12 @@ class TACOP:
             return f"setprop {self.arg1}, {self.arg2}, {self.result}"
         elif op == "CREATE_ARRAY":
             return f"CREATE_ARRAY {self.result}"
+        elif op == "STATIC_ARRAY":
+            # t = STATIC_ARRAY arrK   (cow => se copia al heap antes de usarse)
+            cow = " (cow)" if self.arg2 == "cow" else ""
+            return f"{self.result} = STATIC_ARRAY {self.arg1}{cow}"
+        elif op == "DATA_WORDS":
+            return f"DATA_WORDS {self.result}: {self.arg1}"
         elif op == "PUSH_ARRAY":
             return f"{self.result} PUSH_ARRAY {self.arg1}"
         elif op == "LOAD_IDX":
@@ -136,21 +284,121 @@ class TACOP:
         return f" ".join(parts)
     
     def __post_init__(self):
-        def norm(x):
-            if isinstance(x, tuple) and x:
-                x = x[0]
-            if x is None:
-                return None
-            return str(x)
-        self.arg1   = norm(self.arg1)
-        self.arg2   = norm(self.arg2)
-        self.result = norm(self.result)
-        
+        opcode = self.opcode = OPCODES.get(self.op, TacOp.UNKNOWN)
+        self.arg1   = _operand(self.arg1)
+        self.arg2   = _operand(self.arg2)
+        self.result = _operand(self.result)
+        if opcode in _LABEL_SLOTS:
+            for slot in _LABEL_SLOTS[opcode]:
+                value = getattr(self, slot)
+                if value is not None and type(value) is not Label:
+                    setattr(self, slot, as_label(str.__str__(value)))
+            for slot in _RAW_SLOTS.get(opcode, ()):
+                value = getattr(self, slot)
+                if value is not None:
+                    setattr(self, slot, str.__str__(value))
+
+
+class TacBuffer:
+    """
+    Buffer de emisión de TAC: append de instrucciones y `+=` de otros
+    buffers sin re-copiar el código en cada nivel. Para un hijo grande `+=`
+    guarda un enlace (lista de partes del hijo, largo en ese momento); los
+    chicos se copian. El código se aplana una sola vez al final
+    (iter / list()), así que generar es lineal en el tamaño de la salida.
+
+    Se comporta como la lista que reemplaza: lo que el hijo agregue después
+    del `+=` no aparece en el padre (el enlace recuerda el largo) y pop()
+    nunca modifica a un hijo enlazado. `+=` de una lista común la copia.
+    """
+    __slots__ = ("_parts", "append")
+
+    # hijos con hasta LINK_MIN partes se copian (barato y los libera);
+    # solo los más grandes se enlazan
+    LINK_MIN = 32
+
+    def __init__(self, ops: Optional[Iterable[TACOP]] = None):
+        self._parts: list = [] if ops is None else list(ops)
+        # append(op) es directamente el append de la lista de partes
+        self.append = self._parts.append
+
+    def __iadd__(self, other) -> "TacBuffer":
+        if type(other) is TacBuffer:
+            parts = other._parts
+            if len(parts) > self.LINK_MIN:
+                self._parts.append((parts, len(parts)))
+            else:
+                self._parts += parts
+        else:
+            self._parts.extend(other)
+        return self
+
+    extend = __iadd__
+
+    def __add__(self, other) -> "TacBuffer":
+        out = TacBuffer()
+        out += self
+        out += other
+        return out
+
+    def __bool__(self) -> bool:
+        # append-only y sin enlaces vacíos: tiene partes <=> tiene código
+        return bool(self._parts)
+
+    def __iter__(self):
+        stack = [(self._parts, 0, len(self._parts))]
+        while stack:
+            parts, i, n = stack.pop()
+            while i < n:
+                part = parts[i]
+                i += 1
+                if type(part) is tuple:
+                    stack.append((parts, i, n))
+                    parts, i, n = part[0], 0, part[1]
+                else:
+                    yield part
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __getitem__(self, index: int) -> TACOP:
+        if index == 0 or index == -1:
+            # primera / última instrucción sin aplanar
+            parts, n = self._parts, len(self._parts)
+            while True:
+                part = parts[0 if index == 0 else n - 1]
+                if type(part) is not tuple:
+                    return part
+                parts, n = part
+        return list(self)[index]
+
+    def pop(self) -> TACOP:
+        """Saca la última instrucción; los hijos enlazados no se tocan."""
+        parts = self._parts[:-1]
+        part = self._parts[-1]
+        while type(part) is tuple:
+            child, n = part
+            if n > 1:
+                parts.append((child, n - 1))
+            part = child[n - 1]
+        self._parts = parts
+        self.append = parts.append
+        return part
+
+    def copy(self) -> "TacBuffer":
+        out = TacBuffer()
+        out += self
+        return out
+
+    def __repr__(self) -> str:
+        return f"TacBuffer({list(self)!r})"
+
+
 @dataclass
 class IRNode:
     place: Any = None
     value: Union[int, bool, str, None] = None
-    code : List['TACOP'] = None
+    code : Optional['TacBuffer'] = None
     
     
 @dataclass
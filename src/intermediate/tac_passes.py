@@ -0,0 +1,552 @@
+"""
+Pasadas sobre el TAC ya generado (antes del backend MIPS).
+
+Cada pasada recibe la lista completa de TACOP (tal como la deja
+TacGenerator.visitProgram) y devuelve la lista resultante. Son
+independientes entre sí y no dependen del parse tree.
+
+1. resolve_static_array_cow: decide qué arreglos estáticos (.data) deben
+   copiarse al heap porque el programa los muta o los deja escapar.
+2. merge_constant_prints: junta prints consecutivos de constantes en un
+   solo print_s de un string del .data.
+3. inline_hot_calls / layout_hot_blocks: pasadas guiadas por perfil (PGO),
+   ver intermediate/profile.py.
+"""
+
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+from intermediate.tac_nodes import TACOP
+from intermediate.operands import Operand
+
+
+_TEMP_RE = re.compile(r"^t\d+$")
+
+
+def _operand_key(function: Optional[str], operand: str):
+    """
+    Clave por la que las pasadas identifican un operando: los temporales se
+    numeran desde t0 en cada función, así que van con su función; las
+    variables se comparten (globales).
+    """
+    return (function, operand) if _TEMP_RE.match(operand) else operand
+
+
+def _owners(code: List[TACOP]) -> List[Optional[str]]:
+    """Función (fn_decl) a la que pertenece cada instrucción."""
+    owners = []
+    function = None
+    for ins in code:
+        if ins.op == "fn_decl":
+            function = ins.result
+        owners.append(function)
+    return owners
+
+
+# ========================================
+# 1. ARREGLOS ESTÁTICOS: COPY-ON-WRITE
+# ========================================
+
+# Operaciones que copian un puntero de arreglo de arg1 a `result`
+_ALIAS_OPS = {"="}
+# Aritmética sobre el puntero: `result` es una dirección dentro del arreglo
+_ADDRESS_OPS = {"+", "-"}
+# Leen un elemento: solo es un puntero si el literal tiene sub-arreglos
+_ELEMENT_OPS = {"load", "getidx"}
+
+
+def _nested_literals(code: List[TACOP]) -> Set[str]:
+    """Etiquetas de DATA_WORDS cuyos elementos son otras etiquetas (arreglos anidados)."""
+    words = {ins.result: ins.arg1.split(", ")[1:] for ins in code if ins.op == "DATA_WORDS"}
+    return {label for label, ws in words.items() if any(w in words for w in ws)}
+
+
+def resolve_static_array_cow(code: List[TACOP]) -> List[TACOP]:
+    """
+    Marca con arg2="cow" cada STATIC_ARRAY cuyo contenido puede mutarse.
+
+    Un literal constante se emite una sola vez en .data y todas sus
+    evaluaciones comparten esa memoria. Eso solo es válido mientras nadie
+    escriba en él; si el programa lo muta (o lo pasa a un lugar donde no
+    podemos seguirlo), cada evaluación debe copiarlo al heap.
+
+    Análisis (insensible al flujo, por nombre, conservador):
+      - un STATIC_ARRAY introduce su etiqueta como "raíz" en `result`
+      - `=` copia las raíces (y las direcciones internas) de arg1 a `result`
+      - +, - sobre un alias dan una dirección interna: escribir ahí muta la
+        raíz, pero el valor no es el arreglo
+      - load/getidx propagan la raíz solo si el literal tiene sub-arreglos
+        anidados; leer un entero (`return a[i]`) no expone el arreglo
+      - la raíz se marca como mutable si un alias o dirección interna
+        aparece como dirección de un store, como valor guardado en memoria,
+        como parámetro, como valor de retorno o en setprop/PUSH_ARRAY
+
+    Args:
+        code: TAC completo del programa
+
+    Returns:
+        La misma lista (las instrucciones STATIC_ARRAY se modifican in-place)
+    """
+    static_ops = [ins for ins in code if ins.op == "STATIC_ARRAY"]
+    if not static_ops:
+        return code
+
+    owners = _owners(code)
+    nested = _nested_literals(code)
+    roots: Dict[object, Set[str]] = {}
+    interior: Dict[object, Set[str]] = {}
+    for i, ins in enumerate(code):
+        if ins.op == "STATIC_ARRAY":
+            roots.setdefault(_operand_key(owners[i], ins.result), set()).add(ins.arg1)
+
+    def _aliases(i, operand):
+        if not operand:
+            return set()
+        key = _operand_key(owners[i], operand)
+        return roots.get(key, set()) | interior.get(key, set())
+
+    def _add(target, i, name, labels):
+        if not labels:
+            return False
+        current = target.setdefault(_operand_key(owners[i], name), set())
+        if labels <= current:
+            return False
+        current |= labels
+        return True
+
+    # Propagación hasta punto fijo
+    changed = True
+    while changed:
+        changed = False
+        for i, ins in enumerate(code):
+            if not ins.result:
+                continue
+            if ins.op in _ALIAS_OPS:
+                key = _operand_key(owners[i], ins.arg1) if ins.arg1 else None
+                changed |= _add(roots, i, ins.result, set(roots.get(key, ())))
+                changed |= _add(interior, i, ins.result, set(interior.get(key, ())))
+            elif ins.op in _ADDRESS_OPS:
+                changed |= _add(interior, i, ins.result, _aliases(i, ins.arg1) | _aliases(i, ins.arg2))
+            elif ins.op in _ELEMENT_OPS:
+                changed |= _add(roots, i, ins.result, _aliases(i, ins.arg1) & nested)
+
+    mutable: Set[str] = set()
+
+    def _escape(i, name):
+        mutable.update(_aliases(i, name))
+
+    for i, ins in enumerate(code):
+        if ins.op == "store":
+            _escape(i, ins.result)   # escritura a través del alias
+            _escape(i, ins.arg1)     # el puntero se guarda en otra estructura
+        elif ins.op == "push_param":
+            _escape(i, ins.result)
+        elif ins.op == "return":
+            _escape(i, ins.arg1)
+        elif ins.op in ("setprop", "PUSH_ARRAY"):
+            _escape(i, ins.result)
+            _escape(i, ins.arg1)
+
+    for ins in static_ops:
+        if ins.arg1 in mutable:
+            ins.arg2 = "cow"
+    return code
+
+
+# ========================================
+# 2. PRINTS CONSTANTES CONSECUTIVOS
+# ========================================
+
+
+def _operand_counts(code: List[TACOP], owners: Optional[List[Optional[str]]] = None) -> Dict[object, int]:
+    """Usos de cada operando; con `owners`, los temporales se cuentan por función."""
+    counts: Dict[object, int] = {}
+    for i, ins in enumerate(code):
+        for operand in (ins.result, ins.arg1, ins.arg2):
+            if operand:
+                key = _operand_key(owners[i], operand) if owners is not None else operand
+                counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def _constant_print_text(code: List[TACOP], i: int, counts: Dict[object, int], owners: List[Optional[str]]) -> Optional[str]:
+    """
+    Si code[i:i+2] es `t = <const>; print t` (o print_s) y `t` no se usa en
+    ningún otro lado de su función, devuelve el texto que imprime. Si no, None.
+    """
+    if i + 1 >= len(code):
+        return None
+    assign, prt = code[i], code[i + 1]
+    if assign.op != "=" or prt.op not in ("print", "print_s"):
+        return None
+    temp = assign.result
+    if not temp or not _TEMP_RE.match(temp) or prt.arg1 != temp or counts.get((owners[i], temp)) != 2:
+        return None
+
+    value = assign.arg1 or ""
+    if prt.op == "print_s" and len(value) >= 2 and value.startswith('"') and value.endswith('"'):
+        return value[1:-1]
+    if prt.op == "print" and re.fullmatch(r"-?\d+", value):
+        return str(int(value))
+    return None
+
+
+def merge_constant_prints(code: List[TACOP]) -> List[TACOP]:
+    """
+    Junta secuencias de prints constantes consecutivos:
+
+        t2 = ", "         t2 = ", 5\n"
+        print_s t2   =>   print_s t2
+        t3 = 5
+        print t3
+        t4 = "\n"
+        print_s t4
+
+    Solo se fusionan pares `t = const; print t` pegados (sin labels ni otra
+    instrucción en medio) cuyo temporal no se usa en otro lado, así que el
+    orden de la salida no cambia. El string resultante va al .data como
+    cualquier otro literal (encode_strs).
+    """
+    owners = _owners(code)
+    counts = _operand_counts(code, owners)
+    out: List[TACOP] = []
+    i = 0
+    n = len(code)
+    while i < n:
+        first = _constant_print_text(code, i, counts, owners)
+        if first is None:
+            out.append(code[i])
+            i += 1
+            continue
+
+        texts = [first]
+        j = i + 2
+        while True:
+            nxt = _constant_print_text(code, j, counts, owners)
+            if nxt is None:
+                break
+            texts.append(nxt)
+            j += 2
+
+        if len(texts) == 1:
+            out.extend(code[i:j])
+        else:
+            temp = code[i].result
+            out.append(TACOP(
+                op="=",
+                result=temp,
+                arg1=f'"{"".join(texts)}"',
+                comment=f"{len(texts)} prints fusionados",
+            ))
+            out.append(TACOP(op="print_s", arg1=temp))
+        i = j
+    return out
+
+
+# ========================================
+# 3. PGO: INLINING Y LAYOUT DE BLOQUES
+# ========================================
+#
+# Estas pasadas solo corren con un perfil (intermediate/profile.py).
+# Reciben `counts`: cuántas veces se ejecutó cada instrucción, alineado con
+# `code`, y devuelven (code, counts) para poder encadenarse.
+
+_NON_DEF_RESULT_OPS = {"store", "push_param", "setprop", "label", "goto", "fn_decl", "DATA_WORDS", "PUSH_ARRAY"}
+
+_INVERSE_RELOP = {
+    "<": ">=", ">=": "<", ">": "<=", "<=": ">", "==": "!=", "!=": "==",
+    "str_eq": "str_ne", "str_ne": "str_eq",
+}
+
+
+def _function_ranges(code: List[TACOP]) -> List[Tuple[str, int, int]]:
+    """[(nombre, índice del fn_decl, fin exclusivo)] en orden."""
+    starts = [i for i, ins in enumerate(code) if ins.op == "fn_decl"]
+    return [
+        (code[s].result, s, starts[k + 1] if k + 1 < len(starts) else len(code))
+        for k, s in enumerate(starts)
+    ]
+
+
+def is_variable_operand(operand: Optional[str]) -> bool:
+    """True si el operando es una variable/temporal (no literal)."""
+    if not operand:
+        return False
+    if isinstance(operand, Operand):
+        return not operand.is_literal
+    if operand[0] == '"' or operand in ("true", "false", "null"):
+        return False
+    return not re.fullmatch(r"-?\d+", operand)
+
+
+def _defined_names(body: List[TACOP]) -> Set[str]:
+    """Variables (no temporales) que escribe un rango de TAC."""
+    return {
+        ins.result for ins in body
+        if ins.result and ins.op not in _NON_DEF_RESULT_OPS and not _TEMP_RE.match(ins.result)
+    }
+
+
+def _inlinable(body: List[TACOP], max_size: int, globals_: Set[str] = frozenset()) -> bool:
+    """
+    Función hoja, chica, con un solo return al final y que no escribe
+    globales (`globals_`): sus variables se renombran al insertarla y la
+    escritura se perdería.
+    """
+    real = [ins for ins in body if ins.op != "nop"]
+    if not real or len(real) > max_size:
+        return False
+    if any(ins.op in ("call", "push_param", "class", "attr", "method", "endclass") for ins in real):
+        return False
+    params = {ins.result for ins in real if ins.op == "load_param"}
+    if (_defined_names(real) - params) & globals_:
+        return False
+    returns = [k for k, ins in enumerate(real) if ins.op == "return"]
+    return returns == [] or returns == [len(real) - 1]
+
+
+def inline_hot_calls(
+    code: List[TACOP],
+    counts: List[int],
+    max_size: int = 16,
+    min_count: int = 2,
+) -> Tuple[List[TACOP], List[int]]:
+    """
+    Inserta el cuerpo de funciones hoja pequeñas en los call sites calientes
+    (ejecutados al menos `min_count` veces según el perfil).
+
+        push_param a            inl0_arg0 = a
+        push_param b            inl0_arg1 = b
+        t9 = call func_add  =>  inl0_a = inl0_arg0
+                                inl0_b = inl0_arg1
+                                t40 = inl0_a
+                                ...
+                                t9 = t42
+
+    Las variables del callee se renombran (inlK_x), sus temporales reciben
+    números nuevos (siguen siendo tN para el allocator) y sus labels un
+    sufijo _inlK. Las funciones que escriben globales no se insertan. La
+    función original se conserva para los demás llamados.
+    """
+    functions = {name: (s, e) for name, s, e in _function_ranges(code)}
+    # el TAC no marca declaraciones: lo que escribe el nivel superior es global
+    globals_ = _defined_names(code[slice(*functions["func_main"])]) if "func_main" in functions else set()
+    candidates = {
+        name: code[s + 1:e]
+        for name, (s, e) in functions.items()
+        if name != "func_main" and _inlinable(code[s + 1:e], max_size, globals_)
+    }
+    if not candidates:
+        return code, counts
+
+    next_temp = 1 + max(
+        (int(op[1:]) for ins in code for op in (ins.result, ins.arg1, ins.arg2) if op and _TEMP_RE.match(op)),
+        default=-1,
+    )
+
+    out: List[TACOP] = []
+    out_counts: List[int] = []
+    current = None
+    inlined = 0
+
+    for i, ins in enumerate(code):
+        if ins.op == "fn_decl":
+            current = ins.result
+        body = candidates.get(ins.arg1) if ins.op == "call" else None
+        if body is None or ins.arg1 == current or counts[i] < min_count:
+            out.append(ins)
+            out_counts.append(counts[i])
+            continue
+
+        # Argumentos: los push_param desde la llamada anterior del bloque
+        pushes = []
+        for p in range(len(out) - 1, -1, -1):
+            if out[p].op in ("call", "label", "fn_decl", "goto", "if-goto", "return"):
+                break
+            if out[p].op == "push_param":
+                pushes.append(p)
+        pushes.reverse()
+        n_params = 1 + max((int(b.arg1) for b in body if b.op == "load_param"), default=-1)
+        if len(pushes) != n_params:
+            out.append(ins)
+            out_counts.append(counts[i])
+            continue
+
+        tag = f"inl{inlined}"
+        inlined += 1
+        for k, p in enumerate(pushes):
+            out[p] = TACOP(op="=", arg1=out[p].result, result=f"{tag}_arg{k}", comment=out[p].comment)
+
+        # Renombres del callee
+        names: Dict[str, str] = {}
+        for b in body:
+            if b.op == "label" and b.result:
+                names[b.result] = f"{b.result}_{tag}"
+            elif b.result and b.op not in _NON_DEF_RESULT_OPS and b.result not in names:
+                if _TEMP_RE.match(b.result):
+                    names[b.result] = f"t{next_temp}"
+                    next_temp += 1
+                else:
+                    names[b.result] = f"{tag}_{b.result}"
+
+        def rn(x):
+            return names.get(x, x)
+
+        first = len(out)
+        for b in body:
+            if b.op == "nop":
+                continue
+            if b.op == "load_param":
+                new = TACOP(op="=", arg1=f"{tag}_arg{b.arg1}", result=rn(b.result))
+            elif b.op == "return":
+                if ins.result is None or b.arg1 is None:
+                    continue
+                new = TACOP(op="=", arg1=rn(b.arg1), result=ins.result)
+            elif b.op in ("label", "goto"):
+                new = TACOP(op=b.op, arg1=rn(b.arg1), result=rn(b.result))
+            else:
+                new = TACOP(op=b.op, arg1=rn(b.arg1), arg2=rn(b.arg2), result=rn(b.result), comment=b.comment)
+            out.append(new)
+            out_counts.append(counts[i])
+        if len(out) > first:
+            out[first].comment = f"inline {ins.arg1}"
+        else:
+            out.append(TACOP(op="nop", comment=f"inline {ins.arg1}"))
+            out_counts.append(counts[i])
+
+    return out, out_counts
+
+
+def _layout_function(body: List[TACOP], counts: List[int]) -> Tuple[List[TACOP], List[int]]:
+    n = len(body)
+    if n == 0:
+        return body, counts
+    body = list(body)
+
+    # 1) Unidades: un bloque que no empieza con label solo se alcanza por
+    #    caída, así que se queda pegado al anterior.
+    starts = [0] + [
+        k for k in range(1, n)
+        if body[k].op == "label" and body[k - 1].op not in ("label",)
+    ]
+    units = [list(range(s, starts[u + 1] if u + 1 < len(starts) else n)) for u, s in enumerate(starts)]
+    label_unit: Dict[str, int] = {}
+    for u, idxs in enumerate(units):
+        for k in idxs:
+            if body[k].op == "label":
+                label_unit[body[k].result] = u
+            else:
+                break
+
+    uses = _operand_counts(body)
+
+    def unit_count(u):
+        return counts[units[u][0]] if units[u] else 0
+
+    # 2) Invertir `t = a REL b; if t goto La; goto Lb` si La es más caliente
+    for idxs in units:
+        if len(idxs) < 3:
+            continue
+        rel, br, jmp = (body[k] for k in idxs[-3:])
+        if (rel.op in _INVERSE_RELOP and br.op == "if-goto" and jmp.op == "goto"
+                and br.arg1 == rel.result and uses.get(rel.result) == 2
+                and br.arg2 in label_unit and jmp.arg1 in label_unit
+                and unit_count(label_unit[br.arg2]) > unit_count(label_unit[jmp.arg1])):
+            k_rel, k_br, k_jmp = idxs[-3:]
+            body[k_rel] = TACOP(op=_INVERSE_RELOP[rel.op], arg1=rel.arg1, arg2=rel.arg2,
+                                result=rel.result, comment=rel.comment)
+            body[k_br] = TACOP(op="if-goto", arg1=br.arg1, arg2=jmp.arg1, comment="PGO: rama invertida")
+            body[k_jmp] = TACOP(op="goto", arg1=br.arg2)
+
+    def falls(u):
+        return body[units[u][-1]].op not in ("goto", "return")
+
+    def successors(u):
+        succ = []
+        for k in units[u]:
+            tgt = body[k].arg2 if body[k].op == "if-goto" else (body[k].arg1 if body[k].op == "goto" else None)
+            if tgt in label_unit:
+                succ.append(label_unit[tgt])
+        if falls(u) and u + 1 < len(units):
+            succ.append(u + 1)
+        return succ
+
+    def preferred(u):
+        last = body[units[u][-1]]
+        if last.op == "goto":
+            return label_unit.get(last.arg1)
+        return u + 1 if falls(u) and u + 1 < len(units) else None
+
+    # 3) Encadenar: después de cada unidad va su sucesor más caliente
+    exit_unit = len(units) - 1 if falls(len(units) - 1) and len(units) > 1 else None
+    placed = [0]
+    seen = {0}
+    if exit_unit is not None:
+        seen.add(exit_unit)
+    while len(seen) < len(units):
+        cur = placed[-1]
+        options = [s for s in successors(cur) if s not in seen]
+        pref = preferred(cur)
+        if options:
+            nxt = max(options, key=lambda s: (unit_count(s), s == pref, -s))
+        else:
+            rest = [u for u in range(len(units)) if u not in seen]
+            hot = [u for u in rest if unit_count(u) > 0]
+            nxt = max(hot, key=lambda u: (unit_count(u), -u)) if hot else rest[0]
+        placed.append(nxt)
+        seen.add(nxt)
+    if exit_unit is not None:
+        placed.append(exit_unit)
+
+    # 4) Emitir; la caída rota se vuelve goto explícito
+    out: List[TACOP] = []
+    out_counts: List[int] = []
+    for pos, u in enumerate(placed):
+        for k in units[u]:
+            out.append(body[k])
+            out_counts.append(counts[k])
+        if falls(u) and u + 1 < len(units) and (pos + 1 >= len(placed) or placed[pos + 1] != u + 1):
+            target = body[units[u + 1][0]]
+            out.append(TACOP(op="goto", arg1=target.result))
+            out_counts.append(counts[units[u][-1]])
+
+    # 5) goto al label que quedó inmediatamente después
+    final: List[TACOP] = []
+    final_counts: List[int] = []
+    for k, ins in enumerate(out):
+        if ins.op == "goto" and k + 1 < len(out):
+            j = k + 1
+            following = set()
+            while j < len(out) and out[j].op == "label":
+                following.add(out[j].result)
+                j += 1
+            if ins.arg1 in following:
+                continue
+        final.append(ins)
+        final_counts.append(out_counts[k])
+    return final, final_counts
+
+
+def layout_hot_blocks(code: List[TACOP], counts: List[int]) -> Tuple[List[TACOP], List[int]]:
+    """
+    Reordena los bloques de cada función según el perfil:
+      - `t = a < b; if t goto L1; goto L2` se invierte a
+        `t = a >= b; if t goto L2` cuando L1 es la rama caliente, así el
+        camino caliente cae sin saltar
+      - después de cada bloque se coloca su sucesor más caliente; los
+        bloques que nunca se ejecutaron quedan al final
+      - el bloque que cae al final de la función sigue siendo el último
+    El programa es equivalente: toda caída que se rompe se vuelve un goto.
+    """
+    ranges = _function_ranges(code)
+    if not ranges:
+        return code, counts
+    out = list(code[:ranges[0][1]])
+    out_counts = list(counts[:ranges[0][1]])
+    for _name, s, e in ranges:
+        body, body_counts = _layout_function(code[s + 1:e], counts[s + 1:e])
+        out.append(code[s])
+        out_counts.append(counts[s])
+        out.extend(body)
+        out_counts.extend(body_counts)
+    return out, out_counts
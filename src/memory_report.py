@@ -0,0 +1,146 @@
+# src/memory_report.py
+"""
+MemoryTrace: CompileTrace que además mide memoria por fase con tracemalloc.
+
+Por cada fase de primer nivel (lex, parse, semantic, tac, pre_analysis,
+codegen, ...) registra:
+  - peak_kb: pico de memoria trazada durante la fase
+  - retained_kb: lo que la fase deja vivo al terminar (fin - inicio)
+  - top: sitios (archivo:línea) que más memoria retienen al terminar
+
+tracemalloc hace la compilación varias veces más lenta: usar solo para
+diagnóstico (DriverGen --memory, benchmarks), no en el servidor.
+
+Uso:
+    with MemoryTrace("prog.cps", source_bytes=len(src)) as trace:
+        compile_source(src, trace=trace)
+    print(trace.memory_summary())
+"""
+
+import os
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from typing import Dict, Iterator, List, Optional
+
+from compile_trace import CompileTrace, Span
+
+_SELF = os.path.abspath(__file__)
+
+
+@dataclass
+class PhaseMemory:
+    start_kb: float
+    peak_kb: float = 0.0
+    retained_kb: float = 0.0
+    top: List[Dict[str, object]] = field(default_factory=list)
+
+
+def _kb(n: int) -> float:
+    return round(n / 1024, 1)
+
+
+class MemoryTrace(CompileTrace):
+    def __init__(self, name: str = "compile", source_bytes: int = 0, top: int = 5, frames: int = 1):
+        super().__init__(name=name)
+        self.source_bytes = source_bytes
+        self.top_n = top
+        self.frames = frames
+        self.memory: Dict[str, PhaseMemory] = {}
+        self.peak_kb = 0.0              # máximo de los picos por fase
+        self._started_tracing = False
+
+    # ------------------------------------------------------------
+    # Ciclo de vida de tracemalloc
+    # ------------------------------------------------------------
+
+    def start(self) -> "MemoryTrace":
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        return self
+
+    def stop(self) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def __enter__(self) -> "MemoryTrace":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------
+    # Spans
+    # ------------------------------------------------------------
+
+    def _snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, _SELF),
+        ))
+
+    @contextmanager
+    def span(self, name: str, **args) -> Iterator[Span]:
+        # Solo las fases de primer nivel: reset_peak() dentro de un span
+        # anidado borraría el pico de la fase que lo contiene
+        if self._depth != 0 or not tracemalloc.is_tracing():
+            with super().span(name, **args) as sp:
+                yield sp
+            return
+
+        start, _ = tracemalloc.get_traced_memory()
+        before = self._snapshot() if self.top_n else None
+        # el snapshot vive durante toda la fase: su tamaño se descuenta del pico
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        mem = PhaseMemory(start_kb=_kb(start))
+        try:
+            with super().span(name, **args) as sp:
+                yield sp
+        finally:
+            end, peak = tracemalloc.get_traced_memory()
+            mem.peak_kb = _kb(start + peak - current)
+            mem.retained_kb = _kb(end - current)
+            self.peak_kb = max(self.peak_kb, mem.peak_kb)
+            if before is not None:
+                stats = self._snapshot().compare_to(before, "lineno")
+                mem.top = [
+                    {"site": f"{os.path.basename(s.traceback[0].filename)}:{s.traceback[0].lineno}",
+                     "kb": _kb(s.size_diff), "count": s.count_diff}
+                    for s in stats[: self.top_n] if s.size_diff > 0
+                ]
+            self.memory[name] = mem
+
+    # ------------------------------------------------------------
+    # Reportes
+    # ------------------------------------------------------------
+
+    def peak_per_source_kb(self) -> Optional[float]:
+        """KiB de pico por KiB de fuente."""
+        if not self.source_bytes:
+            return None
+        return round(self.peak_kb / (self.source_bytes / 1024), 1)
+
+    def to_dict(self) -> dict:
+        out = super().to_dict()
+        out["memory"] = {
+            "peak_kb": self.peak_kb,
+            "source_kb": _kb(self.source_bytes),
+            "peak_per_source_kb": self.peak_per_source_kb(),
+            "phases": {name: asdict(m) for name, m in self.memory.items()},
+        }
+        return out
+
+    def memory_summary(self) -> str:
+        lines = [f"== MEMORIA ({self.name}) ==",
+                 f"{'fase':<14} {'inicio KiB':>11} {'pico KiB':>10} {'retiene KiB':>12}"]
+        for name, m in self.memory.items():
+            lines.append(f"{name:<14} {m.start_kb:>11.1f} {m.peak_kb:>10.1f} {m.retained_kb:>12.1f}")
+            for site in m.top[:3]:
+                lines.append(f"{'':<16}{site['site']:<40} {site['kb']:>8.1f} KiB ({site['count']} bloques)")
+        ratio = self.peak_per_source_kb()
+        lines.append(f"pico total: {self.peak_kb:.1f} KiB"
+                     + (f" ({ratio} KiB por KiB de fuente)" if ratio is not None else ""))
+        return "\n".join(lines)
@@ -29,10 +29,10 @@ def serializedATN():
         22,1,22,1,22,1,22,1,22,1,22,1,23,1,23,1,23,1,23,1,24,1,24,1,24,1,
         24,1,24,1,24,1,24,1,25,1,25,1,25,1,25,1,25,1,26,1,26,1,26,1,26,1,
         26,1,26,1,26,1,26,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,
-        28,1,28,1,29,1,29,1,29,1,29,1,29,1,29,1,30,1,30,1,31,1,31,1,31,1,
-        32,1,32,1,32,1,33,1,33,1,33,1,34,1,34,1,34,1,35,1,35,1,36,1,36,1,
-        36,1,37,1,37,1,38,1,38,1,38,1,39,1,39,1,40,1,40,1,41,1,41,1,42,1,
-        42,1,43,1,43,1,44,1,44,1,45,1,45,1,45,1,45,1,45,1,46,1,46,1,46,1,
+        28,1,28,1,29,1,29,1,29,1,29,1,29,1,29,1,30,1,30,1,31,1,31,1,32,1,
+        32,1,33,1,33,1,34,1,34,1,35,1,35,1,36,1,36,1,37,1,37,1,38,1,38,1,
+        38,1,39,1,39,1,40,1,40,1,40,1,41,1,41,1,41,1,42,1,42,1,42,1,43,1,
+        43,1,43,1,44,1,44,1,44,1,45,1,45,1,45,1,45,1,45,1,46,1,46,1,46,1,
         46,1,46,1,47,1,47,1,47,1,47,1,47,1,47,1,48,1,48,1,48,1,48,1,49,1,
         49,1,49,1,49,1,49,1,50,1,50,1,51,1,51,1,52,1,52,1,52,1,52,1,52,1,
         52,1,52,1,52,1,53,1,53,1,53,1,53,1,53,1,53,1,53,1,53,1,54,1,54,1,
@@ -69,10 +69,10 @@ def serializedATN():
         35,186,1,0,0,0,37,189,1,0,0,0,39,195,1,0,0,0,41,204,1,0,0,0,43,211,
         1,0,0,0,45,215,1,0,0,0,47,221,1,0,0,0,49,225,1,0,0,0,51,232,1,0,
         0,0,53,237,1,0,0,0,55,245,1,0,0,0,57,254,1,0,0,0,59,256,1,0,0,0,
-        61,262,1,0,0,0,63,264,1,0,0,0,65,267,1,0,0,0,67,270,1,0,0,0,69,273,
-        1,0,0,0,71,276,1,0,0,0,73,278,1,0,0,0,75,281,1,0,0,0,77,283,1,0,
-        0,0,79,286,1,0,0,0,81,288,1,0,0,0,83,290,1,0,0,0,85,292,1,0,0,0,
-        87,294,1,0,0,0,89,296,1,0,0,0,91,298,1,0,0,0,93,303,1,0,0,0,95,308,
+        61,262,1,0,0,0,63,264,1,0,0,0,65,266,1,0,0,0,67,268,1,0,0,0,69,270,
+        1,0,0,0,71,272,1,0,0,0,73,274,1,0,0,0,75,276,1,0,0,0,77,278,1,0,
+        0,0,79,281,1,0,0,0,81,283,1,0,0,0,83,286,1,0,0,0,85,289,1,0,0,0,
+        87,292,1,0,0,0,89,295,1,0,0,0,91,298,1,0,0,0,93,303,1,0,0,0,95,308,
         1,0,0,0,97,314,1,0,0,0,99,318,1,0,0,0,101,323,1,0,0,0,103,325,1,
         0,0,0,105,327,1,0,0,0,107,335,1,0,0,0,109,343,1,0,0,0,111,352,1,
         0,0,0,113,355,1,0,0,0,115,359,1,0,0,0,117,368,1,0,0,0,119,376,1,
@@ -113,22 +113,22 @@ def serializedATN():
         0,0,252,253,5,110,0,0,253,56,1,0,0,0,254,255,5,44,0,0,255,58,1,0,
         0,0,256,257,5,99,0,0,257,258,5,108,0,0,258,259,5,97,0,0,259,260,
         5,115,0,0,260,261,5,115,0,0,261,60,1,0,0,0,262,263,5,63,0,0,263,
-        62,1,0,0,0,264,265,5,124,0,0,265,266,5,124,0,0,266,64,1,0,0,0,267,
-        268,5,38,0,0,268,269,5,38,0,0,269,66,1,0,0,0,270,271,5,61,0,0,271,
-        272,5,61,0,0,272,68,1,0,0,0,273,274,5,33,0,0,274,275,5,61,0,0,275,
-        70,1,0,0,0,276,277,5,60,0,0,277,72,1,0,0,0,278,279,5,60,0,0,279,
-        280,5,61,0,0,280,74,1,0,0,0,281,282,5,62,0,0,282,76,1,0,0,0,283,
-        284,5,62,0,0,284,285,5,61,0,0,285,78,1,0,0,0,286,287,5,43,0,0,287,
-        80,1,0,0,0,288,289,5,45,0,0,289,82,1,0,0,0,290,291,5,42,0,0,291,
-        84,1,0,0,0,292,293,5,47,0,0,293,86,1,0,0,0,294,295,5,37,0,0,295,
-        88,1,0,0,0,296,297,5,33,0,0,297,90,1,0,0,0,298,299,5,110,0,0,299,
-        300,5,117,0,0,300,301,5,108,0,0,301,302,5,108,0,0,302,92,1,0,0,0,
-        303,304,5,116,0,0,304,305,5,114,0,0,305,306,5,117,0,0,306,307,5,
-        101,0,0,307,94,1,0,0,0,308,309,5,102,0,0,309,310,5,97,0,0,310,311,
-        5,108,0,0,311,312,5,115,0,0,312,313,5,101,0,0,313,96,1,0,0,0,314,
-        315,5,110,0,0,315,316,5,101,0,0,316,317,5,119,0,0,317,98,1,0,0,0,
-        318,319,5,116,0,0,319,320,5,104,0,0,320,321,5,105,0,0,321,322,5,
-        115,0,0,322,100,1,0,0,0,323,324,5,91,0,0,324,102,1,0,0,0,325,326,
+        62,1,0,0,0,264,265,5,45,0,0,265,64,1,0,0,0,266,267,5,33,0,0,267,
+        66,1,0,0,0,268,269,5,42,0,0,269,68,1,0,0,0,270,271,5,47,0,0,271,
+        70,1,0,0,0,272,273,5,37,0,0,273,72,1,0,0,0,274,275,5,43,0,0,275,
+        74,1,0,0,0,276,277,5,60,0,0,277,76,1,0,0,0,278,279,5,60,0,0,279,
+        280,5,61,0,0,280,78,1,0,0,0,281,282,5,62,0,0,282,80,1,0,0,0,283,
+        284,5,62,0,0,284,285,5,61,0,0,285,82,1,0,0,0,286,287,5,61,0,0,287,
+        288,5,61,0,0,288,84,1,0,0,0,289,290,5,33,0,0,290,291,5,61,0,0,291,
+        86,1,0,0,0,292,293,5,38,0,0,293,294,5,38,0,0,294,88,1,0,0,0,295,
+        296,5,124,0,0,296,297,5,124,0,0,297,90,1,0,0,0,298,299,5,110,0,0,
+        299,300,5,117,0,0,300,301,5,108,0,0,301,302,5,108,0,0,302,92,1,0,
+        0,0,303,304,5,116,0,0,304,305,5,114,0,0,305,306,5,117,0,0,306,307,
+        5,101,0,0,307,94,1,0,0,0,308,309,5,102,0,0,309,310,5,97,0,0,310,
+        311,5,108,0,0,311,312,5,115,0,0,312,313,5,101,0,0,313,96,1,0,0,0,
+        314,315,5,110,0,0,315,316,5,101,0,0,316,317,5,119,0,0,317,98,1,0,
+        0,0,318,319,5,116,0,0,319,320,5,104,0,0,320,321,5,105,0,0,321,322,
+        5,115,0,0,322,100,1,0,0,0,323,324,5,91,0,0,324,102,1,0,0,0,325,326,
         5,93,0,0,326,104,1,0,0,0,327,328,5,98,0,0,328,329,5,111,0,0,329,
         330,5,111,0,0,330,331,5,108,0,0,331,332,5,101,0,0,332,333,5,97,0,
         0,333,334,5,110,0,0,334,106,1,0,0,0,335,336,5,105,0,0,336,337,5,
@@ -233,9 +233,9 @@ class CompiscriptLexer(Lexer):
             "'.'", "'print'", "'('", "')'", "'if'", "'else'", "'while'", 
             "'do'", "'foreach'", "'in'", "'break'", "'continue'", "'return'", 
             "'try'", "'catch'", "'for'", "'switch'", "'case'", "'default'", 
-            "'function'", "','", "'class'", "'?'", "'||'", "'&&'", "'=='", 
-            "'!='", "'<'", "'<='", "'>'", "'>='", "'+'", "'-'", "'*'", "'/'", 
-            "'%'", "'!'", "'null'", "'true'", "'false'", "'new'", "'this'", 
+            "'function'", "','", "'class'", "'?'", "'-'", "'!'", "'*'", 
+            "'/'", "'%'", "'+'", "'<'", "'<='", "'>'", "'>='", "'=='", "'!='", 
+            "'&&'", "'||'", "'null'", "'true'", "'false'", "'new'", "'this'", 
             "'['", "']'", "'boolean'", "'integer'", "'string'" ]
 
     symbolicNames = [ "<INVALID>",
@@ -296,69 +296,78 @@ class CompiscriptListener(ParseTreeListener):
         pass
 
 
-    # Enter a parse tree produced by CompiscriptParser#logicalOrExpr.
-    def enterLogicalOrExpr(self, ctx:CompiscriptParser.LogicalOrExprContext):
+    # Enter a parse tree produced by CompiscriptParser#OperandExpr.
+    def enterOperandExpr(self, ctx:CompiscriptParser.OperandExprContext):
         pass
 
-    # Exit a parse tree produced by CompiscriptParser#logicalOrExpr.
-    def exitLogicalOrExpr(self, ctx:CompiscriptParser.LogicalOrExprContext):
+    # Exit a parse tree produced by CompiscriptParser#OperandExpr.
+    def exitOperandExpr(self, ctx:CompiscriptParser.OperandExprContext):
         pass
 
 
-    # Enter a parse tree produced by CompiscriptParser#logicalAndExpr.
-    def enterLogicalAndExpr(self, ctx:CompiscriptParser.LogicalAndExprContext):
+    # Enter a parse tree produced by CompiscriptParser#MultiplicativeExpr.
+    def enterMultiplicativeExpr(self, ctx:CompiscriptParser.MultiplicativeExprContext):
         pass
 
-    # Exit a parse tree produced by CompiscriptParser#logicalAndExpr.
-    def exitLogicalAndExpr(self, ctx:CompiscriptParser.LogicalAndExprContext):
+    # Exit a parse tree produced by CompiscriptParser#MultiplicativeExpr.
+    def exitMultiplicativeExpr(self, ctx:CompiscriptParser.MultiplicativeExprContext):
         pass
 
 
-    # Enter a parse tree produced by CompiscriptParser#equalityExpr.
-    def enterEqualityExpr(self, ctx:CompiscriptParser.EqualityExprContext):
+    # Enter a parse tree produced by CompiscriptParser#LogicalOrExpr.
+    def enterLogicalOrExpr(self, ctx:CompiscriptParser.LogicalOrExprContext):
         pass
 
-    # Exit a parse tree produced by CompiscriptParser#equalityExpr.
-    def exitEqualityExpr(self, ctx:CompiscriptParser.EqualityExprContext):
+    # Exit a parse tree produced by CompiscriptParser#LogicalOrExpr.
+    def exitLogicalOrExpr(self, ctx:CompiscriptParser.LogicalOrExprContext):
         pass
 
 
-    # Enter a parse tree produced by CompiscriptParser#relationalExpr.
-    def enterRelationalExpr(self, ctx:CompiscriptParser.RelationalExprContext):
+    # Enter a parse tree produced by CompiscriptParser#EqualityExpr.
+    def enterEqualityExpr(self, ctx:CompiscriptParser.EqualityExprContext):
         pass
 
-    # Exit a parse tree produced by CompiscriptParser#relationalExpr.
-    def exitRelationalExpr(self, ctx:CompiscriptParser.RelationalExprContext):
+    # Exit a parse tree produced by CompiscriptParser#EqualityExpr.
+    def exitEqualityExpr(self, ctx:CompiscriptParser.EqualityExprContext):
         pass
 
 
-    # Enter a parse tree produced by CompiscriptParser#additiveExpr.
+    # Enter a parse tree produced by CompiscriptParser#AdditiveExpr.
     def enterAdditiveExpr(self, ctx:CompiscriptParser.AdditiveExprContext):
         pass
 
-    # Exit a parse tree produced by CompiscriptParser#additiveExpr.
+    # Exit a parse tree produced by CompiscriptParser#AdditiveExpr.
     def exitAdditiveExpr(self, ctx:CompiscriptParser.AdditiveExprContext):
         pass
 
 
-    # Enter a parse tree produced by CompiscriptParser#multiplicativeExpr.
-    def enterMultiplicativeExpr(self, ctx:CompiscriptParser.MultiplicativeExprContext):
+    # Enter a parse tree produced by CompiscriptParser#RelationalExpr.
+    def enterRelationalExpr(self, ctx:CompiscriptParser.RelationalExprContext):
         pass
 
-    # Exit a parse tree produced by CompiscriptParser#multiplicativeExpr.
-    def exitMultiplicativeExpr(self, ctx:CompiscriptParser.MultiplicativeExprContext):
+    # Exit a parse tree produced by CompiscriptParser#RelationalExpr.
+    def exitRelationalExpr(self, ctx:CompiscriptParser.RelationalExprContext):
         pass
 
 
-    # Enter a parse tree produced by CompiscriptParser#unaryExpr.
+    # Enter a parse tree produced by CompiscriptParser#UnaryExpr.
     def enterUnaryExpr(self, ctx:CompiscriptParser.UnaryExprContext):
         pass
 
-    # Exit a parse tree produced by CompiscriptParser#unaryExpr.
+    # Exit a parse tree produced by CompiscriptParser#UnaryExpr.
     def exitUnaryExpr(self, ctx:CompiscriptParser.UnaryExprContext):
         pass
 
 
+    # Enter a parse tree produced by CompiscriptParser#LogicalAndExpr.
+    def enterLogicalAndExpr(self, ctx:CompiscriptParser.LogicalAndExprContext):
+        pass
+
+    # Exit a parse tree produced by CompiscriptParser#LogicalAndExpr.
+    def exitLogicalAndExpr(self, ctx:CompiscriptParser.LogicalAndExprContext):
+        pass
+
+
     # Enter a parse tree produced by CompiscriptParser#primaryExpr.
     def enterPrimaryExpr(self, ctx:CompiscriptParser.PrimaryExprContext):
         pass
@@ -10,177 +10,165 @@ else:
 
 def serializedATN():
     return [
-        4,1,62,478,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        4,1,62,442,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
         6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
         2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,20,
         7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,26,7,26,
         2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,32,2,33,
         7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,39,7,39,
-        2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,45,1,0,
-        5,0,94,8,0,10,0,12,0,97,9,0,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
-        1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,119,8,1,1,2,1,2,
-        5,2,123,8,2,10,2,12,2,126,9,2,1,2,1,2,1,3,1,3,1,3,3,3,133,8,3,1,
-        3,3,3,136,8,3,1,3,1,3,1,4,1,4,1,4,3,4,143,8,4,1,4,1,4,1,4,1,4,1,
-        5,1,5,1,5,1,6,1,6,1,6,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,
-        7,1,7,3,7,167,8,7,1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,9,1,9,1,10,1,10,
-        1,10,1,10,1,10,1,10,1,10,3,10,185,8,10,1,11,1,11,1,11,1,11,1,11,
-        1,11,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,13,1,13,1,13,1,13,
-        1,13,1,13,1,13,1,13,1,14,1,14,1,14,1,15,1,15,1,15,1,16,1,16,3,16,
-        217,8,16,1,16,1,16,1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,18,
-        1,18,1,18,1,18,1,18,3,18,234,8,18,1,18,3,18,237,8,18,1,18,1,18,3,
-        18,241,8,18,1,18,1,18,1,18,1,19,1,19,1,19,1,19,1,19,1,19,5,19,252,
-        8,19,10,19,12,19,255,9,19,1,19,3,19,258,8,19,1,19,1,19,1,20,1,20,
-        1,20,1,20,5,20,266,8,20,10,20,12,20,269,9,20,1,21,1,21,1,21,5,21,
-        274,8,21,10,21,12,21,277,9,21,1,22,1,22,1,22,1,22,3,22,283,8,22,
-        1,22,1,22,1,22,3,22,288,8,22,1,22,1,22,1,23,1,23,1,23,5,23,295,8,
-        23,10,23,12,23,298,9,23,1,24,1,24,1,24,3,24,303,8,24,1,25,1,25,1,
-        25,1,25,3,25,309,8,25,1,25,1,25,5,25,313,8,25,10,25,12,25,316,9,
-        25,1,25,1,25,1,26,1,26,1,26,3,26,323,8,26,1,27,1,27,1,28,1,28,1,
-        28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,3,28,338,8,28,1,29,1,
-        29,1,29,1,29,1,29,1,29,3,29,346,8,29,1,30,1,30,1,30,5,30,351,8,30,
-        10,30,12,30,354,9,30,1,31,1,31,1,31,5,31,359,8,31,10,31,12,31,362,
-        9,31,1,32,1,32,1,32,5,32,367,8,32,10,32,12,32,370,9,32,1,33,1,33,
-        1,33,5,33,375,8,33,10,33,12,33,378,9,33,1,34,1,34,1,34,5,34,383,
-        8,34,10,34,12,34,386,9,34,1,35,1,35,1,35,5,35,391,8,35,10,35,12,
-        35,394,9,35,1,36,1,36,1,36,3,36,399,8,36,1,37,1,37,1,37,1,37,1,37,
-        1,37,3,37,407,8,37,1,38,1,38,1,38,1,38,1,38,3,38,414,8,38,1,39,1,
-        39,5,39,418,8,39,10,39,12,39,421,9,39,1,40,1,40,1,40,1,40,1,40,3,
-        40,428,8,40,1,40,1,40,3,40,432,8,40,1,41,1,41,3,41,436,8,41,1,41,
-        1,41,1,41,1,41,1,41,1,41,1,41,3,41,445,8,41,1,42,1,42,1,42,5,42,
-        450,8,42,10,42,12,42,453,9,42,1,43,1,43,1,43,1,43,5,43,459,8,43,
-        10,43,12,43,462,9,43,3,43,464,8,43,1,43,1,43,1,44,1,44,1,44,5,44,
-        471,8,44,10,44,12,44,474,9,44,1,45,1,45,1,45,0,0,46,0,2,4,6,8,10,
-        12,14,16,18,20,22,24,26,28,30,32,34,36,38,40,42,44,46,48,50,52,54,
-        56,58,60,62,64,66,68,70,72,74,76,78,80,82,84,86,88,90,0,7,1,0,3,
-        4,1,0,34,35,1,0,36,39,1,0,40,41,1,0,42,44,2,0,41,41,45,45,2,0,53,
-        55,59,59,499,0,95,1,0,0,0,2,118,1,0,0,0,4,120,1,0,0,0,6,129,1,0,
-        0,0,8,139,1,0,0,0,10,148,1,0,0,0,12,151,1,0,0,0,14,166,1,0,0,0,16,
-        168,1,0,0,0,18,171,1,0,0,0,20,177,1,0,0,0,22,186,1,0,0,0,24,192,
-        1,0,0,0,26,200,1,0,0,0,28,208,1,0,0,0,30,211,1,0,0,0,32,214,1,0,
-        0,0,34,220,1,0,0,0,36,228,1,0,0,0,38,245,1,0,0,0,40,261,1,0,0,0,
-        42,270,1,0,0,0,44,278,1,0,0,0,46,291,1,0,0,0,48,299,1,0,0,0,50,304,
-        1,0,0,0,52,322,1,0,0,0,54,324,1,0,0,0,56,337,1,0,0,0,58,339,1,0,
-        0,0,60,347,1,0,0,0,62,355,1,0,0,0,64,363,1,0,0,0,66,371,1,0,0,0,
-        68,379,1,0,0,0,70,387,1,0,0,0,72,398,1,0,0,0,74,406,1,0,0,0,76,413,
-        1,0,0,0,78,415,1,0,0,0,80,431,1,0,0,0,82,444,1,0,0,0,84,446,1,0,
-        0,0,86,454,1,0,0,0,88,467,1,0,0,0,90,475,1,0,0,0,92,94,3,2,1,0,93,
-        92,1,0,0,0,94,97,1,0,0,0,95,93,1,0,0,0,95,96,1,0,0,0,96,98,1,0,0,
-        0,97,95,1,0,0,0,98,99,5,0,0,1,99,1,1,0,0,0,100,119,3,6,3,0,101,119,
-        3,8,4,0,102,119,3,14,7,0,103,119,3,44,22,0,104,119,3,50,25,0,105,
-        119,3,16,8,0,106,119,3,18,9,0,107,119,3,4,2,0,108,119,3,20,10,0,
-        109,119,3,22,11,0,110,119,3,24,12,0,111,119,3,36,18,0,112,119,3,
-        26,13,0,113,119,3,34,17,0,114,119,3,38,19,0,115,119,3,28,14,0,116,
-        119,3,30,15,0,117,119,3,32,16,0,118,100,1,0,0,0,118,101,1,0,0,0,
-        118,102,1,0,0,0,118,103,1,0,0,0,118,104,1,0,0,0,118,105,1,0,0,0,
-        118,106,1,0,0,0,118,107,1,0,0,0,118,108,1,0,0,0,118,109,1,0,0,0,
-        118,110,1,0,0,0,118,111,1,0,0,0,118,112,1,0,0,0,118,113,1,0,0,0,
-        118,114,1,0,0,0,118,115,1,0,0,0,118,116,1,0,0,0,118,117,1,0,0,0,
-        119,3,1,0,0,0,120,124,5,1,0,0,121,123,3,2,1,0,122,121,1,0,0,0,123,
-        126,1,0,0,0,124,122,1,0,0,0,124,125,1,0,0,0,125,127,1,0,0,0,126,
-        124,1,0,0,0,127,128,5,2,0,0,128,5,1,0,0,0,129,130,7,0,0,0,130,132,
-        5,59,0,0,131,133,3,10,5,0,132,131,1,0,0,0,132,133,1,0,0,0,133,135,
-        1,0,0,0,134,136,3,12,6,0,135,134,1,0,0,0,135,136,1,0,0,0,136,137,
-        1,0,0,0,137,138,5,5,0,0,138,7,1,0,0,0,139,140,5,6,0,0,140,142,5,
-        59,0,0,141,143,3,10,5,0,142,141,1,0,0,0,142,143,1,0,0,0,143,144,
-        1,0,0,0,144,145,5,7,0,0,145,146,3,54,27,0,146,147,5,5,0,0,147,9,
-        1,0,0,0,148,149,5,8,0,0,149,150,3,88,44,0,150,11,1,0,0,0,151,152,
-        5,7,0,0,152,153,3,54,27,0,153,13,1,0,0,0,154,155,5,59,0,0,155,156,
-        5,7,0,0,156,157,3,54,27,0,157,158,5,5,0,0,158,167,1,0,0,0,159,160,
-        3,54,27,0,160,161,5,9,0,0,161,162,5,59,0,0,162,163,5,7,0,0,163,164,
-        3,54,27,0,164,165,5,5,0,0,165,167,1,0,0,0,166,154,1,0,0,0,166,159,
-        1,0,0,0,167,15,1,0,0,0,168,169,3,54,27,0,169,170,5,5,0,0,170,17,
-        1,0,0,0,171,172,5,10,0,0,172,173,5,11,0,0,173,174,3,54,27,0,174,
-        175,5,12,0,0,175,176,5,5,0,0,176,19,1,0,0,0,177,178,5,13,0,0,178,
-        179,5,11,0,0,179,180,3,54,27,0,180,181,5,12,0,0,181,184,3,4,2,0,
-        182,183,5,14,0,0,183,185,3,4,2,0,184,182,1,0,0,0,184,185,1,0,0,0,
-        185,21,1,0,0,0,186,187,5,15,0,0,187,188,5,11,0,0,188,189,3,54,27,
-        0,189,190,5,12,0,0,190,191,3,4,2,0,191,23,1,0,0,0,192,193,5,16,0,
-        0,193,194,3,4,2,0,194,195,5,15,0,0,195,196,5,11,0,0,196,197,3,54,
-        27,0,197,198,5,12,0,0,198,199,5,5,0,0,199,25,1,0,0,0,200,201,5,17,
-        0,0,201,202,5,11,0,0,202,203,5,59,0,0,203,204,5,18,0,0,204,205,3,
-        54,27,0,205,206,5,12,0,0,206,207,3,4,2,0,207,27,1,0,0,0,208,209,
-        5,19,0,0,209,210,5,5,0,0,210,29,1,0,0,0,211,212,5,20,0,0,212,213,
-        5,5,0,0,213,31,1,0,0,0,214,216,5,21,0,0,215,217,3,54,27,0,216,215,
-        1,0,0,0,216,217,1,0,0,0,217,218,1,0,0,0,218,219,5,5,0,0,219,33,1,
-        0,0,0,220,221,5,22,0,0,221,222,3,4,2,0,222,223,5,23,0,0,223,224,
-        5,11,0,0,224,225,5,59,0,0,225,226,5,12,0,0,226,227,3,4,2,0,227,35,
-        1,0,0,0,228,229,5,24,0,0,229,233,5,11,0,0,230,234,3,6,3,0,231,234,
-        3,14,7,0,232,234,5,5,0,0,233,230,1,0,0,0,233,231,1,0,0,0,233,232,
-        1,0,0,0,234,236,1,0,0,0,235,237,3,54,27,0,236,235,1,0,0,0,236,237,
-        1,0,0,0,237,238,1,0,0,0,238,240,5,5,0,0,239,241,3,54,27,0,240,239,
-        1,0,0,0,240,241,1,0,0,0,241,242,1,0,0,0,242,243,5,12,0,0,243,244,
-        3,4,2,0,244,37,1,0,0,0,245,246,5,25,0,0,246,247,5,11,0,0,247,248,
-        3,54,27,0,248,249,5,12,0,0,249,253,5,1,0,0,250,252,3,40,20,0,251,
-        250,1,0,0,0,252,255,1,0,0,0,253,251,1,0,0,0,253,254,1,0,0,0,254,
-        257,1,0,0,0,255,253,1,0,0,0,256,258,3,42,21,0,257,256,1,0,0,0,257,
-        258,1,0,0,0,258,259,1,0,0,0,259,260,5,2,0,0,260,39,1,0,0,0,261,262,
-        5,26,0,0,262,263,3,54,27,0,263,267,5,8,0,0,264,266,3,2,1,0,265,264,
-        1,0,0,0,266,269,1,0,0,0,267,265,1,0,0,0,267,268,1,0,0,0,268,41,1,
-        0,0,0,269,267,1,0,0,0,270,271,5,27,0,0,271,275,5,8,0,0,272,274,3,
-        2,1,0,273,272,1,0,0,0,274,277,1,0,0,0,275,273,1,0,0,0,275,276,1,
-        0,0,0,276,43,1,0,0,0,277,275,1,0,0,0,278,279,5,28,0,0,279,280,5,
-        59,0,0,280,282,5,11,0,0,281,283,3,46,23,0,282,281,1,0,0,0,282,283,
-        1,0,0,0,283,284,1,0,0,0,284,287,5,12,0,0,285,286,5,8,0,0,286,288,
-        3,88,44,0,287,285,1,0,0,0,287,288,1,0,0,0,288,289,1,0,0,0,289,290,
-        3,4,2,0,290,45,1,0,0,0,291,296,3,48,24,0,292,293,5,29,0,0,293,295,
-        3,48,24,0,294,292,1,0,0,0,295,298,1,0,0,0,296,294,1,0,0,0,296,297,
-        1,0,0,0,297,47,1,0,0,0,298,296,1,0,0,0,299,302,5,59,0,0,300,301,
-        5,8,0,0,301,303,3,88,44,0,302,300,1,0,0,0,302,303,1,0,0,0,303,49,
-        1,0,0,0,304,305,5,30,0,0,305,308,5,59,0,0,306,307,5,8,0,0,307,309,
-        5,59,0,0,308,306,1,0,0,0,308,309,1,0,0,0,309,310,1,0,0,0,310,314,
-        5,1,0,0,311,313,3,52,26,0,312,311,1,0,0,0,313,316,1,0,0,0,314,312,
-        1,0,0,0,314,315,1,0,0,0,315,317,1,0,0,0,316,314,1,0,0,0,317,318,
-        5,2,0,0,318,51,1,0,0,0,319,323,3,44,22,0,320,323,3,6,3,0,321,323,
-        3,8,4,0,322,319,1,0,0,0,322,320,1,0,0,0,322,321,1,0,0,0,323,53,1,
-        0,0,0,324,325,3,56,28,0,325,55,1,0,0,0,326,327,3,78,39,0,327,328,
-        5,7,0,0,328,329,3,56,28,0,329,338,1,0,0,0,330,331,3,78,39,0,331,
-        332,5,9,0,0,332,333,5,59,0,0,333,334,5,7,0,0,334,335,3,56,28,0,335,
-        338,1,0,0,0,336,338,3,58,29,0,337,326,1,0,0,0,337,330,1,0,0,0,337,
-        336,1,0,0,0,338,57,1,0,0,0,339,345,3,60,30,0,340,341,5,31,0,0,341,
-        342,3,54,27,0,342,343,5,8,0,0,343,344,3,54,27,0,344,346,1,0,0,0,
-        345,340,1,0,0,0,345,346,1,0,0,0,346,59,1,0,0,0,347,352,3,62,31,0,
-        348,349,5,32,0,0,349,351,3,62,31,0,350,348,1,0,0,0,351,354,1,0,0,
-        0,352,350,1,0,0,0,352,353,1,0,0,0,353,61,1,0,0,0,354,352,1,0,0,0,
-        355,360,3,64,32,0,356,357,5,33,0,0,357,359,3,64,32,0,358,356,1,0,
-        0,0,359,362,1,0,0,0,360,358,1,0,0,0,360,361,1,0,0,0,361,63,1,0,0,
-        0,362,360,1,0,0,0,363,368,3,66,33,0,364,365,7,1,0,0,365,367,3,66,
-        33,0,366,364,1,0,0,0,367,370,1,0,0,0,368,366,1,0,0,0,368,369,1,0,
-        0,0,369,65,1,0,0,0,370,368,1,0,0,0,371,376,3,68,34,0,372,373,7,2,
-        0,0,373,375,3,68,34,0,374,372,1,0,0,0,375,378,1,0,0,0,376,374,1,
-        0,0,0,376,377,1,0,0,0,377,67,1,0,0,0,378,376,1,0,0,0,379,384,3,70,
-        35,0,380,381,7,3,0,0,381,383,3,70,35,0,382,380,1,0,0,0,383,386,1,
-        0,0,0,384,382,1,0,0,0,384,385,1,0,0,0,385,69,1,0,0,0,386,384,1,0,
-        0,0,387,392,3,72,36,0,388,389,7,4,0,0,389,391,3,72,36,0,390,388,
-        1,0,0,0,391,394,1,0,0,0,392,390,1,0,0,0,392,393,1,0,0,0,393,71,1,
-        0,0,0,394,392,1,0,0,0,395,396,7,5,0,0,396,399,3,72,36,0,397,399,
-        3,74,37,0,398,395,1,0,0,0,398,397,1,0,0,0,399,73,1,0,0,0,400,407,
-        3,76,38,0,401,407,3,78,39,0,402,403,5,11,0,0,403,404,3,54,27,0,404,
-        405,5,12,0,0,405,407,1,0,0,0,406,400,1,0,0,0,406,401,1,0,0,0,406,
-        402,1,0,0,0,407,75,1,0,0,0,408,414,5,56,0,0,409,414,3,86,43,0,410,
-        414,5,46,0,0,411,414,5,47,0,0,412,414,5,48,0,0,413,408,1,0,0,0,413,
-        409,1,0,0,0,413,410,1,0,0,0,413,411,1,0,0,0,413,412,1,0,0,0,414,
-        77,1,0,0,0,415,419,3,80,40,0,416,418,3,82,41,0,417,416,1,0,0,0,418,
-        421,1,0,0,0,419,417,1,0,0,0,419,420,1,0,0,0,420,79,1,0,0,0,421,419,
-        1,0,0,0,422,432,5,59,0,0,423,424,5,49,0,0,424,425,5,59,0,0,425,427,
-        5,11,0,0,426,428,3,84,42,0,427,426,1,0,0,0,427,428,1,0,0,0,428,429,
-        1,0,0,0,429,432,5,12,0,0,430,432,5,50,0,0,431,422,1,0,0,0,431,423,
-        1,0,0,0,431,430,1,0,0,0,432,81,1,0,0,0,433,435,5,11,0,0,434,436,
-        3,84,42,0,435,434,1,0,0,0,435,436,1,0,0,0,436,437,1,0,0,0,437,445,
-        5,12,0,0,438,439,5,51,0,0,439,440,3,54,27,0,440,441,5,52,0,0,441,
-        445,1,0,0,0,442,443,5,9,0,0,443,445,5,59,0,0,444,433,1,0,0,0,444,
-        438,1,0,0,0,444,442,1,0,0,0,445,83,1,0,0,0,446,451,3,54,27,0,447,
-        448,5,29,0,0,448,450,3,54,27,0,449,447,1,0,0,0,450,453,1,0,0,0,451,
-        449,1,0,0,0,451,452,1,0,0,0,452,85,1,0,0,0,453,451,1,0,0,0,454,463,
-        5,51,0,0,455,460,3,54,27,0,456,457,5,29,0,0,457,459,3,54,27,0,458,
-        456,1,0,0,0,459,462,1,0,0,0,460,458,1,0,0,0,460,461,1,0,0,0,461,
-        464,1,0,0,0,462,460,1,0,0,0,463,455,1,0,0,0,463,464,1,0,0,0,464,
-        465,1,0,0,0,465,466,5,52,0,0,466,87,1,0,0,0,467,472,3,90,45,0,468,
-        469,5,51,0,0,469,471,5,52,0,0,470,468,1,0,0,0,471,474,1,0,0,0,472,
-        470,1,0,0,0,472,473,1,0,0,0,473,89,1,0,0,0,474,472,1,0,0,0,475,476,
-        7,6,0,0,476,91,1,0,0,0,43,95,118,124,132,135,142,166,184,216,233,
-        236,240,253,257,267,275,282,287,296,302,308,314,322,337,345,352,
-        360,368,376,384,392,398,406,413,419,427,431,435,444,451,460,463,
-        472
+        1,0,5,0,82,8,0,10,0,12,0,85,9,0,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,
+        1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,107,8,1,1,2,
+        1,2,5,2,111,8,2,10,2,12,2,114,9,2,1,2,1,2,1,3,1,3,1,3,3,3,121,8,
+        3,1,3,3,3,124,8,3,1,3,1,3,1,4,1,4,1,4,3,4,131,8,4,1,4,1,4,1,4,1,
+        4,1,5,1,5,1,5,1,6,1,6,1,6,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,
+        7,1,7,1,7,3,7,155,8,7,1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,9,1,9,1,10,1,
+        10,1,10,1,10,1,10,1,10,1,10,3,10,173,8,10,1,11,1,11,1,11,1,11,1,
+        11,1,11,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,13,1,13,1,13,1,
+        13,1,13,1,13,1,13,1,13,1,14,1,14,1,14,1,15,1,15,1,15,1,16,1,16,3,
+        16,205,8,16,1,16,1,16,1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,
+        18,1,18,1,18,1,18,1,18,3,18,222,8,18,1,18,3,18,225,8,18,1,18,1,18,
+        3,18,229,8,18,1,18,1,18,1,18,1,19,1,19,1,19,1,19,1,19,1,19,5,19,
+        240,8,19,10,19,12,19,243,9,19,1,19,3,19,246,8,19,1,19,1,19,1,20,
+        1,20,1,20,1,20,5,20,254,8,20,10,20,12,20,257,9,20,1,21,1,21,1,21,
+        5,21,262,8,21,10,21,12,21,265,9,21,1,22,1,22,1,22,1,22,3,22,271,
+        8,22,1,22,1,22,1,22,3,22,276,8,22,1,22,1,22,1,23,1,23,1,23,5,23,
+        283,8,23,10,23,12,23,286,9,23,1,24,1,24,1,24,3,24,291,8,24,1,25,
+        1,25,1,25,1,25,3,25,297,8,25,1,25,1,25,5,25,301,8,25,10,25,12,25,
+        304,9,25,1,25,1,25,1,26,1,26,1,26,3,26,311,8,26,1,27,1,27,1,28,1,
+        28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,3,28,326,8,28,1,
+        29,1,29,1,29,1,29,1,29,1,29,3,29,334,8,29,1,30,1,30,1,30,1,30,3,
+        30,340,8,30,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,
+        30,1,30,1,30,1,30,1,30,1,30,1,30,1,30,5,30,360,8,30,10,30,12,30,
+        363,9,30,1,31,1,31,1,31,1,31,1,31,1,31,3,31,371,8,31,1,32,1,32,1,
+        32,1,32,1,32,3,32,378,8,32,1,33,1,33,5,33,382,8,33,10,33,12,33,385,
+        9,33,1,34,1,34,1,34,1,34,1,34,3,34,392,8,34,1,34,1,34,3,34,396,8,
+        34,1,35,1,35,3,35,400,8,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,3,
+        35,409,8,35,1,36,1,36,1,36,5,36,414,8,36,10,36,12,36,417,9,36,1,
+        37,1,37,1,37,1,37,5,37,423,8,37,10,37,12,37,426,9,37,3,37,428,8,
+        37,1,37,1,37,1,38,1,38,1,38,5,38,435,8,38,10,38,12,38,438,9,38,1,
+        39,1,39,1,39,0,1,60,40,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,
+        32,34,36,38,40,42,44,46,48,50,52,54,56,58,60,62,64,66,68,70,72,74,
+        76,78,0,7,1,0,3,4,1,0,32,33,1,0,34,36,2,0,32,32,37,37,1,0,38,41,
+        1,0,42,43,2,0,53,55,59,59,469,0,83,1,0,0,0,2,106,1,0,0,0,4,108,1,
+        0,0,0,6,117,1,0,0,0,8,127,1,0,0,0,10,136,1,0,0,0,12,139,1,0,0,0,
+        14,154,1,0,0,0,16,156,1,0,0,0,18,159,1,0,0,0,20,165,1,0,0,0,22,174,
+        1,0,0,0,24,180,1,0,0,0,26,188,1,0,0,0,28,196,1,0,0,0,30,199,1,0,
+        0,0,32,202,1,0,0,0,34,208,1,0,0,0,36,216,1,0,0,0,38,233,1,0,0,0,
+        40,249,1,0,0,0,42,258,1,0,0,0,44,266,1,0,0,0,46,279,1,0,0,0,48,287,
+        1,0,0,0,50,292,1,0,0,0,52,310,1,0,0,0,54,312,1,0,0,0,56,325,1,0,
+        0,0,58,327,1,0,0,0,60,339,1,0,0,0,62,370,1,0,0,0,64,377,1,0,0,0,
+        66,379,1,0,0,0,68,395,1,0,0,0,70,408,1,0,0,0,72,410,1,0,0,0,74,418,
+        1,0,0,0,76,431,1,0,0,0,78,439,1,0,0,0,80,82,3,2,1,0,81,80,1,0,0,
+        0,82,85,1,0,0,0,83,81,1,0,0,0,83,84,1,0,0,0,84,86,1,0,0,0,85,83,
+        1,0,0,0,86,87,5,0,0,1,87,1,1,0,0,0,88,107,3,6,3,0,89,107,3,8,4,0,
+        90,107,3,14,7,0,91,107,3,44,22,0,92,107,3,50,25,0,93,107,3,16,8,
+        0,94,107,3,18,9,0,95,107,3,4,2,0,96,107,3,20,10,0,97,107,3,22,11,
+        0,98,107,3,24,12,0,99,107,3,36,18,0,100,107,3,26,13,0,101,107,3,
+        34,17,0,102,107,3,38,19,0,103,107,3,28,14,0,104,107,3,30,15,0,105,
+        107,3,32,16,0,106,88,1,0,0,0,106,89,1,0,0,0,106,90,1,0,0,0,106,91,
+        1,0,0,0,106,92,1,0,0,0,106,93,1,0,0,0,106,94,1,0,0,0,106,95,1,0,
+        0,0,106,96,1,0,0,0,106,97,1,0,0,0,106,98,1,0,0,0,106,99,1,0,0,0,
+        106,100,1,0,0,0,106,101,1,0,0,0,106,102,1,0,0,0,106,103,1,0,0,0,
+        106,104,1,0,0,0,106,105,1,0,0,0,107,3,1,0,0,0,108,112,5,1,0,0,109,
+        111,3,2,1,0,110,109,1,0,0,0,111,114,1,0,0,0,112,110,1,0,0,0,112,
+        113,1,0,0,0,113,115,1,0,0,0,114,112,1,0,0,0,115,116,5,2,0,0,116,
+        5,1,0,0,0,117,118,7,0,0,0,118,120,5,59,0,0,119,121,3,10,5,0,120,
+        119,1,0,0,0,120,121,1,0,0,0,121,123,1,0,0,0,122,124,3,12,6,0,123,
+        122,1,0,0,0,123,124,1,0,0,0,124,125,1,0,0,0,125,126,5,5,0,0,126,
+        7,1,0,0,0,127,128,5,6,0,0,128,130,5,59,0,0,129,131,3,10,5,0,130,
+        129,1,0,0,0,130,131,1,0,0,0,131,132,1,0,0,0,132,133,5,7,0,0,133,
+        134,3,54,27,0,134,135,5,5,0,0,135,9,1,0,0,0,136,137,5,8,0,0,137,
+        138,3,76,38,0,138,11,1,0,0,0,139,140,5,7,0,0,140,141,3,54,27,0,141,
+        13,1,0,0,0,142,143,5,59,0,0,143,144,5,7,0,0,144,145,3,54,27,0,145,
+        146,5,5,0,0,146,155,1,0,0,0,147,148,3,54,27,0,148,149,5,9,0,0,149,
+        150,5,59,0,0,150,151,5,7,0,0,151,152,3,54,27,0,152,153,5,5,0,0,153,
+        155,1,0,0,0,154,142,1,0,0,0,154,147,1,0,0,0,155,15,1,0,0,0,156,157,
+        3,54,27,0,157,158,5,5,0,0,158,17,1,0,0,0,159,160,5,10,0,0,160,161,
+        5,11,0,0,161,162,3,54,27,0,162,163,5,12,0,0,163,164,5,5,0,0,164,
+        19,1,0,0,0,165,166,5,13,0,0,166,167,5,11,0,0,167,168,3,54,27,0,168,
+        169,5,12,0,0,169,172,3,4,2,0,170,171,5,14,0,0,171,173,3,4,2,0,172,
+        170,1,0,0,0,172,173,1,0,0,0,173,21,1,0,0,0,174,175,5,15,0,0,175,
+        176,5,11,0,0,176,177,3,54,27,0,177,178,5,12,0,0,178,179,3,4,2,0,
+        179,23,1,0,0,0,180,181,5,16,0,0,181,182,3,4,2,0,182,183,5,15,0,0,
+        183,184,5,11,0,0,184,185,3,54,27,0,185,186,5,12,0,0,186,187,5,5,
+        0,0,187,25,1,0,0,0,188,189,5,17,0,0,189,190,5,11,0,0,190,191,5,59,
+        0,0,191,192,5,18,0,0,192,193,3,54,27,0,193,194,5,12,0,0,194,195,
+        3,4,2,0,195,27,1,0,0,0,196,197,5,19,0,0,197,198,5,5,0,0,198,29,1,
+        0,0,0,199,200,5,20,0,0,200,201,5,5,0,0,201,31,1,0,0,0,202,204,5,
+        21,0,0,203,205,3,54,27,0,204,203,1,0,0,0,204,205,1,0,0,0,205,206,
+        1,0,0,0,206,207,5,5,0,0,207,33,1,0,0,0,208,209,5,22,0,0,209,210,
+        3,4,2,0,210,211,5,23,0,0,211,212,5,11,0,0,212,213,5,59,0,0,213,214,
+        5,12,0,0,214,215,3,4,2,0,215,35,1,0,0,0,216,217,5,24,0,0,217,221,
+        5,11,0,0,218,222,3,6,3,0,219,222,3,14,7,0,220,222,5,5,0,0,221,218,
+        1,0,0,0,221,219,1,0,0,0,221,220,1,0,0,0,222,224,1,0,0,0,223,225,
+        3,54,27,0,224,223,1,0,0,0,224,225,1,0,0,0,225,226,1,0,0,0,226,228,
+        5,5,0,0,227,229,3,54,27,0,228,227,1,0,0,0,228,229,1,0,0,0,229,230,
+        1,0,0,0,230,231,5,12,0,0,231,232,3,4,2,0,232,37,1,0,0,0,233,234,
+        5,25,0,0,234,235,5,11,0,0,235,236,3,54,27,0,236,237,5,12,0,0,237,
+        241,5,1,0,0,238,240,3,40,20,0,239,238,1,0,0,0,240,243,1,0,0,0,241,
+        239,1,0,0,0,241,242,1,0,0,0,242,245,1,0,0,0,243,241,1,0,0,0,244,
+        246,3,42,21,0,245,244,1,0,0,0,245,246,1,0,0,0,246,247,1,0,0,0,247,
+        248,5,2,0,0,248,39,1,0,0,0,249,250,5,26,0,0,250,251,3,54,27,0,251,
+        255,5,8,0,0,252,254,3,2,1,0,253,252,1,0,0,0,254,257,1,0,0,0,255,
+        253,1,0,0,0,255,256,1,0,0,0,256,41,1,0,0,0,257,255,1,0,0,0,258,259,
+        5,27,0,0,259,263,5,8,0,0,260,262,3,2,1,0,261,260,1,0,0,0,262,265,
+        1,0,0,0,263,261,1,0,0,0,263,264,1,0,0,0,264,43,1,0,0,0,265,263,1,
+        0,0,0,266,267,5,28,0,0,267,268,5,59,0,0,268,270,5,11,0,0,269,271,
+        3,46,23,0,270,269,1,0,0,0,270,271,1,0,0,0,271,272,1,0,0,0,272,275,
+        5,12,0,0,273,274,5,8,0,0,274,276,3,76,38,0,275,273,1,0,0,0,275,276,
+        1,0,0,0,276,277,1,0,0,0,277,278,3,4,2,0,278,45,1,0,0,0,279,284,3,
+        48,24,0,280,281,5,29,0,0,281,283,3,48,24,0,282,280,1,0,0,0,283,286,
+        1,0,0,0,284,282,1,0,0,0,284,285,1,0,0,0,285,47,1,0,0,0,286,284,1,
+        0,0,0,287,290,5,59,0,0,288,289,5,8,0,0,289,291,3,76,38,0,290,288,
+        1,0,0,0,290,291,1,0,0,0,291,49,1,0,0,0,292,293,5,30,0,0,293,296,
+        5,59,0,0,294,295,5,8,0,0,295,297,5,59,0,0,296,294,1,0,0,0,296,297,
+        1,0,0,0,297,298,1,0,0,0,298,302,5,1,0,0,299,301,3,52,26,0,300,299,
+        1,0,0,0,301,304,1,0,0,0,302,300,1,0,0,0,302,303,1,0,0,0,303,305,
+        1,0,0,0,304,302,1,0,0,0,305,306,5,2,0,0,306,51,1,0,0,0,307,311,3,
+        44,22,0,308,311,3,6,3,0,309,311,3,8,4,0,310,307,1,0,0,0,310,308,
+        1,0,0,0,310,309,1,0,0,0,311,53,1,0,0,0,312,313,3,56,28,0,313,55,
+        1,0,0,0,314,315,3,66,33,0,315,316,5,7,0,0,316,317,3,56,28,0,317,
+        326,1,0,0,0,318,319,3,66,33,0,319,320,5,9,0,0,320,321,5,59,0,0,321,
+        322,5,7,0,0,322,323,3,56,28,0,323,326,1,0,0,0,324,326,3,58,29,0,
+        325,314,1,0,0,0,325,318,1,0,0,0,325,324,1,0,0,0,326,57,1,0,0,0,327,
+        333,3,60,30,0,328,329,5,31,0,0,329,330,3,54,27,0,330,331,5,8,0,0,
+        331,332,3,54,27,0,332,334,1,0,0,0,333,328,1,0,0,0,333,334,1,0,0,
+        0,334,59,1,0,0,0,335,336,6,30,-1,0,336,337,7,1,0,0,337,340,3,60,
+        30,8,338,340,3,62,31,0,339,335,1,0,0,0,339,338,1,0,0,0,340,361,1,
+        0,0,0,341,342,10,6,0,0,342,343,7,2,0,0,343,360,3,60,30,7,344,345,
+        10,5,0,0,345,346,7,3,0,0,346,360,3,60,30,6,347,348,10,4,0,0,348,
+        349,7,4,0,0,349,360,3,60,30,5,350,351,10,3,0,0,351,352,7,5,0,0,352,
+        360,3,60,30,4,353,354,10,2,0,0,354,355,5,44,0,0,355,360,3,60,30,
+        3,356,357,10,1,0,0,357,358,5,45,0,0,358,360,3,60,30,2,359,341,1,
+        0,0,0,359,344,1,0,0,0,359,347,1,0,0,0,359,350,1,0,0,0,359,353,1,
+        0,0,0,359,356,1,0,0,0,360,363,1,0,0,0,361,359,1,0,0,0,361,362,1,
+        0,0,0,362,61,1,0,0,0,363,361,1,0,0,0,364,371,3,64,32,0,365,371,3,
+        66,33,0,366,367,5,11,0,0,367,368,3,54,27,0,368,369,5,12,0,0,369,
+        371,1,0,0,0,370,364,1,0,0,0,370,365,1,0,0,0,370,366,1,0,0,0,371,
+        63,1,0,0,0,372,378,5,56,0,0,373,378,3,74,37,0,374,378,5,46,0,0,375,
+        378,5,47,0,0,376,378,5,48,0,0,377,372,1,0,0,0,377,373,1,0,0,0,377,
+        374,1,0,0,0,377,375,1,0,0,0,377,376,1,0,0,0,378,65,1,0,0,0,379,383,
+        3,68,34,0,380,382,3,70,35,0,381,380,1,0,0,0,382,385,1,0,0,0,383,
+        381,1,0,0,0,383,384,1,0,0,0,384,67,1,0,0,0,385,383,1,0,0,0,386,396,
+        5,59,0,0,387,388,5,49,0,0,388,389,5,59,0,0,389,391,5,11,0,0,390,
+        392,3,72,36,0,391,390,1,0,0,0,391,392,1,0,0,0,392,393,1,0,0,0,393,
+        396,5,12,0,0,394,396,5,50,0,0,395,386,1,0,0,0,395,387,1,0,0,0,395,
+        394,1,0,0,0,396,69,1,0,0,0,397,399,5,11,0,0,398,400,3,72,36,0,399,
+        398,1,0,0,0,399,400,1,0,0,0,400,401,1,0,0,0,401,409,5,12,0,0,402,
+        403,5,51,0,0,403,404,3,54,27,0,404,405,5,52,0,0,405,409,1,0,0,0,
+        406,407,5,9,0,0,407,409,5,59,0,0,408,397,1,0,0,0,408,402,1,0,0,0,
+        408,406,1,0,0,0,409,71,1,0,0,0,410,415,3,54,27,0,411,412,5,29,0,
+        0,412,414,3,54,27,0,413,411,1,0,0,0,414,417,1,0,0,0,415,413,1,0,
+        0,0,415,416,1,0,0,0,416,73,1,0,0,0,417,415,1,0,0,0,418,427,5,51,
+        0,0,419,424,3,54,27,0,420,421,5,29,0,0,421,423,3,54,27,0,422,420,
+        1,0,0,0,423,426,1,0,0,0,424,422,1,0,0,0,424,425,1,0,0,0,425,428,
+        1,0,0,0,426,424,1,0,0,0,427,419,1,0,0,0,427,428,1,0,0,0,428,429,
+        1,0,0,0,429,430,5,52,0,0,430,75,1,0,0,0,431,436,3,78,39,0,432,433,
+        5,51,0,0,433,435,5,52,0,0,434,432,1,0,0,0,435,438,1,0,0,0,436,434,
+        1,0,0,0,436,437,1,0,0,0,437,77,1,0,0,0,438,436,1,0,0,0,439,440,7,
+        6,0,0,440,79,1,0,0,0,39,83,106,112,120,123,130,154,172,204,221,224,
+        228,241,245,255,263,270,275,284,290,296,302,310,325,333,339,359,
+        361,370,377,383,391,395,399,408,415,424,427,436
     ]
 
 class CompiscriptParser ( Parser ):
@@ -198,9 +186,9 @@ class CompiscriptParser ( Parser ):
                      "'if'", "'else'", "'while'", "'do'", "'foreach'", "'in'", 
                      "'break'", "'continue'", "'return'", "'try'", "'catch'", 
                      "'for'", "'switch'", "'case'", "'default'", "'function'", 
-                     "','", "'class'", "'?'", "'||'", "'&&'", "'=='", "'!='", 
-                     "'<'", "'<='", "'>'", "'>='", "'+'", "'-'", "'*'", 
-                     "'/'", "'%'", "'!'", "'null'", "'true'", "'false'", 
+                     "','", "'class'", "'?'", "'-'", "'!'", "'*'", "'/'", 
+                     "'%'", "'+'", "'<'", "'<='", "'>'", "'>='", "'=='", 
+                     "'!='", "'&&'", "'||'", "'null'", "'true'", "'false'", 
                      "'new'", "'this'", "'['", "']'", "'boolean'", "'integer'", 
                      "'string'" ]
 
@@ -251,22 +239,16 @@ class CompiscriptParser ( Parser ):
     RULE_expression = 27
     RULE_assignmentExpr = 28
     RULE_conditionalExpr = 29
-    RULE_logicalOrExpr = 30
-    RULE_logicalAndExpr = 31
-    RULE_equalityExpr = 32
-    RULE_relationalExpr = 33
-    RULE_additiveExpr = 34
-    RULE_multiplicativeExpr = 35
-    RULE_unaryExpr = 36
-    RULE_primaryExpr = 37
-    RULE_literalExpr = 38
-    RULE_leftHandSide = 39
-    RULE_primaryAtom = 40
-    RULE_suffixOp = 41
-    RULE_arguments = 42
-    RULE_arrayLiteral = 43
-    RULE_type = 44
-    RULE_baseType = 45
+    RULE_operatorExpr = 30
+    RULE_primaryExpr = 31
+    RULE_literalExpr = 32
+    RULE_leftHandSide = 33
+    RULE_primaryAtom = 34
+    RULE_suffixOp = 35
+    RULE_arguments = 36
+    RULE_arrayLiteral = 37
+    RULE_type = 38
+    RULE_baseType = 39
 
     ruleNames =  [ "program", "statement", "block", "variableDeclaration", 
                    "constantDeclaration", "typeAnnotation", "initializer", 
@@ -276,11 +258,9 @@ class CompiscriptParser ( Parser ):
                    "returnStatement", "tryCatchStatement", "forStatement", 
                    "switchStatement", "switchCase", "defaultCase", "functionDeclaration", 
                    "parameters", "parameter", "classDeclaration", "classMember", 
-                   "expression", "assignmentExpr", "conditionalExpr", "logicalOrExpr", 
-                   "logicalAndExpr", "equalityExpr", "relationalExpr", "additiveExpr", 
-                   "multiplicativeExpr", "unaryExpr", "primaryExpr", "literalExpr", 
-                   "leftHandSide", "primaryAtom", "suffixOp", "arguments", 
-                   "arrayLiteral", "type", "baseType" ]
+                   "expression", "assignmentExpr", "conditionalExpr", "operatorExpr", 
+                   "primaryExpr", "literalExpr", "leftHandSide", "primaryAtom", 
+                   "suffixOp", "arguments", "arrayLiteral", "type", "baseType" ]
 
     EOF = Token.EOF
     T__0=1
@@ -399,17 +379,17 @@ class CompiscriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 95
+            self.state = 83
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 652988962020502618) != 0):
-                self.state = 92
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 652951591510060122) != 0):
+                self.state = 80
                 self.statement()
-                self.state = 97
+                self.state = 85
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 98
+            self.state = 86
             self.match(CompiscriptParser.EOF)
         except RecognitionException as re:
             localctx.exception = re
@@ -524,114 +504,114 @@ class CompiscriptParser ( Parser ):
         localctx = CompiscriptParser.StatementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 2, self.RULE_statement)
         try:
-            self.state = 118
+            self.state = 106
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,1,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 100
+                self.state = 88
                 self.variableDeclaration()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 101
+                self.state = 89
                 self.constantDeclaration()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 102
+                self.state = 90
                 self.assignment()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 103
+                self.state = 91
                 self.functionDeclaration()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 104
+                self.state = 92
                 self.classDeclaration()
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 105
+                self.state = 93
                 self.expressionStatement()
                 pass
 
             elif la_ == 7:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 106
+                self.state = 94
                 self.printStatement()
                 pass
 
             elif la_ == 8:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 107
+                self.state = 95
                 self.block()
                 pass
 
             elif la_ == 9:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 108
+                self.state = 96
                 self.ifStatement()
                 pass
 
             elif la_ == 10:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 109
+                self.state = 97
                 self.whileStatement()
                 pass
 
             elif la_ == 11:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 110
+                self.state = 98
                 self.doWhileStatement()
                 pass
 
             elif la_ == 12:
                 self.enterOuterAlt(localctx, 12)
-                self.state = 111
+                self.state = 99
                 self.forStatement()
                 pass
 
             elif la_ == 13:
                 self.enterOuterAlt(localctx, 13)
-                self.state = 112
+                self.state = 100
                 self.foreachStatement()
                 pass
 
             elif la_ == 14:
                 self.enterOuterAlt(localctx, 14)
-                self.state = 113
+                self.state = 101
                 self.tryCatchStatement()
                 pass
 
             elif la_ == 15:
                 self.enterOuterAlt(localctx, 15)
-                self.state = 114
+                self.state = 102
                 self.switchStatement()
                 pass
 
             elif la_ == 16:
                 self.enterOuterAlt(localctx, 16)
-                self.state = 115
+                self.state = 103
                 self.breakStatement()
                 pass
 
             elif la_ == 17:
                 self.enterOuterAlt(localctx, 17)
-                self.state = 116
+                self.state = 104
                 self.continueStatement()
                 pass
 
             elif la_ == 18:
                 self.enterOuterAlt(localctx, 18)
-                self.state = 117
+                self.state = 105
                 self.returnStatement()
                 pass
 
@@ -686,19 +666,19 @@ class CompiscriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 120
+            self.state = 108
             self.match(CompiscriptParser.T__0)
-            self.state = 124
+            self.state = 112
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 652988962020502618) != 0):
-                self.state = 121
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 652951591510060122) != 0):
+                self.state = 109
                 self.statement()
-                self.state = 126
+                self.state = 114
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 127
+            self.state = 115
             self.match(CompiscriptParser.T__1)
         except RecognitionException as re:
             localctx.exception = re
@@ -754,32 +734,32 @@ class CompiscriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 129
+            self.state = 117
             _la = self._input.LA(1)
             if not(_la==3 or _la==4):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 130
+            self.state = 118
             self.match(CompiscriptParser.Identifier)
-            self.state = 132
+            self.state = 120
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==8:
-                self.state = 131
+                self.state = 119
                 self.typeAnnotation()
 
 
-            self.state = 135
+            self.state = 123
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==7:
-                self.state = 134
+                self.state = 122
                 self.initializer()
 
 
-            self.state = 137
+            self.state = 125
             self.match(CompiscriptParser.T__4)
         except RecognitionException as re:
             localctx.exception = re
@@ -835,23 +815,23 @@ class CompiscriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 139
+            self.state = 127
             self.match(CompiscriptParser.T__5)
-            self.state = 140
+            self.state = 128
             self.match(CompiscriptParser.Identifier)
-            self.state = 142
+            self.state = 130
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==8:
-                self.state = 141
+                self.state = 129
                 self.typeAnnotation()
 
 
-            self.state = 144
+            self.state = 132
             self.match(CompiscriptParser.T__6)
-            self.state = 145
+            self.state = 133
             self.expression()
-            self.state = 146
+            self.state = 134
             self.match(CompiscriptParser.T__4)
         except RecognitionException as re:
             localctx.exception = re
@@ -899,9 +879,9 @@ class CompiscriptParser ( Parser ):
         self.enterRule(localctx, 10, self.RULE_typeAnnotation)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 148
+            self.state = 136
             self.match(CompiscriptParser.T__7)
-            self.state = 149
+            self.state = 137
             self.type_()
         except RecognitionException as re:
             localctx.exception = re
@@ -949,9 +929,9 @@ class CompiscriptParser ( Parser ):
         self.enterRule(localctx, 12, self.RULE_initializer)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 151
+            self.state = 139
             self.match(CompiscriptParser.T__6)
-            self.state = 152
+            self.state = 140
             self.expression()
         except RecognitionException as re:
             localctx.exception = re
@@ -1004,34 +984,34 @@ class CompiscriptParser ( Parser ):
         localctx = CompiscriptParser.AssignmentContext(self, self._ctx, self.state)
         self.enterRule(localctx, 14, self.RULE_assignment)
         try:
-            self.state = 166
+            self.state = 154
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,6,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 154
+                self.state = 142
                 self.match(CompiscriptParser.Identifier)
-                self.state = 155
+                self.state = 143
                 self.match(CompiscriptParser.T__6)
-                self.state = 156
+                self.state = 144
                 self.expression()
-                self.state = 157
+                self.state = 145
                 self.match(CompiscriptParser.T__4)
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 159
+                self.state = 147
                 self.expression()
-                self.state = 160
+                self.state = 148
                 self.match(CompiscriptParser.T__8)
-                self.state = 161
+                self.state = 149
                 self.match(CompiscriptParser.Identifier)
-                self.state = 162
+                self.state = 150
                 self.match(CompiscriptParser.T__6)
-                self.state = 163
+                self.state = 151
                 self.expression()
-                self.state = 164
+                self.state = 152
                 self.match(CompiscriptParser.T__4)
                 pass
 
@@ -1082,9 +1062,9 @@ class CompiscriptParser ( Parser ):
         self.enterRule(localctx, 16, self.RULE_expressionStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 168
+            self.state = 156
             self.expression()
-            self.state = 169
+            self.state = 157
             self.match(CompiscriptParser.T__4)
         except RecognitionException as re:
             localctx.exception = re
@@ -1132,15 +1112,15 @@ class CompiscriptParser ( Parser ):
         self.enterRule(localctx, 18, self.RULE_printStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 171
+            self.state = 159
             self.match(CompiscriptParser.T__9)
-            self.state = 172
+            self.state = 160
             self.match(CompiscriptParser.T__10)
-            self.state = 173
+            self.state = 161
             self.expression()
-            self.state = 174
+            self.state = 162
             self.match(CompiscriptParser.T__11)
-            self.state = 175
+            self.state = 163
             self.match(CompiscriptParser.T__4)
         except RecognitionException as re:
             localctx.exception = re
@@ -1196,23 +1176,23 @@ class CompiscriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 177
+            self.state = 165
             self.match(CompiscriptParser.T__12)
-            self.state = 178
+            self.state = 166
             self.match(CompiscriptParser.T__10)
-            self.state = 179
+            self.state = 167
             self.expression()
-            self.state = 180
+            self.state = 168
             self.match(CompiscriptParser.T__11)
-            self.state = 181
+            self.state = 169
             self.block()
-            self.state = 184
+            self.state = 172
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==14:
-                self.state = 182
+                self.state = 170
                 self.match(CompiscriptParser.T__13)
-                self.state = 183
+                self.state = 171
                 self.block()
 
 
@@ -1266,15 +1246,15 @@ class CompiscriptParser ( Parser ):
         self.enterRule(localctx, 22, self.RULE_whileStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 186
+            self.state = 174
             self.match(CompiscriptParser.T__14)
-            self.state = 187
+            self.state = 175
             self.match(CompiscriptParser.T__10)
-            self.state = 188
+            self.state = 176
             self.expression()
-            self.state = 189
+            self.state = 177
             self.match(CompiscriptParser.T__11)
-            self.state = 190
+            self.state = 178
             self.block()
         except RecognitionException as re:
             localctx.exception = re
@@ -1326,19 +1306,19 @@ class CompiscriptParser ( Parser ):
         self.enterRule(localctx, 24, self.RULE_doWhileStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 192
+            self.state = 180
             self.match(CompiscriptParser.T__15)
-            self.state = 193
+            self.state = 181
             self.block()
-            self.state = 194
+            self.state = 182
             self.match(CompiscriptParser.T__14)
-            self.state = 195
+            self.state = 183
             self.match(CompiscriptParser.T__10)
-            self.state = 196
+            self.state = 184
             self.expression()
-            self.state = 197
+            self.state = 185
             self.match(CompiscriptParser.T__11)
-            self.state = 198
+            self.state = 186
             self.match(CompiscriptParser.T__4)
         except RecognitionException as re:
             localctx.exception = re
@@ -1393,19 +1373,19 @@ class CompiscriptParser ( Parser ):
         self.enterRule(localctx, 26, self.RULE_foreachStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 200
+            self.state = 188
             self.match(CompiscriptParser.T__16)
-            self.state = 201
+            self.state = 189
             self.match(CompiscriptParser.T__10)
-            self.state = 202
+            self.state = 190
             self.match(CompiscriptParser.Identifier)
-            self.state = 203
+            self.state = 191
             self.match(CompiscriptParser.T__17)
-            self.state = 204
+            self.state = 192
             self.expression()
-            self.state = 205
+            self.state = 193
             self.match(CompiscriptParser.T__11)
-            self.state = 206
+            self.state = 194
             self.block()
         except RecognitionException as re:
             localctx.exception = re
@@ -1450,9 +1430,9 @@ class CompiscriptParser ( Parser ):
         self.enterRule(localctx, 28, self.RULE_breakStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 208
+            self.state = 196
             self.match(CompiscriptParser.T__18)
-            self.state = 209
+            self.state = 197
             self.match(CompiscriptParser.T__4)
         except RecognitionException as re:
             localctx.exception = re
@@ -1497,9 +1477,9 @@ class CompiscriptParser ( Parser ):
         self.enterRule(localctx, 30, self.RULE_continueStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 211
+            self.state = 199
             self.match(CompiscriptParser.T__19)
-            self.state = 212
+            self.state = 200
             self.match(CompiscriptParser.T__4)
         except RecognitionException as re:
             localctx.exception = re
@@ -1548,17 +1528,17 @@ class CompiscriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 214
+            self.state = 202
             self.match(CompiscriptParser.T__20)
-            self.state = 216
+            self.state = 204
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 652988960619890688) != 0):
-                self.state = 215
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 652951590109448192) != 0):
+                self.state = 203
                 self.expression()
 
 
-            self.state = 218
+            self.state = 206
             self.match(CompiscriptParser.T__4)
         except RecognitionException as re:
             localctx.exception = re
@@ -1612,19 +1592,19 @@ class CompiscriptParser ( Parser ):
         self.enterRule(localctx, 34, self.RULE_tryCatchStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 220
+            self.state = 208
             self.match(CompiscriptParser.T__21)
-            self.state = 221
+            self.state = 209
             self.block()
-            self.state = 222
+            self.state = 210
             self.match(CompiscriptParser.T__22)
-            self.state = 223
+            self.state = 211
             self.match(CompiscriptParser.T__10)
-            self.state = 224
+            self.state = 212
             self.match(CompiscriptParser.Identifier)
-            self.state = 225
+            self.state = 213
             self.match(CompiscriptParser.T__11)
-            self.state = 226
+            self.state = 214
             self.block()
         except RecognitionException as re:
             localctx.exception = re
@@ -1688,49 +1668,49 @@ class CompiscriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 228
+            self.state = 216
             self.match(CompiscriptParser.T__23)
-            self.state = 229
+            self.state = 217
             self.match(CompiscriptParser.T__10)
-            self.state = 233
+            self.state = 221
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [3, 4]:
-                self.state = 230
+                self.state = 218
                 self.variableDeclaration()
                 pass
-            elif token in [11, 41, 45, 46, 47, 48, 49, 50, 51, 56, 59]:
-                self.state = 231
+            elif token in [11, 32, 33, 46, 47, 48, 49, 50, 51, 56, 59]:
+                self.state = 219
                 self.assignment()
                 pass
             elif token in [5]:
-                self.state = 232
+                self.state = 220
                 self.match(CompiscriptParser.T__4)
                 pass
             else:
                 raise NoViableAltException(self)
 
-            self.state = 236
+            self.state = 224
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 652988960619890688) != 0):
-                self.state = 235
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 652951590109448192) != 0):
+                self.state = 223
                 self.expression()
 
 
-            self.state = 238
+            self.state = 226
             self.match(CompiscriptParser.T__4)
-            self.state = 240
+            self.state = 228
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 652988960619890688) != 0):
-                self.state = 239
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 652951590109448192) != 0):
+                self.state = 227
                 self.expression()
 
 
-            self.state = 242
+            self.state = 230
             self.match(CompiscriptParser.T__11)
-            self.state = 243
+            self.state = 231
             self.block()
         except RecognitionException as re:
             localctx.exception = re
@@ -1790,35 +1770,35 @@ class CompiscriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 245
+            self.state = 233
             self.match(CompiscriptParser.T__24)
-            self.state = 246
+            self.state = 234
             self.match(CompiscriptParser.T__10)
-            self.state = 247
+            self.state = 235
             self.expression()
-            self.state = 248
+            self.state = 236
             self.match(CompiscriptParser.T__11)
-            self.state = 249
+            self.state = 237
             self.match(CompiscriptParser.T__0)
-            self.state = 253
+            self.state = 241
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==26:
-                self.state = 250
+                self.state = 238
                 self.switchCase()
-                self.state = 255
+                self.state = 243
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 257
+            self.state = 245
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==27:
-                self.state = 256
+                self.state = 244
                 self.defaultCase()
 
 
-            self.state = 259
+            self.state = 247
             self.match(CompiscriptParser.T__1)
         except RecognitionException as re:
             localctx.exception = re
@@ -1874,19 +1854,19 @@ class CompiscriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 261
+            self.state = 249
             self.match(CompiscriptParser.T__25)
-            self.state = 262
+            self.state = 250
             self.expression()
-            self.state = 263
+            self.state = 251
             self.match(CompiscriptParser.T__7)
-            self.state = 267
+            self.state = 255
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 652988962020502618) != 0):
-                self.state = 264
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 652951591510060122) != 0):
+                self.state = 252
                 self.statement()
-                self.state = 269
+                self.state = 257
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -1940,17 +1920,17 @@ class CompiscriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 270
+            self.state = 258
             self.match(CompiscriptParser.T__26)
-            self.state = 271
+            self.state = 259
             self.match(CompiscriptParser.T__7)
-            self.state = 275
+            self.state = 263
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 652988962020502618) != 0):
-                self.state = 272
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 652951591510060122) != 0):
+                self.state = 260
                 self.statement()
-                self.state = 277
+                self.state = 265
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -2012,33 +1992,33 @@ class CompiscriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 278
+            self.state = 266
             self.match(CompiscriptParser.T__27)
-            self.state = 279
+            self.state = 267
             self.match(CompiscriptParser.Identifier)
-            self.state = 280
+            self.state = 268
             self.match(CompiscriptParser.T__10)
-            self.state = 282
+            self.state = 270
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==59:
-                self.state = 281
+                self.state = 269
                 self.parameters()
 
 
-            self.state = 284
+            self.state = 272
             self.match(CompiscriptParser.T__11)
-            self.state = 287
+            self.state = 275
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==8:
-                self.state = 285
+                self.state = 273
                 self.match(CompiscriptParser.T__7)
-                self.state = 286
+                self.state = 274
                 self.type_()
 
 
-            self.state = 289
+            self.state = 277
             self.block()
         except RecognitionException as re:
             localctx.exception = re
@@ -2090,17 +2070,17 @@ class CompiscriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 291
+            self.state = 279
             self.parameter()
-            self.state = 296
+            self.state = 284
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==29:
-                self.state = 292
+                self.state = 280
                 self.match(CompiscriptParser.T__28)
-                self.state = 293
+                self.state = 281
                 self.parameter()
-                self.state = 298
+                self.state = 286
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -2154,15 +2134,15 @@ class CompiscriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 299
+            self.state = 287
             self.match(CompiscriptParser.Identifier)
-            self.state = 302
+            self.state = 290
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==8:
-                self.state = 300
+                self.state = 288
                 self.match(CompiscriptParser.T__7)
-                self.state = 301
+                self.state = 289
                 self.type_()
 
 
@@ -2222,33 +2202,33 @@ class CompiscriptParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 304
+            self.state = 292
             self.match(CompiscriptParser.T__29)
-            self.state = 305
+            self.state = 293
             self.match(CompiscriptParser.Identifier)
-            self.state = 308
+            self.state = 296
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==8:
-                self.state = 306
+                self.state = 294
                 self.match(CompiscriptParser.T__7)
-                self.state = 307
+                self.state = 295
                 self.match(CompiscriptParser.Identifier)
 
 
-            self.state = 310
+            self.state = 298
             self.match(CompiscriptParser.T__0)
-            self.state = 314
+            self.state = 302
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while (((_la) & ~0x3f) == 0 and ((1 << _la) & 268435544) != 0):
-                self.state = 311
+                self.state = 299
                 self.classMember()
-                self.state = 316
+                self.state = 304
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 317
+            self.state = 305
             self.match(CompiscriptParser.T__1)
         except RecognitionException as re:
             localctx.exception = re
@@ -2303,22 +2283,22 @@ class CompiscriptParser ( Parser ):
         localctx = CompiscriptParser.ClassMemberContext(self, self._ctx, self.state)
         self.enterRule(localctx, 52, self.RULE_classMember)
         try:
-            self.state = 322
+            self.state = 310
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [28]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 319
+                self.state = 307
                 self.functionDeclaration()
                 pass
             elif token in [3, 4]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 320
+                self.state = 308
                 self.variableDeclaration()
                 pass
             elif token in [6]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 321
+                self.state = 309
                 self.constantDeclaration()
                 pass
             else:
@@ -2370,7 +2350,7 @@ class CompiscriptParser ( Parser ):
         self.enterRule(localctx, 54, self.RULE_expression)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 324
+            self.state = 312
             self.assignmentExpr()
         except RecognitionException as re:
             localctx.exception = re
@@ -2489,39 +2469,39 @@ class CompiscriptParser ( Parser ):
         localctx = CompiscriptParser.AssignmentExprContext(self, self._ctx, self.state)
         self.enterRule(localctx, 56, self.RULE_assignmentExpr)
         try:
-            self.state = 337
+            self.state = 325
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,23,self._ctx)
             if la_ == 1:
                 localctx = CompiscriptParser.AssignExprContext(self, localctx)
                 self.enterOuterAlt(localctx, 1)
-                self.state = 326
+                self.state = 314
                 localctx.lhs = self.leftHandSide()
-                self.state = 327
+                self.state = 315
                 self.match(CompiscriptParser.T__6)
-                self.state = 328
+                self.state = 316
                 self.assignmentExpr()
                 pass
 
             elif la_ == 2:
                 localctx = CompiscriptParser.PropertyAssignExprContext(self, localctx)
                 self.enterOuterAlt(localctx, 2)
-                self.state = 330
+                self.state = 318
                 localctx.lhs = self.leftHandSide()
-                self.state = 331
+                self.state = 319
                 self.match(CompiscriptParser.T__8)
-                self.state = 332
+                self.state = 320
                 self.match(CompiscriptParser.Identifier)
-                self.state = 333
+                self.state = 321
                 self.match(CompiscriptParser.T__6)
-                self.state = 334
+                self.state = 322
                 self.assignmentExpr()
                 pass
 
             elif la_ == 3:
                 localctx = CompiscriptParser.ExprNoAssignContext(self, localctx)
                 self.enterOuterAlt(localctx, 3)
-                self.state = 336
+                self.state = 324
                 self.conditionalExpr()
                 pass
 
@@ -2558,8 +2538,8 @@ class CompiscriptParser ( Parser ):
             super().__init__(parser)
             self.copyFrom(ctx)
 
-        def logicalOrExpr(self):
-            return self.getTypedRuleContext(CompiscriptParser.LogicalOrExprContext,0)
+        def operatorExpr(self):
+            return self.getTypedRuleContext(CompiscriptParser.OperatorExprContext,0)
 
         def expression(self, i:int=None):
             if i is None:
@@ -2592,19 +2572,19 @@ class CompiscriptParser ( Parser ):
         try:
             localctx = CompiscriptParser.TernaryExprContext(self, localctx)
             self.enterOuterAlt(localctx, 1)
-            self.state = 339
-            self.logicalOrExpr()
-            self.state = 345
+            self.state = 327
+            self.operatorExpr(0)
+            self.state = 333
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==31:
-                self.state = 340
+                self.state = 328
                 self.match(CompiscriptParser.T__30)
-                self.state = 341
+                self.state = 329
                 self.expression()
-                self.state = 342
+                self.state = 330
                 self.match(CompiscriptParser.T__7)
-                self.state = 343
+                self.state = 331
                 self.expression()
 
 
@@ -2617,289 +2597,148 @@ class CompiscriptParser ( Parser ):
         return localctx
 
 
-    class LogicalOrExprContext(ParserRuleContext):
+    class OperatorExprContext(ParserRuleContext):
         __slots__ = 'parser'
 
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def logicalAndExpr(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(CompiscriptParser.LogicalAndExprContext)
-            else:
-                return self.getTypedRuleContext(CompiscriptParser.LogicalAndExprContext,i)
-
 
         def getRuleIndex(self):
-            return CompiscriptParser.RULE_logicalOrExpr
+            return CompiscriptParser.RULE_operatorExpr
 
-        def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterLogicalOrExpr" ):
-                listener.enterLogicalOrExpr(self)
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
 
-        def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitLogicalOrExpr" ):
-                listener.exitLogicalOrExpr(self)
 
-        def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitLogicalOrExpr" ):
-                return visitor.visitLogicalOrExpr(self)
-            else:
-                return visitor.visitChildren(self)
+    class OperandExprContext(OperatorExprContext):
 
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a CompiscriptParser.OperatorExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
 
+        def primaryExpr(self):
+            return self.getTypedRuleContext(CompiscriptParser.PrimaryExprContext,0)
 
 
-    def logicalOrExpr(self):
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterOperandExpr" ):
+                listener.enterOperandExpr(self)
 
-        localctx = CompiscriptParser.LogicalOrExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 60, self.RULE_logicalOrExpr)
-        self._la = 0 # Token type
-        try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 347
-            self.logicalAndExpr()
-            self.state = 352
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while _la==32:
-                self.state = 348
-                self.match(CompiscriptParser.T__31)
-                self.state = 349
-                self.logicalAndExpr()
-                self.state = 354
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitOperandExpr" ):
+                listener.exitOperandExpr(self)
 
-        except RecognitionException as re:
-            localctx.exception = re
-            self._errHandler.reportError(self, re)
-            self._errHandler.recover(self, re)
-        finally:
-            self.exitRule()
-        return localctx
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitOperandExpr" ):
+                return visitor.visitOperandExpr(self)
+            else:
+                return visitor.visitChildren(self)
 
 
-    class LogicalAndExprContext(ParserRuleContext):
-        __slots__ = 'parser'
+    class MultiplicativeExprContext(OperatorExprContext):
 
-        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
-            super().__init__(parent, invokingState)
-            self.parser = parser
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a CompiscriptParser.OperatorExprContext
+            super().__init__(parser)
+            self.op = None # Token
+            self.copyFrom(ctx)
 
-        def equalityExpr(self, i:int=None):
+        def operatorExpr(self, i:int=None):
             if i is None:
-                return self.getTypedRuleContexts(CompiscriptParser.EqualityExprContext)
+                return self.getTypedRuleContexts(CompiscriptParser.OperatorExprContext)
             else:
-                return self.getTypedRuleContext(CompiscriptParser.EqualityExprContext,i)
-
+                return self.getTypedRuleContext(CompiscriptParser.OperatorExprContext,i)
 
-        def getRuleIndex(self):
-            return CompiscriptParser.RULE_logicalAndExpr
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterLogicalAndExpr" ):
-                listener.enterLogicalAndExpr(self)
+            if hasattr( listener, "enterMultiplicativeExpr" ):
+                listener.enterMultiplicativeExpr(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitLogicalAndExpr" ):
-                listener.exitLogicalAndExpr(self)
+            if hasattr( listener, "exitMultiplicativeExpr" ):
+                listener.exitMultiplicativeExpr(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitLogicalAndExpr" ):
-                return visitor.visitLogicalAndExpr(self)
+            if hasattr( visitor, "visitMultiplicativeExpr" ):
+                return visitor.visitMultiplicativeExpr(self)
             else:
                 return visitor.visitChildren(self)
 
 
+    class LogicalOrExprContext(OperatorExprContext):
 
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a CompiscriptParser.OperatorExprContext
+            super().__init__(parser)
+            self.op = None # Token
+            self.copyFrom(ctx)
 
-    def logicalAndExpr(self):
-
-        localctx = CompiscriptParser.LogicalAndExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 62, self.RULE_logicalAndExpr)
-        self._la = 0 # Token type
-        try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 355
-            self.equalityExpr()
-            self.state = 360
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while _la==33:
-                self.state = 356
-                self.match(CompiscriptParser.T__32)
-                self.state = 357
-                self.equalityExpr()
-                self.state = 362
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-
-        except RecognitionException as re:
-            localctx.exception = re
-            self._errHandler.reportError(self, re)
-            self._errHandler.recover(self, re)
-        finally:
-            self.exitRule()
-        return localctx
-
-
-    class EqualityExprContext(ParserRuleContext):
-        __slots__ = 'parser'
-
-        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
-            super().__init__(parent, invokingState)
-            self.parser = parser
-
-        def relationalExpr(self, i:int=None):
+        def operatorExpr(self, i:int=None):
             if i is None:
-                return self.getTypedRuleContexts(CompiscriptParser.RelationalExprContext)
+                return self.getTypedRuleContexts(CompiscriptParser.OperatorExprContext)
             else:
-                return self.getTypedRuleContext(CompiscriptParser.RelationalExprContext,i)
-
+                return self.getTypedRuleContext(CompiscriptParser.OperatorExprContext,i)
 
-        def getRuleIndex(self):
-            return CompiscriptParser.RULE_equalityExpr
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterEqualityExpr" ):
-                listener.enterEqualityExpr(self)
+            if hasattr( listener, "enterLogicalOrExpr" ):
+                listener.enterLogicalOrExpr(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitEqualityExpr" ):
-                listener.exitEqualityExpr(self)
+            if hasattr( listener, "exitLogicalOrExpr" ):
+                listener.exitLogicalOrExpr(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitEqualityExpr" ):
-                return visitor.visitEqualityExpr(self)
+            if hasattr( visitor, "visitLogicalOrExpr" ):
+                return visitor.visitLogicalOrExpr(self)
             else:
                 return visitor.visitChildren(self)
 
 
+    class EqualityExprContext(OperatorExprContext):
 
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a CompiscriptParser.OperatorExprContext
+            super().__init__(parser)
+            self.op = None # Token
+            self.copyFrom(ctx)
 
-    def equalityExpr(self):
-
-        localctx = CompiscriptParser.EqualityExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 64, self.RULE_equalityExpr)
-        self._la = 0 # Token type
-        try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 363
-            self.relationalExpr()
-            self.state = 368
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while _la==34 or _la==35:
-                self.state = 364
-                _la = self._input.LA(1)
-                if not(_la==34 or _la==35):
-                    self._errHandler.recoverInline(self)
-                else:
-                    self._errHandler.reportMatch(self)
-                    self.consume()
-                self.state = 365
-                self.relationalExpr()
-                self.state = 370
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-
-        except RecognitionException as re:
-            localctx.exception = re
-            self._errHandler.reportError(self, re)
-            self._errHandler.recover(self, re)
-        finally:
-            self.exitRule()
-        return localctx
-
-
-    class RelationalExprContext(ParserRuleContext):
-        __slots__ = 'parser'
-
-        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
-            super().__init__(parent, invokingState)
-            self.parser = parser
-
-        def additiveExpr(self, i:int=None):
+        def operatorExpr(self, i:int=None):
             if i is None:
-                return self.getTypedRuleContexts(CompiscriptParser.AdditiveExprContext)
+                return self.getTypedRuleContexts(CompiscriptParser.OperatorExprContext)
             else:
-                return self.getTypedRuleContext(CompiscriptParser.AdditiveExprContext,i)
-
+                return self.getTypedRuleContext(CompiscriptParser.OperatorExprContext,i)
 
-        def getRuleIndex(self):
-            return CompiscriptParser.RULE_relationalExpr
 
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterRelationalExpr" ):
-                listener.enterRelationalExpr(self)
+            if hasattr( listener, "enterEqualityExpr" ):
+                listener.enterEqualityExpr(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitRelationalExpr" ):
-                listener.exitRelationalExpr(self)
+            if hasattr( listener, "exitEqualityExpr" ):
+                listener.exitEqualityExpr(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitRelationalExpr" ):
-                return visitor.visitRelationalExpr(self)
+            if hasattr( visitor, "visitEqualityExpr" ):
+                return visitor.visitEqualityExpr(self)
             else:
                 return visitor.visitChildren(self)
 
 
+    class AdditiveExprContext(OperatorExprContext):
 
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a CompiscriptParser.OperatorExprContext
+            super().__init__(parser)
+            self.op = None # Token
+            self.copyFrom(ctx)
 
-    def relationalExpr(self):
-
-        localctx = CompiscriptParser.RelationalExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 66, self.RULE_relationalExpr)
-        self._la = 0 # Token type
-        try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 371
-            self.additiveExpr()
-            self.state = 376
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 1030792151040) != 0):
-                self.state = 372
-                _la = self._input.LA(1)
-                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 1030792151040) != 0)):
-                    self._errHandler.recoverInline(self)
-                else:
-                    self._errHandler.reportMatch(self)
-                    self.consume()
-                self.state = 373
-                self.additiveExpr()
-                self.state = 378
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-
-        except RecognitionException as re:
-            localctx.exception = re
-            self._errHandler.reportError(self, re)
-            self._errHandler.recover(self, re)
-        finally:
-            self.exitRule()
-        return localctx
-
-
-    class AdditiveExprContext(ParserRuleContext):
-        __slots__ = 'parser'
-
-        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
-            super().__init__(parent, invokingState)
-            self.parser = parser
-
-        def multiplicativeExpr(self, i:int=None):
+        def operatorExpr(self, i:int=None):
             if i is None:
-                return self.getTypedRuleContexts(CompiscriptParser.MultiplicativeExprContext)
+                return self.getTypedRuleContexts(CompiscriptParser.OperatorExprContext)
             else:
-                return self.getTypedRuleContext(CompiscriptParser.MultiplicativeExprContext,i)
+                return self.getTypedRuleContext(CompiscriptParser.OperatorExprContext,i)
 
 
-        def getRuleIndex(self):
-            return CompiscriptParser.RULE_additiveExpr
-
         def enterRule(self, listener:ParseTreeListener):
             if hasattr( listener, "enterAdditiveExpr" ):
                 listener.enterAdditiveExpr(self)
@@ -2915,129 +2754,44 @@ class CompiscriptParser ( Parser ):
                 return visitor.visitChildren(self)
 
 
+    class RelationalExprContext(OperatorExprContext):
 
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a CompiscriptParser.OperatorExprContext
+            super().__init__(parser)
+            self.op = None # Token
+            self.copyFrom(ctx)
 
-    def additiveExpr(self):
-
-        localctx = CompiscriptParser.AdditiveExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 68, self.RULE_additiveExpr)
-        self._la = 0 # Token type
-        try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 379
-            self.multiplicativeExpr()
-            self.state = 384
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while _la==40 or _la==41:
-                self.state = 380
-                _la = self._input.LA(1)
-                if not(_la==40 or _la==41):
-                    self._errHandler.recoverInline(self)
-                else:
-                    self._errHandler.reportMatch(self)
-                    self.consume()
-                self.state = 381
-                self.multiplicativeExpr()
-                self.state = 386
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-
-        except RecognitionException as re:
-            localctx.exception = re
-            self._errHandler.reportError(self, re)
-            self._errHandler.recover(self, re)
-        finally:
-            self.exitRule()
-        return localctx
-
-
-    class MultiplicativeExprContext(ParserRuleContext):
-        __slots__ = 'parser'
-
-        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
-            super().__init__(parent, invokingState)
-            self.parser = parser
-
-        def unaryExpr(self, i:int=None):
+        def operatorExpr(self, i:int=None):
             if i is None:
-                return self.getTypedRuleContexts(CompiscriptParser.UnaryExprContext)
+                return self.getTypedRuleContexts(CompiscriptParser.OperatorExprContext)
             else:
-                return self.getTypedRuleContext(CompiscriptParser.UnaryExprContext,i)
+                return self.getTypedRuleContext(CompiscriptParser.OperatorExprContext,i)
 
 
-        def getRuleIndex(self):
-            return CompiscriptParser.RULE_multiplicativeExpr
-
         def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterMultiplicativeExpr" ):
-                listener.enterMultiplicativeExpr(self)
+            if hasattr( listener, "enterRelationalExpr" ):
+                listener.enterRelationalExpr(self)
 
         def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitMultiplicativeExpr" ):
-                listener.exitMultiplicativeExpr(self)
+            if hasattr( listener, "exitRelationalExpr" ):
+                listener.exitRelationalExpr(self)
 
         def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitMultiplicativeExpr" ):
-                return visitor.visitMultiplicativeExpr(self)
+            if hasattr( visitor, "visitRelationalExpr" ):
+                return visitor.visitRelationalExpr(self)
             else:
                 return visitor.visitChildren(self)
 
 
+    class UnaryExprContext(OperatorExprContext):
 
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a CompiscriptParser.OperatorExprContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
 
-    def multiplicativeExpr(self):
-
-        localctx = CompiscriptParser.MultiplicativeExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 70, self.RULE_multiplicativeExpr)
-        self._la = 0 # Token type
-        try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 387
-            self.unaryExpr()
-            self.state = 392
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 30786325577728) != 0):
-                self.state = 388
-                _la = self._input.LA(1)
-                if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 30786325577728) != 0)):
-                    self._errHandler.recoverInline(self)
-                else:
-                    self._errHandler.reportMatch(self)
-                    self.consume()
-                self.state = 389
-                self.unaryExpr()
-                self.state = 394
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-
-        except RecognitionException as re:
-            localctx.exception = re
-            self._errHandler.reportError(self, re)
-            self._errHandler.recover(self, re)
-        finally:
-            self.exitRule()
-        return localctx
-
-
-    class UnaryExprContext(ParserRuleContext):
-        __slots__ = 'parser'
-
-        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
-            super().__init__(parent, invokingState)
-            self.parser = parser
-
-        def unaryExpr(self):
-            return self.getTypedRuleContext(CompiscriptParser.UnaryExprContext,0)
-
-
-        def primaryExpr(self):
-            return self.getTypedRuleContext(CompiscriptParser.PrimaryExprContext,0)
-
+        def operatorExpr(self):
+            return self.getTypedRuleContext(CompiscriptParser.OperatorExprContext,0)
 
-        def getRuleIndex(self):
-            return CompiscriptParser.RULE_unaryExpr
 
         def enterRule(self, listener:ParseTreeListener):
             if hasattr( listener, "enterUnaryExpr" ):
@@ -3054,43 +2808,199 @@ class CompiscriptParser ( Parser ):
                 return visitor.visitChildren(self)
 
 
+    class LogicalAndExprContext(OperatorExprContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a CompiscriptParser.OperatorExprContext
+            super().__init__(parser)
+            self.op = None # Token
+            self.copyFrom(ctx)
+
+        def operatorExpr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(CompiscriptParser.OperatorExprContext)
+            else:
+                return self.getTypedRuleContext(CompiscriptParser.OperatorExprContext,i)
+
 
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterLogicalAndExpr" ):
+                listener.enterLogicalAndExpr(self)
 
-    def unaryExpr(self):
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitLogicalAndExpr" ):
+                listener.exitLogicalAndExpr(self)
 
-        localctx = CompiscriptParser.UnaryExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 72, self.RULE_unaryExpr)
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLogicalAndExpr" ):
+                return visitor.visitLogicalAndExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def operatorExpr(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = CompiscriptParser.OperatorExprContext(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 60
+        self.enterRecursionRule(localctx, 60, self.RULE_operatorExpr, _p)
         self._la = 0 # Token type
         try:
-            self.state = 398
+            self.enterOuterAlt(localctx, 1)
+            self.state = 339
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [41, 45]:
-                self.enterOuterAlt(localctx, 1)
-                self.state = 395
+            if token in [32, 33]:
+                localctx = CompiscriptParser.UnaryExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+
+                self.state = 336
                 _la = self._input.LA(1)
-                if not(_la==41 or _la==45):
+                if not(_la==32 or _la==33):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 396
-                self.unaryExpr()
+                self.state = 337
+                self.operatorExpr(8)
                 pass
             elif token in [11, 46, 47, 48, 49, 50, 51, 56, 59]:
-                self.enterOuterAlt(localctx, 2)
-                self.state = 397
+                localctx = CompiscriptParser.OperandExprContext(self, localctx)
+                self._ctx = localctx
+                _prevctx = localctx
+                self.state = 338
                 self.primaryExpr()
                 pass
             else:
                 raise NoViableAltException(self)
 
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 361
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,27,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    self.state = 359
+                    self._errHandler.sync(self)
+                    la_ = self._interp.adaptivePredict(self._input,26,self._ctx)
+                    if la_ == 1:
+                        localctx = CompiscriptParser.MultiplicativeExprContext(self, CompiscriptParser.OperatorExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_operatorExpr)
+                        self.state = 341
+                        if not self.precpred(self._ctx, 6):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 6)")
+                        self.state = 342
+                        localctx.op = self._input.LT(1)
+                        _la = self._input.LA(1)
+                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 120259084288) != 0)):
+                            localctx.op = self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 343
+                        self.operatorExpr(7)
+                        pass
+
+                    elif la_ == 2:
+                        localctx = CompiscriptParser.AdditiveExprContext(self, CompiscriptParser.OperatorExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_operatorExpr)
+                        self.state = 344
+                        if not self.precpred(self._ctx, 5):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 5)")
+                        self.state = 345
+                        localctx.op = self._input.LT(1)
+                        _la = self._input.LA(1)
+                        if not(_la==32 or _la==37):
+                            localctx.op = self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 346
+                        self.operatorExpr(6)
+                        pass
+
+                    elif la_ == 3:
+                        localctx = CompiscriptParser.RelationalExprContext(self, CompiscriptParser.OperatorExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_operatorExpr)
+                        self.state = 347
+                        if not self.precpred(self._ctx, 4):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 4)")
+                        self.state = 348
+                        localctx.op = self._input.LT(1)
+                        _la = self._input.LA(1)
+                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 4123168604160) != 0)):
+                            localctx.op = self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 349
+                        self.operatorExpr(5)
+                        pass
+
+                    elif la_ == 4:
+                        localctx = CompiscriptParser.EqualityExprContext(self, CompiscriptParser.OperatorExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_operatorExpr)
+                        self.state = 350
+                        if not self.precpred(self._ctx, 3):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 3)")
+                        self.state = 351
+                        localctx.op = self._input.LT(1)
+                        _la = self._input.LA(1)
+                        if not(_la==42 or _la==43):
+                            localctx.op = self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 352
+                        self.operatorExpr(4)
+                        pass
+
+                    elif la_ == 5:
+                        localctx = CompiscriptParser.LogicalAndExprContext(self, CompiscriptParser.OperatorExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_operatorExpr)
+                        self.state = 353
+                        if not self.precpred(self._ctx, 2):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
+                        self.state = 354
+                        localctx.op = self.match(CompiscriptParser.T__43)
+                        self.state = 355
+                        self.operatorExpr(3)
+                        pass
+
+                    elif la_ == 6:
+                        localctx = CompiscriptParser.LogicalOrExprContext(self, CompiscriptParser.OperatorExprContext(self, _parentctx, _parentState))
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_operatorExpr)
+                        self.state = 356
+                        if not self.precpred(self._ctx, 1):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 1)")
+                        self.state = 357
+                        localctx.op = self.match(CompiscriptParser.T__44)
+                        self.state = 358
+                        self.operatorExpr(2)
+                        pass
+
+             
+                self.state = 363
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,27,self._ctx)
+
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
             self._errHandler.recover(self, re)
         finally:
-            self.exitRule()
+            self.unrollRecursionContexts(_parentctx)
         return localctx
 
 
@@ -3136,28 +3046,28 @@ class CompiscriptParser ( Parser ):
     def primaryExpr(self):
 
         localctx = CompiscriptParser.PrimaryExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 74, self.RULE_primaryExpr)
+        self.enterRule(localctx, 62, self.RULE_primaryExpr)
         try:
-            self.state = 406
+            self.state = 370
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [46, 47, 48, 51, 56]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 400
+                self.state = 364
                 self.literalExpr()
                 pass
             elif token in [49, 50, 59]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 401
+                self.state = 365
                 self.leftHandSide()
                 pass
             elif token in [11]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 402
+                self.state = 366
                 self.match(CompiscriptParser.T__10)
-                self.state = 403
+                self.state = 367
                 self.expression()
-                self.state = 404
+                self.state = 368
                 self.match(CompiscriptParser.T__11)
                 pass
             else:
@@ -3209,34 +3119,34 @@ class CompiscriptParser ( Parser ):
     def literalExpr(self):
 
         localctx = CompiscriptParser.LiteralExprContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 76, self.RULE_literalExpr)
+        self.enterRule(localctx, 64, self.RULE_literalExpr)
         try:
-            self.state = 413
+            self.state = 377
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [56]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 408
+                self.state = 372
                 self.match(CompiscriptParser.Literal)
                 pass
             elif token in [51]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 409
+                self.state = 373
                 self.arrayLiteral()
                 pass
             elif token in [46]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 410
+                self.state = 374
                 self.match(CompiscriptParser.T__45)
                 pass
             elif token in [47]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 411
+                self.state = 375
                 self.match(CompiscriptParser.T__46)
                 pass
             elif token in [48]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 412
+                self.state = 376
                 self.match(CompiscriptParser.T__47)
                 pass
             else:
@@ -3292,21 +3202,21 @@ class CompiscriptParser ( Parser ):
     def leftHandSide(self):
 
         localctx = CompiscriptParser.LeftHandSideContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 78, self.RULE_leftHandSide)
+        self.enterRule(localctx, 66, self.RULE_leftHandSide)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 415
+            self.state = 379
             self.primaryAtom()
-            self.state = 419
+            self.state = 383
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,34,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,30,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 416
+                    self.state = 380
                     self.suffixOp() 
-                self.state = 421
+                self.state = 385
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,34,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,30,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -3411,42 +3321,42 @@ class CompiscriptParser ( Parser ):
     def primaryAtom(self):
 
         localctx = CompiscriptParser.PrimaryAtomContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 80, self.RULE_primaryAtom)
+        self.enterRule(localctx, 68, self.RULE_primaryAtom)
         self._la = 0 # Token type
         try:
-            self.state = 431
+            self.state = 395
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [59]:
                 localctx = CompiscriptParser.IdentifierExprContext(self, localctx)
                 self.enterOuterAlt(localctx, 1)
-                self.state = 422
+                self.state = 386
                 self.match(CompiscriptParser.Identifier)
                 pass
             elif token in [49]:
                 localctx = CompiscriptParser.NewExprContext(self, localctx)
                 self.enterOuterAlt(localctx, 2)
-                self.state = 423
+                self.state = 387
                 self.match(CompiscriptParser.T__48)
-                self.state = 424
+                self.state = 388
                 self.match(CompiscriptParser.Identifier)
-                self.state = 425
+                self.state = 389
                 self.match(CompiscriptParser.T__10)
-                self.state = 427
+                self.state = 391
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 652988960619890688) != 0):
-                    self.state = 426
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 652951590109448192) != 0):
+                    self.state = 390
                     self.arguments()
 
 
-                self.state = 429
+                self.state = 393
                 self.match(CompiscriptParser.T__11)
                 pass
             elif token in [50]:
                 localctx = CompiscriptParser.ThisExprContext(self, localctx)
                 self.enterOuterAlt(localctx, 3)
-                self.state = 430
+                self.state = 394
                 self.match(CompiscriptParser.T__49)
                 pass
             else:
@@ -3556,44 +3466,44 @@ class CompiscriptParser ( Parser ):
     def suffixOp(self):
 
         localctx = CompiscriptParser.SuffixOpContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 82, self.RULE_suffixOp)
+        self.enterRule(localctx, 70, self.RULE_suffixOp)
         self._la = 0 # Token type
         try:
-            self.state = 444
+            self.state = 408
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [11]:
                 localctx = CompiscriptParser.CallExprContext(self, localctx)
                 self.enterOuterAlt(localctx, 1)
-                self.state = 433
+                self.state = 397
                 self.match(CompiscriptParser.T__10)
-                self.state = 435
+                self.state = 399
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 652988960619890688) != 0):
-                    self.state = 434
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 652951590109448192) != 0):
+                    self.state = 398
                     self.arguments()
 
 
-                self.state = 437
+                self.state = 401
                 self.match(CompiscriptParser.T__11)
                 pass
             elif token in [51]:
                 localctx = CompiscriptParser.IndexExprContext(self, localctx)
                 self.enterOuterAlt(localctx, 2)
-                self.state = 438
+                self.state = 402
                 self.match(CompiscriptParser.T__50)
-                self.state = 439
+                self.state = 403
                 self.expression()
-                self.state = 440
+                self.state = 404
                 self.match(CompiscriptParser.T__51)
                 pass
             elif token in [9]:
                 localctx = CompiscriptParser.PropertyAccessExprContext(self, localctx)
                 self.enterOuterAlt(localctx, 3)
-                self.state = 442
+                self.state = 406
                 self.match(CompiscriptParser.T__8)
-                self.state = 443
+                self.state = 407
                 self.match(CompiscriptParser.Identifier)
                 pass
             else:
@@ -3645,21 +3555,21 @@ class CompiscriptParser ( Parser ):
     def arguments(self):
 
         localctx = CompiscriptParser.ArgumentsContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 84, self.RULE_arguments)
+        self.enterRule(localctx, 72, self.RULE_arguments)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 446
+            self.state = 410
             self.expression()
-            self.state = 451
+            self.state = 415
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==29:
-                self.state = 447
+                self.state = 411
                 self.match(CompiscriptParser.T__28)
-                self.state = 448
+                self.state = 412
                 self.expression()
-                self.state = 453
+                self.state = 417
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -3709,33 +3619,33 @@ class CompiscriptParser ( Parser ):
     def arrayLiteral(self):
 
         localctx = CompiscriptParser.ArrayLiteralContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 86, self.RULE_arrayLiteral)
+        self.enterRule(localctx, 74, self.RULE_arrayLiteral)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 454
+            self.state = 418
             self.match(CompiscriptParser.T__50)
-            self.state = 463
+            self.state = 427
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 652988960619890688) != 0):
-                self.state = 455
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 652951590109448192) != 0):
+                self.state = 419
                 self.expression()
-                self.state = 460
+                self.state = 424
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while _la==29:
-                    self.state = 456
+                    self.state = 420
                     self.match(CompiscriptParser.T__28)
-                    self.state = 457
+                    self.state = 421
                     self.expression()
-                    self.state = 462
+                    self.state = 426
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
 
 
-            self.state = 465
+            self.state = 429
             self.match(CompiscriptParser.T__51)
         except RecognitionException as re:
             localctx.exception = re
@@ -3780,21 +3690,21 @@ class CompiscriptParser ( Parser ):
     def type_(self):
 
         localctx = CompiscriptParser.TypeContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 88, self.RULE_type)
+        self.enterRule(localctx, 76, self.RULE_type)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 467
+            self.state = 431
             self.baseType()
-            self.state = 472
+            self.state = 436
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==51:
-                self.state = 468
+                self.state = 432
                 self.match(CompiscriptParser.T__50)
-                self.state = 469
+                self.state = 433
                 self.match(CompiscriptParser.T__51)
-                self.state = 474
+                self.state = 438
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -3840,11 +3750,11 @@ class CompiscriptParser ( Parser ):
     def baseType(self):
 
         localctx = CompiscriptParser.BaseTypeContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 90, self.RULE_baseType)
+        self.enterRule(localctx, 78, self.RULE_baseType)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 475
+            self.state = 439
             _la = self._input.LA(1)
             if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 639511147086610432) != 0)):
                 self._errHandler.recoverInline(self)
@@ -3861,5 +3771,41 @@ class CompiscriptParser ( Parser ):
 
 
 
+    def sempred(self, localctx:RuleContext, ruleIndex:int, predIndex:int):
+        if self._predicates == None:
+            self._predicates = dict()
+        self._predicates[30] = self.operatorExpr_sempred
+        pred = self._predicates.get(ruleIndex, None)
+        if pred is None:
+            raise Exception("No predicate with index:" + str(ruleIndex))
+        else:
+            return pred(localctx, predIndex)
+
+    def operatorExpr_sempred(self, localctx:OperatorExprContext, predIndex:int):
+            if predIndex == 0:
+                return self.precpred(self._ctx, 6)
+         
+
+            if predIndex == 1:
+                return self.precpred(self._ctx, 5)
+         
+
+            if predIndex == 2:
+                return self.precpred(self._ctx, 4)
+         
+
+            if predIndex == 3:
+                return self.precpred(self._ctx, 3)
+         
+
+            if predIndex == 4:
+                return self.precpred(self._ctx, 2)
+         
+
+            if predIndex == 5:
+                return self.precpred(self._ctx, 1)
+         
+
+
 
 
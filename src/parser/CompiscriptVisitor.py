@@ -169,41 +169,46 @@ class CompiscriptVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by CompiscriptParser#logicalOrExpr.
-    def visitLogicalOrExpr(self, ctx:CompiscriptParser.LogicalOrExprContext):
+    # Visit a parse tree produced by CompiscriptParser#OperandExpr.
+    def visitOperandExpr(self, ctx:CompiscriptParser.OperandExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by CompiscriptParser#logicalAndExpr.
-    def visitLogicalAndExpr(self, ctx:CompiscriptParser.LogicalAndExprContext):
+    # Visit a parse tree produced by CompiscriptParser#MultiplicativeExpr.
+    def visitMultiplicativeExpr(self, ctx:CompiscriptParser.MultiplicativeExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by CompiscriptParser#equalityExpr.
-    def visitEqualityExpr(self, ctx:CompiscriptParser.EqualityExprContext):
+    # Visit a parse tree produced by CompiscriptParser#LogicalOrExpr.
+    def visitLogicalOrExpr(self, ctx:CompiscriptParser.LogicalOrExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by CompiscriptParser#relationalExpr.
-    def visitRelationalExpr(self, ctx:CompiscriptParser.RelationalExprContext):
+    # Visit a parse tree produced by CompiscriptParser#EqualityExpr.
+    def visitEqualityExpr(self, ctx:CompiscriptParser.EqualityExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by CompiscriptParser#additiveExpr.
+    # Visit a parse tree produced by CompiscriptParser#AdditiveExpr.
     def visitAdditiveExpr(self, ctx:CompiscriptParser.AdditiveExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by CompiscriptParser#multiplicativeExpr.
-    def visitMultiplicativeExpr(self, ctx:CompiscriptParser.MultiplicativeExprContext):
+    # Visit a parse tree produced by CompiscriptParser#RelationalExpr.
+    def visitRelationalExpr(self, ctx:CompiscriptParser.RelationalExprContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by CompiscriptParser#unaryExpr.
+    # Visit a parse tree produced by CompiscriptParser#UnaryExpr.
     def visitUnaryExpr(self, ctx:CompiscriptParser.UnaryExprContext):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by CompiscriptParser#LogicalAndExpr.
+    def visitLogicalAndExpr(self, ctx:CompiscriptParser.LogicalAndExprContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by CompiscriptParser#primaryExpr.
     def visitPrimaryExpr(self, ctx:CompiscriptParser.PrimaryExprContext):
         return self.visitChildren(ctx)
@@ -0,0 +1,298 @@
+# src/pipeline.py
+"""
+Pipeline de compilación compartido por DriverGen y CompilerServer.
+
+    fuente -> lex -> parse -> semantic -> tac -> pre_analysis -> codegen -> asm
+
+Cada fase corre dentro de un span del CompileTrace recibido (o NULL_TRACE),
+así los tiempos y contadores salen del mismo lugar para el CLI, el servidor
+y los benchmarks.
+
+Uso:
+    result = compile_source(code)                       # hasta asm
+    result = compile_source(code, stop_after="tac")     # solo front-end + TAC
+    if result.errors: ...
+    asm = emit_mips(result.tac, result.frame_manager)   # backend por separado
+    for chunk in stream_mips(tac_iter, frame_manager):  # backend por función
+        out.write(chunk)
+    program, errors = parse_ast(code)                   # solo AST sintáctico
+"""
+
+import glob
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from antlr4 import InputStream, CommonTokenStream
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorListener import ErrorListener
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+
+from parser.CompiscriptLexer import CompiscriptLexer
+from fast_lexer import FastLexer
+from parser.CompiscriptParser import CompiscriptParser
+from semantic.ast_and_semantic import AstAndSemantic
+from intermediate.tac_generator import TacGenerator
+from intermediate.tac_nodes import TACOP
+from code_generator.mips_generator import MIPSCodeGenerator
+from code_generator.streaming import StreamingMIPSGenerator
+from ast_builder import build_ast
+from ast_nodes import Program
+import pratt_parser
+from compile_trace import CompileTrace, NULL_TRACE
+from function_cache import FunctionCache
+from tree_walk import IterativeWalker
+
+STAGES = ("semantic", "tac", "asm")
+
+# "fast": lexer de regex equivalente (fast_lexer.py), ~3-4x más rápido
+LEXERS = {"antlr": CompiscriptLexer, "fast": FastLexer}
+
+# Front ends de parse_ast: parse tree de ANTLR + AstBuilder, o PrattParser
+# (Python puro, sin parse tree). "auto" usa pratt desde PRATT_MIN_BYTES
+FRONT_ENDS = ("antlr", "pratt")
+PRATT_MIN_BYTES = 16 * 1024
+
+# Programas que recorren toda la gramática (ver warm_up)
+WARMUP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "warmup_corpus")
+
+
+class ErrorCollector(ErrorListener):
+    def __init__(self):
+        super(ErrorCollector, self).__init__()
+        self.errors = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.errors.append(f"[Line {line}] {msg}")
+
+
+# Parses de este proceso: cuántos resolvió SLL y cuántos cayeron a LL
+PARSE_STATS = {"sll": 0, "ll_fallback": 0}
+
+
+def parse_program(
+    stream: CommonTokenStream,
+    errors: Optional[ErrorListener] = None,
+    trace: Optional[CompileTrace] = None,
+) -> CompiscriptParser.ProgramContext:
+    """
+    Parsea en dos etapas:
+      1. SLL + BailErrorStrategy, sin listeners: barato y casi siempre
+         suficiente para esta gramática. Cualquier error cancela el intento.
+      2. Solo si (1) falla: rebobina y re-parsea en LL completo con la
+         estrategia de recuperación y los listeners normales (`errors`).
+    Como SLL es más débil que LL, (1) solo puede fallar de más: un programa
+    válido puede terminar en (2), pero nunca se aceptan programas inválidos
+    ni cambian los mensajes de error.
+    """
+    trace = trace or NULL_TRACE
+    parser = CompiscriptParser(stream)
+    parser.removeErrorListeners()
+    parser._interp.predictionMode = PredictionMode.SLL
+    parser._errHandler = BailErrorStrategy()
+    try:
+        tree = parser.program()
+        PARSE_STATS["sll"] += 1
+        return tree
+    except ParseCancellationException:
+        pass
+
+    PARSE_STATS["ll_fallback"] += 1
+    trace.count("parse.ll_fallback")
+    stream.seek(0)
+    parser.reset()
+    if errors is not None:
+        parser.addErrorListener(errors)
+    parser._interp.predictionMode = PredictionMode.LL
+    parser._errHandler = DefaultErrorStrategy()
+    return parser.program()
+
+
+def parse_ast(
+    source: str,
+    front_end: str = "auto",
+    trace: Optional[CompileTrace] = None,
+) -> Tuple[Optional[Program], List[str]]:
+    """
+    Front end sintáctico: devuelve (Program, errores) con el AST de ast_nodes
+    (posiciones incluidas, sin tipos). Con errores sintácticos el Program es
+    None; los léxicos se reportan pero el árbol se arma con los tokens válidos.
+
+    Los dos front ends dan el mismo árbol (tests/test_pratt_parser.py); el de
+    ANTLR reporta todos los errores gracias a su recuperación, el Pratt solo
+    el primero pero es varias veces más rápido, así que "auto" lo usa para
+    fuentes grandes. El análisis semántico y el TAC siguen recorriendo el
+    parse tree de ANTLR (compile_source).
+    """
+    if front_end == "auto":
+        front_end = "pratt" if len(source) >= PRATT_MIN_BYTES else "antlr"
+    if front_end not in FRONT_ENDS:
+        raise ValueError(f"front_end debe ser 'auto' o uno de {FRONT_ENDS}")
+    trace = trace or NULL_TRACE
+
+    if front_end == "pratt":
+        with trace.span("lex"):
+            parser = pratt_parser.PrattParser(source)
+        trace.set("lex.tokens", len(parser.types))
+        with trace.span("parse"):
+            try:
+                return parser.program(), parser.lex_errors
+            except pratt_parser.ParseError as e:
+                return None, parser.lex_errors + [str(e)]
+
+    with trace.span("lex"):
+        token_source = FastLexer(InputStream(source))
+        lexer_errors = ErrorCollector()
+        token_source.removeErrorListeners()
+        token_source.addErrorListener(lexer_errors)
+        stream = CommonTokenStream(token_source)
+        stream.fill()
+    trace.set("lex.tokens", len(stream.tokens))
+    with trace.span("parse"):
+        parser_errors = ErrorCollector()
+        tree = parse_program(stream, parser_errors, trace)
+        if parser_errors.errors:
+            return None, lexer_errors.errors + parser_errors.errors
+        return build_ast(tree), lexer_errors.errors
+
+
+@dataclass
+class CompileResult:
+    errors: List[str] = field(default_factory=list)
+    # "syntax" (lexer/parser) o "semantic"; None si no hubo errores
+    error_stage: Optional[str] = None
+    trace: CompileTrace = NULL_TRACE
+    tree: object = None
+    semantic: Optional[AstAndSemantic] = None
+    tac_gen: Optional[TacGenerator] = None
+    tac: List[TACOP] = field(default_factory=list)
+    asm: Optional[str] = None
+
+    @property
+    def frame_manager(self):
+        return self.tac_gen.frame_manager if self.tac_gen else None
+
+
+def compile_source(
+    source: str,
+    stop_after: str = "asm",
+    trace: Optional[CompileTrace] = None,
+    lexer: str = "antlr",
+    cache: Optional[FunctionCache] = None,
+    **mips_options,
+) -> CompileResult:
+    """
+    Compila `source` hasta la etapa `stop_after` ("semantic", "tac" o "asm")
+    tokenizando con `lexer` (ver LEXERS). Con `cache` (FunctionCache) el TAC
+    y el asm de las funciones que no cambiaron se reusan de compilaciones
+    anteriores.
+    Los errores léxicos, sintácticos y semánticos se devuelven en
+    `result.errors` (y el pipeline se detiene ahí); los del backend se
+    propagan como excepción.
+    """
+    if stop_after not in STAGES:
+        raise ValueError(f"stop_after debe ser uno de {STAGES}")
+    if lexer not in LEXERS:
+        raise ValueError(f"lexer debe ser uno de {tuple(LEXERS)}")
+    trace = trace or NULL_TRACE
+    result = CompileResult(trace=trace)
+
+    with trace.span("lex"):
+        token_source = LEXERS[lexer](InputStream(source))
+        lexer_errors = ErrorCollector()
+        token_source.removeErrorListeners()
+        token_source.addErrorListener(lexer_errors)
+        stream = CommonTokenStream(token_source)
+        stream.fill()
+    trace.set("lex.tokens", len(stream.tokens))
+
+    with trace.span("parse"):
+        parser_errors = ErrorCollector()
+        result.tree = parse_program(stream, parser_errors, trace)
+
+    with trace.span("semantic"):
+        result.semantic = AstAndSemantic(trace=trace)
+        IterativeWalker().walk(result.semantic, result.tree)
+
+    result.errors = lexer_errors.errors + parser_errors.errors + result.semantic.errors
+    if lexer_errors.errors or parser_errors.errors:
+        result.error_stage = "syntax"
+    elif result.semantic.errors:
+        result.error_stage = "semantic"
+    if result.errors or stop_after == "semantic":
+        return result
+
+    with trace.span("tac"):
+        sem = result.semantic
+        result.tac_gen = TacGenerator(sem.table, sem.resolved_symbols, sem.types, trace=trace, cache=cache)
+        result.tac_gen.visit(result.tree)
+        result.tac = result.tac_gen.code
+    if stop_after == "tac":
+        return result
+
+    result.asm = emit_mips(result.tac, result.frame_manager, trace=trace, cache=cache, **mips_options)
+    return result
+
+
+def emit_mips(
+    tac: List[TACOP],
+    frame_manager=None,
+    trace: Optional[CompileTrace] = None,
+    buffered_print: bool = False,
+    var_priorities: Optional[Dict[str, Dict[str, int]]] = None,
+    cache: Optional[FunctionCache] = None,
+) -> str:
+    """Backend: pre-análisis + generación de MIPS, cada uno en su span."""
+    trace = trace or NULL_TRACE
+    mips_gen = MIPSCodeGenerator(
+        tac, frame_manager,
+        buffered_print=buffered_print,
+        var_priorities=var_priorities,
+        trace=trace,
+        cache=cache,
+    )
+    with trace.span("pre_analysis"):
+        mips_gen.analyze()
+    with trace.span("codegen"):
+        return mips_gen.generate()
+
+
+def stream_mips(
+    tac: Iterable[TACOP],
+    frame_manager=None,
+    trace: Optional[CompileTrace] = None,
+    buffered_print: bool = False,
+    var_priorities: Optional[Dict[str, Dict[str, int]]] = None,
+    cache: Optional[FunctionCache] = None,
+) -> Iterator[str]:
+    """
+    Backend en streaming (code_generator/streaming.py): consume `tac` de a
+    una función y entrega el asm por partes. Sin span propio de codegen:
+    el consumidor decide el ritmo; cada función registra los suyos.
+    """
+    return StreamingMIPSGenerator(
+        tac, frame_manager,
+        buffered_print=buffered_print,
+        var_priorities=var_priorities,
+        trace=trace or NULL_TRACE,
+        cache=cache,
+    ).stream()
+
+
+def warm_up(corpus_dir: str = WARMUP_DIR) -> Dict[str, float]:
+    """
+    Compila cada .cps de `corpus_dir` hasta asm. ANTLR construye sus DFA de
+    predicción (compartidos por todas las instancias de CompiscriptLexer /
+    CompiscriptParser del proceso) en forma perezosa; sin esto los paga el
+    primer request de cada worker. Devuelve {archivo: segundos}.
+    """
+    times: Dict[str, float] = {}
+    for path in sorted(glob.glob(os.path.join(corpus_dir, "*.cps"))):
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+        start = time.perf_counter()
+        compile_source(source)
+        times[os.path.basename(path)] = time.perf_counter() - start
+    return times
@@ -0,0 +1,553 @@
+# src/pratt_parser.py
+"""
+PrattParser: front end de Compiscript en Python puro que arma los nodos de
+ast_nodes en una sola pasada, sin parse tree de ANTLR.
+
+    tokens (FastLexer.scan) -> descenso recursivo (sentencias)
+                             + Pratt / precedence climbing (expresiones)
+                             -> Program
+
+Acepta el mismo lenguaje que Compiscript.g4 y produce el mismo árbol que
+AstBuilder sobre el parse tree de ANTLR (mismas posiciones incluidas); eso
+lo fija tests/test_pratt_parser.py. Si se cambia la gramática hay que tocar
+los dos.
+
+Diferencias con el parser de ANTLR:
+  - se detiene en el primer error sintáctico (no hay recuperación); el
+    mensaje sigue el formato "[Line N] ..." de ErrorCollector
+  - los errores léxicos son los de FastLexer, idénticos a los de ANTLR
+
+Puntos de la gramática que no son LL(1) y cómo se resuelven:
+  - assignmentExpr: se parsea primero un leftHandSide; si le sigue '=' es
+    asignación, si no, es el primer operando de la expresión binaria
+  - assignment (alt 2, `expr.p = v;`) a nivel de sentencia: ANTLR la elige
+    siempre que sea viable, aunque la sentencia también sea una expresión
+    válida; _assignment_or_expression reacomoda el árbol igual
+"""
+
+from typing import List, Optional, Tuple
+
+from antlr4 import InputStream
+from antlr4.error.ErrorListener import ErrorListener
+
+from parser.CompiscriptLexer import CompiscriptLexer
+from fast_lexer import FastLexer, KEYWORDS, OPERATORS
+from ast_builder import literal_value, array_type, call_name, assign_to
+from ast_nodes import *
+
+_T = {**KEYWORDS, **OPERATORS}
+IDENT = CompiscriptLexer.Identifier
+LITERAL = CompiscriptLexer.Literal
+EOF = -1
+
+# Precedencia de los operadores binarios (todos asociativos a la izquierda)
+BINARY_PRECEDENCE = {
+    _T["||"]: 1,
+    _T["&&"]: 2,
+    _T["=="]: 3, _T["!="]: 3,
+    _T["<"]: 4, _T["<="]: 4, _T[">"]: 4, _T[">="]: 4,
+    _T["+"]: 5, _T["-"]: 5,
+    _T["*"]: 6, _T["/"]: 6, _T["%"]: 6,
+}
+
+_CONSTANTS = {_T["null"]: None, _T["true"]: True, _T["false"]: False}
+_BASE_TYPES = {_T["boolean"], _T["integer"], _T["string"], IDENT}
+# primaryAtom: lo único que admite sufijos y puede quedar a la izquierda de '='
+_ATOMS = {IDENT, _T["new"], _T["this"]}
+# Hijo que cierra cada expresión compuesta (su último token es el del hijo)
+_RIGHT_CHILD = {BinaryOp: "right", UnaryOp: "expr", Assign: "value", TernaryExpr: "else_expr"}
+
+
+class ParseError(Exception):
+    def __init__(self, line: int, message: str):
+        super().__init__(f"[Line {line}] {message}")
+        self.line = line
+
+
+class _LexErrors(ErrorListener):
+    def __init__(self):
+        super().__init__()
+        self.errors: List[str] = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.errors.append(f"[Line {line}] {msg}")
+
+
+class PrattParser:
+    def __init__(self, source: str):
+        self.source = source
+        lexer = FastLexer(InputStream(source))
+        lexer.removeErrorListeners()
+        self._lex_errors = _LexErrors()
+        lexer.addErrorListener(self._lex_errors)
+
+        # Tokens en arreglos paralelos: sin objetos por token
+        types, starts, ends, lines, cols = [], [], [], [], []
+        for ttype, start, end in lexer.scan():
+            types.append(ttype)
+            starts.append(start)
+            ends.append(end)
+            lines.append(lexer.line)
+            cols.append(lexer.column)
+            if ttype == EOF:
+                break
+        self.types, self.starts, self.ends = types, starts, ends
+        self.lines, self.cols = lines, cols
+        self.i = 0
+        # id() de las asignaciones / ternarios escritos entre paréntesis
+        self._grouped = set()
+
+        self._statements = {
+            _T["let"]: self.variable_declaration,
+            _T["var"]: self.variable_declaration,
+            _T["const"]: self.constant_declaration,
+            _T["function"]: lambda: self.function_declaration(FuncDecl),
+            _T["class"]: self.class_declaration,
+            _T["print"]: self.print_statement,
+            _T["{"]: self.block,
+            _T["if"]: self.if_statement,
+            _T["while"]: self.while_statement,
+            _T["do"]: self.do_while_statement,
+            _T["for"]: self.for_statement,
+            _T["foreach"]: self.foreach_statement,
+            _T["try"]: self.try_catch_statement,
+            _T["switch"]: self.switch_statement,
+            _T["break"]: lambda: self._simple(BreakStmt()),
+            _T["continue"]: lambda: self._simple(ContinueStmt()),
+            _T["return"]: self.return_statement,
+        }
+
+    @property
+    def lex_errors(self) -> List[str]:
+        return self._lex_errors.errors
+
+    # ========================================
+    # TOKENS
+    # ========================================
+
+    def _text(self, i: int) -> str:
+        if self.types[i] == EOF:
+            return "<EOF>"
+        return self.source[self.starts[i]:self.ends[i]]
+
+    def _at(self, node, i: int):
+        node.line = self.lines[i]
+        node.column = self.cols[i]
+        return node
+
+    def _error(self, expecting: str):
+        i = self.i
+        raise ParseError(self.lines[i], f"mismatched input '{self._text(i)}' expecting {expecting}")
+
+    def _expect(self, ttype: int, what: Optional[str] = None) -> int:
+        i = self.i
+        if self.types[i] != ttype:
+            self._error(what or f"'{CompiscriptLexer.literalNames[ttype][1:-1]}'")
+        self.i = i + 1
+        return i
+
+    def _accept(self, ttype: int) -> bool:
+        if self.types[self.i] == ttype:
+            self.i += 1
+            return True
+        return False
+
+    def _identifier(self) -> str:
+        return self._text(self._expect(IDENT, "Identifier"))
+
+    # ========================================
+    # SENTENCIAS
+    # ========================================
+
+    def program(self) -> Program:
+        body = []
+        while self.types[self.i] != EOF:
+            body.append(self.statement())
+        return Program(body=body, line=1, column=0)
+
+    def statement(self):
+        handler = self._statements.get(self.types[self.i])
+        if handler is not None:
+            return handler()
+        node = self._assignment_or_expression()
+        self._expect(_T[";"])
+        return node
+
+    def _statements_until(self, *stops: int) -> list:
+        statements = []
+        while self.types[self.i] not in stops:
+            if self.types[self.i] == EOF:
+                self._error(" or ".join(f"'{CompiscriptLexer.literalNames[t][1:-1]}'" for t in stops))
+            statements.append(self.statement())
+        return statements
+
+    def block(self) -> Block:
+        start = self._expect(_T["{"])
+        statements = self._statements_until(_T["}"])
+        self.i += 1
+        return self._at(Block(statements=statements), start)
+
+    def _assignment_or_expression(self):
+        """
+        assignment (sin ';') | expression. Donde la alt 2 de assignment
+        (`expression '.' Identifier '=' expression`) es viable, ANTLR la
+        prefiere sobre expressionStatement; acá se reproduce esa elección.
+        """
+        start = self.i
+        expr = self.expression()
+        types, i = self.types, self.i
+        if types[i] == _T["."] and types[i + 1] == IDENT and types[i + 2] == _T["="]:
+            # `(e).p = v`, `-e.p`...: la expresión no pudo consumir `.p`
+            prop = self._text(i + 1)
+            self.i = i + 3
+            return self._property_assign(expr, prop, self.expression(), start)
+        if types[i] == _T["="]:
+            # `x + y.p = v`: `.p` quedó dentro del último operando
+            if not (types[i - 1] == IDENT and types[i - 2] == _T["."]):
+                self._error("';'")
+            obj, prop = self._peel_property(expr)
+            self.i = i + 1
+            return self._property_assign(obj, prop, self.expression(), start)
+        if types[start] == IDENT and types[start + 1] == _T["="]:
+            return expr                                 # alt 1: `x = v`
+        return self._split_property_assign(expr, start)
+
+    def _property_assign(self, obj, prop: str, value, start: int) -> Assign:
+        dest = self._at(PropertyAccess(obj=obj, prop=prop), start)
+        return self._at(Assign(dest=dest, value=value), start)
+
+    def _peel_property(self, expr):
+        """Separa el `.p` final de la espina derecha: devuelve (resto, p)."""
+        if isinstance(expr, PropertyAccess):
+            return expr.obj, expr.prop
+        attr = _RIGHT_CHILD[type(expr)]
+        rest, prop = self._peel_property(getattr(expr, attr))
+        setattr(expr, attr, rest)
+        return expr, prop
+
+    def _split_property_assign(self, expr, start: int):
+        """
+        `a[0] = b.p = 1;`, `c ? x : y.p = 1;`, `a.b = c.d = 1;`: la alt 2 corta
+        en el último `.p =` de la espina derecha y deja todo lo anterior como
+        objeto: Assign(PropertyAccess(<expr hasta y>, p), 1).
+        """
+        parent, attr, target = None, None, None
+        node, last = expr, (None, None)
+        while id(node) not in self._grouped:
+            if isinstance(node, Assign):
+                if node.index is None and isinstance(node.dest, PropertyAccess):
+                    parent, attr, target = last[0], last[1], node
+                last, node = (node, "value"), node.value
+            elif isinstance(node, TernaryExpr):
+                last, node = (node, "else_expr"), node.else_expr
+            else:
+                break
+        if parent is None:
+            return expr
+        setattr(parent, attr, target.dest.obj)
+        return self._property_assign(expr, target.dest.prop, target.value, start)
+
+    def variable_declaration(self) -> VarDecl:
+        start = self.i
+        self.i += 1                                     # 'let' | 'var'
+        name = self._identifier()
+        declared = self._type() if self._accept(_T[":"]) else None
+        init = self.expression() if self._accept(_T["="]) else None
+        self._expect(_T[";"])
+        return self._at(VarDecl(name=name, declared_type=declared, init=init), start)
+
+    def constant_declaration(self) -> VarDecl:
+        start = self.i
+        self.i += 1
+        name = self._identifier()
+        declared = self._type() if self._accept(_T[":"]) else None
+        self._expect(_T["="])
+        init = self.expression()
+        self._expect(_T[";"])
+        return self._at(VarDecl(name=name, is_const=True, declared_type=declared, init=init), start)
+
+    def _type(self) -> Type:
+        i = self.i
+        if self.types[i] not in _BASE_TYPES:
+            self._error("type")
+        self.i = i + 1
+        dims = 0
+        while self.types[self.i] == _T["["]:
+            self.i += 1
+            self._expect(_T["]"])
+            dims += 1
+        return array_type(self._text(i), dims)
+
+    def print_statement(self) -> PrintStmt:
+        start = self.i
+        self.i += 1
+        self._expect(_T["("])
+        expr = self.expression()
+        self._expect(_T[")"])
+        self._expect(_T[";"])
+        return self._at(PrintStmt(expr=expr), start)
+
+    def _condition(self):
+        self._expect(_T["("])
+        cond = self.expression()
+        self._expect(_T[")"])
+        return cond
+
+    def if_statement(self) -> IfStmt:
+        start = self.i
+        self.i += 1
+        cond = self._condition()
+        then_block = self.block()
+        else_block = self.block() if self._accept(_T["else"]) else None
+        return self._at(IfStmt(cond=cond, then_block=then_block, else_block=else_block), start)
+
+    def while_statement(self) -> WhileStmt:
+        start = self.i
+        self.i += 1
+        cond = self._condition()
+        return self._at(WhileStmt(cond=cond, body=self.block()), start)
+
+    def do_while_statement(self) -> WhileStmt:
+        start = self.i
+        self.i += 1
+        body = self.block()
+        self._expect(_T["while"])
+        cond = self._condition()
+        self._expect(_T[";"])
+        return self._at(WhileStmt(is_do_while=True, cond=cond, body=body), start)
+
+    def for_statement(self) -> ForStmt:
+        start = self.i
+        self.i += 1
+        self._expect(_T["("])
+        if self.types[self.i] in (_T["let"], _T["var"]):
+            init = self.variable_declaration()
+        elif self._accept(_T[";"]):
+            init = None
+        else:
+            # solo `x = e;` o `e.p = e;` (la regla assignment)
+            at = self.i
+            init = self._assignment_or_expression()
+            if not (isinstance(init, Assign) and init.index is None
+                    and isinstance(init.dest, (Identifier, PropertyAccess))):
+                self.i = at
+                self._error("assignment")
+            self._expect(_T[";"])
+        cond = None if self.types[self.i] == _T[";"] else self.expression()
+        self._expect(_T[";"])
+        update = None if self.types[self.i] == _T[")"] else self.expression()
+        self._expect(_T[")"])
+        return self._at(ForStmt(init=init, cond=cond, update=update, body=self.block()), start)
+
+    def foreach_statement(self) -> ForEachStmt:
+        start = self.i
+        self.i += 1
+        self._expect(_T["("])
+        at = self._expect(IDENT, "Identifier")
+        item = self._at(VarDecl(name=self._text(at)), at)
+        self._expect(_T["in"])
+        array = self.expression()
+        self._expect(_T[")"])
+        return self._at(ForEachStmt(array=array, item=item, body=self.block()), start)
+
+    def try_catch_statement(self) -> TryCatchStmt:
+        start = self.i
+        self.i += 1
+        try_block = self.block()
+        self._expect(_T["catch"])
+        self._expect(_T["("])
+        err_name = self._identifier()
+        self._expect(_T[")"])
+        return self._at(TryCatchStmt(try_block=try_block, err_name=err_name,
+                                     catch_block=self.block()), start)
+
+    def switch_statement(self) -> SwitchStatement:
+        start = self.i
+        self.i += 1
+        variable = self._condition()
+        self._expect(_T["{"])
+        cases, default = [], None
+        while self.types[self.i] == _T["case"]:
+            at = self.i
+            self.i += 1
+            literal = self.expression()
+            self._expect(_T[":"])
+            block = self._at(Block(statements=self._statements_until(_T["case"], _T["default"], _T["}"])), at)
+            cases.append(self._at(SwitchCase(literal=literal, case_block=block), at))
+        if self.types[self.i] == _T["default"]:
+            at = self.i
+            self.i += 1
+            self._expect(_T[":"])
+            block = self._at(Block(statements=self._statements_until(_T["}"])), at)
+            default = self._at(DefaultCase(default_block=block), at)
+        self._expect(_T["}"])
+        return self._at(SwitchStatement(variable=variable, cases=cases, default=default), start)
+
+    def _simple(self, node):
+        start = self.i
+        self.i += 1
+        self._expect(_T[";"])
+        return self._at(node, start)
+
+    def return_statement(self) -> ReturnStmt:
+        start = self.i
+        self.i += 1
+        expr = None if self.types[self.i] == _T[";"] else self.expression()
+        self._expect(_T[";"])
+        return self._at(ReturnStmt(expr=expr), start)
+
+    def function_declaration(self, cls=FuncDecl):
+        start = self._expect(_T["function"])
+        name = self._identifier()
+        self._expect(_T["("])
+        params: List[Tuple[str, Optional[Type]]] = []
+        if self.types[self.i] != _T[")"]:
+            while True:
+                pname = self._identifier()
+                params.append((pname, self._type() if self._accept(_T[":"]) else None))
+                if not self._accept(_T[","]):
+                    break
+        self._expect(_T[")"])
+        ret = self._type() if self._accept(_T[":"]) else None
+        return self._at(cls(name=name, params=params, ret=ret, body=self.block()), start)
+
+    def class_declaration(self) -> ClassDecl:
+        start = self.i
+        self.i += 1
+        name = self._identifier()
+        parent = self._identifier() if self._accept(_T[":"]) else None
+        self._expect(_T["{"])
+        members = []
+        while self.types[self.i] != _T["}"]:
+            ttype = self.types[self.i]
+            if ttype == _T["function"]:
+                members.append(self.function_declaration(MethodDecl))
+            elif ttype in (_T["let"], _T["var"]):
+                members.append(self.variable_declaration())
+            elif ttype == _T["const"]:
+                members.append(self.constant_declaration())
+            else:
+                self._error("class member")
+        self.i += 1
+        return self._at(ClassDecl(name=name, members=members, parent=parent), start)
+
+    # ========================================
+    # EXPRESIONES
+    # ========================================
+
+    def expression(self):
+        start = self.i
+        if self.types[start] in _ATOMS:
+            lhs = self._left_hand_side()
+            if self.types[self.i] == _T["="]:
+                self.i += 1
+                return self._at(assign_to(lhs, self.expression()), start)
+            cond = self._binary_from(lhs, 1, start)
+        else:
+            cond = self._binary(1)
+        if self.types[self.i] != _T["?"]:
+            return cond
+        self.i += 1
+        then_expr = self.expression()
+        self._expect(_T[":"])
+        else_expr = self.expression()
+        return self._at(TernaryExpr(cond=cond, then_expr=then_expr, else_expr=else_expr), start)
+
+    def _binary(self, min_prec: int):
+        start = self.i
+        return self._binary_from(self._unary(), min_prec, start)
+
+    def _binary_from(self, left, min_prec: int, start: int):
+        types = self.types
+        while True:
+            prec = BINARY_PRECEDENCE.get(types[self.i])
+            if prec is None or prec < min_prec:
+                return left
+            op = self._text(self.i)
+            self.i += 1
+            right = self._binary(prec + 1)
+            left = self._at(BinaryOp(op=op, left=left, right=right), start)
+
+    def _unary(self):
+        i = self.i
+        ttype = self.types[i]
+        if ttype == _T["-"] or ttype == _T["!"]:
+            self.i = i + 1
+            return self._at(UnaryOp(op=self._text(i), expr=self._unary()), i)
+        if ttype == LITERAL:
+            self.i = i + 1
+            return self._at(Literal(value=literal_value(self._text(i))), i)
+        if ttype in _CONSTANTS:
+            self.i = i + 1
+            return self._at(Literal(value=_CONSTANTS[ttype]), i)
+        if ttype == _T["["]:
+            self.i = i + 1
+            elements = self._expressions(_T["]"])
+            return self._at(ArrayLiteral(elements=elements), i)
+        if ttype == _T["("]:
+            self.i = i + 1
+            expr = self.expression()
+            self._expect(_T[")"])
+            if isinstance(expr, (Assign, TernaryExpr)):
+                self._grouped.add(id(expr))
+            return expr
+        if ttype in _ATOMS:
+            return self._left_hand_side()
+        self._error("expression")
+
+    def _expressions(self, close: int) -> list:
+        """(expression (',' expression)*)? close"""
+        items = []
+        if not self._accept(close):
+            items.append(self.expression())
+            while self._accept(_T[","]):
+                items.append(self.expression())
+            self._expect(close)
+        return items
+
+    def _left_hand_side(self):
+        start = self.i
+        ttype = self.types[start]
+        self.i = start + 1
+        if ttype == IDENT:
+            node = self._at(Identifier(name=self._text(start)), start)
+        elif ttype == _T["this"]:
+            node = self._at(ThisExpr(), start)
+        else:
+            class_name = self._identifier()
+            self._expect(_T["("])
+            node = self._at(NewExpr(class_name=class_name, args=self._expressions(_T[")"])), start)
+
+        types = self.types
+        while True:
+            ttype = types[self.i]
+            if ttype == _T["("]:
+                self.i += 1
+                node = Call(name=call_name(node), callee=node, args=self._expressions(_T[")"]))
+            elif ttype == _T["["]:
+                self.i += 1
+                index = self.expression()
+                self._expect(_T["]"])
+                node = Indexed(name="*" + getattr(node, "name", ""), array=node, index=index)
+            elif ttype == _T["."] and types[self.i + 1] == IDENT:
+                # `lhs.p = v` (PropertyAssignExpr) da el mismo árbol que
+                # AssignExpr sobre `lhs.p`, así que `.p` se consume siempre
+                node = PropertyAccess(obj=node, prop=self._text(self.i + 1))
+                self.i += 2
+            else:
+                return node
+            self._at(node, start)
+
+
+def parse(source: str) -> Tuple[Optional[Program], List[str]]:
+    """
+    Parsea `source` y devuelve (Program, errores). Con errores léxicos el
+    árbol se arma igual sobre los tokens válidos (como ANTLR); con un error
+    sintáctico devuelve (None, errores).
+    """
+    parser = PrattParser(source)
+    try:
+        tree = parser.program()
+    except ParseError as e:
+        return None, parser.lex_errors + [str(e)]
+    return tree, parser.lex_errors
@@ -0,0 +1,186 @@
+# src/profiling.py
+"""
+Profiling bajo demanda de una compilación (CompilerServer ?profile=...).
+
+Dos modos:
+  - "sample": un hilo toma la pila del hilo que compila cada `interval`
+    segundos. Da stacks colapsados (formato de flamegraph.pl / speedscope:
+    "f1;f2;f3 N") y top-N por tiempo propio y acumulado.
+  - "cprofile": cProfile determinista. Da top-N exacto (llamadas, tottime,
+    cumtime) pero no stacks completos.
+
+El servidor solo importa y llama esto cuando el request lo pide; sin el flag
+no hay ningún costo extra.
+
+Uso:
+    result, report = profile_call(lambda: compile_source(code), mode="sample")
+    report.save_collapsed("/tmp/asm.folded")
+"""
+
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+MODES = ("sample", "cprofile")
+
+
+@dataclass
+class ProfileReport:
+    mode: str
+    duration: float
+    samples: int = 0
+    top: List[Dict[str, object]] = field(default_factory=list)
+    collapsed: str = ""                 # solo en modo "sample"
+    path: Optional[str] = None          # archivo .folded si se guardó
+
+    def to_dict(self) -> dict:
+        return {
+            "mode": self.mode,
+            "duration": self.duration,
+            "samples": self.samples,
+            "top": self.top,
+            "collapsed": self.collapsed,
+            "path": self.path,
+        }
+
+    def save_collapsed(self, path: str) -> str:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.collapsed)
+        self.path = path
+        return path
+
+
+def _frame_name(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+# ========================================
+# SAMPLING
+# ========================================
+
+class StackSampler:
+    """
+    Muestrea la pila de `thread_id`. La resolución real está acotada por el
+    switch interval del GIL (sys.getswitchinterval(), 5 ms por defecto).
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        # Frames del propio profiler que no deben salir en los stacks
+        self._skip = {profile_call.__code__, _sample.__code__}
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                if frame.f_code in self._skip:
+                    break
+                stack.append(_frame_name(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+                self.samples += 1
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {n}\n" for stack, n in self.stacks.most_common())
+
+    def top(self, n: int) -> List[Dict[str, object]]:
+        own: Counter = Counter()
+        total: Counter = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")
+            own[frames[-1]] += count
+            for name in set(frames):
+                total[name] += count
+        samples = max(1, self.samples)
+        return [
+            {"function": name, "self": own[name], "total": total[name],
+             "self_pct": round(100.0 * own[name] / samples, 1)}
+            for name, _ in own.most_common(n)
+        ]
+
+
+def _sample(fn: Callable, interval: float, top: int) -> Tuple[object, ProfileReport]:
+    sampler = StackSampler(threading.get_ident(), interval)
+    sampler.start()
+    start = time.perf_counter()
+    try:
+        result = fn()
+    finally:
+        duration = time.perf_counter() - start
+        sampler.stop()
+    return result, ProfileReport(
+        mode="sample", duration=duration, samples=sampler.samples,
+        top=sampler.top(top), collapsed=sampler.collapsed(),
+    )
+
+
+# ========================================
+# CPROFILE
+# ========================================
+
+def _cprofile(fn: Callable, top: int) -> Tuple[object, ProfileReport]:
+    prof = cProfile.Profile()
+    start = time.perf_counter()
+    prof.enable()
+    try:
+        result = fn()
+    finally:
+        prof.disable()
+        duration = time.perf_counter() - start
+    stats = pstats.Stats(prof)
+    rows = []
+    for (filename, line, name), (cc, nc, tt, ct, _callers) in stats.stats.items():
+        rows.append({
+            "function": f"{name} ({os.path.basename(filename)}:{line})",
+            "calls": nc, "tottime": round(tt, 6), "cumtime": round(ct, 6),
+        })
+    rows.sort(key=lambda r: r["tottime"], reverse=True)
+    return result, ProfileReport(mode="cprofile", duration=duration, top=rows[:top])
+
+
+def profile_call(
+    fn: Callable,
+    mode: str = "sample",
+    top: int = 20,
+    interval: float = 0.001,
+    out_dir: Optional[str] = None,
+    name: str = "compile",
+) -> Tuple[object, ProfileReport]:
+    """
+    Corre `fn()` bajo el profiler pedido. Si `out_dir` está definido y hay
+    stacks, guarda `<out_dir>/<name>-<timestamp>.folded`.
+    """
+    if mode not in MODES:
+        raise ValueError(f"modo de profiling desconocido: {mode} (usa {MODES})")
+    if mode == "cprofile":
+        result, report = _cprofile(fn, top)
+    else:
+        result, report = _sample(fn, interval, top)
+    if out_dir and report.collapsed:
+        os.makedirs(out_dir, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        safe = name.replace("/", "_")
+        report.save_collapsed(os.path.join(out_dir, f"{safe}-{stamp}-{os.getpid()}-{threading.get_ident()}.folded"))
+    return result, report
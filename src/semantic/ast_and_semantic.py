@@ -5,6 +5,7 @@ from typing import Optional, List, Dict, Any
 from symbol_table.symbol_table import Symbol, SymbolTable
 from ast_nodes import *
 from symbol_table.runtime_layout import FrameManager
+from compile_trace import CompileTrace, NULL_TRACE
 
 RESERVED_FUNCTIONS = [
     "main",
@@ -68,7 +69,8 @@ def _get_type_text_from_ctx(ctx) -> Optional[str]:
     return None
     
 class AstAndSemantic(CompiscriptListener):
-    def __init__(self):
+    def __init__(self, trace: Optional[CompileTrace] = None):
+        self.trace = trace or NULL_TRACE
         self.resolved_symbols : Dict[Any, Symbol] = {}
         self.ast: Dict[Any, ASTNode] = {}
         self.types: Dict[Any, Type] = {}
@@ -207,6 +209,8 @@ class AstAndSemantic(CompiscriptListener):
         body = [self.ast.get(s) for s in ctx.statement()]
         self.program.body = [s for s in body if s is not None]
         self.program.ty = NULL
+        self.trace.set("semantic.errors", len(self.errors))
+        self.trace.set("semantic.resolved_symbols", len(self.resolved_symbols))
         # print(self.table.print_table())
 
     def enterBlock(self, ctx: CompiscriptParser.BlockContext):
@@ -944,14 +948,14 @@ class AstAndSemantic(CompiscriptListener):
             self.ast[ctx.parentCtx] = node
             self.types[ctx.parentCtx] = ty
 
+    def exitOperandExpr(self, ctx: CompiscriptParser.OperandExprContext):
+        self.ast[ctx] = self.ast.get(ctx.primaryExpr())
+        self.types[ctx] = self.types.get(ctx.primaryExpr(), ERROR)
+
     def exitUnaryExpr(self, ctx: CompiscriptParser.UnaryExprContext):
-        if ctx.primaryExpr():
-            self.ast[ctx] = self.ast.get(ctx.primaryExpr())
-            self.types[ctx] = self.types.get(ctx.primaryExpr(), ERROR)
-            return
         op = ctx.getChild(0).getText()
-        e_node = self.ast.get(ctx.unaryExpr())
-        e_ty = self.types.get(ctx.unaryExpr(), ERROR)
+        e_node = self.ast.get(ctx.operatorExpr())
+        e_ty = self.types.get(ctx.operatorExpr(), ERROR)
         if op == "!":
             ty = BOOL if e_ty == BOOL else ERROR
         elif op == "-":
@@ -968,50 +972,35 @@ class AstAndSemantic(CompiscriptListener):
         return BinaryOp(op=op_text, left=l, right=r, ty=ty), ty
 
 ########
+    # operatorExpr (recursión izquierda): cada operación binaria es un
+    # contexto con exactamente dos operandos, ctx.operatorExpr(0) y (1)
     def exitMultiplicativeExpr(self, ctx: CompiscriptParser.MultiplicativeExprContext):
-        if len(ctx.unaryExpr()) == 1:            
-            sub = ctx.unaryExpr(0)
-            self.ast[ctx] = self.ast.get(sub)
-            self.types[ctx] = self.types.get(sub, ERROR)
-            return
-        op = ctx.getChild(1).getText()
-        node, ty = self._bin2(ctx.unaryExpr(0), ctx.unaryExpr(1), op)
+        op = ctx.op.text
+        node, ty = self._bin2(ctx.operatorExpr(0), ctx.operatorExpr(1), op)
         compat = (node.right.ty == node.left.ty) and (node.right.ty == INT)
         if (not compat):
             self.errors.append(f"No se puede aplicar {op} a tipos \'{node.left.ty}\' y \'{node.right.ty}\'")
         self.ast[ctx] = node; self.types[ctx] = ty
 
     def exitAdditiveExpr(self, ctx: CompiscriptParser.AdditiveExprContext):
-        if len(ctx.multiplicativeExpr()) == 1:
-            sub = ctx.multiplicativeExpr(0)
-            self.ast[ctx] = self.ast.get(sub); self.types[ctx] = self.types.get(sub, ERROR)
-            return
-        op = ctx.getChild(1).getText()
-        node, ty = self._bin2(ctx.multiplicativeExpr(0), ctx.multiplicativeExpr(1), op)
+        op = ctx.op.text
+        node, ty = self._bin2(ctx.operatorExpr(0), ctx.operatorExpr(1), op)
         compat = (node.right.ty == node.left.ty) and ((node.right.ty == STR) or (node.right.ty == INT))
         if (not compat):
             self.errors.append(f"No se puede aplicar {op} a tipos \'{node.left.ty}\' y \'{node.right.ty}\'")
         self.ast[ctx] = node; self.types[ctx] = ty
 
     def exitLogicalAndExpr(self, ctx: CompiscriptParser.LogicalAndExprContext):
-        if len(ctx.equalityExpr()) == 1:
-            sub = ctx.equalityExpr(0)
-            self.ast[ctx] = self.ast.get(sub); self.types[ctx] = self.types.get(sub, ERROR)
-            return
-        op = ctx.getChild(1).getText()
-        node, ty = self._bin2(ctx.equalityExpr(0), ctx.equalityExpr(1), op)
+        op = ctx.op.text
+        node, ty = self._bin2(ctx.operatorExpr(0), ctx.operatorExpr(1), op)
         compat = (node.right.ty == node.left.ty) and (node.right.ty == BOOL)
         if (not compat):
             self.errors.append(f"No se puede aplicar {op} a tipos \'{node.left.ty}\' y \'{node.right.ty}\'")
         self.ast[ctx] = node; self.types[ctx] = ty
 
     def exitLogicalOrExpr(self, ctx: CompiscriptParser.LogicalOrExprContext):
-        if len(ctx.logicalAndExpr()) == 1:
-            sub = ctx.logicalAndExpr(0)
-            self.ast[ctx] = self.ast.get(sub); self.types[ctx] = self.types.get(sub, ERROR)
-            return
-        op = ctx.getChild(1).getText()
-        node, ty = self._bin2(ctx.logicalAndExpr(0), ctx.logicalAndExpr(1), "||")
+        op = ctx.op.text
+        node, ty = self._bin2(ctx.operatorExpr(0), ctx.operatorExpr(1), op)
         compat = (node.right.ty == node.left.ty) and (node.right.ty == BOOL)
         if (not compat):
             self.errors.append(f"No se puede aplicar {op} a tipos \'{node.left.ty}\' y \'{node.right.ty}\'")
@@ -1019,21 +1008,11 @@ class AstAndSemantic(CompiscriptListener):
 ######
 
     def exitRelationalExpr(self, ctx: CompiscriptParser.RelationalExprContext):
-        if len(ctx.additiveExpr()) == 1:
-            sub = ctx.additiveExpr(0)
-            self.ast[ctx] = self.ast.get(sub); self.types[ctx] = self.types.get(sub, ERROR)
-            return
-        op = ctx.getChild(1).getText()
-        node, ty = self._bin2(ctx.additiveExpr(0), ctx.additiveExpr(1), op)
+        node, ty = self._bin2(ctx.operatorExpr(0), ctx.operatorExpr(1), ctx.op.text)
         self.ast[ctx] = node; self.types[ctx] = ty
 
     def exitEqualityExpr(self, ctx: CompiscriptParser.EqualityExprContext):
-        if len(ctx.relationalExpr()) == 1:
-            sub = ctx.relationalExpr(0)
-            self.ast[ctx] = self.ast.get(sub); self.types[ctx] = self.types.get(sub, ERROR)
-            return
-        op = ctx.getChild(1).getText()
-        node, ty = self._bin2(ctx.relationalExpr(0), ctx.relationalExpr(1), op)
+        node, ty = self._bin2(ctx.operatorExpr(0), ctx.operatorExpr(1), ctx.op.text)
         self.ast[ctx] = node; self.types[ctx] = ty
 
     def exitExpression(self, ctx: CompiscriptParser.ExpressionContext):
@@ -1311,18 +1290,18 @@ class AstAndSemantic(CompiscriptListener):
         self.types[ctx] = ty
 
     def exitTernaryExpr(self, ctx: CompiscriptParser.TernaryExprContext):
-        # conditionalExpr: logicalOrExpr ('?' expression ':' expression)?
+        # conditionalExpr: operatorExpr ('?' expression ':' expression)?
         if ctx.getChildCount() == 1:
-            node = self.ast.get(ctx.logicalOrExpr())
-            ty = self.types.get(ctx.logicalOrExpr(), ERROR)
+            node = self.ast.get(ctx.operatorExpr())
+            ty = self.types.get(ctx.operatorExpr(), ERROR)
         else:
-            cond_ty = self.types.get(ctx.logicalOrExpr(), ERROR)
+            cond_ty = self.types.get(ctx.operatorExpr(), ERROR)
             then_ty = self.types.get(ctx.expression(0), ERROR)
             else_ty = self.types.get(ctx.expression(1), ERROR)
             if cond_ty != BOOL:
                 self.errors.append("La condicion del operador ternario debe ser boolean")
             ty = then_ty if then_ty == else_ty else ERROR
-            node = self.ast.get(ctx.logicalOrExpr())  # opcional: crear nodo Ternary
+            node = self.ast.get(ctx.operatorExpr())  # opcional: crear nodo Ternary
 
         self.ast[ctx] = node
         self.types[ctx] = ty
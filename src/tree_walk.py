@@ -0,0 +1,91 @@
+# src/tree_walk.py
+"""
+Recorridos del parse tree de ANTLR sin recursión de Python.
+
+ParseTreeWalker.walk y ParseTreeVisitor.visit del runtime bajan uno o más
+frames de Python por nivel del árbol: un programa con bloques o expresiones
+muy anidados termina en RecursionError (o obliga a subir
+sys.setrecursionlimit). Acá la profundidad vive en pilas explícitas:
+
+  - IterativeWalker: reemplazo directo de ParseTreeWalker para listeners
+    (AstAndSemantic). Mismo orden de enter/exit/visitTerminal.
+  - TrampolineVisitor: base para visitors cuyos visit* son generadores.
+    En vez de `x = self.visit(hijo)` el handler hace `x = (yield hijo)` y
+    visit() lleva la pila de generadores. Un visit* que no es generador se
+    comporta como siempre, y visit() se puede seguir llamando desde adentro
+    de un handler (abre otro trampolín).
+
+    Las excepciones de un hijo se relanzan dentro del generador del padre
+    (generator.throw), igual que con la recursión normal.
+"""
+
+from types import GeneratorType
+
+from antlr4.tree.Tree import ErrorNode, ParseTreeVisitor, ParseTreeWalker, TerminalNode
+
+
+class IterativeWalker(ParseTreeWalker):
+    def walk(self, listener, t):
+        stack = [(t, False)]
+        while stack:
+            node, exiting = stack.pop()
+            if exiting:
+                self.exitRule(listener, node)
+            elif isinstance(node, ErrorNode):
+                listener.visitErrorNode(node)
+            elif isinstance(node, TerminalNode):
+                listener.visitTerminal(node)
+            else:
+                self.enterRule(listener, node)
+                stack.append((node, True))
+                if node.children:
+                    stack.extend((child, False) for child in reversed(node.children))
+
+
+class TrampolineVisitor(ParseTreeVisitor):
+    def visit(self, tree):
+        result = tree.accept(self)
+        if not isinstance(result, GeneratorType):
+            return result
+
+        stack = [result]
+        value = error = None
+        while stack:
+            try:
+                if error is None:
+                    child = stack[-1].send(value)
+                else:
+                    # se limpia antes: si el padre la atrapa y termina,
+                    # no hay que volver a lanzarla al abuelo
+                    pending, error = error, None
+                    child = stack[-1].throw(pending)
+            except StopIteration as stop:
+                stack.pop()
+                value = stop.value
+                continue
+            except Exception as e:
+                stack.pop()
+                if not stack:
+                    raise
+                error = e
+                continue
+
+            try:
+                result = child.accept(self)
+            except Exception as e:
+                error = e
+                continue
+            if isinstance(result, GeneratorType):
+                stack.append(result)
+                value = None
+            else:
+                value = result
+        return value
+
+    def visitChildren(self, node):
+        result = self.defaultResult()
+        for child in node.getChildren():
+            if not self.shouldVisitNextChild(node, result):
+                break
+            result = self.aggregateResult(result, (yield child))
+        return result
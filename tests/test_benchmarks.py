@@ -0,0 +1,62 @@
+from pathlib import Path
+
+from benchmarks.bench import measure, compare, asm_counts, compile_once, PHASES
+from benchmarks.scaling import analyze, fit_exponent
+from benchmarks.synth import ProgramShape, generate_program
+from intermediate.tac_interpreter import run_tac
+
+# /tests/test_benchmarks.py
+
+PROGRAMS = Path(__file__).resolve().parent.parent / "benchmarks" / "programs"
+
+
+def test_measure_records_phases_and_code_metrics():
+    rec = measure(PROGRAMS / "loops.cps", "O1", repeat=1)
+    assert "error" not in rec
+    assert set(rec["phases"]) == set(PHASES)
+    assert rec["tac_count"] > 0
+    assert rec["asm_instructions"] > 0
+    assert rec["sim_exit"] == "exit"
+    assert rec["sim_cycles"] >= rec["sim_instructions"]
+    assert set(rec["memory"]) == set(PHASES)
+    assert rec["peak_memory_kb"] == max(m["peak_kb"] for m in rec["memory"].values())
+
+
+def test_asm_counts_skips_labels_directives_and_comments():
+    asm = ".data\nx: .word 1\n.text\nmain:\n    # c\n    li $t0, 1\n    sw $t0, -8($fp)    # spill t0\nL0:\n"
+    assert asm_counts(asm) == {"asm_instructions": 2, "spills": 1}
+
+
+def test_compare_flags_only_regressions_beyond_threshold():
+    base = {"results": {"p@O1": {"time": 0.100, "tac_count": 10, "spills": 2}}}
+    noisy = {"results": {"p@O1": {"time": 0.104, "tac_count": 10, "spills": 2}}}
+    worse = {"results": {"p@O1": {"time": 0.100, "tac_count": 12, "spills": 1}}}
+    assert compare(noisy, base) == []
+    regressions = compare(worse, base)
+    assert len(regressions) == 1 and "tac_count" in regressions[0]
+
+
+def test_compare_checks_memory_per_phase():
+    base = {"results": {"p@O1": {"memory": {"parse": {"peak_kb": 500.0, "retained_kb": 200.0}}}}}
+    cur = {"results": {"p@O1": {"memory": {"parse": {"peak_kb": 520.0, "retained_kb": 400.0}}}}}
+    regressions = compare(cur, base)
+    assert len(regressions) == 1 and "memory.parse.retained_kb" in regressions[0]
+
+
+def test_synthetic_programs_compile_and_terminate():
+    for seed in range(3):
+        shape = ProgramShape(statements=12, functions=2, classes=1, max_depth=2)
+        source = generate_program(shape, seed)
+        assert source == generate_program(shape, seed)
+        out = compile_once(source, "O1")
+        assert run_tac(out["tac"]).exit_reason == "return"
+
+
+def test_fit_exponent_recovers_power_law():
+    xs = [10, 20, 40, 80]
+    assert abs(fit_exponent(xs, [3 * x for x in xs]) - 1.0) < 1e-9
+    assert abs(fit_exponent(xs, [0.5 * x * x for x in xs]) - 2.0) < 1e-9
+    samples = [{"lines": x, "phases": {p: (x * x * 1e-5 if p == "tac" else x * 1e-4) for p in PHASES}}
+               for x in xs]
+    fits = analyze(samples)
+    assert fits["tac"]["superlinear"] and not fits["parse"]["superlinear"]
@@ -0,0 +1,71 @@
+import json
+
+import tracemalloc
+
+from compile_trace import CompileTrace, NULL_TRACE
+from memory_report import MemoryTrace
+from pipeline import compile_source
+from code_generator.mips_generator import MIPSCodeGenerator
+
+# /tests/test_compile_trace.py
+
+PROGRAM = """
+function sq(x: integer): integer { return x * x; }
+let i: integer = 0;
+while (i < 3) { print(sq(i)); i = i + 1; }
+"""
+
+
+def test_pipeline_records_every_phase_and_counters():
+    trace = CompileTrace("t")
+    result = compile_source(PROGRAM, trace=trace)
+    assert result.errors == []
+    phases = [sp.name for sp in trace.spans if sp.depth == 0]
+    assert phases == ["lex", "parse", "semantic", "tac", "pre_analysis", "codegen"]
+    assert trace.counters["tac.instructions"] == len(result.tac)
+    assert trace.counters["tac.functions"] == 2
+    assert trace.counters.get("regalloc.spills", 0) == result.asm.count("# spill ")
+    assert trace.counters["asm.lines"] == result.asm.count("\n") + 1
+    nested = {sp.name for sp in trace.spans if sp.depth == 1}
+    assert {"pre.liveness", "codegen.function"} <= nested
+
+
+def test_errors_stop_pipeline_before_tac():
+    trace = CompileTrace()
+    result = compile_source("let x: integer = true;", trace=trace)
+    assert result.errors and result.tac == [] and result.asm is None
+    assert "tac" not in trace.phase_times()
+    assert trace.counters["semantic.errors"] == len(result.errors)
+
+
+def test_chrome_trace_export_and_no_stdout(capsys):
+    trace = CompileTrace("t")
+    compile_source(PROGRAM, trace=trace)
+    assert capsys.readouterr().out == ""     # el pre-análisis ya no imprime banners
+    events = json.loads(json.dumps(trace.to_chrome_trace()))["traceEvents"]
+    spans = [e for e in events if e["ph"] == "X"]
+    assert len(spans) == len(trace.spans)
+    assert all(e["dur"] >= 0 and e["ts"] >= 0 for e in spans)
+    assert [e for e in events if e["ph"] == "C"][0]["args"] == trace.counters
+
+
+def test_null_trace_records_nothing():
+    result = compile_source(PROGRAM)
+    MIPSCodeGenerator(result.tac, result.frame_manager).generate()
+    assert result.trace is NULL_TRACE
+    assert NULL_TRACE.spans == [] and NULL_TRACE.counters == {}
+
+
+def test_memory_trace_reports_peak_and_retained_per_phase():
+    with MemoryTrace("m", source_bytes=len(PROGRAM)) as trace:
+        result = compile_source(PROGRAM, trace=trace)
+    assert not tracemalloc.is_tracing()
+    assert result.errors == []
+    assert list(trace.memory) == ["lex", "parse", "semantic", "tac", "pre_analysis", "codegen"]
+    for mem in trace.memory.values():
+        assert mem.peak_kb >= mem.start_kb
+    # el parse tree queda vivo después del parse
+    assert trace.memory["parse"].retained_kb > 0 and trace.memory["parse"].top
+    assert trace.peak_kb == max(m.peak_kb for m in trace.memory.values())
+    data = trace.to_dict()["memory"]
+    assert data["peak_per_source_kb"] > 0 and "retained_kb" in data["phases"]["tac"]
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+from antlr4 import InputStream, CommonTokenStream
+from antlr4.error.ErrorListener import ErrorListener
+
+from parser.CompiscriptLexer import CompiscriptLexer
+from fast_lexer import FastLexer
+from pipeline import compile_source
+from benchmarks.synth import ProgramShape, generate_program
+
+# /tests/test_fast_lexer.py
+
+
+class _Errors(ErrorListener):
+    def __init__(self):
+        super().__init__()
+        self.errors = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.errors.append((line, column, msg))
+
+
+def tokens(lexer_cls, src):
+    lexer = lexer_cls(InputStream(src))
+    errors = _Errors()
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(errors)
+    stream = CommonTokenStream(lexer)
+    stream.fill()
+    toks = [(t.type, t.text, t.start, t.stop, t.line, t.column, t.channel) for t in stream.tokens]
+    return toks, errors.errors
+
+
+def assert_same(src):
+    assert tokens(FastLexer, src) == tokens(CompiscriptLexer, src), repr(src)
+
+
+@pytest.mark.parametrize("src", [
+    "let x: integer = 10; // comentario\nprint(x);",
+    "letter let _a1 1abc 007",
+    "a&&b||c!=d<=e>=f==g",
+    "/* multi\nlínea */ x /* sin cerrar",
+    "x\r\ny\t\"á é\"",
+    '"sin cerrar\nlet y = 1;',
+    '"sin cerrar al final',
+    "a & b | c",
+    "@ # $ \\ ' é",
+    "",
+])
+def test_same_tokens_and_errors_as_antlr(src):
+    assert_same(src)
+
+
+FRAGMENTS = ["let", "x", "_a1", "12", '"s t"', '"', "/*", "*/", "//", "/", "*", "\n", "\r", " ",
+             "\t", "&", "|", "&&", "||", "=", "==", "!", "!=", "<", "<=", ">", ">=", "@", "é",
+             "[", "]", ".", ";", "integer", "letter", "0"]
+
+
+def test_random_fragments_match_antlr():
+    rnd = random.Random(7)
+    for _ in range(400):
+        assert_same("".join(rnd.choice(FRAGMENTS) for _ in range(rnd.randint(1, 25))))
+
+
+def test_generated_programs_compile_identically():
+    for seed in range(3):
+        assert_same(generate_program(ProgramShape(statements=30, functions=3, classes=1), seed))
+        # sin clases: el parse LL con el DFA frío es lento
+        src = generate_program(ProgramShape(statements=15, functions=2, classes=0), seed)
+        fast = compile_source(src, lexer="fast")
+        slow = compile_source(src)
+        assert fast.errors == [] and fast.asm == slow.asm
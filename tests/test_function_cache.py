@@ -0,0 +1,89 @@
+from code_generator.mips_simulator import run_asm
+from function_cache import FunctionCache
+from pipeline import compile_source
+
+# /tests/test_function_cache.py
+#
+# Compilación incremental por función: labels y temporales locales a cada
+# función, y el cache solo regenera lo que cambió.
+
+SRC = """
+function sq(n: integer): integer { let r: integer = n * n; return r; }
+function pick(n: integer): integer { let r: integer = n; if (n > 2) { r = sq(n); } return r; }
+function twice(n: integer): integer { let a: integer = sq(n); return a + a; }
+let xs: integer[] = [1, 2, 3];
+print(pick(3));
+print(twice(xs[0]));
+print("listo");
+"""
+
+EDITED = SRC.replace("if (n > 2)", "if (n > 1)")
+
+
+def sections(tac):
+    """{función: texto de su TAC}."""
+    out, name = {}, "<preamble>"
+    for op in tac:
+        if op.op == "fn_decl":
+            name = op.result
+        out.setdefault(name, []).append(str(op))
+    return {k: "\n".join(v) for k, v in out.items()}
+
+
+def compile_ok(source, **kwargs):
+    result = compile_source(source, **kwargs)
+    assert result.errors == []
+    return result
+
+
+def test_editing_one_function_leaves_the_others_unchanged():
+    before = sections(compile_ok(SRC, stop_after="tac").tac)
+    after = sections(compile_ok(EDITED, stop_after="tac").tac)
+    changed = {name for name in before if before[name] != after[name]}
+    assert changed == {"func_pick"}
+
+
+def test_labels_are_local_to_each_function():
+    tac = compile_ok(SRC, stop_after="tac").tac
+    labels = [op.result for op in tac if op.op == "label"]
+    assert len(labels) == len(set(labels))
+    assert any(str(label).startswith("func_pick.L") for label in labels)
+    result = run_asm(compile_ok(SRC).asm, max_instructions=500_000)
+    assert result.output == "92listo"
+
+
+def test_shared_cache_reuses_unchanged_functions():
+    cache = FunctionCache()
+    compile_ok(SRC, cache=cache)
+    cache.stats.update(tac_hits=0, tac_misses=0, asm_hits=0, asm_misses=0)
+
+    result = compile_ok(EDITED, cache=cache)
+    # solo pick se regenera: el TAC de main (que la llama) no cambia
+    assert cache.stats["tac_hits"] == 2 and cache.stats["tac_misses"] == 1
+    assert cache.stats["asm_hits"] == 3 and cache.stats["asm_misses"] == 1
+    assert result.asm == compile_ok(EDITED).asm
+    assert compile_ok(EDITED, cache=cache).tac == result.tac
+
+
+def test_cached_program_runs_like_uncached():
+    cache = FunctionCache()
+    for _ in range(2):
+        asm = compile_ok(SRC, cache=cache).asm
+        assert run_asm(asm, max_instructions=500_000).output == "92listo"
+    assert cache.stats["tac_hits"] == 3
+
+
+def test_cow_marks_do_not_leak_through_the_cache():
+    # En P1 main escribe en el arreglo que f guarda en g: el literal de f
+    # queda "cow". P2 reusa f del cache sin escribir: debe compilar igual
+    # que sin cache.
+    f = "let g: integer[] = [0]; function f(): integer { g = [1, 2, 3]; return 0; } "
+    p1 = f + "let r: integer = f(); g[0] = 9; print(g[0]);"
+    p2 = f + "let r: integer = f(); print(r);"
+    cache = FunctionCache()
+    compile_ok(p1, cache=cache)
+    cached = compile_ok(p2, cache=cache)
+    assert cache.stats["tac_hits"] == 1
+    fresh = compile_ok(p2)
+    assert [str(op) for op in cached.tac] == [str(op) for op in fresh.tac]
+    assert cached.asm == fresh.asm
@@ -0,0 +1,78 @@
+import pytest
+
+from intermediate.ir_format import IRFormatError, TACParseError, dump_ir, format_tac, load_ir, parse_tac
+from intermediate.operands import Label, StrConst, Temp, Var
+from intermediate.tac_nodes import TACOP
+from pipeline import compile_source, emit_mips
+
+# /tests/test_ir_format.py
+#
+# IR binario (.ir) y TAC en texto: lo que se escribe se tiene que poder
+# volver a leer igual, y el backend tiene que dar el mismo asm.
+
+SRC = """
+class A { let v: integer; function constructor(v: integer) { this.v = v; } }
+function f(n: integer): integer { if (n < 2) { return n; } return f(n - 1) + 1; }
+let a: A = new A(3);
+let xs: integer[] = [1, 2, 3];
+let ys: integer[] = [a.v, 2];
+let s: string = "a, b" + " c";
+print(f(a.v) + xs[1] + ys[0]);
+print(s);
+"""
+
+
+def compiled():
+    result = compile_source(SRC, stop_after="tac")
+    assert result.errors == []
+    return result
+
+
+def test_binary_round_trip_keeps_ops_kinds_and_frames():
+    result = compiled()
+    module = load_ir(dump_ir(result.tac, result.frame_manager))
+    assert module.tac == result.tac
+    for a, b in zip(result.tac, module.tac):
+        for slot in ("arg1", "arg2", "result", "comment"):
+            assert type(getattr(a, slot)) is type(getattr(b, slot)), (a, slot)
+    assert emit_mips(module.tac, module.frame_manager) == emit_mips(result.tac, result.frame_manager)
+
+
+def test_binary_is_smaller_than_pretty_text():
+    result = compiled()
+    assert len(dump_ir(result.tac, result.frame_manager)) < len(format_tac(result.tac).encode())
+
+
+def test_text_round_trip():
+    result = compiled()
+    text = format_tac(result.tac)
+    assert parse_tac(text) == result.tac
+    assert format_tac(parse_tac(text)) == text
+
+
+def test_text_operands_with_commas_spaces_and_comments():
+    tac = [
+        TACOP(op="fn_decl", result="func_main"),
+        TACOP(op="=", arg1='"x, y # z"', result="t0", comment="copia"),
+        TACOP(op="print", arg1='"a b"'),
+        TACOP(op="if-goto", arg1="t0", arg2="L3"),
+        TACOP(op="nop", comment="solo comentario"),
+        TACOP(op="+", arg1="x", arg2="1", result="t1"),
+        TACOP(op="uminus", arg1="t1", result="t2"),
+        TACOP(op="return"),
+    ]
+    back = parse_tac(format_tac(tac))
+    assert back == tac
+    assert type(back[1].arg1) is StrConst and back[1].comment == "copia"
+    assert type(back[3].arg2) is Label and type(back[5].arg1) is Var
+    assert type(back[6].result) is Temp
+
+
+def test_bad_input_is_reported():
+    with pytest.raises(IRFormatError):
+        load_ir(b"NOPE" + bytes(16))
+    data = dump_ir(compiled().tac)
+    with pytest.raises(IRFormatError):
+        load_ir(data[: len(data) // 2])
+    with pytest.raises(TACParseError):
+        parse_tac("t0 =")
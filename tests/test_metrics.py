@@ -0,0 +1,55 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import CompilerServer
+from metrics import Registry
+
+# /tests/test_metrics.py
+
+
+def test_histogram_buckets_are_cumulative():
+    reg = Registry()
+    h = reg.histogram("lat_seconds", "latencia", ("endpoint",), buckets=(0.1, 1.0))
+    for v in (0.05, 0.5, 0.5, 3.0):
+        h.observe(v, endpoint="/asm")
+    text = reg.render()
+    assert 'lat_seconds_bucket{endpoint="/asm",le="0.1"} 1' in text
+    assert 'lat_seconds_bucket{endpoint="/asm",le="1"} 3' in text
+    assert 'lat_seconds_bucket{endpoint="/asm",le="+Inf"} 4' in text
+    assert 'lat_seconds_count{endpoint="/asm"} 4' in text
+    assert h.sum(endpoint="/asm") == pytest.approx(4.05)
+
+
+def test_metric_rejects_wrong_labels():
+    c = Registry().counter("c_total", "c", ("stage",))
+    with pytest.raises(ValueError):
+        c.inc(phase="x")
+
+
+def test_metrics_endpoint_reports_requests_phases_cache_and_errors():
+    client = TestClient(CompilerServer.app)
+    src = "function f(a: integer): integer { return a * 3; } print(f(2));"
+    before_hits = CompilerServer.CACHE_REQUESTS.value(cache="function_tac", result="hit")
+    before_sem = CompilerServer.COMPILE_ERRORS.value(stage="semantic")
+
+    first = client.post("/asm", json={"source": src}).json()
+    second = client.post("/asm", json={"source": src}).json()
+    assert first == second
+    client.post("/diagnostics", json={"source": "let b: integer = true;"})
+
+    text = client.get("/metrics").text
+    assert 'compiler_requests_total{endpoint="/asm",status="200"}' in text
+    assert 'compiler_phase_duration_seconds_count{phase="codegen"}' in text
+    assert "compiler_requests_in_flight 0" in text
+    assert "compiler_queue_depth 0" in text
+    assert "process_resident_memory_bytes" in text
+    assert 'compiler_parses_total{mode="sll"}' in text
+    # el segundo /asm reusa el TAC de f del cache por función
+    assert CompilerServer.CACHE_REQUESTS.value(cache="function_tac", result="hit") >= before_hits + 1
+    assert CompilerServer.COMPILE_ERRORS.value(stage="semantic") == before_sem + 1
+
+
+def test_startup_warmup_runs_before_first_request():
+    with TestClient(CompilerServer.app) as client:
+        assert CompilerServer.WARMUP_SECONDS.value() > 0
+        assert client.post("/tac/pretty", json={"source": "print(1);"}).status_code == 200
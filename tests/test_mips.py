@@ -17,9 +17,9 @@ def normalize_lines(s: str):
 #  Helpers
 # ============================
 
-def make_generator(tac):
+def make_generator(tac, **kwargs):
     fm = FrameManager()
-    gen = MIPSCodeGenerator(tac, fm)
+    gen = MIPSCodeGenerator(tac, fm, **kwargs)
     asm = gen.generate()
     return normalize_lines(asm)
 
@@ -158,7 +158,7 @@ def test_print_int_generates_syscall_1():
         TACOP(op="return", arg1="a"),
     ]
 
-    lines = make_generator(tac)
+    lines = make_generator(tac, buffered_print=False)
 
     # syscall de print int
     assert any("li $v0, 1" in ln for ln in lines)
@@ -174,7 +174,7 @@ def test_print_string_uses_data_label_and_syscall_4():
         TACOP(op="return", arg1="t0"),
     ]
 
-    lines = make_generator(tac)
+    lines = make_generator(tac, buffered_print=False)
 
     # Debe existir alguna etiqueta strX en .data
     data_labels = [ln for ln in lines if ln.strip().startswith("str")]
@@ -185,6 +185,42 @@ def test_print_string_uses_data_label_and_syscall_4():
     assert any("syscall" in ln for ln in lines)
 
 
+def test_buffered_print_calls_runtime_and_flushes_at_exit():
+    tac = [
+        TACOP(op="fn_decl", result="func_main"),
+        TACOP(op="=", arg1="42", result="a"),
+        TACOP(op="print", arg1="a"),
+        TACOP(op="=", arg1='"hola"', result="t0"),
+        TACOP(op="print_s", arg1="t0"),
+        TACOP(op="return", arg1="a"),
+    ]
+
+    lines = make_generator(tac, buffered_print=True)
+
+    # Los prints no hacen syscall directo: pasan por el buffer del runtime
+    assert not any(re.search(r"li \$v0, 1\b", ln) for ln in lines)
+    assert any("jal __rt_print_int" in ln for ln in lines)
+    assert any("jal __rt_print_str" in ln for ln in lines)
+    assert any(ln.strip() == "__rt_flush:" for ln in lines)
+
+    # El wrapper vacía el buffer antes del exit
+    main_idx = lines.index("main:")
+    exit_idx = next(i for i, ln in enumerate(lines) if "li $v0, 10" in ln)
+    assert any("jal __rt_flush" in ln for ln in lines[main_idx:exit_idx])
+
+
+def test_program_without_prints_has_no_output_runtime():
+    tac = [
+        TACOP(op="fn_decl", result="func_main"),
+        TACOP(op="=", arg1="3", result="a"),
+        TACOP(op="return", arg1="a"),
+    ]
+
+    lines = make_generator(tac)
+
+    assert not any("__rt_" in ln for ln in lines)
+
+
 # ======================================
 #  5) Funciones, parámetros y retornos
 # ======================================
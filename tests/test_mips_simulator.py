@@ -0,0 +1,187 @@
+import pytest
+from fastapi.testclient import TestClient
+from code_generator.mips_simulator import run_asm, MIPSSimulationError
+from pipeline import compile_source, emit_mips
+import CompilerServer
+
+# /tests/test_mips_simulator.py
+
+
+def compile_asm(code: str, **kwargs) -> str:
+    result = compile_source(code, stop_after="tac")
+    assert result.errors == []
+    return emit_mips(result.tac, result.frame_manager, **kwargs)
+
+
+def run(code: str, **kwargs):
+    return run_asm(compile_asm(code, **kwargs), max_instructions=500_000)
+
+
+# ======================================
+#  1) Ensamblado a mano
+# ======================================
+
+def test_handwritten_loop_counts_instructions():
+    asm = """
+    .data
+    msg: .asciiz "fin\\n"
+    .text
+    main:
+        li $t0, 0
+    loop:
+        addi $t0, $t0, 1
+        blt $t0, 3, loop
+        move $a0, $t0
+        li $v0, 1
+        syscall
+        la $a0, msg
+        li $v0, 4
+        syscall
+        li $v0, 10
+        syscall
+    """
+    result = run_asm(asm)
+    assert result.output == "3fin\n"
+    assert result.exit_reason == "exit"
+    # li + 3*(addi+blt) + move,li,syscall + la,li,syscall + li,syscall
+    assert result.stats.instructions == 1 + 6 + 3 + 3 + 2
+    assert result.stats.branches == 3
+    assert result.stats.branches_taken == 2
+    assert result.stats.syscalls == 3
+
+
+def test_load_use_stall_is_counted():
+    asm = """
+    .data
+    x: .word 5
+    .text
+    main:
+        lw $t0, x
+        addi $t1, $t0, 1
+        lw $t2, x
+        nop
+        addi $t3, $t2, 1
+        li $v0, 10
+        syscall
+    """
+    result = run_asm(asm)
+    assert result.stats.loads == 2
+    assert result.stats.load_use_stalls == 1
+
+
+def test_budget_stops_infinite_loop():
+    asm = """
+    .text
+    main:
+        j main
+    """
+    result = run_asm(asm, max_instructions=100)
+    assert result.exit_reason == "budget"
+    assert result.stats.instructions == 100
+
+
+def test_output_limit_stops_the_program():
+    asm = """
+    .text
+    main:
+        li $a0, 7
+        li $v0, 1
+        syscall
+        j main
+    """
+    result = run_asm(asm, max_instructions=10_000, max_output=5)
+    assert result.exit_reason == "output"
+    assert result.output == "77777"
+
+
+def test_sbrk_over_heap_limit_is_an_error():
+    asm = """
+    .text
+    main:
+        li $a0, 4096
+        li $v0, 9
+        syscall
+        j main
+    """
+    with pytest.raises(MIPSSimulationError, match="sbrk"):
+        run_asm(asm, max_instructions=10_000, max_heap=16 * 4096)
+
+
+def test_unknown_instruction_is_reported():
+    with pytest.raises(MIPSSimulationError):
+        run_asm(".text\nmain:\n    frob $t0, $t1\n")
+
+
+# ======================================
+#  2) Programas compilados
+# ======================================
+
+def test_compiled_loop_output_matches_in_both_print_modes():
+    code = """
+    let i: integer = 0;
+    while (i < 5) {
+      print(i * 3);
+      print(",");
+      i = i + 1;
+    }
+    """
+    buffered = run(code, buffered_print=True)
+    direct = run(code)
+    assert buffered.output == direct.output == "0,3,6,9,12,"
+    # el buffer de salida ahorra syscalls
+    assert buffered.stats.syscalls < direct.stats.syscalls
+
+
+def test_buffered_print_flushes_long_output_and_negatives():
+    code = """
+    let x = 0 - 7;
+    print(x);
+    let i = 0;
+    while (i < 300) { print(i); print(";"); i = i + 1; }
+    """
+    result = run(code, buffered_print=True)
+    assert result.exit_reason == "exit"
+    assert result.output == "-7" + "".join(f"{i};" for i in range(300))
+
+
+def test_string_concat_and_equality_run_correctly():
+    code = """
+    let s = "";
+    let i = 0;
+    while (i < 20) { s = s + "ab"; i = i + 1; }
+    let t = s;
+    t = t + "!";
+    s = s + "?";
+    print(t);
+    print(s);
+    if (s == t) { print("bad"); }
+    if (t == t + "") { print("ok"); }
+    """
+    result = run(code)
+    assert result.output == "ab" * 20 + "!" + "ab" * 20 + "?" + "ok"
+
+
+# ======================================
+#  3) /run en el servidor
+# ======================================
+
+def test_run_endpoint_clamps_the_budget(monkeypatch):
+    client = TestClient(CompilerServer.app)
+    src = "let i = 0; while (i < 1) { i = i + 0; }"
+    monkeypatch.setattr(CompilerServer, "RUN_MAX_INSTRUCTIONS", 1_000)
+    body = client.post("/run", json={"source": src, "max_instructions": 10**12}).json()
+    assert body["exit_reason"] == "budget"
+    assert body["stats"]["instructions"] == 1_000
+
+    for bad in (0, -5):
+        response = client.post("/run", json={"source": src, "max_instructions": bad})
+        assert response.status_code == 422
+
+
+def test_run_endpoint_caps_output(monkeypatch):
+    monkeypatch.setattr(CompilerServer, "RUN_MAX_OUTPUT", 10)
+    body = TestClient(CompilerServer.app).post(
+        "/run", json={"source": 'while (true) { print("ab"); }'}
+    ).json()
+    assert body["exit_reason"] == "output"
+    assert body["output"] == "ab" * 5
@@ -0,0 +1,69 @@
+from code_generator.pre_analysis import is_literal
+from code_generator.register_allocator import RegisterAllocator
+from intermediate.operands import (
+    BoolConst, IntConst, Label, NullConst, StrConst, Temp, Var, classify,
+)
+from intermediate.tac_interpreter import _constant
+from intermediate.tac_nodes import TACOP
+from pipeline import compile_source
+
+# /tests/test_operands.py
+#
+# Operandos tipados: se clasifican una vez al construir el TACOP y siguen
+# siendo el mismo texto para todo lo que los trata como str.
+
+
+def test_classify_value_operands():
+    kinds = {
+        "t12": Temp, "x": Var, "t": Var, "tmp1": Var, "-5": IntConst, "42": IntConst,
+        "true": BoolConst, "false": BoolConst, "null": NullConst, '"hi"': StrConst,
+    }
+    for text, kind in kinds.items():
+        assert type(classify(text)) is kind, text
+    assert classify("t12").id == 12
+    assert classify("-5").value == -5 and classify("false").value is False
+    assert classify('"hi"').value == "hi"
+    assert classify("x") is classify("".join(["x"]))
+
+
+def test_label_positions_depend_on_the_op():
+    assert type(TACOP(op="goto", arg1="L3").arg1) is Label
+    assert TACOP(op="goto", arg1="L3").arg1.id == 3
+    br = TACOP(op="if-goto", arg1="t0", arg2="L1")
+    assert type(br.arg1) is Temp and type(br.arg2) is Label
+    call = TACOP(op="call", arg1="func_f", result="t2")
+    assert type(call.arg1) is Label and call.arg1.id is None and type(call.result) is Temp
+    words = TACOP(op="DATA_WORDS", arg1="1, 2, 3", result="arr0")
+    assert type(words.arg1) is str and type(words.result) is Label
+
+
+def test_typed_operands_are_still_their_text():
+    ins = TACOP(op="+", arg1="x", arg2="1", result="t0")
+    assert ins == TACOP(op="+", arg1="x", arg2="1", result="t0")
+    assert ins.result == "t0" and {"t0": 1}[ins.result] == 1
+    assert str(ins) == "t0 = x + 1"
+    assert repr(ins.arg2) == "'1'"
+
+
+def test_generator_emits_typed_operands():
+    result = compile_source("let x: integer = 3;\nwhile (x < 5) { x = x + 1; }\nprint(x);", stop_after="tac")
+    assert result.errors == []
+    adds = [t for t in result.tac if t.op == "+"]
+    assert adds and all(type(t.result) is Temp for t in adds)
+    jumps = [t for t in result.tac if t.op in ("goto", "label")]
+    assert all(type(t.arg1 or t.result) is Label for t in jumps)
+    assert {type(t.arg1) for t in result.tac if t.op == "=" and t.result == "x"} == {Temp}
+
+
+def test_consumers_dispatch_on_type():
+    assert is_literal(classify("7")) and is_literal(classify('"s"'))
+    assert not is_literal(classify("t1")) and not is_literal(classify("x"))
+    assert is_literal("true") and not is_literal("y")  # texto suelto: se sigue parseando
+
+    assert _constant(classify("true"), {}) == (True, 1)
+    assert _constant(classify('"a\\n"'), {}) == (True, "a\n")
+    assert _constant(classify("x"), {}) == (False, None)
+
+    ra = RegisterAllocator(var_offsets={"x": -8, "t1": -12})
+    assert ra.get_register_for(classify("t1"), set(), for_read=False, for_write=True)[0].startswith("$t")
+    assert ra.get_register_for(classify("x"), set(), for_read=False, for_write=True)[0].startswith("$s")
@@ -50,3 +50,50 @@ def test_valid_programs_parse_ok(code):
 def test_invalid_programs_have_errors(code):
     parser = parse_code(code)
     assert parser.getNumberOfSyntaxErrors() > 0
+
+
+# ---------------- PARSE EN DOS ETAPAS (SLL -> LL) ---------------- #
+
+def two_stage(src: str):
+    from pipeline import ErrorCollector, parse_program, PARSE_STATS
+    errors = ErrorCollector()
+    stream = CommonTokenStream(CompiscriptLexer(InputStream(src)))
+    before = PARSE_STATS["ll_fallback"]
+    tree = parse_program(stream, errors)
+    return tree, errors.errors, PARSE_STATS["ll_fallback"] - before
+
+
+def test_two_stage_parse_uses_sll_for_plain_code():
+    tree, errors, fallbacks = two_stage("let a: integer[] = [1,2]; a[0] = 3; print(a[0] + 1);")
+    assert errors == [] and fallbacks == 0
+    assert tree.getChildCount() == 4          # 3 sentencias + EOF
+
+
+@pytest.mark.parametrize("code", [
+    "class C { let v: integer; function m() { this.v = 1; } }",   # conflicto SLL
+    "if (1 { print(1); }",
+])
+def test_two_stage_parse_falls_back_to_ll_with_same_errors(code):
+    tree, errors, fallbacks = two_stage(code)
+    assert fallbacks == 1
+    parser = parse_code(code)
+    assert len(errors) == parser.getNumberOfSyntaxErrors()
+
+
+def _rules(tree, acc):
+    if hasattr(tree, "getRuleIndex"):
+        acc.add(CompiscriptParser.ruleNames[tree.getRuleIndex()])
+        for child in tree.getChildren():
+            _rules(child, acc)
+    return acc
+
+
+def test_warmup_corpus_covers_every_rule_and_compiles():
+    import glob, os
+    from pipeline import WARMUP_DIR, compile_source
+    seen = set()
+    for path in glob.glob(os.path.join(WARMUP_DIR, "*.cps")):
+        result = compile_source(open(path, encoding="utf-8").read())
+        assert result.errors == [] and result.asm, path
+        _rules(result.tree, seen)
+    assert set(CompiscriptParser.ruleNames) - seen == set()
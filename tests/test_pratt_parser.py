@@ -0,0 +1,226 @@
+import glob
+import os
+import random
+
+import pytest
+
+import pipeline
+from pipeline import parse_ast
+from pratt_parser import PrattParser
+from ast_nodes import _iter_children, render_ascii
+
+# /tests/test_pratt_parser.py
+#
+# Tests diferenciales: PrattParser contra el parse tree de ANTLR + AstBuilder
+# (el oráculo). Mismo árbol, mismas posiciones, mismos programas aceptados y
+# misma línea del primer error.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def positions(node, path="program"):
+    out = [(path, type(node).__name__, node.line, node.column)]
+    for name, child in _iter_children(node):
+        out += positions(child, f"{path}.{name}")
+    return out
+
+
+def _first_syntax_error_line(errors):
+    syntax = [e for e in errors if "token recognition error" not in e]
+    return syntax[0].split("]")[0] if syntax else None
+
+
+def assert_same(src):
+    expected, expected_errors = parse_ast(src, "antlr")
+    got, got_errors = parse_ast(src, "pratt")
+    assert (expected is None) == (got is None), (src, expected_errors, got_errors)
+    if expected is None:
+        assert _first_syntax_error_line(got_errors) == _first_syntax_error_line(expected_errors), src
+        return
+    assert got == expected, src
+    assert positions(got) == positions(expected), src
+    assert got_errors == expected_errors
+
+
+def _corpus():
+    paths = glob.glob(os.path.join(ROOT, "benchmarks", "programs", "*.cps"))
+    paths += glob.glob(os.path.join(ROOT, "src", "warmup_corpus", "*.cps"))
+    paths += [os.path.join(ROOT, "input.cps")]
+    return sorted(p for p in paths if os.path.exists(p))
+
+
+@pytest.mark.parametrize("path", _corpus(), ids=os.path.basename)
+def test_corpus_builds_the_same_ast(path):
+    with open(path, encoding="utf-8") as f:
+        assert_same(f.read())
+
+
+@pytest.mark.parametrize("src", [
+    # la alt 2 de assignment gana sobre expressionStatement
+    "a.b = c.d = 1;",
+    "c ? x : y.p = 1;",
+    "a[0] = b.p = 1;",
+    "x = (a).p = 1;",
+    "x = -new K().q = 2;",
+    "x + y.p = 1;",
+    "(a).p = f()[0];",
+    "new K() = (x().p = b1);",
+    # alt 1 (`x = ...`) y asignaciones dentro de expresiones
+    "x = t ? a : b.p = 1;",
+    "print(a.b = c.d = 1);",
+    "for (o.p = 1; ; i = i + 1) { }",
+    # precedencia, sufijos y posiciones
+    "let x: integer[][] = -!a * (b + c) - d % 2 < 3 == true || null && \"s\";",
+    "f()(1)[2].x.y(3);\nthis.x = [1, [2], []];",
+    "switch (x) {\ncase 1:\nprint(1);\ncase 2:\ndefault:\n}",
+    "foreach (e in xs) { try { } catch (err) { break; } }",
+    "class B : A {\nlet a: integer;\nconst K = 1;\nfunction m(p, q: B[]): string { return; }\n}",
+    # inválidos
+    "(a.b) = 1;",
+    "for (a[0] = 1; ;) { }",
+    "let x = (b + c)[0];",
+    "if (x) print(1);",
+    "class C { print(1); }",
+    "let x = 1 +;\n",
+    "function f( { }",
+    "x = 1\ny = 2;",
+    "{ let a = 1;",
+    "a & b;",
+])
+def test_tricky_statements_match_antlr(src):
+    assert_same(src)
+
+
+# ---------------- PROGRAMAS ALEATORIOS ---------------- #
+
+OPS = ["||", "&&", "==", "!=", "<", "<=", ">", ">=", "+", "-", "*", "/", "%"]
+
+
+def _lhs(r, d):
+    s = r.choice(["x", "o", "this", "new K()"])
+    for _ in range(r.randrange(4 if d < 2 else 1)):
+        k = r.randrange(3)
+        if k == 0:
+            s += "(" + ", ".join(_expr(r, d + 2) for _ in range(r.randrange(3))) + ")"
+        elif k == 1:
+            s += f"[{_expr(r, d + 2)}]"
+        else:
+            s += "." + r.choice(["p", "q"])
+    return s
+
+
+def _expr(r, d=0):
+    k = r.randrange(13 if d < 2 else 3)
+    if k == 0:
+        return r.choice([str(r.randrange(100)), '"s"', "null", "true", "false", "this"])
+    if k in (1, 2):
+        return _lhs(r, d)
+    if k in (3, 4, 5):
+        return f"{_expr(r, d + 1)} {r.choice(OPS)} {_expr(r, d + 1)}"
+    if k == 6:
+        return f"{r.choice('-!')}{_expr(r, d + 1)}"
+    if k == 7:
+        return f"({_expr(r, d + 1)})"
+    if k == 8:
+        return f"{_expr(r, d + 1)} ? {_expr(r, d + 1)} : {_expr(r, d + 1)}"
+    if k == 9:
+        return f"{_lhs(r, d)} = {_expr(r, d + 1)}"
+    if k == 10:
+        return "[" + ", ".join(_expr(r, d + 1) for _ in range(r.randrange(3))) + "]"
+    if k == 11:
+        return f"new K({', '.join(_expr(r, d + 1) for _ in range(r.randrange(3)))})"
+    return f"{_expr(r, d + 1)}.p = {_expr(r, d + 1)}"
+
+
+def _block(r, d):
+    return "{\n" + "".join(_stmt(r, d + 1) for _ in range(r.randrange(3))) + "}"
+
+
+def _type(r):
+    return r.choice(["integer", "string", "boolean", "K"]) + "[]" * r.randrange(3)
+
+
+def _stmt(r, d=0):
+    k = r.randrange(16 if d < 3 else 5)
+    if k == 0:
+        return f"{r.choice(['let', 'var'])} v{r.choice([': ' + _type(r), ''])}{r.choice([' = ' + _expr(r), ''])};\n"
+    if k == 1:
+        return f"x = {_expr(r)};\n"
+    if k == 2:
+        return f"{_expr(r)}.p = {_expr(r)};\n"
+    if k in (3, 4):
+        return f"{_expr(r)};\n"
+    if k == 5:
+        return f"if ({_expr(r)}) {_block(r, d)}{r.choice([' else ' + _block(r, d), ''])}\n"
+    if k == 6:
+        return f"while ({_expr(r)}) {_block(r, d)}\n"
+    if k == 7:
+        return f"do {_block(r, d)} while ({_expr(r)});\n"
+    if k == 8:
+        init = r.choice(["let i = 0;", ";", "i = 0;", "o.p = 1;"])
+        return f"for ({init} {r.choice([_expr(r), ''])}; {r.choice([_expr(r), ''])}) {_block(r, d)}\n"
+    if k == 9:
+        return f"foreach (e in {_expr(r)}) {_block(r, d)}\n"
+    if k == 10:
+        return f"try {_block(r, d)} catch (err) {_block(r, d)}\n"
+    if k == 11:
+        cases = "".join(f"case {_expr(r)}:\n" + _stmt(r, d + 1) for _ in range(r.randrange(3)))
+        return f"switch ({_expr(r)}) {{\n{cases}{r.choice(['', 'default:' + chr(10)])}}}\n"
+    if k == 12:
+        return r.choice(["break;\n", "continue;\n", "return;\n", f"return {_expr(r)};\n", f"print({_expr(r)});\n"])
+    if k == 13:
+        params = ", ".join(f"p{i}" + r.choice(["", ": " + _type(r)]) for i in range(r.randrange(3)))
+        return f"function f({params}){r.choice(['', ': ' + _type(r)])} {_block(r, d)}\n"
+    if k == 14:
+        members = "".join(r.choice([f"let m: {_type(r)};\n", f"const M = {_expr(r)};\n",
+                                     f"function g() {_block(r, d)}\n"]) for _ in range(r.randrange(3)))
+        return f"class K{r.choice([' : B', ''])} {{\n{members}}}\n"
+    return f"const C = {_expr(r)};\n"
+
+
+def random_program(seed, statements=5):
+    r = random.Random(seed)
+    return "".join(_stmt(r) for _ in range(statements))
+
+
+def test_random_programs_build_the_same_ast():
+    for seed in range(20):
+        assert_same(random_program(seed))
+
+
+def test_random_mutations_fail_on_the_same_line():
+    # borra, inserta o duplica un token de un programa válido
+    for seed in range(30):
+        src = random_program(seed, 3)
+        r = random.Random(seed)
+        parser = PrattParser(src)
+        i = r.randrange(len(parser.types) - 1)
+        start, end = parser.starts[i], parser.ends[i]
+        src = r.choice([
+            src[:start] + src[end:],
+            src[:start] + r.choice(["(", ")", ";", "=", ".", "{", "}", "let", "?", ",", "["]) + " " + src[start:],
+            src[:start] + src[start:end] + " " + src[start:],
+        ])
+        assert_same(src)
+
+
+# ---------------- parse_ast ---------------- #
+
+def test_parse_ast_auto_picks_pratt_for_large_sources(monkeypatch):
+    calls = []
+    original = pipeline.pratt_parser.PrattParser
+    monkeypatch.setattr(pipeline.pratt_parser, "PrattParser",
+                        lambda src: calls.append(len(src)) or original(src))
+    small = "print(1);\n"
+    large = small * (pipeline.PRATT_MIN_BYTES // len(small) + 1)
+    assert parse_ast(small)[0] is not None and calls == []
+    program, errors = parse_ast(large)
+    assert errors == [] and len(program.body) == large.count("print") and calls == [len(large)]
+    with pytest.raises(ValueError):
+        parse_ast(small, "yacc")
+
+
+def test_lexer_errors_are_reported_and_the_tree_still_built():
+    program, errors = parse_ast('let a = 1 @ ;\nprint(a);', "pratt")
+    assert errors == ["[Line 1] token recognition error at: '@'"]
+    assert "PrintStmt" in render_ascii(program)
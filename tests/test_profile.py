@@ -0,0 +1,121 @@
+import contextlib
+import io
+
+import pytest
+from antlr4 import InputStream, CommonTokenStream, ParseTreeWalker
+from parser.CompiscriptLexer import CompiscriptLexer
+from parser.CompiscriptParser import CompiscriptParser
+from semantic.ast_and_semantic import AstAndSemantic
+from intermediate.tac_generator import TacGenerator
+from intermediate.tac_interpreter import run_tac
+from intermediate.profile import (
+    ExecutionProfile, ProfileMismatchError, collect_profile, apply_profile,
+)
+from code_generator.mips_generator import MIPSCodeGenerator
+from code_generator.mips_simulator import run_asm
+from code_generator.register_allocator import RegisterAllocator
+
+# /tests/test_profile.py
+
+HOT_LOOP = """
+function sq(x: integer): integer { return x * x; }
+let i: integer = 0;
+let acc: integer = 0;
+while (i < 40) {
+  if (i % 10 == 0) { print(i); } else { acc = acc + sq(i); }
+  i = i + 1;
+}
+print(acc);
+"""
+
+
+def compile_tac(code: str):
+    tokens = CommonTokenStream(CompiscriptLexer(InputStream(code)))
+    tree = CompiscriptParser(tokens).program()
+    sem = AstAndSemantic()
+    ParseTreeWalker().walk(sem, tree)
+    assert sem.errors == []
+    gen = TacGenerator(sem.table, sem.resolved_symbols, sem.types)
+    gen.visit(tree)
+    return gen
+
+
+def simulate(code, frame_manager, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        asm = MIPSCodeGenerator(code, frame_manager, **kwargs).generate()
+    return run_asm(asm, max_instructions=500_000)
+
+
+# ======================================
+#  1) Perfil
+# ======================================
+
+def test_profile_round_trips_through_json(tmp_path):
+    gen = compile_tac(HOT_LOOP)
+    profile = collect_profile(gen.code)
+    path = tmp_path / "prof.json"
+    profile.save(str(path))
+    loaded = ExecutionProfile.load(str(path))
+    assert loaded.matches(gen.code)
+    assert loaded.instruction_counts(gen.code) == profile.instruction_counts(gen.code)
+    assert loaded.function_counts()["func_sq"] == 36
+
+
+def test_profile_for_other_program_is_rejected():
+    profile = collect_profile(compile_tac(HOT_LOOP).code)
+    other = compile_tac("print(1);")
+    with pytest.raises(ProfileMismatchError):
+        apply_profile(other.code, profile)
+
+
+# ======================================
+#  2) Pasadas guiadas
+# ======================================
+
+def test_hot_leaf_call_is_inlined_and_hot_branch_falls_through():
+    gen = compile_tac(HOT_LOOP)
+    code, _weights = apply_profile(gen.code, collect_profile(gen.code))
+    main = code[next(i for i, t in enumerate(code) if t.result == "func_main"):]
+    assert not any(t.op == "call" for t in main)
+    # la condición del while se invirtió: el cuerpo cae sin goto
+    inverted = [t for t in main if t.comment == "PGO: rama invertida"]
+    assert len(inverted) == 1
+
+
+def test_profile_use_keeps_output_and_runs_fewer_instructions():
+    gen = compile_tac(HOT_LOOP)
+    code, weights = apply_profile(gen.code, collect_profile(gen.code))
+    assert run_tac(code).output == run_tac(gen.code).output
+
+    base = simulate(gen.code, gen.frame_manager)
+    pgo = simulate(code, gen.frame_manager, var_priorities=weights)
+    assert pgo.output == run_tac(gen.code).output
+    assert pgo.stats.instructions < base.stats.instructions
+
+
+def test_callee_that_writes_a_global_is_not_inlined():
+    gen = compile_tac("""
+    let counter: integer = 0;
+    function bump(): integer { counter = counter + 1; return counter; }
+    let i: integer = 0;
+    while (i < 5) { bump(); i = i + 1; }
+    print(counter);
+    """)
+    code, weights = apply_profile(gen.code, collect_profile(gen.code))
+    assert not any(str(t.result).startswith("inl") for t in code)
+    assert run_tac(code).output == "5"
+    assert simulate(code, gen.frame_manager, var_priorities=weights).output == "5"
+
+
+def test_allocator_spills_coldest_live_variable():
+    alloc = RegisterAllocator(
+        available_registers=["$s0", "$s1"],
+        var_offsets={"hot": -8, "cold": -12, "x": -16},
+        priorities={"hot": 100, "cold": 1},
+    )
+    for name in ("hot", "cold"):
+        reg, _ = alloc.get_register_for(name, set(), for_read=False, for_write=True)
+        alloc.mark_written(reg)
+    reg, code = alloc.get_register_for("x", {"hot", "cold"}, for_read=False, for_write=True)
+    assert reg == "$s1"
+    assert any("spill cold" in ln for ln in code)
@@ -0,0 +1,48 @@
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import CompilerServer
+from profiling import profile_call
+
+# /tests/test_profiling.py
+
+
+def busy_leaf(deadline):
+    n = 0
+    while time.perf_counter() < deadline:
+        n += 1
+    return n
+
+
+def busy_root():
+    return busy_leaf(time.perf_counter() + 0.08)
+
+
+def test_sampler_produces_collapsed_stacks_and_top(tmp_path):
+    result, report = profile_call(busy_root, mode="sample", out_dir=str(tmp_path), name="t/x")
+    assert result > 0 and report.samples > 0
+    stack, count = report.collapsed.splitlines()[0].rsplit(" ", 1)
+    assert stack.split(";")[0].startswith("busy_root") and int(count) > 0
+    assert report.top[0]["function"].startswith("busy_leaf")
+    assert report.path and open(report.path).read() == report.collapsed
+
+
+def test_cprofile_reports_exact_calls():
+    _, report = profile_call(lambda: [busy_leaf(0) for _ in range(7)], mode="cprofile")
+    row = next(r for r in report.top if r["function"].startswith("busy_leaf"))
+    assert row["calls"] == 7 and report.collapsed == ""
+    with pytest.raises(ValueError):
+        profile_call(busy_root, mode="perf")
+
+
+def test_profile_flag_on_endpoint_skips_cache():
+    client = TestClient(CompilerServer.app)
+    src = "let a: integer = 4; print(a);"
+    plain = client.post("/tac/pretty", json={"source": src}).json()
+    assert plain["profile"] is None
+    prof = client.post("/tac/pretty?profile=cprofile", json={"source": src}).json()
+    assert prof["result"] == plain["result"]
+    assert prof["profile"]["mode"] == "cprofile" and prof["profile"]["top"]
+    assert client.post("/tac/pretty", json={"source": src}).json()["profile"] is None
@@ -0,0 +1,179 @@
+from antlr4 import InputStream, CommonTokenStream, ParseTreeWalker
+from parser.CompiscriptLexer import CompiscriptLexer
+from parser.CompiscriptParser import CompiscriptParser
+from semantic.ast_and_semantic import AstAndSemantic
+from intermediate.tac_generator import TacGenerator
+from intermediate.tac_nodes import TACOP
+from intermediate.tac_passes import resolve_static_array_cow
+from intermediate.tac_interpreter import run_tac
+from code_generator.mips_generator import MIPSCodeGenerator
+
+# /tests/test_static_arrays.py
+
+
+def compile_tac(code: str):
+    tokens = CommonTokenStream(CompiscriptLexer(InputStream(code)))
+    tree = CompiscriptParser(tokens).program()
+    sem = AstAndSemantic()
+    ParseTreeWalker().walk(sem, tree)
+    assert sem.errors == []
+    gen = TacGenerator(sem.table, sem.resolved_symbols)
+    gen.visit(tree)
+    return gen
+
+
+def ops(code, name):
+    return [t for t in code if t.op == name]
+
+
+# ======================================
+#  1) TAC: detección de literales constantes
+# ======================================
+
+def test_constant_literal_becomes_data_words():
+    gen = compile_tac("let a = [1, -2, 3];")
+    data = ops(gen.code, "DATA_WORDS")
+    assert len(data) == 1
+    assert data[0].arg1 == "3, 1, -2, 3"
+    assert not ops(gen.code, "CREATE_ARRAY")
+    static = ops(gen.code, "STATIC_ARRAY")
+    assert static[0].arg1 == data[0].result
+    assert static[0].arg2 != "cow"
+
+
+def test_nested_constant_literal_references_inner_labels():
+    gen = compile_tac("let m = [[1, 2], [3, 4]];")
+    data = {t.result: t.arg1 for t in ops(gen.code, "DATA_WORDS")}
+    assert len(data) == 3
+    outer = ops(gen.code, "STATIC_ARRAY")[0].arg1
+    words = data[outer].split(", ")
+    assert words[0] == "2"
+    assert words[1] in data and words[2] in data
+
+
+def test_identical_literals_share_label():
+    gen = compile_tac("let a = [1, 2]; let b = [1, 2];")
+    assert len(ops(gen.code, "DATA_WORDS")) == 1
+    labels = {t.arg1 for t in ops(gen.code, "STATIC_ARRAY")}
+    assert len(labels) == 1
+
+
+def test_non_constant_literal_keeps_heap_path():
+    gen = compile_tac("let x = 4; let a = [1, x];")
+    assert not ops(gen.code, "DATA_WORDS")
+    assert ops(gen.code, "CREATE_ARRAY")
+
+
+def test_written_literal_is_marked_cow():
+    gen = compile_tac("let a = [1, 2, 3]; let b = [4, 5]; a[0] = 7; print(b[0]);")
+    static = ops(gen.code, "STATIC_ARRAY")
+    assert static[0].arg2 == "cow"
+    assert static[1].arg2 != "cow"
+
+
+def test_literal_passed_as_argument_is_marked_cow():
+    gen = compile_tac("""
+    function f(v: integer[]): integer { return v[0]; }
+    print(f([7, 8]));
+    """)
+    assert ops(gen.code, "STATIC_ARRAY")[0].arg2 == "cow"
+
+
+def test_dynamic_literal_evaluates_each_element_once():
+    # cada elemento se baja desde su expression(), no desde el texto
+    gen = compile_tac("""
+    function f(): integer { print("!"); return 2; }
+    let x = 4;
+    let a = [x + 1, f() * x, (3), -5];
+    let s = ["a,b", "c"];
+    print(a[0]); print(a[1]); print(a[2]); print(a[3]); print(s[0]);
+    """)
+    assert run_tac(gen.code).output == "!583-5a,b"
+    assert not ops(gen.code, "uminus")
+
+
+def test_nested_dynamic_literal():
+    gen = compile_tac("let x = 1; let m = [[x, 2], [3, x + 3], [4, 5]]; print(m[1][1]);")
+    assert run_tac(gen.code).output == "4"
+    assert len(ops(gen.code, "CREATE_ARRAY")) == 3
+    # la fila constante sigue yendo a .data
+    assert [t.arg1 for t in ops(gen.code, "DATA_WORDS")] == ["2, 4, 5"]
+
+
+# ======================================
+#  2) Pasada COW sobre TAC armado a mano
+# ======================================
+
+def test_cow_follows_aliases_through_loads():
+    # m es [[..], ..]: el load devuelve un sub-arreglo que vive en .data
+    tac = [
+        TACOP(op="DATA_WORDS", result="arrlit1", arg1="1, 5"),
+        TACOP(op="DATA_WORDS", result="arrlit0", arg1="1, arrlit1"),
+        TACOP(op="STATIC_ARRAY", result="t0", arg1="arrlit0"),
+        TACOP(op="=", arg1="t0", result="m"),
+        TACOP(op="+", arg1="m", arg2="4", result="t1"),
+        TACOP(op="load", arg1="t1", result="t2"),
+        TACOP(op="store", result="t2", arg1="9"),
+    ]
+    resolve_static_array_cow(tac)
+    assert tac[2].arg2 == "cow"
+
+
+def test_loaded_element_of_flat_literal_is_not_an_alias():
+    # a[i] de un arreglo de enteros es un entero: devolverlo no expone el arreglo
+    gen = compile_tac("""
+    function f(i: integer): integer { let a: integer[] = [1, 2, 3]; return a[i]; }
+    print(f(1));
+    """)
+    assert ops(gen.code, "STATIC_ARRAY")[0].arg2 != "cow"
+    assert run_tac(gen.code).output == "2"
+
+
+def test_index_arithmetic_is_not_an_alias():
+    tac = [
+        TACOP(op="STATIC_ARRAY", result="t0", arg1="arrlit0"),
+        TACOP(op="=", arg1="t0", result="a"),
+        TACOP(op="+", arg1="a", arg2="4", result="t1"),
+        TACOP(op="load", arg1="t1", result="t2"),
+        TACOP(op="+", arg1="t2", arg2="1", result="t3"),
+        TACOP(op="return", arg1="t3"),
+    ]
+    resolve_static_array_cow(tac)
+    assert tac[0].arg2 != "cow"
+
+
+def test_cow_temps_are_scoped_to_their_function():
+    # los temporales se numeran desde t0 en cada función: el t0 que escapa
+    # en f no es el literal de main
+    tac = [
+        TACOP(op="fn_decl", result="func_f"),
+        TACOP(op="load_param", arg1="0", result="v"),
+        TACOP(op="=", arg1="v", result="t0"),
+        TACOP(op="return", arg1="t0"),
+        TACOP(op="fn_decl", result="func_main"),
+        TACOP(op="STATIC_ARRAY", result="t0", arg1="arrlit0"),
+        TACOP(op="=", arg1="t0", result="a"),
+    ]
+    resolve_static_array_cow(tac)
+    assert tac[5].arg2 != "cow"
+
+
+# ======================================
+#  3) MIPS
+# ======================================
+
+def test_static_array_emits_words_and_la():
+    gen = compile_tac("let a = [1, 2, 3]; print(a[1]);")
+    asm = MIPSCodeGenerator(gen.code, gen.frame_manager).generate()
+    assert "arrlit0: .word 3, 1, 2, 3" in asm
+    assert "la $" in asm and "arrlit0" in asm
+    assert "__rt_array_copy" not in asm
+
+
+def test_cow_array_copies_through_runtime():
+    gen = compile_tac("let m = [[1, 2], [3, 4]]; m[0] = [5, 6];")
+    asm = MIPSCodeGenerator(gen.code, gen.frame_manager).generate()
+    assert "jal __rt_array_copy" in asm
+    assert "__rt_array_copy:" in asm
+    # m + sus dos hijos, y [5, 6] (se guarda dentro de m => escapa)
+    assert asm.count("jal __rt_array_copy") == 4
@@ -0,0 +1,119 @@
+import io
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+import CompilerServer
+from code_generator.mips_simulator import run_asm, MIPSSimulationError
+from code_generator.streaming import StreamingMIPSGenerator
+from intermediate.ir_format import format_tac, iter_tac
+from pipeline import compile_source, emit_mips, stream_mips
+
+# /tests/test_streaming.py
+#
+# Backend en streaming: el asm sale función por función y hace lo mismo
+# que el de emit_mips.
+
+SRC = """
+function sq(n: integer): integer { let r: integer = n * n; return r; }
+function greet(s: string): string { return "hola " + s; }
+function third(): integer { let xs: integer[] = [4, 5, 6]; return xs[2]; }
+let k: integer = sq(5);
+print(k);
+print(greet("mundo"));
+let t: integer = third();
+print(t);
+"""
+
+OUTPUT = "25hola mundo6"
+
+PROGRAMS = sorted((Path(__file__).resolve().parent.parent / "benchmarks" / "programs").glob("*.cps"))
+
+
+def compiled():
+    result = compile_source(SRC, stop_after="tac")
+    assert result.errors == []
+    return result
+
+
+def test_stream_runs_like_emit_mips():
+    result = compiled()
+    asm = "".join(stream_mips(result.tac, result.frame_manager))
+    assert run_asm(asm, max_instructions=500_000).output == OUTPUT
+    assert run_asm(emit_mips(result.tac, result.frame_manager), max_instructions=500_000).output == OUTPUT
+
+
+def test_functions_are_emitted_before_the_tac_ends_and_then_dropped():
+    result = compiled()
+    pulled = []
+
+    def tac():
+        for op in result.tac:
+            pulled.append(op)
+            yield op
+
+    gen = StreamingMIPSGenerator(tac(), result.frame_manager)
+    chunks = gen.stream()
+    asm = next(chunks)
+    while "func_sq:" not in asm:
+        asm += next(chunks)
+    assert len(pulled) < len(result.tac)
+    asm += "".join(chunks)
+    assert len(pulled) == len(result.tac)
+    assert gen.pre.functions == {} and gen.pre.liveness == {}
+    assert run_asm(asm, max_instructions=500_000).output == OUTPUT
+
+
+def first_text_label(asm):
+    """Primer label de .text: donde arrancan MARS/SPIM por defecto."""
+    lines = [ln.strip() for ln in asm.splitlines()]
+    for ln in lines[lines.index(".text") + 1:]:
+        if ln and not ln.startswith((".", "#")):
+            return ln
+
+
+def test_stream_starts_text_at_main():
+    result = compiled()
+    for buffered in (False, True):
+        asm = "".join(stream_mips(result.tac, result.frame_manager, buffered_print=buffered))
+        assert first_text_label(asm) == "main:"
+        assert run_asm(asm, max_instructions=500_000).output == OUTPUT
+
+
+def test_iter_tac_streams_from_text_lines():
+    result = compiled()
+    text = format_tac(result.tac)
+    assert list(iter_tac(io.StringIO(text))) == result.tac
+    out = io.StringIO()
+    StreamingMIPSGenerator(iter_tac(io.StringIO(text))).write_to(out)
+    assert run_asm(out.getvalue(), max_instructions=500_000).output == OUTPUT
+
+
+def test_asm_stream_endpoint():
+    client = TestClient(CompilerServer.app)
+    response = client.post("/asm/stream", json={"source": SRC})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert run_asm(response.text, max_instructions=500_000).output == OUTPUT
+
+    errors = client.post("/asm/stream", json={"source": "let b: integer = true;"}).json()
+    assert errors["result"] == "== ERRORS ==" and errors["errors"]
+
+
+def simulated(asm):
+    """Salida del simulador, o el tipo de error (los mensajes traen números de línea)."""
+    try:
+        return run_asm(asm, max_instructions=2_000_000).output
+    except MIPSSimulationError:
+        return MIPSSimulationError
+
+
+@pytest.mark.parametrize("buffered", [False, True])
+@pytest.mark.parametrize("path", PROGRAMS, ids=lambda p: p.name)
+def test_stream_matches_emit_mips_on_benchmark_corpus(path, buffered):
+    result = compile_source(path.read_text(encoding="utf-8"), stop_after="tac")
+    assert result.errors == []
+    streamed = "".join(stream_mips(result.tac, result.frame_manager, buffered_print=buffered))
+    whole = emit_mips(result.tac, result.frame_manager, buffered_print=buffered)
+    assert simulated(streamed) == simulated(whole)
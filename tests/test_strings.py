@@ -0,0 +1,142 @@
+from antlr4 import InputStream, CommonTokenStream, ParseTreeWalker
+from parser.CompiscriptLexer import CompiscriptLexer
+from parser.CompiscriptParser import CompiscriptParser
+from semantic.ast_and_semantic import AstAndSemantic
+from intermediate.tac_generator import TacGenerator
+from code_generator.mips_generator import MIPSCodeGenerator
+from code_generator.pre_analysis import mips_string_bytes, str_hash
+from code_generator.mips_simulator import run_asm
+from code_generator.runtime_lib import runtime_data, runtime_text
+
+# /tests/test_strings.py
+
+
+def compile_tac(code: str):
+    tokens = CommonTokenStream(CompiscriptLexer(InputStream(code)))
+    tree = CompiscriptParser(tokens).program()
+    sem = AstAndSemantic()
+    ParseTreeWalker().walk(sem, tree)
+    assert sem.errors == []
+    gen = TacGenerator(sem.table, sem.resolved_symbols, sem.types)
+    gen.visit(tree)
+    return gen
+
+
+def ops(gen):
+    return [t.op for t in gen.code]
+
+
+# ======================================
+#  1) TAC: operaciones de string tipadas
+# ======================================
+
+def test_string_plus_lowers_to_concat():
+    gen = compile_tac('let s = "a"; let i = 1; s = s + "b"; i = i + 2;')
+    assert ops(gen).count("concat") == 1
+    assert ops(gen).count("+") == 1
+
+
+def test_string_equality_compares_contents():
+    gen = compile_tac('let s = "a"; let b = s == "a"; let c = s != "b"; let d = 1 == 2;')
+    assert "str_eq" in ops(gen)
+    assert "str_ne" in ops(gen)
+    assert "==" in ops(gen)
+
+
+def test_print_of_string_variable_uses_print_s():
+    gen = compile_tac('let s = "hola"; print(s); let n = 3; print(n);')
+    prints = [t.op for t in gen.code if t.op in ("print", "print_s")]
+    assert prints == ["print_s", "print"]
+
+
+def test_print_of_concat_prints_both_sides():
+    gen = compile_tac('let s = "x"; print("v=" + s);')
+    assert "concat" not in ops(gen)
+    assert ops(gen).count("print_s") == 2
+
+
+# ======================================
+#  2) Literales internados
+# ======================================
+
+def test_literal_bytes_and_hash():
+    assert mips_string_bytes('"a\\n"') == b"a\n"
+    # FNV-1a 32 bits de referencia
+    assert str_hash(b"a") == 0xE40C292C
+    assert str_hash(b"") == 0x811C9DC5
+
+
+def test_literal_descriptor_has_length_hash_and_chars():
+    gen = compile_tac('let s = "hola"; print(s);')
+    asm = MIPSCodeGenerator(gen.code, gen.frame_manager).generate()
+    h = str_hash(b"hola")
+    assert f"str0: .word 4, {h:#010x}, str0_c, 0" in asm
+    assert 'str0_c: .asciiz "hola"' in asm
+
+
+# ======================================
+#  3) MIPS
+# ======================================
+
+def test_string_ops_call_runtime():
+    gen = compile_tac("""
+    let s = "ab";
+    s = s + "c";
+    if (s == "abc") { print("ok"); }
+    """)
+    asm = MIPSCodeGenerator(gen.code, gen.frame_manager).generate()
+    assert "jal __rt_str_concat" in asm
+    assert "jal __rt_str_eq" in asm
+    for routine in ("__rt_str_concat:", "__rt_copy_chars:", "__rt_str_eq:", "__rt_str_hash:"):
+        assert routine in asm
+    assert "__rt_str_tmp:" in asm
+
+
+def test_unbuffered_dynamic_print_is_one_syscall():
+    # t comparte el buffer de s: el terminador temporal no debe quedar
+    gen = compile_tac("""
+    let s = "ab";
+    s = s + "c";
+    let t = s;
+    s = s + "d";
+    print(t);
+    print(s);
+    """)
+    asm = MIPSCodeGenerator(gen.code, gen.frame_manager).generate()
+    assert "__rt_flush" not in asm
+    assert asm.count("jal __rt_print_str_direct") == 2
+    result = run_asm(asm, max_instructions=100_000)
+    assert result.output == "abcabcd"
+    # 2 prints, exit y 3 sbrk (el segundo concat agrega en el mismo buffer)
+    assert result.stats.syscalls == 2 + 1 + 3
+
+
+def test_str_eq_with_null_returns_false():
+    # "" armado en el heap (buf != 0): sin el chequeo, null se leía como
+    # otro string vacío
+    asm = "\n".join([
+        ".data",
+        "empty_chars: .asciiz \"\"",
+        ".align 2",
+        "lit: .word 0, 0, empty_chars, empty_chars",
+        ".text",
+        "main:",
+        "    li $a0, 0",
+        "    la $a1, lit",
+        "    jal __rt_str_eq",
+        "    move $a0, $v0",
+        "    li $v0, 1",
+        "    syscall",
+        "    la $a0, lit",
+        "    li $a1, 0",
+        "    jal __rt_str_eq",
+        "    move $a0, $v0",
+        "    li $v0, 1",
+        "    syscall",
+        "    li $v0, 10",
+        "    syscall",
+        *runtime_text(["__rt_str_eq"]),
+        ".data",
+        *runtime_data(["__rt_str_eq"]),
+    ])
+    assert run_asm(asm, max_instructions=1_000).output == "00"
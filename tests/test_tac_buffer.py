@@ -0,0 +1,70 @@
+from intermediate.tac_nodes import TACOP, TacBuffer
+from pipeline import compile_source
+
+# /tests/test_tac_buffer.py
+#
+# TacBuffer: enlaza en vez de copiar, pero tiene que verse igual que la
+# lista que reemplaza en TacGenerator.
+
+
+def ops(*names):
+    return [TACOP(op="label", result=n) for n in names]
+
+
+def names(buf):
+    return [t.result for t in buf]
+
+
+def test_iadd_links_large_children_and_copies_small_ones():
+    big = TacBuffer(ops(*map(str, range(TacBuffer.LINK_MIN + 1))))
+    small = TacBuffer(ops("s"))
+    out = TacBuffer()
+    out += big
+    out += small
+    out += ops("l")
+    assert out._parts[0] == (big._parts, len(big._parts))
+    assert names(out) == names(big) + ["s", "l"]
+    assert len(out) == TacBuffer.LINK_MIN + 3
+
+
+def test_later_appends_to_a_child_are_not_visible():
+    child = TacBuffer(ops(*map(str, range(40))))
+    parent = TacBuffer()
+    parent += child
+    child.append(TACOP(op="label", result="late"))
+    assert "late" not in names(parent)
+    assert names(child)[-1] == "late"
+
+
+def test_pop_and_ends_do_not_touch_linked_children():
+    child = TacBuffer(ops(*map(str, range(40))))
+    parent = TacBuffer(ops("a"))
+    parent += child
+    assert parent[0].result == "a" and parent[-1].result == "39"
+    assert parent.pop().result == "39"
+    assert parent[-1].result == "38"
+    assert len(child) == 40 and child[-1].result == "39"
+    parent.append(TACOP(op="label", result="b"))
+    assert names(parent)[-2:] == ["38", "b"]
+    assert names(child)[-1] == "39"
+
+
+def test_deep_links_flatten_without_recursion():
+    buf = TacBuffer(ops(*map(str, range(40))))
+    for i in range(5000):
+        outer = TacBuffer(ops(f"x{i}") * 40)
+        outer += buf
+        buf = outer
+    flat = list(buf)
+    assert len(flat) == 5000 * 40 + 40
+    assert flat[-1].result == "39"
+
+
+def test_deeply_nested_program_keeps_its_tac():
+    src = "let x: integer = 0;\n" + "while (x < 9) {\n" * 200 + "x = x + 1;\n" + "}\n" * 200
+    result = compile_source(src, stop_after="tac")
+    assert result.errors == []
+    assert sum(1 for t in result.tac if t.op == "+") == 1
+    assert sum(1 for t in result.tac if t.op == "label") == 600
+    assert result.tac[0].op == "fn_decl"
+    assert str(result.tac[-2]) == "goto L0"
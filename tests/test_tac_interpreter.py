@@ -0,0 +1,134 @@
+from antlr4 import InputStream, CommonTokenStream, ParseTreeWalker
+from parser.CompiscriptLexer import CompiscriptLexer
+from parser.CompiscriptParser import CompiscriptParser
+from semantic.ast_and_semantic import AstAndSemantic
+from intermediate.tac_generator import TacGenerator
+from intermediate.tac_interpreter import run_tac, compare_with_mips
+
+# /tests/test_tac_interpreter.py
+
+
+def compile_tac(code: str):
+    tokens = CommonTokenStream(CompiscriptLexer(InputStream(code)))
+    tree = CompiscriptParser(tokens).program()
+    sem = AstAndSemantic()
+    ParseTreeWalker().walk(sem, tree)
+    assert sem.errors == []
+    gen = TacGenerator(sem.table, sem.resolved_symbols, sem.types)
+    gen.visit(tree)
+    return gen
+
+
+# ======================================
+#  1) Semántica
+# ======================================
+
+def test_recursive_function_and_arithmetic():
+    gen = compile_tac("""
+    function fib(n: integer): integer {
+      if (n < 2) { return n; }
+      return fib(n - 1) + fib(n - 2);
+    }
+    let i: integer = 0;
+    while (i < 8) { print(fib(i)); print(" "); i = i + 1; }
+    print(-7 / 2);
+    print(-7 % 2);
+    """)
+    result = run_tac(gen.code)
+    assert result.exit_reason == "return"
+    assert result.output == "0 1 1 2 3 5 8 13 -3-1"
+
+
+def test_objects_arrays_and_foreach():
+    gen = compile_tac("""
+    class Box {
+      let v: integer;
+      function constructor(v: integer) { this.v = v; }
+      function get(): integer { return this.v; }
+    }
+    let b: Box = new Box(4);
+    print(b.get());
+    let m = [[1, 2], [3, 4]];
+    print(m[1][0]);
+    let a = [5, 6];
+    foreach (x in a) { print(x); }
+    """)
+    assert run_tac(gen.code).output == "4356"
+
+
+def test_function_writes_global_variable():
+    gen = compile_tac("""
+    let counter: integer = 0;
+    function bump(): integer { counter = counter + 1; return counter; }
+    let i: integer = 0;
+    while (i < 5) { bump(); i = i + 1; }
+    print(counter);
+    """)
+    assert run_tac(gen.code).output == "5"
+    diff = compare_with_mips(gen.code, gen.frame_manager)
+    assert diff.matches, (diff.tac.output, diff.mips_output)
+    # un parámetro con el nombre del global no escribe el global
+    assert run_tac(compile_tac("""
+    let counter: integer = 3;
+    function shadow(counter: integer): integer { counter = counter * 100; return counter; }
+    print(shadow(2));
+    print(counter);
+    """).code).output == "2003"
+
+
+def test_copy_on_write_static_arrays_do_not_share_storage():
+    gen = compile_tac("""
+    let i = 0;
+    while (i < 3) {
+      let a = [1, 2];
+      print(a[0]);
+      a[0] = 7;
+      i = i + 1;
+    }
+    """)
+    assert run_tac(gen.code).output == "111"
+
+
+def test_budget_stops_infinite_loop():
+    gen = compile_tac("let i = 0; while (true) { i = i + 1; }")
+    result = run_tac(gen.code, max_steps=1000)
+    assert result.exit_reason == "budget"
+    assert result.steps == 1000
+
+
+# ======================================
+#  2) Conteo por bloque básico
+# ======================================
+
+def test_block_counts_follow_loop_trip_count():
+    gen = compile_tac("""
+    let i = 0;
+    while (i < 10) { i = i + 1; }
+    """)
+    result = run_tac(gen.code)
+    counts = sorted(b.count for b in result.blocks if b.function == "func_main")
+    # entrada y salida una vez, cuerpo 10 veces, condición 11 veces
+    assert counts[-1] == 11
+    assert 10 in counts
+    assert counts[0] == 1
+
+
+# ======================================
+#  3) Diferencial contra MIPS
+# ======================================
+
+def test_interpreter_matches_mips_backend():
+    gen = compile_tac("""
+    let s = "";
+    let i = 0;
+    while (i < 6) {
+      s = s + "ab";
+      print(i * i);
+      print(",");
+      i = i + 1;
+    }
+    if (s == "abababababab") { print(s); }
+    """)
+    diff = compare_with_mips(gen.code, gen.frame_manager)
+    assert diff.mips_exit_reason == "exit"
+    assert diff.matches, (diff.tac.output, diff.mips_output)
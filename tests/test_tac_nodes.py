@@ -0,0 +1,51 @@
+import pickle
+
+from intermediate.tac_nodes import OPCODES, TACOP, TacOp
+from pipeline import compile_source, emit_mips
+
+# /tests/test_tac_nodes.py
+
+
+def test_opcode_follows_op_text():
+    assert TACOP(op="if-goto", arg1="t0", arg2="L1").opcode is TacOp.IF_GOTO
+    assert TACOP(op="+", arg1="a", arg2="1", result="t0").opcode is TacOp.ADD
+    assert TACOP().opcode is TacOp.NOP
+    assert TACOP(op="no_such_op").opcode is TacOp.UNKNOWN
+    assert len(set(OPCODES.values())) == len(OPCODES)
+
+
+def test_tacop_is_slotted_and_compares_like_before():
+    a = TACOP(op="=", arg1=5, result=("t0", "int"))
+    assert not hasattr(a, "__dict__")
+    assert (a.arg1, a.result) == ("5", "t0")
+    assert a == TACOP(op="=", arg1="5", result="t0")
+    assert repr(a) == "TACOP(op='=', arg1='5', arg2=None, result='t0', comment=None)"
+    assert str(a) == "t0 = 5"
+    assert pickle.loads(pickle.dumps(a)).opcode is TacOp.ASSIGN
+
+
+def test_operands_are_interned():
+    name = "".join(["cou", "nter"])
+    a = TACOP(op="=", arg1=name, result="t0")
+    b = TACOP(op="+", arg1="counter", arg2="1", result="t1")
+    assert a.arg1 is b.arg1
+
+
+def test_every_generated_op_has_an_opcode():
+    src = """
+    class A { let v: integer; function constructor(v: integer) { this.v = v; } }
+    function f(n: integer): integer { if (n < 2) { return n; } return f(n - 1) + 1; }
+    let a: A = new A(3);
+    let xs: integer[] = [1, 2, 3];
+    let s: string = "a" + "b";
+    print(f(a.v) + xs[1]);
+    print(s);
+    """
+    result = compile_source(src, stop_after="tac")
+    assert result.errors == []
+    assert [t.op for t in result.tac if t.opcode is TacOp.UNKNOWN] == []
+
+
+def test_unknown_op_still_reaches_the_asm_as_a_comment():
+    tac = [TACOP(op="fn_decl", result="func_main"), TACOP(op="mystery", arg1="x")]
+    assert "# TODO: unsupported TAC op mystery" in emit_mips(tac)
@@ -0,0 +1,70 @@
+from intermediate.tac_nodes import TACOP
+from intermediate.tac_passes import merge_constant_prints
+from pipeline import compile_source
+
+# /tests/test_tac_passes.py
+
+
+def test_adjacent_constant_prints_are_merged():
+    tac = [
+        TACOP(op="fn_decl", result="func_main"),
+        TACOP(op="=", arg1='", "', result="t2"),
+        TACOP(op="print_s", arg1="t2"),
+        TACOP(op="=", arg1="5", result="t3"),
+        TACOP(op="print", arg1="t3"),
+        TACOP(op="=", arg1='"\\n"', result="t4"),
+        TACOP(op="print_s", arg1="t4"),
+    ]
+    out = merge_constant_prints(tac)
+    assert [t.op for t in out] == ["fn_decl", "=", "print_s"]
+    assert out[1].arg1 == '", 5\\n"'
+    assert out[2].arg1 == out[1].result
+
+
+def test_single_constant_print_is_left_alone():
+    tac = [
+        TACOP(op="=", arg1="5", result="t0"),
+        TACOP(op="print", arg1="t0"),
+    ]
+    out = merge_constant_prints(tac)
+    assert [(t.op, t.arg1) for t in out] == [("=", "5"), ("print", "t0")]
+
+
+def test_merge_stops_at_labels_and_variable_prints():
+    tac = [
+        TACOP(op="=", arg1='"a"', result="t0"),
+        TACOP(op="print_s", arg1="t0"),
+        TACOP(op="label", result="L0"),
+        TACOP(op="=", arg1='"b"', result="t1"),
+        TACOP(op="print_s", arg1="t1"),
+        TACOP(op="print", arg1="i"),
+        TACOP(op="=", arg1='"c"', result="t2"),
+        TACOP(op="print_s", arg1="t2"),
+    ]
+    out = merge_constant_prints(tac)
+    assert len(out) == len(tac)
+
+
+def test_temp_used_elsewhere_is_not_merged():
+    tac = [
+        TACOP(op="=", arg1='"a"', result="t0"),
+        TACOP(op="print_s", arg1="t0"),
+        TACOP(op="=", arg1='"b"', result="t1"),
+        TACOP(op="print_s", arg1="t1"),
+        TACOP(op="=", arg1="t1", result="s"),
+    ]
+    out = merge_constant_prints(tac)
+    assert len(out) == len(tac)
+
+
+def test_temp_reused_by_another_function_does_not_block_merge():
+    # cada función numera sus temporales desde t0
+    result = compile_source(
+        'function g(): string { let s: string = "x"; return s; } '
+        'print("a"); print("b"); print("c");',
+        stop_after="tac",
+    )
+    assert result.errors == []
+    prints = [i for i, t in enumerate(result.tac) if t.op in ("print", "print_s")]
+    assert len(prints) == 1
+    assert result.tac[prints[0] - 1].arg1 == '"abc"'
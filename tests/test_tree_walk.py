@@ -0,0 +1,140 @@
+import glob
+import os
+import sys
+
+import pytest
+from antlr4 import InputStream, CommonTokenStream, ParseTreeWalker
+from antlr4.tree.Tree import ParseTreeListener
+
+from fast_lexer import FastLexer
+from pipeline import compile_source, parse_program
+from tree_walk import IterativeWalker, TrampolineVisitor
+from ast_nodes import UnaryOp, Literal, render_ascii
+
+# /tests/test_tree_walk.py
+#
+# IterativeWalker / TrampolineVisitor: mismos eventos y resultados que los
+# recorridos recursivos de ANTLR, sin depender de sys.getrecursionlimit().
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse(src):
+    stream = CommonTokenStream(FastLexer(InputStream(src)))
+    stream.fill()
+    return parse_program(stream)
+
+
+class Recorder(ParseTreeListener):
+    def __init__(self):
+        self.events = []
+
+    def enterEveryRule(self, ctx):
+        self.events.append(("enter", type(ctx).__name__))
+
+    def exitEveryRule(self, ctx):
+        self.events.append(("exit", type(ctx).__name__))
+
+    def visitTerminal(self, node):
+        self.events.append(("terminal", node.getText()))
+
+    def visitErrorNode(self, node):
+        self.events.append(("error", node.getText()))
+
+
+def _corpus():
+    paths = glob.glob(os.path.join(ROOT, "benchmarks", "programs", "*.cps"))
+    paths += glob.glob(os.path.join(ROOT, "src", "warmup_corpus", "*.cps"))
+    return sorted(paths)
+
+
+@pytest.mark.parametrize("path", _corpus(), ids=os.path.basename)
+def test_iterative_walker_emits_the_same_events(path):
+    with open(path, encoding="utf-8") as f:
+        tree = parse(f.read())
+    expected, got = Recorder(), Recorder()
+    ParseTreeWalker().walk(expected, tree)
+    IterativeWalker().walk(got, tree)
+    assert got.events == expected.events
+
+
+def test_iterative_walker_visits_error_nodes():
+    tree = parse("let x = ;\nprint(1);")
+    expected, got = Recorder(), Recorder()
+    ParseTreeWalker().walk(expected, tree)
+    IterativeWalker().walk(got, tree)
+    assert got.events == expected.events
+
+
+class Depth(TrampolineVisitor):
+    # profundidad del parse tree, con visit* como generador
+    def visitChildren(self, node):
+        deepest = 0
+        for child in node.getChildren():
+            deepest = max(deepest, (yield child))
+        return deepest + 1
+
+    def visitTerminal(self, node):
+        return 0
+
+
+class Failing(TrampolineVisitor):
+    def visitProgram(self, ctx):
+        try:
+            yield ctx.statement(0)
+        except ZeroDivisionError:
+            return "caught"
+
+    def visitPrintStatement(self, ctx):
+        return 1 / 0
+
+
+class CaughtInTheMiddle(TrampolineVisitor):
+    # el padre atrapa el error del hijo y termina normalmente: el abuelo
+    # recibe su valor, como con la recursión normal
+    def visitProgram(self, ctx):
+        return ("program", (yield ctx.statement(0)))
+
+    def visitStatement(self, ctx):
+        try:
+            yield ctx.printStatement()
+        except ZeroDivisionError:
+            return "caught"
+
+    def visitPrintStatement(self, ctx):
+        return 1 / 0
+
+
+def test_trampoline_has_no_recursion_limit():
+    tree = parse("let x: integer = " + " + ".join(["1"] * 3000) + ";")
+    assert Depth().visit(tree) > sys.getrecursionlimit()
+
+
+def test_trampoline_raises_child_errors_inside_the_parent():
+    assert Failing().visit(parse("print(1);")) == "caught"
+    with pytest.raises(ZeroDivisionError):
+        Failing().visit(parse("print(1);").statement(0))
+
+
+def test_trampoline_error_handled_by_the_parent_does_not_reach_the_grandparent():
+    assert CaughtInTheMiddle().visit(parse("print(1);")) == ("program", "caught")
+
+
+def test_deep_programs_compile_without_recursion_error():
+    chain = "let x: integer = " + " + ".join(["1"] * 3000) + ";\nprint(x);"
+    result = compile_source(chain)
+    assert result.errors == [] and result.asm
+    assert sum(1 for t in result.tac if t.op == "+") == 2999
+
+    nested = "let x: integer = 0;\n" + "if (x < 1) {\n" * 250 + "x = x + 1;\n" + "}\n" * 250
+    result = compile_source(nested, stop_after="tac")
+    assert result.errors == [] and len(result.tac) > 250
+
+
+def test_render_ascii_on_a_deep_ast():
+    node = Literal(value=1)
+    for _ in range(5000):
+        node = UnaryOp(op="-", expr=node)
+    lines = render_ascii(node).splitlines()
+    assert len(lines) == 5001
+    assert lines[-1].endswith("Literal 1 ty=error")
@@ -235,3 +235,23 @@ def test_ax_asignar_a_const_error():
     """
     errors, _ = run_semantic(code)
     assert any("No se puede asignar a const 'C'" in e for e in errors), errors
+
+def test_ax_cadena_de_operadores_chequea_cada_operando():
+    # operatorExpr es recursivo por la izquierda: el tercer operando de
+    # una cadena también se chequea (antes solo se miraban los dos primeros)
+    code = """
+    let a: integer = 1;
+    let k: integer = a + 2 + "x";
+    let m: integer = a * 2 * true;
+    """
+    errors, _ = run_semantic(code)
+    assert any("No se puede aplicar + a tipos 'integer' y 'string'" in e for e in errors), errors
+    assert any("No se puede aplicar * a tipos 'integer' y 'boolean'" in e for e in errors), errors
+
+def test_ax_precedencia_y_asociatividad_izquierda():
+    code = """
+    let a: integer = 10 - 4 - 3 * 2 % 4;
+    let b: boolean = 1 + 2 < 4 == true && !false || false;
+    """
+    errors, _ = run_semantic(code)
+    assert errors == [], errors